@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Shared Audit Valuations
+=======================
+
+Audit tests declare the model runs they read as ValuationPoints. Identical
+runs (same scenario, execution factor and benchmarks) are valued once, in
+parallel on the shared valuation pool, and every test reads the same
+run_full_analysis() result.
+
+Usage:
+    from audit_valuations import get_audit_valuations, comparison_points
+
+    valuations = get_audit_valuations()
+    valuations.declare(comparison_points())
+    valuations.compute()
+    base = valuations.preset(ScenarioType.BASE_CASE)
+"""
+
+import hashlib
+import sys
+from concurrent.futures import CancelledError, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add parent directory to path to import model
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from price_volume_model import (
+    PriceVolumeModel, ModelScenario, ScenarioType, ValuationPoint,
+    get_scenario_presets, comparison_execution_factor,
+    get_valuation_pool, shutdown_valuation_pool, VALUATION_POOL_WORKERS
+)
+
+
+def _audit_analysis(args) -> Dict:
+    """Full analysis of one audit input (module level so worker processes can run it)"""
+    scenario, execution_factor, custom_benchmarks = args
+    return PriceVolumeModel(scenario, execution_factor=execution_factor,
+                            custom_benchmarks=custom_benchmarks).run_full_analysis()
+
+
+def comparison_points(scenario_types: List[ScenarioType] = None,
+                      execution_factor: float = 1.0) -> List[ValuationPoint]:
+    """Runs behind compare_scenarios() (default: all presets except CUSTOM)
+
+    Points are labelled with the ScenarioType name and also cover
+    calculate_probability_weighted_valuation(), whose presets run at 1.0.
+    """
+    presets = get_scenario_presets()
+    if scenario_types is None:
+        scenario_types = [st for st in ScenarioType if st != ScenarioType.CUSTOM]
+    return [
+        ValuationPoint(label=st.name, scenario=presets[st], group='scenarios',
+                       execution_factor=comparison_execution_factor(st, execution_factor))
+        for st in scenario_types if st in presets
+    ]
+
+
+class AuditValuations:
+    """Model analyses for declared audit inputs, each computed once"""
+
+    def __init__(self, custom_benchmarks: dict = None, n_workers: int = VALUATION_POOL_WORKERS):
+        self.custom_benchmarks = custom_benchmarks
+        self.n_workers = n_workers
+        self._analyses: Dict[str, Dict] = {}
+        self._pending: Dict[str, tuple] = {}
+        self.stats = {'declared': 0, 'computed': 0, 'reused': 0}
+
+    def key(self, scenario: ModelScenario, execution_factor: float = 1.0) -> str:
+        payload = repr((scenario, execution_factor, sorted((self.custom_benchmarks or {}).items())))
+        return hashlib.md5(payload.encode()).hexdigest()
+
+    def declare(self, points: List[ValuationPoint]):
+        """Register model runs to value on the next compute()"""
+        for point in points:
+            self.stats['declared'] += 1
+            key = self.key(point.scenario, point.execution_factor)
+            if key not in self._analyses:
+                self._pending[key] = (point.scenario, point.execution_factor, self.custom_benchmarks)
+
+    def compute(self):
+        """Value every declared run not yet computed (in parallel when n_workers > 1)"""
+        pending, self._pending = self._pending, {}
+        if self.n_workers > 1 and len(pending) > 1:
+            pool = None
+            try:
+                pool = get_valuation_pool(self.n_workers)
+                futures = {pool.submit(_audit_analysis, args): key for key, args in pending.items()}
+                for future in as_completed(futures):
+                    self._store(futures[future], future.result())
+            except (BrokenProcessPool, CancelledError, OSError):
+                # Pool died (e.g. worker killed); finish the remaining runs in-process
+                shutdown_valuation_pool(pool)
+        for key, args in pending.items():
+            if key not in self._analyses:
+                self._store(key, _audit_analysis(args))
+
+    def _store(self, key: str, analysis: Dict):
+        self._analyses[key] = analysis
+        self.stats['computed'] += 1
+
+    def analysis(self, scenario: ModelScenario, execution_factor: float = 1.0) -> Dict:
+        """run_full_analysis() result of one run (valued now if it was not declared)
+
+        The result is shared between tests and must not be modified.
+        """
+        key = self.key(scenario, execution_factor)
+        if key in self._analyses:
+            self.stats['reused'] += 1
+        else:
+            self._pending.pop(key, None)
+            self._store(key, _audit_analysis((scenario, execution_factor, self.custom_benchmarks)))
+        return self._analyses[key]
+
+    def preset(self, scenario_type: ScenarioType, execution_factor: Optional[float] = None) -> Dict:
+        """Analysis of a preset (default: the execution factor compare_scenarios uses)"""
+        if execution_factor is None:
+            execution_factor = comparison_execution_factor(scenario_type)
+        return self.analysis(get_scenario_presets()[scenario_type], execution_factor)
+
+    def preset_analyses(self, points: List[ValuationPoint]) -> Dict[ScenarioType, Dict]:
+        """Analyses of comparison_points(), keyed by ScenarioType"""
+        return {ScenarioType[p.label]: self.analysis(p.scenario, p.execution_factor) for p in points}
+
+
+_shared_valuations: Dict[tuple, AuditValuations] = {}
+
+
+def get_audit_valuations(custom_benchmarks: dict = None) -> AuditValuations:
+    """Process-wide AuditValuations, so audits run in one process share model runs"""
+    key = tuple(sorted((custom_benchmarks or {}).items()))
+    if key not in _shared_valuations:
+        _shared_valuations[key] = AuditValuations(custom_benchmarks)
+    return _shared_valuations[key]
+
+
+def clear_audit_valuations():
+    """Drop all shared audit valuations"""
+    _shared_valuations.clear()
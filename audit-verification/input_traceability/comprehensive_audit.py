@@ -19,8 +19,10 @@ import sys
 
 # Add root directory to path for imports (two levels up from audits/input_traceability/)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scripts.data_loader import USSteelDataLoader
+from scripts.data_loader import get_shared_loader
+from audit_valuations import AuditValuations, comparison_points, get_audit_valuations
 from price_volume_model import (
     PriceVolumeModel, get_scenario_presets, ScenarioType,
     BENCHMARK_PRICES_2023, get_segment_configs, get_capital_projects,
@@ -31,9 +33,10 @@ from price_volume_model import (
 class ComprehensiveAudit:
     """Full audit of model inputs, assumptions, and outputs"""
 
-    def __init__(self):
+    def __init__(self, valuations: AuditValuations = None):
         root_dir = Path(__file__).parent.parent.parent
         self.root_dir = root_dir
+        self.valuations = valuations if valuations is not None else get_audit_valuations()
 
         # Try multiple possible data directories for Capital IQ files
         for data_dir in [
@@ -42,10 +45,10 @@ class ComprehensiveAudit:
             root_dir / "audit-verification" / "evidence",
         ]:
             if data_dir.exists():
-                self.loader = USSteelDataLoader(data_dir=str(data_dir))
+                self.loader = get_shared_loader(str(data_dir))
                 break
         else:
-            self.loader = USSteelDataLoader(data_dir=str(root_dir / "references"))
+            self.loader = get_shared_loader(str(root_dir / "references"))
 
         # Capital IQ balance sheet export (new format .xls)
         self.ciq_balance_sheet_file = root_dir / "references" / "uss_capital_iq_export_2023.xls"
@@ -57,6 +60,29 @@ class ComprehensiveAudit:
         }
         self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+    def _load_ciq_balance_sheet(self) -> dict:
+        """FY2023 values of the CIQ balance sheet export, by row label (parsed once, then cached)"""
+        def parse():
+            import xlrd
+            wb = xlrd.open_workbook(str(self.ciq_balance_sheet_file))
+            ws = wb.sheet_by_name('Balance Sheet')
+
+            # FY2023 is column 11 (Dec-31-2023)
+            FY2023_COL = 11
+
+            rows = []
+            for r in range(ws.nrows):
+                label = str(ws.cell_value(r, 0)).strip()
+                if label:
+                    val = ws.cell_value(r, FY2023_COL)
+                    if isinstance(val, (int, float)) and val != 0:
+                        rows.append({'Label': label, 'Value': float(val)})
+            return pd.DataFrame(rows, columns=['Label', 'Value'])
+
+        table = self.loader.load_table('ciq_balance_sheet_2023', self.ciq_balance_sheet_file, parse)
+        # Later rows win, as with the original row-by-row lookup
+        return dict(zip(table['Label'], table['Value']))
+
     # =========================================================================
     # SECTION 1: INPUT AUDIT - Capital IQ vs 10-K
     # =========================================================================
@@ -116,21 +142,7 @@ class ComprehensiveAudit:
 
         if use_ciq_direct and self.ciq_balance_sheet_file.exists():
             try:
-                import xlrd
-                wb = xlrd.open_workbook(str(self.ciq_balance_sheet_file))
-                ws = wb.sheet_by_name('Balance Sheet')
-
-                # FY2023 is column 11 (Dec-31-2023)
-                FY2023_COL = 11
-
-                # Build a lookup from row labels to FY2023 values
-                ciq_data = {}
-                for r in range(ws.nrows):
-                    label = str(ws.cell_value(r, 0)).strip()
-                    if label:
-                        val = ws.cell_value(r, FY2023_COL)
-                        if isinstance(val, (int, float)) and val != 0:
-                            ciq_data[label] = val
+                ciq_data = self._load_ciq_balance_sheet()
 
                 # Map CIQ balance sheet items to audit items
                 ciq_mapping = {
@@ -506,9 +518,13 @@ class ComprehensiveAudit:
         print("SECTION 3: MODEL OUTPUT AUDIT")
         print("=" * 80)
 
-        # Run model scenarios
+        # Run model scenarios (each preset valued once, shared with the other audits)
         print("\n--- Running All Scenarios ---")
-        comparison = compare_scenarios()
+        points = comparison_points()
+        self.valuations.declare(points)
+        self.valuations.compute()
+        analyses = self.valuations.preset_analyses(points)
+        comparison = compare_scenarios(analyses=analyses)
 
         print("\nSCENARIO COMPARISON TABLE:")
         print(comparison.to_string(index=False))
@@ -527,7 +543,7 @@ class ComprehensiveAudit:
         # Probability-weighted valuation
         print("\n--- Probability-Weighted Valuation ---")
         try:
-            pw_results = calculate_probability_weighted_valuation()
+            pw_results = calculate_probability_weighted_valuation(analyses=analyses)
 
             print(f"\nWeighted USS Value:     ${pw_results['weighted_uss_value_per_share']:.2f}/share")
             print(f"Weighted Nippon Value:  ${pw_results['weighted_nippon_value_per_share']:.2f}/share")
@@ -558,10 +574,7 @@ class ComprehensiveAudit:
 
         # Detailed Base Case Analysis
         print("\n--- Base Case Detailed Analysis ---")
-        presets = get_scenario_presets()
-        base = presets[ScenarioType.BASE_CASE]
-        model = PriceVolumeModel(base)
-        analysis = model.run_full_analysis()
+        analysis = self.valuations.preset(ScenarioType.BASE_CASE)
 
         consolidated = analysis['consolidated']
 
@@ -19,7 +19,7 @@ import sys
 # Add root directory to path for imports (two levels up from audits/input_traceability/)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from scripts.data_loader import USSteelDataLoader
+from scripts.data_loader import get_shared_loader
 from price_volume_model import (
     BENCHMARK_PRICES_2023, get_segment_configs, get_capital_projects,
     Segment, get_scenario_presets, ScenarioType
@@ -30,9 +30,9 @@ class InputTraceabilityAudit:
     """Trace model inputs to source documents"""
 
     def __init__(self):
-        # Use absolute path to reference_materials
+        # Use absolute path to reference_materials (tables come from the parsed cache)
         root_dir = Path(__file__).parent.parent.parent
-        self.loader = USSteelDataLoader(data_dir=str(root_dir / "reference_materials"))
+        self.loader = get_shared_loader(str(root_dir / "reference_materials"))
         self.results = []
 
     def get_excel_value(self, df, item_pattern, col_pattern=None):
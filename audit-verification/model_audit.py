@@ -21,8 +21,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from price_volume_model import (
     PriceVolumeModel, get_scenario_presets, ScenarioType,
     get_segment_configs, BENCHMARK_PRICES_2023, Segment,
-    get_capital_projects
+    get_capital_projects, ModelScenario, VolumeScenario, ValuationPoint
 )
+from audit_valuations import AuditValuations, comparison_points, get_audit_valuations
+
+AUDIT_DIR = Path(__file__).parent
 
 
 class AuditTest:
@@ -40,10 +43,45 @@ class AuditTest:
 class ModelAuditor:
     """Main audit framework"""
 
-    def __init__(self):
+    def __init__(self, valuations: AuditValuations = None):
         self.tests: List[AuditTest] = []
         self.base_model = None
         self.base_analysis = None
+        self.valuations = valuations if valuations is not None else get_audit_valuations()
+
+    @staticmethod
+    def _volume_down_scenario(scenario: ModelScenario) -> ModelScenario:
+        """Scenario with all segment volumes 10% below the given one (ST-02)"""
+        vol_down = VolumeScenario(
+            name="Test", description="Test",
+            flat_rolled_volume_factor=0.9,
+            mini_mill_volume_factor=0.9,
+            usse_volume_factor=0.9,
+            tubular_volume_factor=0.9,
+            flat_rolled_growth_adj=0, mini_mill_growth_adj=0,
+            usse_growth_adj=0, tubular_growth_adj=0
+        )
+        return ModelScenario(
+            name="Test", scenario_type=ScenarioType.CUSTOM, description="Test",
+            price_scenario=scenario.price_scenario, volume_scenario=vol_down,
+            uss_wacc=scenario.uss_wacc, terminal_growth=scenario.terminal_growth,
+            exit_multiple=scenario.exit_multiple, us_10yr=scenario.us_10yr,
+            japan_10yr=scenario.japan_10yr, nippon_equity_risk_premium=scenario.nippon_equity_risk_premium,
+            nippon_credit_spread=scenario.nippon_credit_spread, nippon_debt_ratio=scenario.nippon_debt_ratio,
+            nippon_tax_rate=scenario.nippon_tax_rate, include_projects=scenario.include_projects
+        )
+
+    def declared_inputs(self) -> List[ValuationPoint]:
+        """Model runs read by the test categories
+
+        The presets (as compare_scenarios runs them) cover the base case,
+        the NSA financing checks and the cross-scenario ranking.
+        """
+        base_scenario = get_scenario_presets()[ScenarioType.BASE_CASE]
+        return comparison_points() + [
+            ValuationPoint(label="Volume -10%", scenario=self._volume_down_scenario(base_scenario),
+                           group='sensitivity'),
+        ]
 
     def run_all_tests(self):
         """Execute all audit tests"""
@@ -52,11 +90,13 @@ class ModelAuditor:
         print("=" * 80)
         print()
 
-        # Initialize base case model
-        print("Initializing base case model...")
+        # Value every declared model run once (in parallel)
+        print("Running declared model inputs...")
+        self.valuations.declare(self.declared_inputs())
+        self.valuations.compute()
         base_scenario = get_scenario_presets()[ScenarioType.BASE_CASE]
         self.base_model = PriceVolumeModel(base_scenario)
-        self.base_analysis = self.base_model.run_full_analysis()
+        self.base_analysis = self.valuations.preset(ScenarioType.BASE_CASE)
         print("✓ Model initialized\n")
 
         # Run test categories
@@ -317,28 +357,8 @@ class ModelAuditor:
         base_fcf = self.base_analysis['consolidated']['FCF'].sum()
 
         # Test 10% volume reduction
-        from price_volume_model import VolumeScenario, ModelScenario
-        scenario = self.base_analysis['scenario']
-        vol_down = VolumeScenario(
-            name="Test", description="Test",
-            flat_rolled_volume_factor=0.9,
-            mini_mill_volume_factor=0.9,
-            usse_volume_factor=0.9,
-            tubular_volume_factor=0.9,
-            flat_rolled_growth_adj=0, mini_mill_growth_adj=0,
-            usse_growth_adj=0, tubular_growth_adj=0
-        )
-        test_scenario = ModelScenario(
-            name="Test", scenario_type=ScenarioType.CUSTOM, description="Test",
-            price_scenario=scenario.price_scenario, volume_scenario=vol_down,
-            uss_wacc=scenario.uss_wacc, terminal_growth=scenario.terminal_growth,
-            exit_multiple=scenario.exit_multiple, us_10yr=scenario.us_10yr,
-            japan_10yr=scenario.japan_10yr, nippon_equity_risk_premium=scenario.nippon_equity_risk_premium,
-            nippon_credit_spread=scenario.nippon_credit_spread, nippon_debt_ratio=scenario.nippon_debt_ratio,
-            nippon_tax_rate=scenario.nippon_tax_rate, include_projects=scenario.include_projects
-        )
-        test_model = PriceVolumeModel(test_scenario)
-        test_consolidated, _ = test_model.build_consolidated()
+        test_scenario = self._volume_down_scenario(self.base_analysis['scenario'])
+        test_consolidated = self.valuations.analysis(test_scenario)['consolidated']
         low_vol_fcf = test_consolidated['FCF'].sum()
 
         test.passed = low_vol_fcf < base_fcf
@@ -394,9 +414,7 @@ class ModelAuditor:
 
         # Test FI-02: NSA scenario triggers financing
         test = AuditTest("FI-02", "NSA scenario triggers financing impact", "Financing")
-        nsa_scenario = get_scenario_presets()[ScenarioType.NIPPON_COMMITMENTS]
-        nsa_model = PriceVolumeModel(nsa_scenario)
-        nsa_analysis = nsa_model.run_full_analysis()
+        nsa_analysis = self.valuations.preset(ScenarioType.NIPPON_COMMITMENTS, execution_factor=1.0)
         nsa_financing = nsa_analysis['financing_impact']
         test.passed = nsa_financing['financing_gap'] > 0
         test.notes = f"NSA financing gap: ${nsa_financing['financing_gap']:,.0f}M"
@@ -422,12 +440,10 @@ class ModelAuditor:
         # Test LC-15: Downside < Base < Optimistic
         test = AuditTest("LC-15", "Scenario valuations rank correctly", "Scenario")
 
-        from price_volume_model import compare_scenarios
-        comparison = compare_scenarios()
-
-        downside_val = comparison[comparison['Scenario'] == 'Downside (Weak Markets)']['Value to Nippon ($/sh)'].values[0]
-        base_val = comparison[comparison['Scenario'] == 'Base Case (Mid-Cycle)']['Value to Nippon ($/sh)'].values[0]
-        optimistic_val = comparison[comparison['Scenario'] == 'Optimistic (Sustained Growth)']['Value to Nippon ($/sh)'].values[0]
+        # Same runs as compare_scenarios(), looked up by preset rather than display name
+        downside_val = self.valuations.preset(ScenarioType.DOWNSIDE)['val_nippon']['share_price']
+        base_val = self.valuations.preset(ScenarioType.BASE_CASE)['val_nippon']['share_price']
+        optimistic_val = self.valuations.preset(ScenarioType.OPTIMISTIC)['val_nippon']['share_price']
 
         test.passed = downside_val < base_val < optimistic_val
         test.notes = f"Downside: ${downside_val:.2f} < Base: ${base_val:.2f} < Optimistic: ${optimistic_val:.2f}"
@@ -504,7 +520,7 @@ class ModelAuditor:
             'Notes': t.notes
         } for t in self.tests])
 
-        results_df.to_csv('audit_results.csv', index=False)
+        results_df.to_csv(AUDIT_DIR / 'audit_results.csv', index=False)
         print("Results exported to: audit_results.csv")
         print()
 
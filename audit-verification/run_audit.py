@@ -6,7 +6,13 @@ Master Audit Orchestration Script
 Runs the complete audit workflow:
 1. Automated tests (model_audit.py)
 2. Input verification (verify_inputs.py)
-3. Generates comprehensive report
+3. Source traceability audits (input_traceability/)
+4. Generates comprehensive report
+
+Every model run the audits declare is valued once on the shared valuation
+pool; input verification runs alongside in its own process and the Capital IQ
+tables are parsed into the parquet cache by a pool worker meanwhile, so the
+full audit is cheap enough to run on every data refresh.
 
 Usage:
     python run_audit.py              # Run all tests
@@ -21,9 +27,36 @@ Output:
 import argparse
 import sys
 import subprocess
+from concurrent.futures import CancelledError
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from audit_valuations import get_audit_valuations
+from model_audit import ModelAuditor
+from price_volume_model import get_valuation_pool, shutdown_valuation_pool
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# Capital IQ export directories read by the traceability audits
+CAPITAL_IQ_DIRS = [ROOT_DIR / "reference_materials", ROOT_DIR / "references"]
+
+EXPECTED_DOCS = [
+    'USS_10K_2023.pdf',
+    'USS_Proxy_2024.pdf',
+    'CME_HRC_Futures_2023.csv',
+    'USS_Q4_2023_Earnings_Deck.pdf',
+]
+
+
+def _prefetch_parsed_tables(data_dirs):
+    """Parse the Capital IQ tables of each directory into the parquet cache (pool worker)"""
+    from scripts.data_loader import get_shared_loader
+    return {d: get_shared_loader(d).build_parsed_cache() for d in data_dirs}
+
 
 class AuditOrchestrator:
     """Run complete audit workflow"""
@@ -33,6 +66,44 @@ class AuditOrchestrator:
         self.results_dir = self.audit_dir / "results"
         self.results_dir.mkdir(exist_ok=True)
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.valuations = get_audit_valuations()
+        self._verification = None
+        self._prefetch = None
+        self._prefetch_pool = None
+
+    def has_source_documents(self):
+        """True if any expected source document has been collected"""
+        evidence_dir = self.audit_dir / "evidence"
+        return any((evidence_dir / doc).exists() for doc in EXPECTED_DOCS)
+
+    def start_background_work(self, verify_inputs=True):
+        """Start the work that does not depend on model results
+
+        Input verification runs as its own process and a valuation pool
+        worker parses the Capital IQ exports, while the model runs.
+        """
+        if verify_inputs:
+            verify_script = self.audit_dir / "verification_scripts" / "verify_inputs.py"
+            try:
+                self._verification = subprocess.Popen(
+                    [sys.executable, str(verify_script)],
+                    cwd=self.audit_dir / "verification_scripts",
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True
+                )
+            except OSError as e:
+                print(f"⚠ Warning: Could not start input verification: {e}")
+
+        data_dirs = [str(d) for d in CAPITAL_IQ_DIRS if d.exists()]
+        if data_dirs and self.valuations.n_workers > 1:
+            pool = None
+            try:
+                pool = get_valuation_pool(self.valuations.n_workers)
+                self._prefetch = pool.submit(_prefetch_parsed_tables, data_dirs)
+                self._prefetch_pool = pool
+            except (BrokenProcessPool, OSError):
+                shutdown_valuation_pool(pool)
 
     def run_automated_tests(self):
         """Run automated test suite"""
@@ -40,21 +111,10 @@ class AuditOrchestrator:
         print("STEP 1: RUNNING AUTOMATED TESTS")
         print("=" * 80)
 
-        test_script = self.audit_dir / "model_audit.py"
-
         try:
-            result = subprocess.run(
-                [sys.executable, str(test_script)],
-                cwd=self.audit_dir,
-                capture_output=True,
-                text=True
-            )
-
-            print(result.stdout)
-            if result.stderr:
-                print("Errors:", result.stderr)
-
-            return result.returncode == 0
+            # Its declared runs (all presets) also cover the traceability audits
+            ModelAuditor(self.valuations).run_all_tests()
+            return True
 
         except Exception as e:
             print(f"✗ Error running automated tests: {e}")
@@ -69,16 +129,22 @@ class AuditOrchestrator:
         verify_script = self.audit_dir / "verification_scripts" / "verify_inputs.py"
 
         try:
-            result = subprocess.run(
-                [sys.executable, str(verify_script)],
-                cwd=self.audit_dir / "verification_scripts",
-                capture_output=True,
-                text=True
-            )
-
-            print(result.stdout)
-            if result.stderr:
-                print("Errors:", result.stderr)
+            if self._verification is not None:
+                # Started alongside the automated tests
+                stdout, stderr = self._verification.communicate()
+                self._verification = None
+            else:
+                result = subprocess.run(
+                    [sys.executable, str(verify_script)],
+                    cwd=self.audit_dir / "verification_scripts",
+                    capture_output=True,
+                    text=True
+                )
+                stdout, stderr = result.stdout, result.stderr
+
+            print(stdout)
+            if stderr:
+                print("Errors:", stderr)
 
             return True  # Return True even if no data filled (just report status)
 
@@ -128,22 +194,15 @@ class AuditOrchestrator:
         print("\nEvidence Documents Status:")
         print("-" * 60)
 
-        expected_docs = [
-            'USS_10K_2023.pdf',
-            'USS_Proxy_2024.pdf',
-            'CME_HRC_Futures_2023.csv',
-            'USS_Q4_2023_Earnings_Deck.pdf',
-        ]
-
         docs_found = 0
-        for doc in expected_docs:
+        for doc in EXPECTED_DOCS:
             path = evidence_dir / doc
             status = "✓ Downloaded" if path.exists() else "⚠ Missing"
             if path.exists():
                 docs_found += 1
             print(f"  {doc:<40} {status}")
 
-        print(f"\nDocuments collected: {docs_found}/{len(expected_docs)}")
+        print(f"\nDocuments collected: {docs_found}/{len(EXPECTED_DOCS)}")
 
         if docs_found == 0:
             print("\n⚠ No source documents found.")
@@ -152,6 +211,37 @@ class AuditOrchestrator:
 
         return docs_found > 0
 
+    def run_traceability_audits(self):
+        """Trace model inputs and outputs to the source documents
+
+        Reuses the model runs of the automated tests and reads the Capital IQ
+        tables from the parsed cache.
+        """
+        print("\n" + "=" * 80)
+        print("STEP 3: RUNNING SOURCE TRACEABILITY AUDITS")
+        print("=" * 80)
+
+        if self._prefetch is not None:
+            try:
+                self._prefetch.result()
+            except (BrokenProcessPool, CancelledError, OSError):
+                # Prefetch lost; the audits parse the tables themselves
+                shutdown_valuation_pool(self._prefetch_pool)
+            self._prefetch = None
+            self._prefetch_pool = None
+
+        from input_traceability.comprehensive_audit import ComprehensiveAudit
+        from input_traceability.input_traceability_audit import InputTraceabilityAudit
+
+        for name, run in [
+            ('Comprehensive audit', lambda: ComprehensiveAudit(self.valuations).run_full_audit()),
+            ('Input traceability audit', lambda: InputTraceabilityAudit().run_audit()),
+        ]:
+            try:
+                run()
+            except Exception as e:
+                print(f"⚠ Warning: {name} not completed: {e}")
+
     def generate_master_report(self):
         """Generate comprehensive audit report"""
         print("\n" + "=" * 80)
@@ -225,6 +315,9 @@ class AuditOrchestrator:
         print("MODEL AUDIT - COMPLETE WORKFLOW")
         print("=" * 80)
 
+        # Input verification and Capital IQ parsing run alongside the model
+        self.start_background_work(verify_inputs=not skip_manual and self.has_source_documents())
+
         # Step 1: Automated tests
         auto_success = self.run_automated_tests()
 
@@ -238,7 +331,11 @@ class AuditOrchestrator:
             print("\n⚠ Skipping input verification - no source data collected")
             print("  Run data_scraper.py and fill CSV templates to enable verification")
 
-        # Step 4: Generate master report
+        # Step 4: Source traceability audits
+        if not skip_manual:
+            self.run_traceability_audits()
+
+        # Step 5: Generate master report
         report_path = self.generate_master_report()
 
         # Final summary
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Model Instrumentation: Named Timers and Counters
+================================================
+
+Low-overhead timing of the model hot paths (segment projections,
+consolidation, financing, DCF, synergies, Monte Carlo sampling and worker
+batches). Hooks are no-ops unless profiling is enabled, so they stay in
+production code.
+
+Enable with the environment variable (also inherited by worker processes):
+
+    USS_MODEL_PROFILE=1 python scripts/run_monte_carlo_analysis.py
+    USS_MODEL_PROFILE=1 USS_MODEL_PROFILE_OUTPUT=mc.trace.json python ...
+
+or in code:
+
+    from instrumentation import profiling
+
+    with profiling() as prof:
+        MonteCarloEngine(n_simulations=1000).run_simulation()
+    print(prof.summary())
+    prof.to_chrome_trace('mc.trace.json')   # open in chrome://tracing or Perfetto
+
+Work done in pool workers is collected with run_profiled() and merged into
+the parent's profiler, so totals cover every process.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+PROFILE_ENV_VAR = 'USS_MODEL_PROFILE'
+PROFILE_OUTPUT_ENV_VAR = 'USS_MODEL_PROFILE_OUTPUT'
+
+# Individual timer events kept for the Chrome trace; aggregates are always complete
+MAX_TRACE_EVENTS = 200_000
+
+
+def _env_enabled() -> bool:
+    return os.environ.get(PROFILE_ENV_VAR, '').strip().lower() not in ('', '0', 'false', 'no', 'off')
+
+
+class Profiler:
+    """
+    Named timers and counters for one process
+
+    Timers keep count / total / min / max nanoseconds per name plus
+    individual (name, pid, tid, start, duration) events for tracing.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        """Drop all recorded timers, counters and events"""
+        self.timers: Dict[str, List[int]] = {}
+        self.counters: Dict[str, int] = {}
+        self.events: List[tuple] = []
+        self.dropped_events = 0
+
+    def record(self, name: str, start_ns: int, duration_ns: int):
+        """Add one timed call (perf_counter_ns start and duration)"""
+        stats = self.timers.get(name)
+        if stats is None:
+            self.timers[name] = [1, duration_ns, duration_ns, duration_ns]
+        else:
+            stats[0] += 1
+            stats[1] += duration_ns
+            if duration_ns < stats[2]:
+                stats[2] = duration_ns
+            if duration_ns > stats[3]:
+                stats[3] = duration_ns
+        if len(self.events) < MAX_TRACE_EVENTS:
+            self.events.append((name, os.getpid(), threading.get_ident(), start_ns, duration_ns))
+        else:
+            self.dropped_events += 1
+
+    def count(self, name: str, n: int = 1):
+        """Increment a named counter"""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self) -> Dict:
+        """Picklable copy of everything recorded (for merging across processes)"""
+        return {
+            'timers': {name: list(stats) for name, stats in self.timers.items()},
+            'counters': dict(self.counters),
+            'events': list(self.events),
+            'dropped_events': self.dropped_events,
+        }
+
+    def merge(self, snapshot: Optional[Dict]):
+        """Add a snapshot from another process (or profiler) into this one"""
+        if not snapshot:
+            return
+        for name, (n, total, low, high) in snapshot['timers'].items():
+            stats = self.timers.get(name)
+            if stats is None:
+                self.timers[name] = [n, total, low, high]
+            else:
+                stats[0] += n
+                stats[1] += total
+                stats[2] = min(stats[2], low)
+                stats[3] = max(stats[3], high)
+        for name, n in snapshot['counters'].items():
+            self.counters[name] = self.counters.get(name, 0) + n
+        room = MAX_TRACE_EVENTS - len(self.events)
+        self.events.extend(snapshot['events'][:room])
+        self.dropped_events += snapshot['dropped_events'] + max(0, len(snapshot['events']) - room)
+
+    def summary(self) -> pd.DataFrame:
+        """Timers as a DataFrame (ms), slowest total first"""
+        rows = [{
+            'timer': name, 'calls': n, 'total_ms': total / 1e6, 'mean_ms': total / n / 1e6,
+            'min_ms': low / 1e6, 'max_ms': high / 1e6,
+        } for name, (n, total, low, high) in self.timers.items()]
+        columns = ['timer', 'calls', 'total_ms', 'mean_ms', 'min_ms', 'max_ms']
+        return pd.DataFrame(rows, columns=columns).sort_values('total_ms', ascending=False, ignore_index=True)
+
+    def to_json(self, path: Optional[Path] = None) -> Dict:
+        """Timer aggregates and counters as a dict (written to path if given)"""
+        report = {
+            'timers': {row['timer']: {k: row[k] for k in ('calls', 'total_ms', 'mean_ms', 'min_ms', 'max_ms')}
+                       for row in self.summary().to_dict('records')},
+            'counters': dict(self.counters),
+            'processes': len({pid for _, pid, _, _, _ in self.events}),
+            'dropped_events': self.dropped_events,
+        }
+        if path is not None:
+            Path(path).write_text(json.dumps(report, indent=2))
+        return report
+
+    def to_chrome_trace(self, path: Optional[Path] = None) -> Dict:
+        """Timer events in Chrome trace format (chrome://tracing, Perfetto)"""
+        trace = [{
+            'name': name, 'cat': name.split('.')[0], 'ph': 'X',
+            'ts': start / 1e3, 'dur': duration / 1e3, 'pid': pid, 'tid': tid,
+        } for name, pid, tid, start, duration in self.events]
+        if self.counters:
+            end = max((e['ts'] + e['dur'] for e in trace), default=0.0)
+            trace.append({'name': 'counters', 'ph': 'C', 'ts': end, 'pid': os.getpid(),
+                          'args': dict(self.counters)})
+        report = {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+        if path is not None:
+            Path(path).write_text(json.dumps(report))
+        return report
+
+
+_profiler = Profiler(enabled=_env_enabled())
+
+
+def get_profiler() -> Profiler:
+    """The process-wide profiler the hooks record into"""
+    return _profiler
+
+
+@contextmanager
+def profiling(reset: bool = True):
+    """Enable profiling for a block; yields the profiler
+
+    Args:
+        reset: Start from empty timers and counters
+    """
+    was_enabled = _profiler.enabled
+    if reset:
+        _profiler.reset()
+    _profiler.enabled = True
+    try:
+        yield _profiler
+    finally:
+        _profiler.enabled = was_enabled
+
+
+# =============================================================================
+# HOOKS
+# =============================================================================
+
+class _Timer:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        _profiler.record(self.name, self.start, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timed(name: str):
+    """Context manager timing a block under `name` (no-op when profiling is off)"""
+    return _Timer(name) if _profiler.enabled else _NULL_TIMER
+
+
+def count(name: str, n: int = 1):
+    """Increment a named counter (no-op when profiling is off)"""
+    if _profiler.enabled:
+        _profiler.count(name, n)
+
+
+def profiled(name: str) -> Callable:
+    """Decorator timing every call of a function under `name`"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _profiler.record(name, start, time.perf_counter_ns() - start)
+        return wrapper
+    return decorate
+
+
+def run_profiled(fn: Callable, args, enabled: bool):
+    """Pool worker: run fn(args) with the parent's profiling state
+
+    Returns:
+        (result, snapshot) where snapshot holds what this call recorded
+        (None when profiling is off); merge it with get_profiler().merge().
+    """
+    if not enabled:
+        return fn(args), None
+    was_enabled = _profiler.enabled
+    _profiler.reset()
+    _profiler.enabled = True
+    try:
+        result = fn(args)
+        return result, _profiler.snapshot()
+    finally:
+        _profiler.reset()
+        _profiler.enabled = was_enabled
+
+
+def _write_env_output():
+    """Write the profile named by USS_MODEL_PROFILE_OUTPUT at exit (.trace.json = Chrome trace)"""
+    output = os.environ.get(PROFILE_OUTPUT_ENV_VAR)
+    if not output or not _profiler.timers:
+        return
+    if output.endswith('.trace.json'):
+        _profiler.to_chrome_trace(output)
+    else:
+        _profiler.to_json(output)
+
+
+if _profiler.enabled:
+    _main_pid = os.getpid()
+    # Only the process that enabled profiling writes the file, not forked workers
+    atexit.register(lambda: _write_env_output() if os.getpid() == _main_pid else None)
@@ -47,6 +47,7 @@ from price_volume_model import (
     WACC_MODULE_AVAILABLE, get_wacc_module_status,
     BLOOMBERG_AVAILABLE, get_bloomberg_status, get_benchmark_prices,
     SCENARIO_CALIBRATION_AVAILABLE, get_calibration_mode_status,
+    run_valuation_grid, preset_points, price_factor_points, exit_multiple_points,
 )
 
 # Optional: Import Bloomberg module for detailed status display
@@ -158,6 +159,12 @@ def create_scenario_hash(scenario, execution_factor, custom_benchmarks):
     return hashlib.md5(json.dumps(scenario_dict, sort_keys=True).encode()).hexdigest()
 
 
+def prob_weighted_cache_key(scenario_hash: str) -> str:
+    """Session key of the probability-weighted valuation for the current modes."""
+    return (f"prob_weighted_{scenario_hash}_{st.session_state.get('calibration_mode')}"
+            f"_{st.session_state.get('probability_mode')}")
+
+
 def render_calculation_button(
     section_name: str,
     button_label: str,
@@ -230,20 +237,44 @@ def load_historical_steel_prices():
 
 @st.cache_data
 def load_monte_carlo_data():
-    """Load Monte Carlo simulation results and inputs from CSV files."""
-    results_path = Path(__file__).parent / "data" / "monte_carlo_results.csv"
-    inputs_path = Path(__file__).parent / "data" / "monte_carlo_inputs.csv"
-    if not results_path.exists() or not inputs_path.exists():
-        return None
+    """Load Monte Carlo simulation results and inputs.
+
+    Reads the columnar result store (data/monte_carlo_results.parquet), both
+    frames indexed by iteration, and only the labelled input variables.
+    Falls back to the legacy CSV pair written by older runs.
+    """
+    from monte_carlo.result_store import DEFAULT_RESULT_STORE, read_results, read_inputs, store_columns
+
     try:
+        if DEFAULT_RESULT_STORE.exists():
+            input_cols = [c for c in store_columns(DEFAULT_RESULT_STORE)[1] if c in MC_VARIABLE_LABELS]
+            return read_results(DEFAULT_RESULT_STORE), read_inputs(DEFAULT_RESULT_STORE, columns=input_cols)
+
+        results_path = Path(__file__).parent / "data" / "monte_carlo_results.csv"
+        inputs_path = Path(__file__).parent / "data" / "monte_carlo_inputs.csv"
+        if not results_path.exists() or not inputs_path.exists():
+            return None
         results_df = pd.read_csv(results_path)
         inputs_df = pd.read_csv(inputs_path)
-        return results_df, inputs_df
+        return results_df.set_index('iteration').sort_index(), inputs_df
     except Exception as e:
         st.error(f"Error loading Monte Carlo data: {e}")
         return None
 
 
+@st.cache_data
+def load_monte_carlo_metadata():
+    """Provenance of the stored Monte Carlo run (empty for legacy CSV results)."""
+    from monte_carlo.result_store import DEFAULT_RESULT_STORE, read_metadata
+
+    if not DEFAULT_RESULT_STORE.exists():
+        return {}
+    try:
+        return read_metadata(DEFAULT_RESULT_STORE)
+    except Exception:
+        return {}
+
+
 # Human-readable labels for Monte Carlo input variables
 MC_VARIABLE_LABELS = {
     'hrc_price_factor': 'HRC US Price',
@@ -268,6 +299,9 @@ MC_VARIABLE_LABELS = {
     'flat_rolled_margin_factor': 'Flat Rolled Margin',
     'operating_synergy_factor': 'Operating Synergies',
     'revenue_synergy_factor': 'Revenue Synergies',
+    'technology_synergy_factor': 'Technology Synergies',
+    'synergy_ramp_delay': 'Synergy Ramp Delay',
+    'integration_cost_overrun': 'Integration Cost Overrun',
     'working_capital_efficiency': 'Working Capital Efficiency',
     'capex_intensity_factor': 'Capex Intensity',
     'tariff_probability': 'Tariff Probability',
@@ -1940,8 +1974,8 @@ def render_tab_valuation(ctx):
 
     if comparison_df is not None:
 
-        # Highlight the current scenario
-        comparison_df['Current'] = comparison_df['Scenario'] == scenario_name
+        # Highlight the current scenario (on a copy: the cached frame is reused by the export)
+        comparison_df = comparison_df.assign(Current=comparison_df['Scenario'] == scenario_name)
 
         # View toggle for USS vs Nippon perspective
         col_toggle, col_spacer = st.columns([1, 3])
@@ -2023,8 +2057,8 @@ def render_tab_valuation(ctx):
         **Total: 100%**
         """)
 
-    # Auto-calculate probability-weighted valuation (cached by scenario hash)
-    pw_cache_key = f"prob_weighted_{scenario_hash}"
+    # Auto-calculate probability-weighted valuation (cached by scenario hash and modes)
+    pw_cache_key = prob_weighted_cache_key(scenario_hash)
     if pw_cache_key not in st.session_state:
         try:
             st.session_state[pw_cache_key] = calculate_probability_weighted_valuation(
@@ -2126,95 +2160,53 @@ def render_tab_valuation(ctx):
         # Build football field data
         football_field_data = []
 
-        # Calculate total steps for progress tracking
         calibration_mode = st.session_state.get('calibration_mode')
         probability_mode = st.session_state.get('probability_mode')
         presets = get_scenario_presets(calibration_mode=calibration_mode, probability_mode=probability_mode)
-        price_test_count = 5  # Number of price sensitivity tests
-        wacc_test_count = 4  # Number of WACC tests
-        exit_test_count = 4  # Number of exit multiple tests
-        total_steps = len(presets) + price_test_count + wacc_test_count + exit_test_count
-        current_step = 0
+
+        # Declare the DCF sweeps as one grid: presets, steel prices (85% to 115% of
+        # benchmarks - realistic range) and exit multiples. Cached points return
+        # immediately; the rest run on the shared valuation worker pool.
+        ff_points = (
+            preset_points(presets, execution_factor=execution_factor)
+            + price_factor_points(scenario, [0.85, 0.95, 1.00, 1.05, 1.15])
+            + exit_multiple_points(scenario, [3.5, 4.5, 5.5, 6.5])
+        )
 
         # Create progress bar for football field
         progress_bar_ff = st.progress(0, text="Generating football field chart...")
 
-        # 1. Scenario-based ranges (use scenario comparison data)
-        scenario_values = []
-        for st_type, preset in presets.items():
-            current_step += 1
-            progress_pct = int((current_step / total_steps) * 100)
-            progress_bar_ff.progress(progress_pct, text=f"Calculating DCF scenario: {st_type.name} ({current_step}/{total_steps})")
-
-            ef = execution_factor if st_type == ScenarioType.NIPPON_COMMITMENTS else 1.0
-            temp_model = PriceVolumeModel(preset, execution_factor=ef, custom_benchmarks=custom_benchmarks)
-            temp_analysis = temp_model.run_full_analysis()
-            if ff_perspective == "Value to Nippon":
-                scenario_values.append(temp_analysis['val_nippon']['share_price'])
-            else:
-                scenario_values.append(temp_analysis['val_uss']['share_price'])
+        def _ff_progress(done, total, label):
+            progress_bar_ff.progress(int(done / total * 100), text=f"Valued {label} ({done}/{total})")
+
+        ff_grid = run_valuation_grid(ff_points, custom_benchmarks=custom_benchmarks,
+                                     progress_callback=_ff_progress)
+        ff_value_col = 'Value to Nippon ($/sh)' if ff_perspective == "Value to Nippon" else 'USS - No Sale ($/sh)'
+
+        def _ff_values(group):
+            return ff_grid.loc[ff_grid['Group'] == group, ff_value_col]
 
+        # 1. Scenario-based ranges
+        scenario_values = _ff_values('scenarios')
         football_field_data.append({
             'Method': 'DCF Scenarios',
-            'Low': min(scenario_values),
-            'High': max(scenario_values),
+            'Low': scenario_values.min(),
+            'High': scenario_values.max(),
             'Description': 'Low: Conservative (weak prices, 12% WACC) → High: Nippon Commitments ($14B CapEx, full synergies)'
         })
 
-        # 2. Steel Price Sensitivity (85% to 115% of benchmarks - realistic range)
-        price_sens_values = []
-        for pf in [0.85, 0.95, 1.00, 1.05, 1.15]:
-            current_step += 1
-            progress_pct = int((current_step / total_steps) * 100)
-            progress_bar_ff.progress(progress_pct, text=f"Testing steel price: {pf:.0%} of baseline ({current_step}/{total_steps})")
-
-            test_price_scenario = SteelPriceScenario(
-                name="Test", description="Test",
-                hrc_us_factor=pf, crc_us_factor=pf, coated_us_factor=pf,
-                hrc_eu_factor=pf, octg_factor=pf,
-                annual_price_growth=scenario.price_scenario.annual_price_growth
-            )
-            test_scenario = ModelScenario(
-                name="Test", scenario_type=ScenarioType.CUSTOM, description="Test",
-                price_scenario=test_price_scenario,
-                volume_scenario=scenario.volume_scenario,
-                uss_wacc=scenario.uss_wacc,
-                terminal_growth=scenario.terminal_growth,
-                exit_multiple=scenario.exit_multiple,
-                us_10yr=scenario.us_10yr,
-                japan_10yr=scenario.japan_10yr,
-                nippon_equity_risk_premium=scenario.nippon_equity_risk_premium,
-                nippon_credit_spread=scenario.nippon_credit_spread,
-                nippon_debt_ratio=scenario.nippon_debt_ratio,
-                nippon_tax_rate=scenario.nippon_tax_rate,
-                override_irp=scenario.override_irp,
-                manual_nippon_usd_wacc=scenario.manual_nippon_usd_wacc,
-                include_projects=scenario.include_projects
-            )
-            temp_model = PriceVolumeModel(test_scenario, custom_benchmarks=custom_benchmarks)
-            temp_analysis = temp_model.run_full_analysis()
-            if ff_perspective == "Value to Nippon":
-                price_sens_values.append(temp_analysis['val_nippon']['share_price'])
-            else:
-                price_sens_values.append(temp_analysis['val_uss']['share_price'])
-
+        # 2. Steel Price Sensitivity
+        price_sens_values = _ff_values('price')
         football_field_data.append({
             'Method': 'Steel Price Sensitivity',
-            'Low': min(price_sens_values),
-            'High': max(price_sens_values),
+            'Low': price_sens_values.min(),
+            'High': price_sens_values.max(),
             'Description': 'HRC $580-780/ton range (±15% from $680 benchmark). Steel prices are #1 value driver'
         })
 
-        # 3. WACC Sensitivity
-        wacc_sens_values = []
-        for w in [0.08, 0.10, 0.12, 0.14]:
-            current_step += 1
-            progress_pct = int((current_step / total_steps) * 100)
-            progress_bar_ff.progress(progress_pct, text=f"Testing WACC: {w:.1%} ({current_step}/{total_steps})")
-
-            test_val = model.calculate_dcf(consolidated, w)
-            wacc_sens_values.append(test_val['share_price'])
-
+        # 3. WACC Sensitivity (DCF only - reuses the current projection)
+        wacc_sens_values = [model.calculate_dcf(consolidated, w)['share_price']
+                            for w in [0.08, 0.10, 0.12, 0.14]]
         football_field_data.append({
             'Method': 'WACC Sensitivity',
             'Low': min(wacc_sens_values),
@@ -2223,40 +2215,11 @@ def render_tab_valuation(ctx):
         })
 
         # 4. Exit Multiple Sensitivity
-        exit_sens_values = []
-        for em in [3.5, 4.5, 5.5, 6.5]:
-            current_step += 1
-            progress_pct = int((current_step / total_steps) * 100)
-            progress_bar_ff.progress(progress_pct, text=f"Testing exit multiple: {em:.1f}x EBITDA ({current_step}/{total_steps})")
-
-            temp_scenario = ModelScenario(
-                name="Test", scenario_type=ScenarioType.CUSTOM, description="Test",
-                price_scenario=scenario.price_scenario,
-                volume_scenario=scenario.volume_scenario,
-                uss_wacc=scenario.uss_wacc,
-                terminal_growth=scenario.terminal_growth,
-                exit_multiple=em,
-                us_10yr=scenario.us_10yr,
-                japan_10yr=scenario.japan_10yr,
-                nippon_equity_risk_premium=scenario.nippon_equity_risk_premium,
-                nippon_credit_spread=scenario.nippon_credit_spread,
-                nippon_debt_ratio=scenario.nippon_debt_ratio,
-                nippon_tax_rate=scenario.nippon_tax_rate,
-                override_irp=scenario.override_irp,
-                manual_nippon_usd_wacc=scenario.manual_nippon_usd_wacc,
-                include_projects=scenario.include_projects
-            )
-            temp_model = PriceVolumeModel(temp_scenario, custom_benchmarks=custom_benchmarks)
-            temp_analysis = temp_model.run_full_analysis()
-            if ff_perspective == "Value to Nippon":
-                exit_sens_values.append(temp_analysis['val_nippon']['share_price'])
-            else:
-                exit_sens_values.append(temp_analysis['val_uss']['share_price'])
-
+        exit_sens_values = _ff_values('exit_multiple')
         football_field_data.append({
             'Method': 'Exit Multiple',
-            'Low': min(exit_sens_values),
-            'High': max(exit_sens_values),
+            'Low': exit_sens_values.min(),
+            'High': exit_sens_values.max(),
             'Description': '3.5x (trough) to 6.5x (peak) EV/EBITDA. Steel sector historical range 4-6x'
         })
 
@@ -3322,6 +3285,16 @@ def render_tab_risk(ctx):
         This replaces the previous correlation analysis which was based on only 3 data points.
         """)
 
+        mc_meta = load_monte_carlo_metadata()
+        if mc_meta:
+            st.caption(
+                f"Run {mc_meta.get('created', '?')}: seed {mc_meta.get('random_seed')}, "
+                f"{mc_meta.get('sampling_method', '?').upper()} sampling, "
+                f"calibration: {mc_meta.get('calibration_mode', '?')}, "
+                f"config hash {mc_meta.get('distributions_config_hash') or 'n/a'}, "
+                f"engine v{mc_meta.get('engine_version', '?')}"
+            )
+
         # =================================================================
         # SUMMARY STATISTICS
         # =================================================================
@@ -3530,7 +3503,7 @@ def render_tab_risk(ctx):
         ```
         python scripts/run_monte_carlo_analysis.py
         ```
-        This generates `data/monte_carlo_results.csv` and `data/monte_carlo_inputs.csv`.
+        This generates the result store `data/monte_carlo_results.parquet`.
         """)
 
 
@@ -3555,52 +3528,24 @@ def render_tab_risk(ctx):
 
     if st.button("Calculate Price Sensitivity", type="primary", key="btn_price_sens"):
         price_factors = np.arange(0.6, 1.5, 0.1)
-        sensitivity_data = []
-
-        for pf in price_factors:
-            test_price_scenario = SteelPriceScenario(
-                name="Test",
-                description="Test",
-                hrc_us_factor=pf,
-                crc_us_factor=pf,
-                coated_us_factor=pf,
-                hrc_eu_factor=pf,
-                octg_factor=pf,
-                annual_price_growth=scenario.price_scenario.annual_price_growth
-            )
-
-            test_scenario = ModelScenario(
-                name="Test",
-                scenario_type=ScenarioType.CUSTOM,
-                description="Test",
-                price_scenario=test_price_scenario,
-                volume_scenario=scenario.volume_scenario,
-                uss_wacc=scenario.uss_wacc,
-                terminal_growth=scenario.terminal_growth,
-                exit_multiple=scenario.exit_multiple,
-                us_10yr=scenario.us_10yr,
-                japan_10yr=scenario.japan_10yr,
-                nippon_equity_risk_premium=scenario.nippon_equity_risk_premium,
-                nippon_credit_spread=scenario.nippon_credit_spread,
-                nippon_debt_ratio=scenario.nippon_debt_ratio,
-                nippon_tax_rate=scenario.nippon_tax_rate,
-                override_irp=scenario.override_irp,
-                manual_nippon_usd_wacc=scenario.manual_nippon_usd_wacc,
-                include_projects=scenario.include_projects
-            )
-
-            test_model = PriceVolumeModel(test_scenario, custom_benchmarks=custom_benchmarks)
-            test_analysis = test_model.run_full_analysis()
-
-            sensitivity_data.append({
-                'Price Factor': f"{pf:.0%}",
-                'Price Factor Num': pf,
-                'Nippon Value': test_analysis['val_nippon']['share_price'],
-                'USS Value': test_analysis['val_uss']['share_price']
-            })
+        progress_bar_sens = st.progress(0, text="Calculating price sensitivity...")
+
+        def _sens_progress(done, total, label):
+            progress_bar_sens.progress(int(done / total * 100), text=f"Valued {label} prices ({done}/{total})")
+
+        sens_grid = run_valuation_grid(price_factor_points(scenario, price_factors),
+                                       custom_benchmarks=custom_benchmarks,
+                                       progress_callback=_sens_progress)
+        progress_bar_sens.empty()
+        sensitivity_data = pd.DataFrame({
+            'Price Factor': sens_grid['Label'],
+            'Price Factor Num': price_factors,
+            'Nippon Value': sens_grid['Value to Nippon ($/sh)'],
+            'USS Value': sens_grid['USS - No Sale ($/sh)'],
+        })
 
         st.session_state[sens_cache_key] = {
-            'sens_df': pd.DataFrame(sensitivity_data),
+            'sens_df': sensitivity_data,
             'timestamp': datetime.now(),
         }
 
@@ -4037,16 +3982,26 @@ def render_tab_risk(ctx):
 
     gc_df = st.session_state.get(granger_cache_key)
 
-    # Load decomposition for partial_r column
+    # Load decomposition (partial_r) and lag correlations from the demand feature store,
+    # falling back to the saved decomposition CSV when the source data is unavailable
     decomp_cache_key = "demand_decomp_loaded"
+    lag_corr_cache_key = "demand_lag_corr_loaded"
     if decomp_cache_key not in st.session_state:
         try:
-            from pathlib import Path as P
-            dp = P('audit-verification/demand_price_volume_decomposition.csv')
-            st.session_state[decomp_cache_key] = pd.read_csv(dp) if dp.exists() else None
+            from scripts.demand_driver_analysis import get_feature_store, decompose_price_volume
+            store = get_feature_store()
+            st.session_state[decomp_cache_key] = decompose_price_volume(store)
+            st.session_state[lag_corr_cache_key] = store.lag_correlations()
         except Exception:
-            st.session_state[decomp_cache_key] = None
+            try:
+                from pathlib import Path as P
+                dp = P('audit-verification/demand_price_volume_decomposition.csv')
+                st.session_state[decomp_cache_key] = pd.read_csv(dp) if dp.exists() else None
+            except Exception:
+                st.session_state[decomp_cache_key] = None
+            st.session_state[lag_corr_cache_key] = None
     decomp_df = st.session_state.get(decomp_cache_key)
+    lag_corr_df = st.session_state.get(lag_corr_cache_key)
 
     if gc_df is not None and len(gc_df) > 0:
         display_gc = gc_df[['indicator', 'lag', 'f_stat', 'f_pvalue', 'n']].copy()
@@ -4059,6 +4014,14 @@ def render_tab_risk(ctx):
                 lambda x: f"{x:.3f}" if pd.notna(x) else "N/A"
             )
 
+        # Strongest revenue correlation across lags 0-4Q
+        if lag_corr_df is not None and len(lag_corr_df) > 0:
+            best_lag = lag_corr_df.loc[lag_corr_df.groupby('indicator')['r_revenue'].apply(
+                lambda x: x.abs().idxmax())].set_index('indicator')
+            display_gc['Best Lag r'] = display_gc['Indicator'].map(best_lag['r_revenue']).apply(
+                lambda x: f"{x:.3f}" if pd.notna(x) else "N/A"
+            )
+
         display_gc['Significant'] = display_gc['p-value'].apply(
             lambda p: 'Yes (p<0.05)' if p < 0.05 else 'Marginal' if p < 0.10 else 'No'
         )
@@ -6431,32 +6394,53 @@ def main():
 
     export_type = st.sidebar.radio(
         "Export Type",
-        ["Current Scenario (Static)", "All Scenarios Comparison", "Interactive Model (Formulas)"],
-        help="Static exports values; Interactive exports working Excel formulas"
+        ["Current Scenario (Static)", "All Scenarios Comparison", "Interactive Model (Formulas)",
+         "Review Pack (Presets x Calibration Modes)"],
+        help="Static exports values; Interactive exports working Excel formulas; "
+             "the review pack zips one workbook per preset under every calibration mode"
     )
 
     if st.sidebar.button("Generate Excel Export", type="primary"):
-        from scripts.export_model import ModelExporter, FormulaModelExporter, get_export_filename
+        from scripts.export_model import (
+            ModelExporter, FormulaModelExporter, BatchModelExporter,
+            preset_calibration_points, get_export_filename
+        )
 
+        mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         with st.sidebar.spinner("Generating Excel file..."):
-            if export_type == "Interactive Model (Formulas)":
-                exporter = FormulaModelExporter(scenario, execution_factor, custom_benchmarks)
+            # Reuse the analysis and any scenario valuations already computed this session
+            if export_type == "Review Pack (Presets x Calibration Modes)":
+                pack_progress = st.sidebar.progress(0.0)
+                exporter = BatchModelExporter(preset_calibration_points(execution_factor=execution_factor),
+                                              custom_benchmarks=custom_benchmarks)
+                excel_bytes = exporter.export_zip(
+                    progress_callback=lambda done, total, label: pack_progress.progress(done / total))
+                pack_progress.empty()
+                filename = get_export_filename(scenario_name, "batch_zip")
+                mime = "application/zip"
+            elif export_type == "Interactive Model (Formulas)":
+                exporter = FormulaModelExporter(scenario, execution_factor, custom_benchmarks, analysis=analysis)
                 excel_bytes = exporter.export_with_formulas()
                 filename = get_export_filename(scenario_name, "formula")
             else:
-                exporter = ModelExporter(scenario, execution_factor, custom_benchmarks)
+                exporter = ModelExporter(scenario, execution_factor, custom_benchmarks, analysis=analysis)
                 if export_type == "Current Scenario (Static)":
                     excel_bytes = exporter.export_single_scenario()
                     filename = get_export_filename(scenario_name, "single")
                 else:
-                    excel_bytes = exporter.export_multi_scenario()
+                    excel_bytes = exporter.export_multi_scenario(
+                        comparison=st.session_state.get(f"scenario_comparison_{current_hash}"),
+                        pw_results=st.session_state.get(prob_weighted_cache_key(current_hash)),
+                        calibration_mode=st.session_state.get('calibration_mode'),
+                        probability_mode=st.session_state.get('probability_mode'),
+                    )
                     filename = get_export_filename(scenario_name, "multi")
 
             st.sidebar.download_button(
                 label="Download Excel File",
                 data=excel_bytes,
                 file_name=filename,
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                mime=mime
             )
 
 
@@ -1191,10 +1191,10 @@ def build_example_scenario() -> LBOScenario:
     """
 
     # Get conservative operating scenario from PriceVolumeModel
-    operating_scenario = get_scenario_presets()[ScenarioType.CONSERVATIVE]
-
     # Limit to maintenance CapEx only (PE cannot fund $14B program)
-    operating_scenario.include_projects = ['BR2 Mini Mill']  # Only committed project
+    operating_scenario = get_scenario_presets()[ScenarioType.CONSERVATIVE].with_overrides(
+        include_projects=['BR2 Mini Mill']  # Only committed project
+    )
 
     # Transaction inputs
     transaction = LBOTransactionInputs(
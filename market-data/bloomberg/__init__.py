@@ -80,6 +80,15 @@ from .monte_carlo_calibrator import (
     get_calibrated_correlation_matrix,
     calibrate_steel_price_distributions,
     export_for_monte_carlo_engine,
+    calibrate_correlation_matrix,
+)
+
+# Dynamic correlation calibration
+from .correlation_calibrator import (
+    CorrelationCalibrator,
+    PairwiseMoments,
+    get_correlation_calibrator,
+    REGIMES as CORRELATION_REGIMES,
 )
 
 # Price realization mapping
@@ -91,6 +100,14 @@ from .price_realization_mapper import (
     get_realization_summary,
     validate_realization_factors,
     USS_2023_REALIZED_PRICES,
+    BENCHMARK_KEYS,
+    SEGMENT_KEYS,
+    realization_matrix,
+    estimate_segment_realizations_batch,
+    forecast_realizations_with_change_batch,
+    quarterly_benchmark_prices,
+    load_quarterly_realized_prices,
+    validate_realization_history,
 )
 
 # Scenario calibration modes
@@ -101,6 +118,8 @@ from .scenario_calibrator import (
     get_all_scenarios_for_mode,
     get_scenario_names_for_mode,
     recalculate_bloomberg_factors,
+    get_calibrated_factor_sets,
+    get_calibration_data_version,
     get_mode_description,
     get_mode_short_description,
     compare_calibration_modes,
@@ -143,6 +162,11 @@ __all__ = [
     'get_calibrated_correlation_matrix',
     'calibrate_steel_price_distributions',
     'export_for_monte_carlo_engine',
+    'calibrate_correlation_matrix',
+    'CorrelationCalibrator',
+    'PairwiseMoments',
+    'get_correlation_calibrator',
+    'CORRELATION_REGIMES',
     # Price realization mapping
     'SegmentRealizationFactors',
     'DEFAULT_REALIZATION_FACTORS',
@@ -150,6 +174,14 @@ __all__ = [
     'forecast_realizations_with_change',
     'get_realization_summary',
     'validate_realization_factors',
+    'BENCHMARK_KEYS',
+    'SEGMENT_KEYS',
+    'realization_matrix',
+    'estimate_segment_realizations_batch',
+    'forecast_realizations_with_change_batch',
+    'quarterly_benchmark_prices',
+    'load_quarterly_realized_prices',
+    'validate_realization_history',
     'USS_2023_REALIZED_PRICES',
     # Scenario calibration modes
     'ScenarioCalibrationMode',
@@ -158,6 +190,8 @@ __all__ = [
     'get_all_scenarios_for_mode',
     'get_scenario_names_for_mode',
     'recalculate_bloomberg_factors',
+    'get_calibrated_factor_sets',
+    'get_calibration_data_version',
     'get_mode_description',
     'get_mode_short_description',
     'compare_calibration_modes',
@@ -15,6 +15,7 @@ Usage:
     status = service.get_status()
 """
 
+import hashlib
 import json
 import pandas as pd
 import numpy as np
@@ -116,6 +117,7 @@ class BloombergDataService:
         self._config: Dict = {}
         self._datasets: Dict[str, DatasetInfo] = {}
         self._load_timestamp: Optional[datetime] = None
+        self._data_version: Optional[str] = None
         self._enabled: bool = True
 
         # Load configuration and data
@@ -176,6 +178,19 @@ class BloombergDataService:
             self._load_dataset(key, cfg, data_dir, 'derived')
 
         self._load_timestamp = datetime.now()
+        self._data_version = self._compute_data_version()
+
+    def _compute_data_version(self) -> str:
+        """Hash of every dataset file's name, size and modification time"""
+        entries = []
+        for key in sorted(self._datasets):
+            path = Path(self._datasets[key].file_path)
+            try:
+                st = path.stat()
+                entries.append(f"{key}:{path.name}:{st.st_size}:{st.st_mtime_ns}")
+            except OSError:
+                entries.append(f"{key}:{path.name}:missing")
+        return hashlib.md5("|".join(entries).encode()).hexdigest()[:16]
 
     def _load_dataset(self, key: str, cfg: Dict, data_dir: Path, data_type: str) -> None:
         """Load a single dataset and calculate statistics"""
@@ -365,6 +380,18 @@ class BloombergDataService:
         self._datasets = {}
         self._load_all_data()
 
+    def get_dataset_keys(self, category: str) -> List[str]:
+        """Configured dataset keys in a config section (e.g. 'price_data')"""
+        return list(self._config.get(category, {}))
+
+    def get_data_version(self) -> Optional[str]:
+        """
+        Version tag of the loaded data (changes when any CSV is replaced)
+
+        Use as a cache key for anything derived from Bloomberg data.
+        """
+        return self._data_version
+
     def get_data_as_of_date(self) -> Optional[datetime]:
         """Get the most recent data date across price datasets"""
         dates = []
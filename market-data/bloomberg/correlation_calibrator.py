@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Correlation Calibrator
+======================
+
+Rolling, exponentially weighted and regime-conditional correlation
+matrices across every Bloomberg price, rate, macro and stock series.
+
+All series are aligned to month-end and converted to changes (log returns
+for prices, stocks and positive macro series; first differences for
+rates). Correlations are pairwise-complete, so series with different
+start dates still contribute wherever they overlap.
+
+Moments are kept as running sums (PairwiseMoments), so appending a new
+observation updates the full-sample, EWMA and rolling-window matrices in
+O(k^2) without recomputing from history.
+
+Usage:
+    from market_data.bloomberg.correlation_calibrator import get_correlation_calibrator
+
+    calibrator = get_correlation_calibrator()
+    calibrator.matrix('ewma')                       # latest EWMA correlations
+    calibrator.matrix('regime', regime='post_covid')
+    calibrator.engine_correlations('rolling')       # {var1: {var2: rho}} for MonteCarloEngine
+
+    calibrator.update(pd.Timestamp('2026-01-31'), {'hrc_us': 0.02, ...})
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .bloomberg_data_service import get_bloomberg_service, is_bloomberg_available
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Config sections included in the panel
+CORRELATION_CATEGORIES = ('price_data', 'rate_data', 'macro_data', 'stock_data')
+
+# Sections whose changes are first differences (yields/spreads in percent)
+DIFFERENCE_CATEGORIES = ('rate_data',)
+
+# Panel frequency: month-end, the coarsest common frequency (macro is monthly)
+DEFAULT_FREQUENCY = 'ME'
+
+DEFAULT_ROLLING_WINDOW = 36     # months
+DEFAULT_EWMA_HALFLIFE = 12      # months
+MIN_PAIR_OBS = 24               # overlapping observations for a usable pair
+
+# Regime sets: name -> {regime: (start, end)} with inclusive month-end bounds
+REGIMES = {
+    # Section 232 steel tariffs announced March 2018
+    'tariff': {
+        'no_tariff': (None, '2018-02-28'),
+        'tariff': ('2018-03-01', None),
+    },
+    'covid': {
+        'pre_covid': (None, '2020-02-29'),
+        'post_covid': ('2020-03-01', None),
+    },
+}
+
+# Bloomberg series -> MonteCarloEngine variables they drive
+ENGINE_VARIABLE_MAP = {
+    'hrc_us': ['hrc_price_factor'],
+    'crc_us': ['crc_price_factor', 'coated_price_factor'],   # coated tracks CRC
+    'octg_us': ['octg_price_factor'],
+    'hrc_eu': ['hrc_eu_factor'],
+    'ust_10y': ['us_10yr'],
+}
+
+# Calibrators kept per process (keyed by data version and settings)
+CALIBRATOR_CACHE_SIZE = 4
+
+
+# =============================================================================
+# INCREMENTAL MOMENTS
+# =============================================================================
+
+class PairwiseMoments:
+    """
+    Running pairwise-complete moment sums for k variables
+
+    For every pair (i, j) tracks, over observations where both are present:
+    weight W, sum of x_i, sum of x_i^2 and sum of x_i * x_j. Adding or
+    removing one observation is a handful of outer products, so windows
+    slide and EWMA decays without touching history.
+
+    Args:
+        n_vars: Number of variables
+        decay: EWMA decay per observation (None = equal weights)
+    """
+
+    def __init__(self, n_vars: int, decay: Optional[float] = None):
+        self.n_vars = n_vars
+        self.decay = decay
+        shape = (n_vars, n_vars)
+        self.weight = np.zeros(shape)
+        self.count = np.zeros(shape, dtype=int)
+        self.sum_x = np.zeros(shape)     # [i, j]: sum of x_i where i and j present
+        self.sum_xx = np.zeros(shape)    # [i, j]: sum of x_i^2 where i and j present
+        self.sum_xy = np.zeros(shape)    # [i, j]: sum of x_i * x_j
+
+    @classmethod
+    def from_panel(cls, values: np.ndarray, decay: Optional[float] = None) -> 'PairwiseMoments':
+        """Batch-build moments from a (T, k) array with NaN for missing"""
+        moments = cls(values.shape[1], decay)
+        if len(values) == 0:
+            return moments
+        present = ~np.isnan(values)
+        x = np.where(present, values, 0.0)
+        m = present.astype(float)
+        if decay is None:
+            w = np.ones(len(values))
+        else:
+            w = decay ** np.arange(len(values) - 1, -1, -1)
+        mw = m * w[:, None]
+        moments.weight = mw.T @ m
+        moments.count = (m.T @ m).astype(int)
+        moments.sum_x = (x * w[:, None]).T @ m
+        moments.sum_xx = (x * x * w[:, None]).T @ m
+        moments.sum_xy = (x * w[:, None]).T @ x
+        return moments
+
+    def _outer(self, row: np.ndarray) -> Tuple[np.ndarray, ...]:
+        present = ~np.isnan(row)
+        x = np.where(present, row, 0.0)
+        m = present.astype(float)
+        return m, np.outer(m, m), np.outer(x, m), np.outer(x * x, m), np.outer(x, x)
+
+    def add(self, row: np.ndarray) -> None:
+        """Add one observation (NaN = missing); older weights decay first"""
+        m, mm, xm, xxm, xx = self._outer(row)
+        if self.decay is not None:
+            for arr in (self.weight, self.sum_x, self.sum_xx, self.sum_xy):
+                arr *= self.decay
+        self.weight += mm
+        self.count += mm.astype(int)
+        self.sum_x += xm
+        self.sum_xx += xxm
+        self.sum_xy += xx
+
+    def remove(self, row: np.ndarray) -> None:
+        """Remove one previously added observation (equal weights only)"""
+        if self.decay is not None:
+            raise ValueError("Cannot remove observations from exponentially weighted moments")
+        m, mm, xm, xxm, xx = self._outer(row)
+        self.weight -= mm
+        self.count -= mm.astype(int)
+        self.sum_x -= xm
+        self.sum_xx -= xxm
+        self.sum_xy -= xx
+
+    def covariance(self, min_obs: int = MIN_PAIR_OBS) -> np.ndarray:
+        """Pairwise covariance (sample for equal weights, weighted otherwise)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cross = self.sum_xy - self.sum_x * self.sum_x.T / self.weight
+            denom = self.weight - 1 if self.decay is None else self.weight
+            cov = cross / denom
+        cov[self.count < max(min_obs, 2)] = np.nan
+        return cov
+
+    def correlation(self, min_obs: int = MIN_PAIR_OBS) -> np.ndarray:
+        """Pairwise correlation; NaN where a pair has fewer than min_obs overlaps"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cross = self.sum_xy - self.sum_x * self.sum_x.T / self.weight
+            var = self.sum_xx - self.sum_x ** 2 / self.weight
+            corr = cross / np.sqrt(var * var.T)
+        corr = np.clip(corr, -1.0, 1.0)
+        corr[self.count < max(min_obs, 2)] = np.nan
+        np.fill_diagonal(corr, np.where(np.diag(self.count) >= max(min_obs, 2), 1.0, np.nan))
+        return corr
+
+
+def ewma_decay(halflife: float) -> float:
+    """Per-observation decay for a given half-life"""
+    return 0.5 ** (1.0 / halflife)
+
+
+# =============================================================================
+# PANEL CONSTRUCTION
+# =============================================================================
+
+def _to_changes(levels: pd.Series, difference: bool) -> pd.Series:
+    """Log returns for positive series, first differences otherwise"""
+    if difference or (levels.dropna() <= 0).any():
+        return levels.diff()
+    return np.log(levels).diff()
+
+
+def build_change_panel(
+    service=None,
+    freq: str = DEFAULT_FREQUENCY,
+    categories: Tuple[str, ...] = CORRELATION_CATEGORIES,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> pd.DataFrame:
+    """
+    Month-end change panel for every configured date/value series
+
+    Args:
+        service: BloombergDataService (default: singleton)
+        freq: Resampling frequency
+        categories: Config sections to include
+        start_date, end_date: Optional bounds on the panel dates
+
+    Returns:
+        DataFrame indexed by period end, one column per series (NaN = missing)
+    """
+    service = service or get_bloomberg_service()
+    columns = {}
+    for category in categories:
+        difference = category in DIFFERENCE_CATEGORIES
+        for key in service.get_dataset_keys(category):
+            df = service.get_historical_prices(key)
+            if df is None or not {'date', 'value'} <= set(df.columns):
+                continue
+            levels = df.set_index('date')['value'].astype(float).resample(freq).last()
+            columns[key] = _to_changes(levels, difference)
+
+    panel = pd.DataFrame(columns).dropna(how='all')
+    if start_date is not None:
+        panel = panel[panel.index >= pd.Timestamp(start_date)]
+    if end_date is not None:
+        panel = panel[panel.index <= pd.Timestamp(end_date)]
+    return panel
+
+
+def regime_mask(dates: pd.DatetimeIndex, bounds: Tuple[Optional[str], Optional[str]]) -> np.ndarray:
+    """Boolean mask of dates inside inclusive (start, end) bounds"""
+    start, end = bounds
+    mask = np.ones(len(dates), dtype=bool)
+    if start is not None:
+        mask &= dates >= pd.Timestamp(start)
+    if end is not None:
+        mask &= dates <= pd.Timestamp(end)
+    return mask
+
+
+# =============================================================================
+# CALIBRATOR
+# =============================================================================
+
+class CorrelationCalibrator:
+    """
+    Full-sample, rolling, EWMA and regime-conditional correlations
+
+    Attributes:
+        names: Series names (matrix order)
+        dates: Observation dates
+        window: Rolling window length (observations)
+        halflife: EWMA half-life (observations)
+    """
+
+    METHODS = ('full', 'rolling', 'ewma', 'regime')
+
+    def __init__(
+        self,
+        panel: pd.DataFrame,
+        window: int = DEFAULT_ROLLING_WINDOW,
+        halflife: float = DEFAULT_EWMA_HALFLIFE,
+        min_obs: int = MIN_PAIR_OBS
+    ):
+        self.names: List[str] = list(panel.columns)
+        self.dates = pd.DatetimeIndex(panel.index)
+        self.window = window
+        self.halflife = halflife
+        self.min_obs = min_obs
+        self._values = panel.to_numpy(dtype=float)
+
+        self.full = PairwiseMoments.from_panel(self._values)
+        self.ewma = PairwiseMoments.from_panel(self._values, decay=ewma_decay(halflife))
+        self.rolling = PairwiseMoments.from_panel(self._values[-window:])
+
+    @classmethod
+    def from_service(cls, service=None, freq: str = DEFAULT_FREQUENCY, **kwargs) -> 'CorrelationCalibrator':
+        """Build from the Bloomberg service's loaded series"""
+        return cls(build_change_panel(service, freq), **kwargs)
+
+    @property
+    def panel(self) -> pd.DataFrame:
+        """Change panel as a DataFrame"""
+        return pd.DataFrame(self._values, index=self.dates, columns=self.names)
+
+    def update(self, date, changes: Dict[str, float]) -> None:
+        """
+        Append one observation and update all running moments
+
+        Args:
+            date: Observation date (must follow the last date)
+            changes: Series name -> change for this period (missing = NaN)
+        """
+        date = pd.Timestamp(date)
+        if len(self.dates) and date <= self.dates[-1]:
+            raise ValueError(f"Observation {date.date()} does not follow {self.dates[-1].date()}")
+        row = np.array([changes.get(name, np.nan) for name in self.names], dtype=float)
+
+        self.full.add(row)
+        self.ewma.add(row)
+        self.rolling.add(row)
+        if len(self._values) >= self.window:
+            self.rolling.remove(self._values[len(self._values) - self.window])
+
+        self._values = np.vstack([self._values, row])
+        self.dates = self.dates.append(pd.DatetimeIndex([date]))
+
+    # -------------------------------------------------------------------------
+    # Matrices
+    # -------------------------------------------------------------------------
+
+    def _frame(self, corr: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(corr, index=self.names, columns=self.names)
+
+    def regime_moments(self, regime: str) -> PairwiseMoments:
+        """Moments restricted to one regime (e.g. 'tariff', 'post_covid')"""
+        for regimes in REGIMES.values():
+            if regime in regimes:
+                mask = regime_mask(self.dates, regimes[regime])
+                return PairwiseMoments.from_panel(self._values[mask])
+        raise ValueError(f"Unknown regime: {regime}")
+
+    def matrix(self, method: str = 'full', regime: Optional[str] = None) -> pd.DataFrame:
+        """
+        Correlation matrix by method
+
+        Args:
+            method: 'full', 'rolling' (latest window), 'ewma' or 'regime'
+            regime: Regime name when method='regime'
+
+        Returns:
+            DataFrame (NaN where a pair lacks min_obs overlapping observations)
+        """
+        if method == 'full':
+            moments = self.full
+        elif method == 'rolling':
+            moments = self.rolling
+        elif method == 'ewma':
+            moments = self.ewma
+        elif method == 'regime':
+            if regime is None:
+                raise ValueError("method='regime' requires a regime name")
+            moments = self.regime_moments(regime)
+        else:
+            raise ValueError(f"Unknown method: {method}. Use one of {self.METHODS}")
+        return self._frame(moments.correlation(self.min_obs))
+
+    def regime_matrices(self, regime_set: str) -> Dict[str, pd.DataFrame]:
+        """Correlation matrix for each regime in a set ('tariff' or 'covid')"""
+        if regime_set not in REGIMES:
+            raise ValueError(f"Unknown regime set: {regime_set}. Use one of {list(REGIMES)}")
+        return {regime: self.matrix('regime', regime) for regime in REGIMES[regime_set]}
+
+    def rolling_history(self, window: Optional[int] = None) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+        """
+        Rolling-window correlation for every window end
+
+        Slides one PairwiseMoments through the panel (one add and one remove
+        per step).
+
+        Returns:
+            (window end dates, array of shape (n_windows, k, k))
+        """
+        window = window or self.window
+        moments = PairwiseMoments(len(self.names))
+        history = []
+        for t, row in enumerate(self._values):
+            moments.add(row)
+            if t >= window:
+                moments.remove(self._values[t - window])
+            if t >= window - 1:
+                history.append(moments.correlation(self.min_obs))
+        ends = self.dates[window - 1:] if len(self.dates) >= window else self.dates[:0]
+        return ends, np.array(history).reshape(len(history), len(self.names), len(self.names))
+
+    def engine_correlations(
+        self,
+        method: str = 'full',
+        regime: Optional[str] = None,
+        variable_map: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Correlations in MonteCarloEngine format {var1: {var2: rho}}
+
+        Series are mapped to engine variables with ENGINE_VARIABLE_MAP;
+        pairs without enough overlap are omitted. Variables driven by the
+        same series (e.g. CRC and coated) are also omitted, so the engine
+        keeps its configured correlation instead of a degenerate 1.0.
+        """
+        variable_map = variable_map or ENGINE_VARIABLE_MAP
+        corr = self.matrix(method, regime)
+        result: Dict[str, Dict[str, float]] = {}
+        series = [s for s in variable_map if s in corr.index]
+        for a_idx, a in enumerate(series):
+            for b in series[a_idx + 1:]:
+                rho = corr.loc[a, b]
+                if np.isnan(rho):
+                    continue
+                for var_a in variable_map[a]:
+                    for var_b in variable_map[b]:
+                        result.setdefault(var_a, {})[var_b] = round(float(rho), 4)
+        return result
+
+
+# =============================================================================
+# CACHED ACCESSOR
+# =============================================================================
+
+_calibrator_cache: 'OrderedDict[tuple, CorrelationCalibrator]' = OrderedDict()
+
+
+def get_correlation_calibrator(
+    window: int = DEFAULT_ROLLING_WINDOW,
+    halflife: float = DEFAULT_EWMA_HALFLIFE,
+    freq: str = DEFAULT_FREQUENCY
+) -> Optional[CorrelationCalibrator]:
+    """
+    Calibrator for the current Bloomberg data, cached by data version
+
+    Returns:
+        CorrelationCalibrator, or None if Bloomberg data is unavailable
+    """
+    if not is_bloomberg_available():
+        return None
+    service = get_bloomberg_service()
+    if not service.is_available():
+        return None
+
+    key = (service.get_data_version(), window, halflife, freq)
+    calibrator = _calibrator_cache.get(key)
+    if calibrator is None:
+        calibrator = CorrelationCalibrator.from_service(service, freq, window=window, halflife=halflife)
+        _calibrator_cache[key] = calibrator
+        if len(_calibrator_cache) > CALIBRATOR_CACHE_SIZE:
+            _calibrator_cache.popitem(last=False)
+    else:
+        _calibrator_cache.move_to_end(key)
+    return calibrator
+
+
+def clear_correlation_calibrator_cache() -> None:
+    """Drop cached calibrators (e.g. after appending observations in tests)"""
+    _calibrator_cache.clear()
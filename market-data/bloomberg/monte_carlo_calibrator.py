@@ -25,6 +25,7 @@ from dataclasses import dataclass, field
 from scipy import stats
 
 from .bloomberg_data_service import get_bloomberg_service, is_bloomberg_available
+from .correlation_calibrator import get_correlation_calibrator, REGIMES
 
 
 @dataclass
@@ -223,14 +224,22 @@ def get_calibrated_correlation_matrix() -> Optional[pd.DataFrame]:
         return None
 
 
-def calibrate_correlation_matrix(period_years: int = 5) -> Optional[pd.DataFrame]:
+def calibrate_correlation_matrix(
+    period_years: int = 5,
+    method: str = 'precomputed',
+    regime: Optional[str] = None
+) -> Optional[pd.DataFrame]:
     """
     Calculate correlation matrix from aligned time series.
 
     Computes correlations between price series and other variables.
 
     Args:
-        period_years: Number of years of history to use
+        period_years: Number of years of history to use ('precomputed' only)
+        method: 'precomputed' (static matrix, else weekly price returns) or a
+                CorrelationCalibrator method over all price, rate, macro and
+                stock series: 'full', 'rolling', 'ewma', 'regime'
+        regime: Regime name for method='regime' (e.g. 'tariff', 'post_covid')
 
     Returns:
         DataFrame with correlation matrix, or None if calculation fails.
@@ -243,6 +252,10 @@ def calibrate_correlation_matrix(period_years: int = 5) -> Optional[pd.DataFrame
         if not service.is_available():
             return None
 
+        if method != 'precomputed':
+            calibrator = get_correlation_calibrator()
+            return calibrator.matrix(method, regime) if calibrator else None
+
         # Try to use pre-computed matrix first
         precomputed = service.get_correlation_matrix()
         if precomputed is not None:
@@ -352,12 +365,27 @@ def export_for_monte_carlo_engine() -> Optional[Dict[str, Any]]:
         # Get correlation matrix
         corr_matrix = get_calibrated_correlation_matrix()
 
+        # Dynamic correlations in engine format ({var1: {var2: rho}})
+        calibrator = get_correlation_calibrator()
+        engine_correlations = None
+        if calibrator is not None:
+            engine_correlations = {
+                'full': calibrator.engine_correlations('full'),
+                'rolling': calibrator.engine_correlations('rolling'),
+                'ewma': calibrator.engine_correlations('ewma'),
+                'regimes': {
+                    regime: calibrator.engine_correlations('regime', regime)
+                    for regimes in REGIMES.values() for regime in regimes
+                },
+            }
+
         # Build export package
         export = {
             'calibration_date': datetime.now().isoformat(),
             'data_as_of': service.get_data_as_of_date().isoformat() if service.get_data_as_of_date() else None,
             'distributions': {},
             'correlation_matrix': None,
+            'engine_correlations': engine_correlations,
             'metadata': {
                 'source': 'Bloomberg via market-data/bloomberg',
                 'period_years': 5,
@@ -27,10 +27,23 @@ Usage:
                   'hrc_eu': 717, 'octg': 2750}
     realizations = estimate_segment_realizations(benchmarks)
     # Returns: {'flat_rolled': 1030, 'mini_mill': 879, 'usse': 874, 'tubular': 3135}
+
+    # Batch: every row of a price matrix / history at once
+    realized = estimate_segment_realizations_batch(history_df)   # DataFrame in, DataFrame out
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .bloomberg_data_service import get_bloomberg_service, is_bloomberg_available
+except ImportError:
+    # For standalone execution
+    from bloomberg_data_service import get_bloomberg_service, is_bloomberg_available
 
 
 @dataclass
@@ -74,6 +87,179 @@ class SegmentRealizationFactors:
 # Default factors based on 2023 calibration
 DEFAULT_REALIZATION_FACTORS = SegmentRealizationFactors()
 
+# Column order of price matrices and realization results
+BENCHMARK_KEYS = ('hrc_us', 'crc_us', 'coated_us', 'hrc_eu', 'octg')
+SEGMENT_KEYS = ('flat_rolled', 'mini_mill', 'usse', 'tubular')
+
+# Bloomberg series behind each benchmark (coated is derived from CRC)
+BLOOMBERG_BENCHMARK_SERIES = {'hrc_us': 'hrc_us', 'crc_us': 'crc_us', 'hrc_eu': 'hrc_eu', 'octg': 'octg_us'}
+COATED_PREMIUM_TO_CRC = 1.12
+
+# Quarterly realized prices available in the repo
+MINI_MILL_QUARTERLY_FILE = Path(__file__).parent.parent.parent / 'data' / 'mini_mill_quarterly.csv'
+
+PriceInput = Union[np.ndarray, pd.DataFrame]
+
+
+# =============================================================================
+# BATCH API
+# =============================================================================
+# Every mapping is linear in benchmark prices, so realized prices for N rows
+# are one (N x benchmarks) @ (benchmarks x segments) product.
+
+def benchmark_keys(factors: Optional[SegmentRealizationFactors] = None) -> List[str]:
+    """Benchmarks used by a factor set, BENCHMARK_KEYS first"""
+    f = factors or DEFAULT_REALIZATION_FACTORS
+    keys = list(BENCHMARK_KEYS)
+    for key in [*f.flat_rolled_weights, f.mini_mill_benchmark, f.usse_benchmark, f.tubular_benchmark]:
+        if key not in keys:
+            keys.append(key)
+    return keys
+
+
+def realization_matrix(
+    factors: Optional[SegmentRealizationFactors] = None,
+    benchmarks: Optional[List[str]] = None
+) -> np.ndarray:
+    """
+    Linear map from benchmark prices to segment realized prices
+
+    Args:
+        factors: Realization factors (uses defaults if None)
+        benchmarks: Row order (default: benchmark_keys(factors))
+
+    Returns:
+        Array (len(benchmarks), 4) with columns in SEGMENT_KEYS order
+    """
+    f = factors or DEFAULT_REALIZATION_FACTORS
+    benchmarks = list(benchmarks or benchmark_keys(f))
+    index = {key: i for i, key in enumerate(benchmarks)}
+    matrix = np.zeros((len(benchmarks), len(SEGMENT_KEYS)))
+
+    for key, weight in f.flat_rolled_weights.items():
+        if key in index:
+            matrix[index[key], 0] += weight * f.flat_rolled_adjustment
+    single = [
+        (f.mini_mill_benchmark, f.mini_mill_factor),
+        (f.usse_benchmark, f.usse_factor),
+        (f.tubular_benchmark, f.tubular_factor),
+    ]
+    for col, (key, factor) in enumerate(single, start=1):
+        if key in index:
+            matrix[index[key], col] += factor
+    return matrix
+
+
+def estimate_segment_realizations_batch(
+    prices: PriceInput,
+    factors: Optional[SegmentRealizationFactors] = None,
+    benchmarks: Optional[List[str]] = None
+) -> PriceInput:
+    """
+    Segment realized prices for every row of a benchmark price matrix.
+
+    Args:
+        prices: (N, n_benchmarks) array with columns in `benchmarks` order
+                (default BENCHMARK_KEYS), or a DataFrame with benchmark
+                columns (missing columns count as 0, as in the dict API)
+        factors: Realization factors (uses defaults if None)
+        benchmarks: Column order of an array input
+
+    Returns:
+        (N, 4) array in SEGMENT_KEYS order, or a DataFrame with segment
+        columns on the input index
+    """
+    if isinstance(prices, pd.DataFrame):
+        keys = benchmark_keys(factors)
+        values = prices.reindex(columns=keys, fill_value=0.0).to_numpy(dtype=float)
+        return pd.DataFrame(values @ realization_matrix(factors, keys),
+                            index=prices.index, columns=list(SEGMENT_KEYS))
+
+    keys = list(benchmarks or BENCHMARK_KEYS)
+    return np.asarray(prices, dtype=float) @ realization_matrix(factors, keys)
+
+
+def forecast_realizations_with_change_batch(
+    base_benchmarks: Union[Dict[str, float], PriceInput],
+    price_change_pct: PriceInput,
+    factors: Optional[SegmentRealizationFactors] = None,
+    benchmarks: Optional[List[str]] = None
+) -> PriceInput:
+    """
+    Segment realizations for many sets of benchmark % changes at once.
+
+    Args:
+        base_benchmarks: Baseline prices: dict, (n_benchmarks,) or
+                         (N, n_benchmarks) array, or DataFrame
+        price_change_pct: (N, n_benchmarks) array of changes, or a DataFrame
+                          with benchmark columns (e.g. MC price paths)
+        factors: Realization factors
+        benchmarks: Column order of array inputs (default BENCHMARK_KEYS)
+
+    Returns:
+        Realized prices in the same form as estimate_segment_realizations_batch
+    """
+    if isinstance(price_change_pct, pd.DataFrame):
+        keys = benchmark_keys(factors)
+        changes = price_change_pct.reindex(columns=keys, fill_value=0.0)
+        if isinstance(base_benchmarks, pd.DataFrame):
+            base = base_benchmarks.reindex(index=changes.index, columns=keys, fill_value=0.0)
+        else:
+            base = pd.Series(base_benchmarks, dtype=float).reindex(keys, fill_value=0.0)
+        return estimate_segment_realizations_batch(base * (1 + changes), factors)
+
+    keys = list(benchmarks or BENCHMARK_KEYS)
+    if isinstance(base_benchmarks, dict):
+        base = np.array([base_benchmarks.get(k, 0.0) for k in keys], dtype=float)
+    else:
+        base = np.asarray(base_benchmarks, dtype=float)
+    forecast = base * (1 + np.asarray(price_change_pct, dtype=float))
+    return estimate_segment_realizations_batch(forecast, factors, keys)
+
+
+def quarterly_benchmark_prices(service=None) -> Optional[pd.DataFrame]:
+    """
+    Quarterly average benchmark prices from Bloomberg history.
+
+    Returns:
+        DataFrame indexed by quarter-end with BENCHMARK_KEYS columns, or
+        None if Bloomberg data is unavailable
+    """
+    if service is None:
+        if not is_bloomberg_available():
+            return None
+        service = get_bloomberg_service()
+        if not service.is_available():
+            return None
+
+    columns = {}
+    for key, series in BLOOMBERG_BENCHMARK_SERIES.items():
+        df = service.get_historical_prices(series)
+        if df is not None and len(df):
+            columns[key] = df.set_index('date')['value'].resample('QE').mean()
+    if not columns:
+        return None
+
+    quarterly = pd.DataFrame(columns)
+    if 'crc_us' in quarterly:
+        quarterly['coated_us'] = quarterly['crc_us'] * COATED_PREMIUM_TO_CRC
+    return quarterly.reindex(columns=[k for k in BENCHMARK_KEYS if k in quarterly.columns])
+
+
+def load_quarterly_realized_prices(path: Path = MINI_MILL_QUARTERLY_FILE) -> Optional[pd.DataFrame]:
+    """
+    Quarterly segment realized prices on the repo (Mini Mill, 2021Q1 onward).
+
+    Returns:
+        DataFrame indexed by quarter-end with segment columns, or None
+    """
+    if not path.exists():
+        return None
+    df = pd.read_csv(path)
+    index = pd.PeriodIndex.from_fields(year=df['year'], quarter=df['quarter'], freq='Q').to_timestamp(how='end')
+    return pd.DataFrame({'mini_mill': df['realized_price'].to_numpy(dtype=float)},
+                        index=index.normalize())
+
 
 def estimate_segment_realizations(
     benchmark_prices: Dict[str, float],
@@ -96,30 +282,10 @@ def estimate_segment_realizations(
         >>> print(f"Flat-Rolled: ${realizations['flat_rolled']:.0f}/ton")
         Flat-Rolled: $1030/ton
     """
-    f = factors or DEFAULT_REALIZATION_FACTORS
-
-    # Flat-Rolled: weighted average of US products
-    flat_rolled_base = sum(
-        benchmark_prices.get(k, 0) * w
-        for k, w in f.flat_rolled_weights.items()
-    )
-    flat_rolled = flat_rolled_base * f.flat_rolled_adjustment
-
-    # Mini Mill: direct mapping from HRC
-    mini_mill = benchmark_prices.get(f.mini_mill_benchmark, 0) * f.mini_mill_factor
-
-    # USSE: EU HRC with premium
-    usse = benchmark_prices.get(f.usse_benchmark, 0) * f.usse_factor
-
-    # Tubular: OCTG with premium
-    tubular = benchmark_prices.get(f.tubular_benchmark, 0) * f.tubular_factor
-
-    return {
-        'flat_rolled': flat_rolled,
-        'mini_mill': mini_mill,
-        'usse': usse,
-        'tubular': tubular,
-    }
+    keys = benchmark_keys(factors)
+    row = np.array([benchmark_prices.get(k, 0) for k in keys], dtype=float)
+    realized = estimate_segment_realizations_batch(row, factors, keys)
+    return dict(zip(SEGMENT_KEYS, realized.tolist()))
 
 
 def forecast_realizations_with_change(
@@ -207,46 +373,108 @@ def get_realization_summary(
 
 
 def validate_realization_factors(
-    benchmark_prices: Dict[str, float],
-    actual_realizations: Dict[str, float],
+    benchmark_prices: Union[Dict[str, float], pd.DataFrame],
+    actual_realizations: Union[Dict[str, float], pd.DataFrame],
     factors: Optional[SegmentRealizationFactors] = None
 ) -> Dict[str, Dict[str, float]]:
     """
     Compare estimated realizations to actual values for factor validation.
 
+    Accepts one period (dicts) or a history: DataFrames indexed by period
+    with benchmark columns and segment realized-price columns. Both go
+    through estimate_segment_realizations_batch; only periods with an
+    actual value for a segment are scored.
+
     Args:
         benchmark_prices: Benchmark prices (e.g., 2023 annual averages)
         actual_realizations: Actual realized prices from 10-K
         factors: Factors to validate
 
     Returns:
-        Dict with validation metrics for each segment
+        Dict with validation metrics for each segment. estimated / actual /
+        error / error_pct are means over the scored periods; mape, rmse and
+        within_5pct_share summarise the whole history.
 
     Example:
         >>> benchmarks = {'hrc_us': 916, 'crc_us': 1127, ...}
         >>> actuals = {'flat_rolled': 1030, 'mini_mill': 875, ...}
         >>> validation = validate_realization_factors(benchmarks, actuals)
     """
-    estimated = estimate_segment_realizations(benchmark_prices, factors)
+    if isinstance(benchmark_prices, dict):
+        benchmark_prices = pd.DataFrame([benchmark_prices])
+        actual_realizations = pd.DataFrame([actual_realizations])
 
-    validation = {}
-    for segment in estimated.keys():
-        est = estimated.get(segment, 0)
-        actual = actual_realizations.get(segment, 0)
-        error = est - actual if actual else 0
-        error_pct = (error / actual * 100) if actual else 0
+    estimated = estimate_segment_realizations_batch(benchmark_prices, factors)
+    actual = actual_realizations.reindex(index=estimated.index, columns=estimated.columns)
 
+    est = estimated.to_numpy()
+    act = actual.to_numpy(dtype=float)
+    scored = ~np.isnan(act) & (act != 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        error = np.where(scored, est - act, np.nan)
+        error_pct = error / act * 100
+
+    validation = {}
+    for col, segment in enumerate(SEGMENT_KEYS):
+        mask = scored[:, col]
+        n = int(mask.sum())
+        if n == 0:
+            # No actual to compare against: report the estimate, zero error
+            validation[segment] = {
+                'estimated': float(np.nanmean(est[:, col])),
+                'actual': 0,
+                'error': 0,
+                'error_pct': 0,
+                'within_5pct': True,
+                'n_periods': 0,
+                'mape': 0.0,
+                'rmse': 0.0,
+                'within_5pct_share': 1.0,
+            }
+            continue
+
+        seg_pct = error_pct[mask, col]
+        mean_pct = float(seg_pct.mean())
         validation[segment] = {
-            'estimated': est,
-            'actual': actual,
-            'error': error,
-            'error_pct': error_pct,
-            'within_5pct': abs(error_pct) <= 5,
+            'estimated': float(est[mask, col].mean()),
+            'actual': float(act[mask, col].mean()),
+            'error': float(error[mask, col].mean()),
+            'error_pct': mean_pct,
+            'within_5pct': abs(mean_pct) <= 5,
+            'n_periods': n,
+            'mape': float(np.abs(seg_pct).mean()),
+            'rmse': float(np.sqrt((error[mask, col] ** 2).mean())),
+            'within_5pct_share': float((np.abs(seg_pct) <= 5).mean()),
         }
 
     return validation
 
 
+def validate_realization_history(
+    realized: Optional[pd.DataFrame] = None,
+    factors: Optional[SegmentRealizationFactors] = None,
+    service=None
+) -> Optional[Dict[str, Dict[str, float]]]:
+    """
+    Score realization factors against the full quarterly history.
+
+    Args:
+        realized: Quarterly realized prices (default: load_quarterly_realized_prices())
+        factors: Factors to validate
+        service: BloombergDataService (default: singleton)
+
+    Returns:
+        validate_realization_factors() output over all overlapping quarters,
+        or None if benchmark or realized history is unavailable
+    """
+    realized = realized if realized is not None else load_quarterly_realized_prices()
+    benchmarks = quarterly_benchmark_prices(service)
+    if realized is None or benchmarks is None:
+        return None
+    common = benchmarks.index.intersection(realized.index)
+    return validate_realization_factors(benchmarks.loc[common], realized.loc[common], factors)
+
+
 # USS 2023 10-K realized prices for validation
 USS_2023_REALIZED_PRICES = {
     'flat_rolled': 1030,  # Flat-Rolled segment $/ton
@@ -294,3 +522,13 @@ if __name__ == '__main__':
         base = realizations[segment]
         pct_change = ((price - base) / base * 100) if base else 0
         print(f"   {segment}: ${price:,.0f}/ton ({pct_change:+.1f}% from base)")
+
+    print("\n5. Quarterly History Validation:")
+    history = validate_realization_history()
+    if history is None:
+        print("   Quarterly history not available")
+    else:
+        for segment, metrics in history.items():
+            if metrics['n_periods']:
+                print(f"   {segment}: {metrics['n_periods']} quarters, bias {metrics['error_pct']:+.1f}%, "
+                      f"MAPE {metrics['mape']:.1f}%, within 5%: {metrics['within_5pct_share']:.0%}")
@@ -17,9 +17,11 @@ Usage:
     downturn = get_scenario_factors('severe_downturn', ScenarioCalibrationMode.HYBRID)
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+import numpy as np
 
 try:
     from .bloomberg_data_service import get_bloomberg_service, is_bloomberg_available
@@ -367,6 +369,183 @@ def get_scenario_names_for_mode(
     return list(get_all_scenarios_for_mode(mode).keys())
 
 
+# =============================================================================
+# DYNAMIC CALIBRATION
+# =============================================================================
+# Percentile factors for every benchmark and every mode, recomputed from the
+# loaded Bloomberg history in one pass and cached by data version.
+
+# Factor field -> Bloomberg price series (coated follows CRC)
+BENCHMARK_SERIES = {
+    'hrc_us': 'hrc_us',
+    'crc_us': 'crc_us',
+    'hrc_eu': 'hrc_eu',
+    'octg': 'octg_us',
+}
+
+# Scenarios defined by a historical price percentile
+PERCENTILE_SCENARIOS = {
+    'severe_downturn': 10,
+    'downside': 25,
+    'modest_decline': 50,
+    'upside': 75,
+    'boom': 90,
+}
+
+# HYBRID: Bloomberg percentiles on the downside, static factors capped at
+# the Bloomberg percentile on the upside
+HYBRID_DOWNSIDE_PERCENTILES = {'severe_downturn': 10, 'downside': 25}
+HYBRID_UPSIDE_PERCENTILES = {'modest_upside': 75, 'optimistic': 90}
+
+BASELINE_YEAR = 2023
+
+_STATIC_FACTOR_SETS = {
+    ScenarioCalibrationMode.FIXED: FIXED_FACTORS,
+    ScenarioCalibrationMode.BLOOMBERG: BLOOMBERG_FACTORS,
+    ScenarioCalibrationMode.HYBRID: HYBRID_FACTORS,
+}
+
+_calibrated_factor_cache: Dict[str, Dict[ScenarioCalibrationMode, Dict[str, ScenarioFactors]]] = {}
+
+
+def percentile_factor_table(
+    histories: Dict[str, np.ndarray],
+    baseline: Dict[str, float],
+    percentiles: List[int]
+) -> np.ndarray:
+    """
+    Price percentiles relative to baseline for all benchmarks at once
+
+    Histories of different lengths are NaN-padded into one array so every
+    percentile of every benchmark comes from a single nanpercentile call.
+
+    Args:
+        histories: Factor field -> price history
+        baseline: Factor field -> baseline price
+        percentiles: Percentiles to evaluate
+
+    Returns:
+        Array (len(percentiles), len(histories)) of factors, columns in
+        histories order
+    """
+    fields = list(histories)
+    length = max(len(v) for v in histories.values())
+    padded = np.full((length, len(fields)), np.nan)
+    for col, field in enumerate(fields):
+        values = np.asarray(histories[field], dtype=float)
+        padded[:len(values), col] = values
+    levels = np.nanpercentile(padded, percentiles, axis=0)
+    return levels / np.array([baseline[f] for f in fields])
+
+
+def _factors_from_row(static: ScenarioFactors, row: Dict[str, float], pct: int,
+                      description: str) -> ScenarioFactors:
+    """Static scenario with benchmark factors replaced by one percentile row"""
+    return replace(
+        static,
+        hrc_us=row['hrc_us'],
+        crc_us=row['crc_us'],
+        coated_us=row['crc_us'],   # Derive from CRC
+        hrc_eu=row['hrc_eu'],
+        octg=row['octg'],
+        description=description,
+        percentile=pct,
+    )
+
+
+def calculate_calibrated_factor_sets(service) -> Dict[ScenarioCalibrationMode, Dict[str, ScenarioFactors]]:
+    """
+    Scenario factors for every calibration mode from current Bloomberg data
+
+    Returns:
+        Mode -> {scenario name: ScenarioFactors}. FIXED is unchanged; base
+        case stays at its calibrated mid-cycle factors in every mode.
+    """
+    baseline = service.get_annual_average_prices(BASELINE_YEAR)
+    histories = {}
+    for field, key in BENCHMARK_SERIES.items():
+        df = service.get_historical_prices(key)
+        if df is None or field not in baseline:
+            return dict(_STATIC_FACTOR_SETS)
+        histories[field] = df['value'].dropna().to_numpy()
+
+    percentiles = sorted(set(PERCENTILE_SCENARIOS.values()))
+    table = percentile_factor_table(histories, baseline, percentiles)
+    rows = {pct: dict(zip(histories, table[i].tolist())) for i, pct in enumerate(percentiles)}
+
+    bloomberg = {}
+    for name, static in BLOOMBERG_FACTORS.items():
+        pct = PERCENTILE_SCENARIOS.get(name)
+        bloomberg[name] = (static if pct is None else
+                           _factors_from_row(static, rows[pct], pct, f'P{pct} from Bloomberg (recalculated)'))
+
+    hybrid = {}
+    for name, static in HYBRID_FACTORS.items():
+        if name in HYBRID_DOWNSIDE_PERCENTILES:
+            pct = HYBRID_DOWNSIDE_PERCENTILES[name]
+            hybrid[name] = _factors_from_row(static, rows[pct], pct, f'P{pct} from Bloomberg')
+        elif name in HYBRID_UPSIDE_PERCENTILES:
+            row = rows[HYBRID_UPSIDE_PERCENTILES[name]]
+            hybrid[name] = replace(
+                static,
+                hrc_us=min(static.hrc_us, row['hrc_us']),
+                crc_us=min(static.crc_us, row['crc_us']),
+                coated_us=min(static.coated_us, row['crc_us']),
+                hrc_eu=min(static.hrc_eu, row['hrc_eu']),
+                octg=min(static.octg, row['octg']),
+            )
+        else:
+            hybrid[name] = static
+
+    return {
+        ScenarioCalibrationMode.FIXED: FIXED_FACTORS,
+        ScenarioCalibrationMode.BLOOMBERG: bloomberg,
+        ScenarioCalibrationMode.HYBRID: hybrid,
+    }
+
+
+def get_calibration_data_version() -> str:
+    """Bloomberg data version the live factors are keyed on ('static' if unavailable)"""
+    if not is_bloomberg_available():
+        return 'static'
+    try:
+        service = get_bloomberg_service()
+        if service.is_available():
+            return service.get_data_version() or 'static'
+    except Exception:
+        pass
+    return 'static'
+
+
+def get_calibrated_factor_sets() -> Dict[ScenarioCalibrationMode, Dict[str, ScenarioFactors]]:
+    """
+    Live scenario factors for all modes, cached by Bloomberg data version
+
+    The first call after a data refresh recomputes every mode in one
+    vectorized pass; later calls are a dict lookup. Returned factor
+    objects are shared, do not mutate them.
+
+    Returns:
+        Mode -> {scenario name: ScenarioFactors}, or the static factor
+        tables if Bloomberg data is unavailable.
+    """
+    version = get_calibration_data_version()
+    cached = _calibrated_factor_cache.get(version)
+    if cached is not None:
+        return cached
+
+    factor_sets = dict(_STATIC_FACTOR_SETS)
+    if version != 'static':
+        try:
+            factor_sets = calculate_calibrated_factor_sets(get_bloomberg_service())
+        except Exception:
+            pass
+
+    _calibrated_factor_cache.clear()   # Only the current data version is useful
+    _calibrated_factor_cache[version] = factor_sets
+    return factor_sets
+
+
 def recalculate_bloomberg_factors() -> Dict[str, ScenarioFactors]:
     """
     Dynamically recalculate Bloomberg factors from current data.
@@ -374,74 +553,11 @@ def recalculate_bloomberg_factors() -> Dict[str, ScenarioFactors]:
     Call this when Bloomberg data is refreshed to update factors.
     Returns updated BLOOMBERG_FACTORS dict (does not modify global).
 
-    Note: This is a placeholder for dynamic recalculation.
-    In practice, the percentile-based factors are pre-computed and
-    stored in the BLOOMBERG_FACTORS constant above.
-
     Returns:
         Dict of scenario factors calculated from current Bloomberg data,
         or the static BLOOMBERG_FACTORS if Bloomberg is unavailable.
     """
-    if not is_bloomberg_available():
-        return BLOOMBERG_FACTORS.copy()
-
-    try:
-        service = get_bloomberg_service()
-        if not service.is_available():
-            return BLOOMBERG_FACTORS.copy()
-
-        baseline = service.get_annual_average_prices(2023)
-        if not baseline:
-            return BLOOMBERG_FACTORS.copy()
-
-        # Get percentile values for each product
-        new_factors = {}
-
-        # Calculate factors for each scenario percentile
-        percentile_scenarios = [
-            ('severe_downturn', 10),
-            ('downside', 25),
-            ('modest_decline', 50),
-            ('upside', 75),
-            ('boom', 90),
-        ]
-
-        for scenario_name, pct in percentile_scenarios:
-            # Get percentile prices from Bloomberg stats
-            hrc_stats = service.get_price_stats('hrc_us')
-            crc_stats = service.get_price_stats('crc_us')
-            hrc_eu_stats = service.get_price_stats('hrc_eu')
-            octg_stats = service.get_price_stats('octg_us')
-
-            # Calculate factors relative to 2023 baseline
-            hrc_pct_val = getattr(hrc_stats, f'percentile_{pct}', None)
-            crc_pct_val = getattr(crc_stats, f'percentile_{pct}', None)
-            hrc_eu_pct_val = getattr(hrc_eu_stats, f'percentile_{pct}', None)
-            octg_pct_val = getattr(octg_stats, f'percentile_{pct}', None)
-
-            if all([hrc_pct_val, crc_pct_val, hrc_eu_pct_val, octg_pct_val]):
-                # Use static factors as fallback for growth rate
-                static = BLOOMBERG_FACTORS.get(scenario_name, BLOOMBERG_FACTORS['base_case'])
-
-                new_factors[scenario_name] = ScenarioFactors(
-                    name=static.name,
-                    hrc_us=hrc_pct_val / baseline['hrc_us'],
-                    crc_us=crc_pct_val / baseline['crc_us'],
-                    coated_us=crc_pct_val / baseline['crc_us'],  # Derive from CRC
-                    hrc_eu=hrc_eu_pct_val / baseline['hrc_eu'],
-                    octg=octg_pct_val / baseline['octg'],
-                    annual_price_growth=static.annual_price_growth,
-                    description=f'P{pct} from Bloomberg (recalculated)',
-                    percentile=pct
-                )
-
-        # Always include base case
-        new_factors['base_case'] = BLOOMBERG_FACTORS['base_case']
-
-        return new_factors
-
-    except Exception:
-        return BLOOMBERG_FACTORS.copy()
+    return dict(get_calibrated_factor_sets()[ScenarioCalibrationMode.BLOOMBERG])
 
 
 # =============================================================================
@@ -572,7 +688,8 @@ def apply_probability_weights_to_scenarios(
     """
     Apply probability weights from the specified mode to a dict of scenarios.
 
-    This modifies the probability_weight attribute of each ModelScenario.
+    Scenarios are immutable, so each weighted scenario is replaced in the
+    dict by a copy with the new probability_weight.
 
     Args:
         scenarios: Dict of ScenarioType -> ModelScenario
@@ -599,12 +716,12 @@ def apply_probability_weights_to_scenarios(
         'Optimistic (Sustained Growth)': 'optimistic',
     }
 
-    for scenario_type, scenario in scenarios.items():
+    for scenario_type, scenario in list(scenarios.items()):
         # Try to match by scenario type value first
         weight_key = type_to_weight_key.get(scenario_type.value)
 
         if weight_key and weight_key in weights:
-            scenario.probability_weight = weights[weight_key]
+            scenarios[scenario_type] = replace(scenario, probability_weight=weights[weight_key])
         else:
             # Scenarios like WALL_STREET, NIPPON_COMMITMENTS stay at 0
             pass
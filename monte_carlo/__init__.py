@@ -25,9 +25,11 @@ Distribution Fitting:
 """
 
 from .monte_carlo_engine import MonteCarloEngine, Distribution, InputVariable
+from .correlated_sampler import CorrelatedSampler
 from .distribution_fitter import (
     DistributionFitter,
     FitResult,
+    FitCache,
     fit_distribution,
     select_best_distribution,
     validate_distribution_params
@@ -37,8 +39,10 @@ __all__ = [
     'MonteCarloEngine',
     'Distribution',
     'InputVariable',
+    'CorrelatedSampler',
     'DistributionFitter',
     'FitResult',
+    'FitCache',
     'fit_distribution',
     'select_best_distribution',
     'validate_distribution_params'
@@ -13,11 +13,24 @@ Usage:
     fitter = DistributionFitter()
     result = fitter.fit_distribution(data, 'lognormal')
     best = fitter.select_best_distribution(data, ['normal', 'lognormal', 'triangular'])
+
+    # Many series at once: (variable x candidate) fits run across a process pool
+    # and are cached by series hash, so unchanged series are never refit
+    fitter = DistributionFitter(cache=FitCache('fit_cache.json'), cutoff_date='2023-12-18')
+    best = fitter.select_best_distributions({'hrc': hrc, 'crc': crc}, ['normal', 'lognormal'])
+    fitter.cache.save()
 """
 
+import copy
+import hashlib
+import json
+import os
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 from scipy import stats
 from scipy.optimize import minimize_scalar
@@ -62,6 +75,160 @@ class FitResult:
             'warnings': self.warnings
         }
 
+    @classmethod
+    def from_dict(cls, d: dict) -> 'FitResult':
+        """Rebuild a FitResult from to_dict() output"""
+        return cls(
+            distribution_type=d['distribution_type'],
+            parameters=dict(d['parameters']),
+            n_observations=d['n_observations'],
+            goodness_of_fit=dict(d['goodness_of_fit']),
+            rationale=d['rationale'],
+            data_source=d.get('data_source'),
+            warnings=list(d.get('warnings', []))
+        )
+
+
+# =============================================================================
+# FIT CACHE
+# =============================================================================
+
+# Bump when fitting logic changes so stale cached fits are ignored
+FIT_CACHE_VERSION = 1
+
+# Worker processes for batch fitting (leave one core for the caller)
+FIT_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+
+def series_hash(data: np.ndarray, cutoff_date: Optional[str] = None) -> str:
+    """Hash of a cleaned data series plus the cutoff date it was filtered to"""
+    h = hashlib.md5(np.ascontiguousarray(data, dtype=np.float64).tobytes())
+    h.update(str(cutoff_date).encode())
+    return h.hexdigest()
+
+
+def _clean_series(data) -> np.ndarray:
+    """Flatten to float array and drop NaNs"""
+    data = np.asarray(data, dtype=float).flatten()
+    return data[~np.isnan(data)]
+
+
+class FitCache:
+    """
+    Fitted distributions keyed by (series hash, distribution type, bounds)
+
+    Entries are stored as FitResult dicts, so every lookup returns a fresh
+    FitResult the caller is free to modify. With a path the cache persists
+    as JSON between runs (e.g. across Bloomberg refreshes).
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path is not None else None
+        self.entries: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None and self.path.exists():
+            try:
+                with open(self.path) as f:
+                    stored = json.load(f)
+                if stored.get('version') == FIT_CACHE_VERSION:
+                    self.entries = stored.get('fits', {})
+            except (json.JSONDecodeError, OSError):
+                # Corrupt cache file, start empty
+                self.entries = {}
+
+    @staticmethod
+    def key(series_key: str, dist_type: str,
+            bounds: Optional[Tuple[float, float]] = None) -> str:
+        bounds_str = 'none' if bounds is None else f"{float(bounds[0])!r},{float(bounds[1])!r}"
+        return f"{series_key}:{dist_type}:{bounds_str}"
+
+    def get(self, key: str) -> Optional[FitResult]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return FitResult.from_dict(entry)
+
+    def put(self, key: str, result: FitResult):
+        self.entries[key] = copy.deepcopy(result.to_dict())
+
+    def save(self):
+        """Write the cache to its path (no-op for in-memory caches)"""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({'version': FIT_CACHE_VERSION, 'fits': self.entries}, f)
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.entries)}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class _PrivateCache:
+    """Default for DistributionFitter(cache=...): a new in-memory FitCache per fitter"""
+
+
+_PRIVATE_CACHE = _PrivateCache()
+
+
+def _fit_job(args: tuple) -> Optional[FitResult]:
+    """Pool worker: fit one (series, distribution) pair; None if the fit fails"""
+    data, dist_type, bounds = args
+    try:
+        return DistributionFitter(cache=None).fit_distribution(data, dist_type, bounds)
+    except Exception:
+        return None
+
+
+def fitted_distribution(result: FitResult):
+    """
+    Frozen scipy distribution for a fit, used for analytic CDF tests
+
+    Args:
+        result: FitResult from DistributionFitter
+
+    Returns:
+        scipy.stats frozen distribution on the original data scale
+    """
+    p = result.parameters
+    dist_type = result.distribution_type
+    if dist_type == 'normal':
+        return stats.norm(p['mean'], p['std'])
+    if dist_type == 'lognormal':
+        return stats.lognorm(s=p['std'], scale=np.exp(p['mean']))
+    if dist_type == 'triangular':
+        width = p['max'] - p['min']
+        c = (p['mode'] - p['min']) / width if width > 0 else 0.5
+        return stats.triang(c, loc=p['min'], scale=width)
+    if dist_type == 'beta':
+        return stats.beta(p['alpha'], p['beta'], loc=p['min'], scale=p['max'] - p['min'])
+    if dist_type == 'uniform':
+        return stats.uniform(loc=p['min'], scale=p['max'] - p['min'])
+    if dist_type == 'truncnorm':
+        a = (p['min'] - p['mean']) / p['std']
+        b = (p['max'] - p['mean']) / p['std']
+        return stats.truncnorm(a, b, loc=p['mean'], scale=p['std'])
+    raise ValueError(f"Unknown distribution type: {dist_type}")
+
+
+def anderson_darling_statistic(data: np.ndarray, cdf) -> float:
+    """
+    Anderson-Darling A^2 against a fully specified CDF
+
+    A^2 = -n - (1/n) * sum((2i-1) * [ln F(x_i) + ln(1 - F(x_{n+1-i}))])
+    """
+    x = np.sort(data)
+    n = len(x)
+    # Clip so observations outside a bounded support stay finite
+    u = np.clip(cdf(x), 1e-12, 1 - 1e-12)
+    i = np.arange(1, n + 1)
+    return float(-n - np.sum((2 * i - 1) * (np.log(u) + np.log1p(-u[::-1]))) / n)
+
 
 # =============================================================================
 # DISTRIBUTION FITTER CLASS
@@ -98,9 +265,24 @@ class DistributionFitter:
         'beta': 3
     }
 
-    def __init__(self, random_seed: int = 42):
-        """Initialize fitter with optional random seed"""
+    def __init__(
+        self,
+        random_seed: int = 42,
+        cache: Union[FitCache, _PrivateCache, None] = _PRIVATE_CACHE,
+        cutoff_date: Optional[str] = None
+    ):
+        """
+        Initialize fitter
+
+        Args:
+            random_seed: Seed for the fitter's random state
+            cache: FitCache to reuse fits across calls (default: private
+                in-memory cache, None = no caching)
+            cutoff_date: Data cutoff the series were filtered to; part of the cache key
+        """
         self.rng = np.random.RandomState(random_seed)
+        self.cache = FitCache() if cache is _PRIVATE_CACHE else cache
+        self.cutoff_date = cutoff_date
 
     def fit_distribution(
         self,
@@ -119,13 +301,32 @@ class DistributionFitter:
         Returns:
             FitResult with fitted parameters and statistics
         """
-        data = np.asarray(data).flatten()
-        data = data[~np.isnan(data)]  # Remove NaN values
+        data = _clean_series(data)  # Flatten and remove NaN values
         n = len(data)
 
         if n < 10:
             raise ValueError(f"Need at least 10 observations, got {n}")
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = FitCache.key(series_hash(data, self.cutoff_date), dist_type, bounds)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = self._fit_clean(data, dist_type, bounds)
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+        return result
+
+    def _fit_clean(
+        self,
+        data: np.ndarray,
+        dist_type: str,
+        bounds: Optional[Tuple[float, float]] = None
+    ) -> FitResult:
+        """Fit a distribution to an already-cleaned series (no caching)"""
+        n = len(data)
         warnings_list = []
 
         if dist_type == 'normal':
@@ -479,12 +680,66 @@ class DistributionFitter:
 
         return params, gof, rationale
 
+    def fit_batch(
+        self,
+        jobs: Dict[str, Tuple[np.ndarray, str, Optional[Tuple[float, float]]]],
+        n_workers: int = FIT_POOL_WORKERS
+    ) -> Dict[str, FitResult]:
+        """
+        Fit many (series, distribution) pairs, refitting only cache misses
+
+        Args:
+            jobs: Mapping of job name -> (data, dist_type, bounds)
+            n_workers: Worker processes for the misses (1 = fit in-process)
+
+        Returns:
+            Mapping of job name -> FitResult. Jobs whose fit failed are omitted.
+        """
+        results = {}
+        pending = {}
+
+        for name, (data, dist_type, bounds) in jobs.items():
+            data = _clean_series(data)
+            key = None
+            if self.cache is not None:
+                key = FitCache.key(series_hash(data, self.cutoff_date), dist_type, bounds)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    results[name] = cached
+                    continue
+            pending[name] = (key, (data, dist_type, bounds))
+
+        fitted = {}
+        if n_workers > 1 and len(pending) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(n_workers, len(pending))) as pool:
+                    names = list(pending)
+                    for name, result in zip(names, pool.map(_fit_job, [pending[n][1] for n in names])):
+                        fitted[name] = result
+            except (BrokenProcessPool, OSError):
+                # No usable pool (e.g. restricted sandbox); fit what is left in-process
+                pass
+        for name, (_, args) in pending.items():
+            if name not in fitted:
+                fitted[name] = _fit_job(args)
+
+        for name, result in fitted.items():
+            if result is None:
+                continue
+            key = pending[name][0]
+            if key is not None:
+                self.cache.put(key, result)
+            results[name] = result
+
+        return {name: results[name] for name in jobs if name in results}
+
     def select_best_distribution(
         self,
         data: np.ndarray,
         candidates: List[str],
         bounds: Optional[Tuple[float, float]] = None,
-        domain_constraint: Optional[str] = None
+        domain_constraint: Optional[str] = None,
+        n_workers: int = 1
     ) -> FitResult:
         """
         Select best distribution from candidates using weighted criteria
@@ -494,37 +749,70 @@ class DistributionFitter:
             candidates: List of distribution types to test
             bounds: Optional (min, max) bounds for bounded distributions
             domain_constraint: 'non_negative', 'bounded_01', or None
+            n_workers: Worker processes for the candidate fits (a pool only
+                pays off when many series are batched, see select_best_distributions)
 
         Returns:
             FitResult for the best distribution
         """
-        results = []
+        best = self.select_best_distributions(
+            {'data': data}, candidates, bounds, domain_constraint, n_workers
+        )
+        if 'data' not in best:
+            raise ValueError("No distributions could be fit to the data")
+        return best['data']
 
-        for dist_type in candidates:
-            try:
-                result = self.fit_distribution(data, dist_type, bounds)
-                results.append(result)
-            except Exception as e:
-                # Skip distributions that fail to fit
-                pass
+    def select_best_distributions(
+        self,
+        series: Dict[str, np.ndarray],
+        candidates: List[str],
+        bounds: Optional[Tuple[float, float]] = None,
+        domain_constraint: Optional[str] = None,
+        n_workers: int = FIT_POOL_WORKERS
+    ) -> Dict[str, FitResult]:
+        """
+        Select the best distribution for several series in one batch
 
-        if not results:
-            raise ValueError("No distributions could be fit to the data")
+        All (variable x candidate) fits are submitted together so they share
+        one process pool; cached fits are reused.
+
+        Args:
+            series: Mapping of variable name -> historical observations
+            candidates: List of distribution types to test
+            bounds: Optional (min, max) bounds for bounded distributions
+            domain_constraint: 'non_negative', 'bounded_01', or None
+            n_workers: Worker processes for the fits
+
+        Returns:
+            Mapping of variable name -> best FitResult (variables where no
+            candidate could be fit are omitted)
+        """
+        series = {name: _clean_series(data) for name, data in series.items()}
+        jobs = {
+            (name, dist_type): (data, dist_type, bounds)
+            for name, data in series.items()
+            for dist_type in candidates
+        }
+        fits = self.fit_batch(jobs, n_workers)
+
+        best = {}
+        for name, data in series.items():
+            results = [fits[(name, d)] for d in candidates if (name, d) in fits]
+            if not results:
+                continue
 
-        # Score each distribution
-        scores = []
-        for result in results:
-            score = self._score_distribution(result, data, domain_constraint)
-            scores.append(score)
+            # Score each distribution
+            scores = [self._score_distribution(r, data, domain_constraint) for r in results]
 
-        # Select best
-        best_idx = np.argmax(scores)
-        best_result = results[best_idx]
+            # Select best
+            best_idx = int(np.argmax(scores))
+            best_result = results[best_idx]
 
-        # Add selection rationale
-        best_result.rationale += f"\n  Selected from {candidates} with score {scores[best_idx]:.3f}"
+            # Add selection rationale
+            best_result.rationale += f"\n  Selected from {candidates} with score {scores[best_idx]:.3f}"
+            best[name] = best_result
 
-        return best_result
+        return best
 
     def _score_distribution(
         self,
@@ -608,39 +896,35 @@ class DistributionFitter:
         """
         Compute additional goodness-of-fit statistics
 
+        All tests use the fitted distribution's analytic CDF, so results are
+        deterministic and cost O(n log n) instead of resampling. The KS
+        statistic from the fit (ks_statistic / ks_p_value) is kept as is.
+
         Returns dict with KS, Anderson-Darling, Cramer-von Mises statistics
         """
-        dist_type = result.distribution_type
-        params = result.parameters
-
         gof = dict(result.goodness_of_fit)  # Copy existing
 
-        # Generate samples from fitted distribution for comparison
-        n = len(data)
-        if dist_type == 'normal':
-            theoretical = stats.norm.rvs(params['mean'], params['std'], size=n*10)
-        elif dist_type == 'lognormal':
-            theoretical = stats.lognorm.rvs(
-                s=params['std'],
-                scale=np.exp(params['mean']),
-                size=n*10
-            )
-        else:
-            # Skip advanced tests for other distributions
+        data = _clean_series(data)
+        if result.distribution_type == 'lognormal':
+            data = data[data > 0]
+        if len(data) < 2:
             return gof
 
-        # Anderson-Darling (only for normal and lognormal)
-        if dist_type == 'normal':
-            ad_result = stats.anderson(data, dist='norm')
-            gof['anderson_darling_statistic'] = float(ad_result.statistic)
-            gof['anderson_darling_critical_5pct'] = float(ad_result.critical_values[2])
+        cdf = fitted_distribution(result).cdf
+
+        # Anderson-Darling against the fitted CDF
+        gof['anderson_darling_statistic'] = anderson_darling_statistic(data, cdf)
+        if result.distribution_type == 'normal':
+            # 5% critical value for the estimated-parameter normal case (Stephens 1974)
+            n = len(data)
+            gof['anderson_darling_critical_5pct'] = float(0.787 / (1.0 + 4.0 / n - 25.0 / n**2))
 
-        # Cramér-von Mises (two-sample)
+        # Cramér-von Mises (one-sample, analytic CDF)
         try:
-            cvm_result = stats.cramervonmises_2samp(data, theoretical)
+            cvm_result = stats.cramervonmises(data, cdf)
             gof['cvm_statistic'] = float(cvm_result.statistic)
             gof['cvm_p_value'] = float(cvm_result.pvalue)
-        except:
+        except (ValueError, FloatingPointError):
             pass
 
         return gof
@@ -9,6 +9,7 @@ Implements probabilistic valuation using Monte Carlo simulation with:
 - Risk metrics (VaR, CVaR, percentiles)
 - Integration with existing PriceVolumeModel
 - Configurable distributions from distributions_config.json
+- Stochastic synergies (realization, ramp delay, integration overruns)
 
 Usage:
     from monte_carlo.monte_carlo_engine import MonteCarloEngine
@@ -24,7 +25,6 @@ import pandas as pd
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional, Callable
 from scipy import stats
-from scipy.linalg import cholesky
 import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
@@ -40,8 +40,11 @@ from price_volume_model import (
     PriceVolumeModel, ModelScenario, ScenarioType,
     SteelPriceScenario, VolumeScenario, get_scenario_presets,
     BENCHMARK_PRICES_2023, calculate_tariff_adjustment,
-    apply_macro_adjustments,
+    apply_macro_adjustments, SynergyAssumptions, get_synergy_presets,
+    synergy_parameter_arrays, compute_synergy_vectors, synergy_enterprise_value,
 )
+from monte_carlo.correlated_sampler import CorrelatedSampler
+from instrumentation import count, get_profiler, profiled, run_profiled
 
 
 # =============================================================================
@@ -117,20 +120,129 @@ class InputVariable:
     correlations: Dict[str, float] = field(default_factory=dict)
 
 
+# =============================================================================
+# SYNERGY SAMPLING
+# =============================================================================
+
+# Sampled synergy variables and their deterministic base values. Realization
+# factors scale the preset confidences by (sample / base), so a draw at the
+# base value reproduces the preset package exactly.
+SYNERGY_VARIABLE_BASES = {
+    'operating_synergy_factor': 0.80,
+    'technology_synergy_factor': 0.70,
+    'revenue_synergy_factor': 0.55,
+    'synergy_ramp_delay': 0.0,
+    'integration_cost_overrun': 1.0,
+}
+
+
+def _delay_ramps(ramp: np.ndarray, delay: np.ndarray) -> np.ndarray:
+    """Shift a (n_years,) ramp right by fractional year delays, one row per delay.
+
+    Realization before the first model year is zero; values between years are
+    linearly interpolated and the final year's level is held.
+    """
+    n_years = len(ramp)
+    padded = np.concatenate([[0.0], ramp, [ramp[-1]]])
+    position = np.arange(n_years)[None, :] - np.maximum(delay, 0.0)[:, None]
+    lower = np.floor(position)
+    frac = position - lower
+    lower = lower.astype(int)
+    left = padded[np.clip(lower + 1, 0, n_years + 1)]
+    right = padded[np.clip(lower + 2, 0, n_years + 1)]
+    return left * (1 - frac) + right * frac
+
+
+@profiled('synergy.sample_parameters')
+def sample_synergy_parameters(synergies: SynergyAssumptions, years: List[int],
+                              samples: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Build per-iteration synergy parameter arrays from sampled variables.
+
+    Args:
+        synergies: Deterministic synergy package to perturb
+        years: Model years, in projection order
+        samples: Sampled inputs, one row per iteration (missing synergy
+                 columns fall back to SYNERGY_VARIABLE_BASES)
+
+    Returns:
+        Dict of (n,) / (n, n_years) arrays accepted by compute_synergy_vectors
+    """
+    n = len(samples)
+
+    def ratio(var_name):
+        base = SYNERGY_VARIABLE_BASES[var_name]
+        return np.asarray(samples.get(var_name, pd.Series(base, index=samples.index)), dtype=float) / base
+
+    def column(var_name):
+        base = SYNERGY_VARIABLE_BASES[var_name]
+        return np.asarray(samples.get(var_name, pd.Series(base, index=samples.index)), dtype=float)
+
+    base = synergy_parameter_arrays([synergies], years)
+    params = {k: np.repeat(v, n, axis=0) for k, v in base.items()}
+    if not synergies.enabled:
+        return params
+
+    # Operating: each savings line weighted by its scaled confidence (capped at 100%)
+    op = synergies.operating
+    op_savings = np.array([op.procurement_savings_annual, op.logistics_savings_annual,
+                           op.overhead_savings_annual])
+    op_conf = np.array([op.procurement_confidence, op.logistics_confidence, op.overhead_confidence])
+    params['operating_run_rate'] = np.clip(np.outer(ratio('operating_synergy_factor'), op_conf), 0, 1) @ op_savings
+
+    params['technology_confidence'] = np.clip(
+        synergies.technology.confidence * ratio('technology_synergy_factor'), 0, 1)
+
+    rev = synergies.revenue
+    rev_ebitda = np.array([rev.cross_sell_revenue_annual * rev.cross_sell_margin,
+                           rev.product_mix_revenue_uplift * rev.product_mix_margin])
+    rev_conf = np.array([rev.cross_sell_confidence, rev.product_mix_confidence])
+    params['revenue_run_rate'] = np.clip(np.outer(ratio('revenue_synergy_factor'), rev_conf), 0, 1) @ rev_ebitda
+
+    # Integration delays push every ramp out; overruns scale the cost schedule
+    delay = column('synergy_ramp_delay')
+    for ramp_key in ('operating_ramp', 'technology_ramp', 'revenue_ramp'):
+        params[ramp_key] = _delay_ramps(base[ramp_key][0], delay)
+    params['integration_cost'] = base['integration_cost'] * column('integration_cost_overrun')[:, None]
+
+    return params
+
+
+def _synergy_inputs(analysis: Dict, ev_adjustment: float) -> Dict:
+    """Per-iteration projection and valuation terms needed to add sampled synergies."""
+    consolidated = analysis['consolidated']
+    val_nippon = analysis['val_nippon']
+    return {
+        'years': consolidated['Year'].tolist(),
+        'revenue': consolidated['Revenue'].values,
+        'ebitda': consolidated['Total_EBITDA'].values,
+        'wacc': analysis['usd_wacc'],
+        'terminal_growth': analysis['scenario'].terminal_growth,
+        'exit_multiple': val_nippon['exit_multiple_used'],
+        'equity_bridge': analysis['val_uss'].get('equity_bridge', -4000),
+        'ev_adjustment': ev_adjustment,
+    }
+
+
 # =============================================================================
 # MULTIPROCESSING WORKER (module-level for pickling)
 # =============================================================================
 
+@profiled('mc.worker_batch')
 def _simulate_batch(args):
     """Process a batch of Monte Carlo iterations in a worker process.
 
     Must be at module level (not a method) so ProcessPoolExecutor can pickle it.
     Mirrors the logic in MonteCarloEngine._build_scenario_from_sample and the
     sequential run_simulation loop.
+
+    Returns:
+        Tuple of (result rows, {iteration: _synergy_inputs record}) so the
+        parent process can add sampled synergies in one vectorized pass.
     """
     input_chunk, base_scenario, include_projects, execution_factor_override = args
 
     results = []
+    synergy_inputs = {}
     for idx in range(len(input_chunk)):
         sample = input_chunk.iloc[idx]
         iteration_id = int(input_chunk.index[idx])
@@ -257,7 +369,9 @@ def _simulate_batch(args):
                 'effective_tariff_rate': effective_tariff,
                 'tariff_adjustment_hrc': calculate_tariff_adjustment(effective_tariff, 'hrc_us'),
             })
+            synergy_inputs[iteration_id] = _synergy_inputs(analysis, ev_adjustment)
         except Exception:
+            count('mc.failed_iterations')
             results.append({
                 'iteration': iteration_id,
                 'uss_enterprise_value': np.nan, 'uss_share_price': np.nan,
@@ -268,7 +382,8 @@ def _simulate_batch(args):
                 'effective_tariff_rate': np.nan, 'tariff_adjustment_hrc': np.nan,
             })
 
-    return results
+    count('mc.iterations', len(input_chunk))
+    return results, synergy_inputs
 
 
 # =============================================================================
@@ -297,7 +412,9 @@ class MonteCarloEngine:
         use_config_file: bool = True,
         use_bloomberg_calibration: bool = True,
         config_path: Optional[Path] = None,
-        n_workers: int = 1
+        n_workers: int = 1,
+        include_synergies: bool = True,
+        synergies: Optional[SynergyAssumptions] = None
     ):
         """
         Initialize Monte Carlo engine
@@ -312,6 +429,10 @@ class MonteCarloEngine:
                                        Bloomberg data when available
             config_path: Optional custom path to distributions config file
             n_workers: Number of parallel worker processes (1 = sequential)
+            include_synergies: If True, sample synergy realization, ramp delay and
+                               integration overruns and add them to the Nippon view
+            synergies: Synergy package to perturb (default: base scenario's
+                       synergies if enabled, else the 'base_case' preset)
         """
         self.n_simulations = n_simulations
         self.random_seed = random_seed
@@ -330,11 +451,23 @@ class MonteCarloEngine:
         else:
             self.base_scenario = base_scenario
 
+        # Synergy package sampled around (None = synergies excluded)
+        if not include_synergies:
+            self.synergies = None
+        elif synergies is not None:
+            self.synergies = synergies
+        elif self.base_scenario.synergies is not None:
+            # A disabled package on the scenario is an explicit opt-out
+            self.synergies = self.base_scenario.synergies if self.base_scenario.synergies.enabled else None
+        else:
+            self.synergies = get_synergy_presets()['base_case']
+
         # Load config-based correlations if available
         self.config_correlations = None
 
         # Define input variables and distributions (may load from config/Bloomberg)
         self.variables = self._define_input_variables()
+        self._sampler = None
 
         # Results storage
         self.simulation_inputs = None
@@ -942,6 +1075,61 @@ class MonteCarloEngine:
             base_value=0.55,
         )
 
+        # Remaining synergy drivers only enter the valuation with a synergy package
+        if self.synergies is not None:
+            ts_type, ts_params = get_config_or_default(
+                'technology_synergy_factor', 'beta', {'alpha': 4, 'beta': 2, 'min': 0.30, 'max': 0.95}
+            )
+            variables['technology_synergy_factor'] = InputVariable(
+                name='technology_synergy_factor',
+                description='Technology Transfer Realization Rate',
+                distribution=Distribution(
+                    name='Technology Synergy Factor',
+                    dist_type=ts_type,
+                    params=ts_params
+                ),
+                base_value=SYNERGY_VARIABLE_BASES['technology_synergy_factor'],
+                correlations=get_correlations('technology_synergy_factor', {
+                    'operating_synergy_factor': 0.50,  # Shared integration quality
+                    'gary_works_execution': 0.30,
+                })
+            )
+
+            rd_type, rd_params = get_config_or_default(
+                'synergy_ramp_delay', 'triangular', {'min': 0.0, 'mode': 0.0, 'max': 2.0}
+            )
+            variables['synergy_ramp_delay'] = InputVariable(
+                name='synergy_ramp_delay',
+                description='Synergy Ramp Delay (years)',
+                distribution=Distribution(
+                    name='Synergy Ramp Delay',
+                    dist_type=rd_type,
+                    params=rd_params
+                ),
+                base_value=SYNERGY_VARIABLE_BASES['synergy_ramp_delay'],
+                correlations=get_correlations('synergy_ramp_delay', {
+                    'operating_synergy_factor': -0.40,  # Slow integrations realize less
+                    'technology_synergy_factor': -0.30,
+                })
+            )
+
+            io_type, io_params = get_config_or_default(
+                'integration_cost_overrun', 'triangular', {'min': 0.90, 'mode': 1.00, 'max': 1.50}
+            )
+            variables['integration_cost_overrun'] = InputVariable(
+                name='integration_cost_overrun',
+                description='Integration Cost Overrun Factor (vs plan)',
+                distribution=Distribution(
+                    name='Integration Cost Overrun',
+                    dist_type=io_type,
+                    params=io_params
+                ),
+                base_value=SYNERGY_VARIABLE_BASES['integration_cost_overrun'],
+                correlations=get_correlations('integration_cost_overrun', {
+                    'synergy_ramp_delay': 0.50,  # Delays extend integration spend
+                })
+            )
+
         # Working capital efficiency factor
         wc_type, wc_params = get_config_or_default(
             'working_capital_efficiency', 'normal', {'mean': 1.00, 'std': 0.08}
@@ -1108,6 +1296,13 @@ class MonteCarloEngine:
 
         return variables
 
+    @property
+    def sampler(self) -> CorrelatedSampler:
+        """Correlated sampler compiled from self.variables (built once, then reused)"""
+        if self._sampler is None:
+            self._sampler = CorrelatedSampler.from_variables(self.variables)
+        return self._sampler
+
     def _build_correlation_matrix(self) -> Tuple[np.ndarray, List[str]]:
         """
         Build correlation matrix from variable definitions
@@ -1116,30 +1311,9 @@ class MonteCarloEngine:
             correlation_matrix: NxN correlation matrix
             variable_names: List of variable names in order
         """
-        var_names = list(self.variables.keys())
-        n_vars = len(var_names)
-
-        # Initialize with identity matrix
-        corr_matrix = np.eye(n_vars)
-
-        # Fill in correlations
-        for i, var1 in enumerate(var_names):
-            for j, var2 in enumerate(var_names):
-                if i != j and var2 in self.variables[var1].correlations:
-                    corr_matrix[i, j] = self.variables[var1].correlations[var2]
-                    corr_matrix[j, i] = self.variables[var1].correlations[var2]
-
-        # Ensure positive semi-definite
-        # (add small value to diagonal if needed)
-        min_eigenval = np.linalg.eigvalsh(corr_matrix)[0]
-        if min_eigenval < 0:
-            corr_matrix += np.eye(n_vars) * (abs(min_eigenval) + 0.01)
-            # Rescale to unit diagonal
-            D = np.diag(1.0 / np.sqrt(np.diag(corr_matrix)))
-            corr_matrix = D @ corr_matrix @ D
-
-        return corr_matrix, var_names
+        return self.sampler.correlation, self.sampler.names
 
+    @profiled('mc.sample_generation')
     def _generate_correlated_samples(self) -> pd.DataFrame:
         """
         Generate correlated samples using Latin Hypercube or random sampling
@@ -1147,111 +1321,10 @@ class MonteCarloEngine:
         Returns:
             DataFrame with columns for each variable
         """
-        var_names = list(self.variables.keys())
-        n_vars = len(var_names)
-
-        if self.use_lhs:
-            # Latin Hypercube Sampling for better coverage
-            # Generate uniformly distributed LHS samples
-            lhs_samples = self._latin_hypercube_sample(n_vars, self.n_simulations)
-
-            # Transform to standard normal
-            standard_normal = stats.norm.ppf(lhs_samples)
-        else:
-            # Simple random sampling
-            standard_normal = self.rng.randn(self.n_simulations, n_vars)
-
-        # Apply correlation structure via Cholesky decomposition
-        corr_matrix, ordered_names = self._build_correlation_matrix()
-
-        try:
-            L = cholesky(corr_matrix, lower=True)
-            correlated_normal = standard_normal @ L.T
-        except np.linalg.LinAlgError:
-            print("Warning: Correlation matrix not positive definite. Using uncorrelated samples.")
-            correlated_normal = standard_normal
-
-        # Transform from standard normal to target distributions
-        samples = {}
-        for i, var_name in enumerate(ordered_names):
-            variable = self.variables[var_name]
-
-            # Get correlated uniform samples via CDF
-            uniform_samples = stats.norm.cdf(correlated_normal[:, i])
-
-            # Transform to target distribution
-            if variable.distribution.dist_type == 'normal':
-                samples[var_name] = stats.norm.ppf(
-                    uniform_samples,
-                    loc=variable.distribution.params['mean'],
-                    scale=variable.distribution.params['std']
-                )
-            elif variable.distribution.dist_type == 'lognormal':
-                samples[var_name] = stats.lognorm.ppf(
-                    uniform_samples,
-                    s=variable.distribution.params['std'],
-                    scale=np.exp(variable.distribution.params['mean'])
-                )
-            elif variable.distribution.dist_type == 'triangular':
-                # Scipy triangular uses c = (mode - min) / (max - min)
-                min_val = variable.distribution.params['min']
-                max_val = variable.distribution.params['max']
-                mode_val = variable.distribution.params['mode']
-                c = (mode_val - min_val) / (max_val - min_val)
-                samples[var_name] = stats.triang.ppf(
-                    uniform_samples,
-                    c=c,
-                    loc=min_val,
-                    scale=max_val - min_val
-                )
-            elif variable.distribution.dist_type == 'beta':
-                # Beta distribution scaled to [min, max]
-                min_val = variable.distribution.params['min']
-                max_val = variable.distribution.params['max']
-                alpha = variable.distribution.params['alpha']
-                beta_param = variable.distribution.params['beta']
-                beta_samples = stats.beta.ppf(uniform_samples, alpha, beta_param)
-                samples[var_name] = min_val + beta_samples * (max_val - min_val)
-            elif variable.distribution.dist_type == 'uniform':
-                min_val = variable.distribution.params['min']
-                max_val = variable.distribution.params['max']
-                samples[var_name] = min_val + uniform_samples * (max_val - min_val)
-            elif variable.distribution.dist_type == 'truncnorm':
-                # Truncated normal distribution
-                mean = variable.distribution.params['mean']
-                std = variable.distribution.params['std']
-                min_val = variable.distribution.params['min']
-                max_val = variable.distribution.params['max']
-                a = (min_val - mean) / std
-                b = (max_val - mean) / std
-                samples[var_name] = stats.truncnorm.ppf(uniform_samples, a, b, loc=mean, scale=std)
-
-        return pd.DataFrame(samples)
-
-    def _latin_hypercube_sample(self, n_vars: int, n_samples: int) -> np.ndarray:
-        """
-        Generate Latin Hypercube samples
-
-        Args:
-            n_vars: Number of variables
-            n_samples: Number of samples
-
-        Returns:
-            Array of shape (n_samples, n_vars) with uniform [0,1] samples
-        """
-        # Generate LHS samples
-        samples = np.zeros((n_samples, n_vars))
-
-        for i in range(n_vars):
-            # Divide [0,1] into n_samples bins
-            bins = np.arange(n_samples) / n_samples
-            # Randomly sample within each bin
-            samples[:, i] = bins + self.rng.rand(n_samples) / n_samples
-            # Shuffle
-            self.rng.shuffle(samples[:, i])
-
-        return samples
+        method = 'lhs' if self.use_lhs else 'random'
+        return self.sampler.sample(self.n_simulations, self.rng, method)
 
+    @profiled('mc.run_simulation')
     def run_simulation(
         self,
         include_projects: Optional[List[str]] = None,
@@ -1272,6 +1345,8 @@ class MonteCarloEngine:
         if verbose:
             print(f"Running Monte Carlo simulation with {self.n_simulations:,} iterations...")
             print(f"Sampling method: {'Latin Hypercube' if self.use_lhs else 'Random'}")
+            if self.synergies is not None:
+                print(f"Synergies: sampled around '{self.synergies.name}' package")
             start_time = time.time()
 
         # Generate correlated input samples
@@ -1286,6 +1361,7 @@ class MonteCarloEngine:
 
         # Run model for each sample (sequential)
         results = []
+        synergy_inputs = {}
 
         # Use tqdm progress bar if available, otherwise fall back to print
         try:
@@ -1362,7 +1438,9 @@ class MonteCarloEngine:
                     'effective_tariff_rate': eff_tariff,
                     'tariff_adjustment_hrc': calculate_tariff_adjustment(eff_tariff, 'hrc_us'),
                 })
+                synergy_inputs[i] = _synergy_inputs(analysis, ev_adjustment)
             except Exception as e:
+                count('mc.failed_iterations')
                 if verbose:
                     print(f"  Warning: Iteration {i} failed: {e}")
                 # Record NaN for failed iterations (matching column structure above)
@@ -1382,7 +1460,9 @@ class MonteCarloEngine:
                     'tariff_adjustment_hrc': np.nan,
                 })
 
+        count('mc.iterations', self.n_simulations)
         self.simulation_results = pd.DataFrame(results)
+        self._apply_sampled_synergies(synergy_inputs)
 
         # Remove failed iterations
         n_failed = self.simulation_results['uss_share_price'].isna().sum()
@@ -1411,7 +1491,8 @@ class MonteCarloEngine:
 
         # More chunks than workers gives better progress granularity
         n_chunks = min(self.n_workers * 4, self.n_simulations)
-        chunks = np.array_split(input_samples, n_chunks)
+        chunks = [input_samples.iloc[idx]
+                  for idx in np.array_split(np.arange(len(input_samples)), n_chunks)]
 
         batch_args = [
             (chunk, self.base_scenario, include_projects, execution_factor_override)
@@ -1419,6 +1500,7 @@ class MonteCarloEngine:
         ]
 
         results = []
+        synergy_inputs = {}
         completed = 0
 
         # Use tqdm progress bar for parallel execution
@@ -1435,14 +1517,18 @@ class MonteCarloEngine:
         except ImportError:
             pbar = None
 
+        # Workers return their timers/counters with each batch when profiling is on
+        profiler = get_profiler()
         with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
             futures = {
-                executor.submit(_simulate_batch, args): i
+                executor.submit(run_profiled, _simulate_batch, args, profiler.enabled): i
                 for i, args in enumerate(batch_args)
             }
             for future in as_completed(futures):
-                batch_results = future.result()
+                (batch_results, batch_synergy_inputs), worker_profile = future.result()
+                profiler.merge(worker_profile)
                 results.extend(batch_results)
+                synergy_inputs.update(batch_synergy_inputs)
                 completed += 1
 
                 if pbar:
@@ -1455,6 +1541,7 @@ class MonteCarloEngine:
             pbar.close()
 
         self.simulation_results = pd.DataFrame(results)
+        self._apply_sampled_synergies(synergy_inputs)
 
         # Remove failed iterations
         n_failed = self.simulation_results['uss_share_price'].isna().sum()
@@ -1469,6 +1556,41 @@ class MonteCarloEngine:
 
         return self.simulation_results
 
+    @profiled('mc.apply_sampled_synergies')
+    def _apply_sampled_synergies(self, synergy_inputs: Dict[int, Dict]):
+        """Add sampled synergies to the Nippon view of every completed iteration.
+
+        Iterations run the model without synergies; the synergy schedule and its
+        DCF contribution are then computed for all iterations in one array pass
+        (compute_synergy_vectors / synergy_enterprise_value), so sampling
+        synergies adds almost nothing to simulation time.
+        """
+        if self.synergies is None or not synergy_inputs:
+            return
+
+        results = self.simulation_results
+        done = results['iteration'].isin(list(synergy_inputs))
+        iterations = results.loc[done, 'iteration'].astype(int).values
+        records = [synergy_inputs[i] for i in iterations]
+
+        def stack(key):
+            return np.array([r[key] for r in records], dtype=float)
+
+        params = sample_synergy_parameters(
+            self.synergies, records[0]['years'], self.simulation_inputs.loc[iterations])
+        vectors = compute_synergy_vectors(params, stack('revenue'), stack('ebitda'))
+        synergy_ebitda = vectors['total_synergy_ebitda']
+        synergy_ev = synergy_enterprise_value(
+            synergy_ebitda, stack('wacc'), stack('terminal_growth'), stack('exit_multiple')
+        ) * stack('ev_adjustment')
+
+        nippon_ev = results.loc[done, 'nippon_enterprise_value'].values + synergy_ev
+        results.loc[done, 'nippon_enterprise_value'] = nippon_ev
+        results.loc[done, 'nippon_share_price'] = np.maximum(0, nippon_ev + stack('equity_bridge')) / 225.0
+        results.loc[done, 'synergy_enterprise_value'] = synergy_ev
+        results.loc[done, 'run_rate_synergies'] = synergy_ebitda[:, -1]
+
+    @profiled('mc.build_scenario')
     def _build_scenario_from_sample(
         self,
         sample: pd.Series,
@@ -1707,6 +1829,11 @@ class MonteCarloEngine:
 
         print(f"\nSimulations: {len(results):,}")
         print(f"Sampling: {'Latin Hypercube' if self.use_lhs else 'Random'}")
+        if self._sampler is not None and self._sampler.repair['repaired']:
+            repair = self._sampler.repair
+            print(f"Correlations: repaired to nearest valid matrix "
+                  f"(Frobenius change {repair['frobenius_change']:.3f}, "
+                  f"max |change| {repair['max_abs_change']:.3f})")
 
         print("\n" + "-" * 80)
         print("DUAL-PERSPECTIVE COMPARISON")
@@ -1816,7 +1943,7 @@ if __name__ == "__main__":
     output_dir = Path(__file__).parent.parent / 'data'
     output_dir.mkdir(exist_ok=True)
 
-    results.to_csv(output_dir / 'monte_carlo_results.csv', index=False)
-    mc.simulation_inputs.to_csv(output_dir / 'monte_carlo_inputs.csv', index=False)
+    from monte_carlo.result_store import DEFAULT_RESULT_STORE, write_result_store
+    write_result_store(output_dir / DEFAULT_RESULT_STORE.name, mc)
 
     print(f"\nResults saved to {output_dir}")
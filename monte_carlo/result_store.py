@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo Result Store
+========================
+
+Columnar store for one Monte Carlo run: sampled inputs and model outputs
+side by side in a single Parquet file (zstd, row-grouped), keyed by
+iteration, with the run's provenance in the file metadata.
+
+- Outputs keep their engine column names; inputs are stored as
+  'input.<variable>'. Iterations that failed have null outputs and
+  completed = False, so every sampled input row is kept.
+- MCResultWriter appends row groups chunk by chunk (e.g. as worker batches
+  complete) and only replaces the target file once closed.
+- Reads are column-projected and memory-mapped: opening a multi-million
+  iteration store for two columns only touches those column chunks.
+
+Usage:
+    from monte_carlo.result_store import write_result_store, read_results
+
+    write_result_store(DEFAULT_RESULT_STORE, mc)
+    prices = read_results(DEFAULT_RESULT_STORE, columns=['uss_share_price'])
+    meta = read_metadata(DEFAULT_RESULT_STORE)
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# Default store written by scripts/run_monte_carlo_analysis.py
+DEFAULT_RESULT_STORE = Path(__file__).parent.parent / 'data' / 'monte_carlo_results.parquet'
+
+RESULT_STORE_FORMAT = 'uss-mc-result-store'
+RESULT_STORE_VERSION = 1
+
+# Parquet key holding the JSON run metadata
+METADATA_KEY = b'uss_mc_run'
+
+INPUT_PREFIX = 'input.'
+ITERATION_COLUMN = 'iteration'
+COMPLETED_COLUMN = 'completed'
+
+DEFAULT_ROW_GROUP_SIZE = 100_000
+COMPRESSION = 'zstd'
+
+PathLike = Union[str, Path]
+
+
+# =============================================================================
+# METADATA
+# =============================================================================
+
+def file_hash(path: Optional[PathLike]) -> Optional[str]:
+    """md5 of a file's bytes (first 16 hex chars), None if missing"""
+    if path is None or not Path(path).exists():
+        return None
+    return hashlib.md5(Path(path).read_bytes()).hexdigest()[:16]
+
+
+def run_metadata(mc, **extra) -> Dict:
+    """
+    Provenance of a MonteCarloEngine run
+
+    Args:
+        mc: MonteCarloEngine after run_simulation()
+        **extra: Additional JSON-serializable fields
+
+    Returns:
+        Dict with seed, sampling method, config path/hash, calibration mode,
+        engine version and variable names
+    """
+    from monte_carlo import __version__ as engine_version
+
+    if mc.bloomberg_calibration_used:
+        calibration_mode = 'bloomberg'
+    elif mc.config_file_used:
+        calibration_mode = 'config'
+    else:
+        calibration_mode = 'default'
+
+    metadata = {
+        'format': RESULT_STORE_FORMAT,
+        'version': RESULT_STORE_VERSION,
+        'engine_version': engine_version,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'n_simulations': int(mc.n_simulations),
+        'random_seed': mc.random_seed,
+        'sampling_method': 'lhs' if mc.use_lhs else 'random',
+        'n_workers': int(mc.n_workers),
+        'distributions_config': str(mc.config_path) if mc.config_file_used else None,
+        'distributions_config_hash': file_hash(mc.config_path) if mc.config_file_used else None,
+        'calibration_mode': calibration_mode,
+        'base_scenario': mc.base_scenario.name,
+        'synergies': mc.synergies.name if mc.synergies is not None else None,
+        'input_variables': list(mc.simulation_inputs.columns) if mc.simulation_inputs is not None else [],
+    }
+    metadata.update(extra)
+    return metadata
+
+
+# =============================================================================
+# WRITING
+# =============================================================================
+
+def combine_chunk(results: pd.DataFrame, inputs: pd.DataFrame) -> pd.DataFrame:
+    """
+    One store chunk: inputs (indexed by iteration) joined with their outputs
+
+    Inputs without an output row are kept with null outputs and
+    completed = False.
+    """
+    outputs = results.set_index(ITERATION_COLUMN)
+    combined = pd.DataFrame(index=pd.Index(inputs.index.astype(np.int64), name=ITERATION_COLUMN))
+    combined[COMPLETED_COLUMN] = combined.index.isin(outputs.index)
+    combined = combined.join(outputs, how='left')
+    combined = combined.join(inputs.add_prefix(INPUT_PREFIX).set_axis(combined.index))
+    return combined.reset_index()
+
+
+class MCResultWriter:
+    """
+    Append-only writer for a result store
+
+    Chunks are appended as row groups in arrival order, to a temporary
+    file that replaces `path` on close(), so readers never see a partial
+    store. Use as a context manager.
+    """
+
+    def __init__(self, path: PathLike, metadata: Optional[Dict] = None,
+                 row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        self.path = Path(path)
+        self.metadata = dict(metadata or {})
+        self.row_group_size = row_group_size
+        self.tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self.n_rows = 0
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._schema: Optional[pa.Schema] = None
+
+    def write_chunk(self, results: pd.DataFrame, inputs: pd.DataFrame):
+        """Append the outputs and inputs of one batch of iterations"""
+        self.write_table(combine_chunk(results, inputs))
+
+    def write_table(self, chunk: pd.DataFrame):
+        """Append an already combined chunk (see combine_chunk)"""
+        if self._writer is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            meta = dict(table.schema.metadata or {})
+            meta[METADATA_KEY] = json.dumps(self.metadata, default=str).encode()
+            self._schema = table.schema.with_metadata(meta)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.tmp_path, self._schema, compression=COMPRESSION)
+        else:
+            table = pa.Table.from_pandas(chunk[self._schema.names], schema=self._schema,
+                                         preserve_index=False)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.n_rows += len(chunk)
+
+    def close(self):
+        """Finish the file and move it into place"""
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Discard everything written so far"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self.tmp_path.exists():
+            self.tmp_path.unlink()
+
+    def __enter__(self) -> 'MCResultWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_result_store(path: PathLike, mc, chunk_size: int = DEFAULT_ROW_GROUP_SIZE,
+                       **metadata) -> Path:
+    """
+    Write a finished MonteCarloEngine run to a result store
+
+    Args:
+        path: Target .parquet file
+        mc: Engine after run_simulation()
+        chunk_size: Iterations per row group
+        **metadata: Extra metadata fields
+
+    Returns:
+        Path written
+    """
+    inputs = mc.simulation_inputs.sort_index()
+    results = mc.simulation_results.sort_values(ITERATION_COLUMN)
+    iterations = results[ITERATION_COLUMN].to_numpy()
+    with MCResultWriter(path, run_metadata(mc, **metadata), row_group_size=chunk_size) as writer:
+        if inputs.empty:
+            # No sampled iterations: still write the schema and run metadata
+            writer.write_chunk(results.iloc[:0], inputs)
+        for start in range(0, len(inputs), chunk_size):
+            chunk_inputs = inputs.iloc[start:start + chunk_size]
+            lo = np.searchsorted(iterations, chunk_inputs.index[0], side='left')
+            hi = np.searchsorted(iterations, chunk_inputs.index[-1], side='right')
+            writer.write_chunk(results.iloc[lo:hi], chunk_inputs)
+    return Path(path)
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+def read_metadata(path: PathLike) -> Dict:
+    """Run metadata of a store (reads only the footer)"""
+    schema = pq.read_schema(path)
+    raw = (schema.metadata or {}).get(METADATA_KEY)
+    return json.loads(raw) if raw else {}
+
+
+def store_columns(path: PathLike) -> Tuple[List[str], List[str]]:
+    """(output columns, input variable names) of a store"""
+    names = pq.read_schema(path).names
+    inputs = [n[len(INPUT_PREFIX):] for n in names if n.startswith(INPUT_PREFIX)]
+    outputs = [n for n in names if not n.startswith(INPUT_PREFIX)
+               and n not in (ITERATION_COLUMN, COMPLETED_COLUMN)]
+    return outputs, inputs
+
+
+def _read(path: PathLike, columns: List[str], completed_only: bool) -> pd.DataFrame:
+    filters = [(COMPLETED_COLUMN, '==', True)] if completed_only else None
+    table = pq.read_table(path, columns=[ITERATION_COLUMN] + columns,
+                          filters=filters, memory_map=True)
+    return table.to_pandas().set_index(ITERATION_COLUMN)
+
+
+def read_results(path: PathLike, columns: Optional[List[str]] = None,
+                 completed_only: bool = True) -> pd.DataFrame:
+    """
+    Model outputs indexed by iteration
+
+    Args:
+        path: Store file
+        columns: Output columns to read (default: all)
+        completed_only: Drop failed iterations (as run_simulation does)
+    """
+    if columns is None:
+        columns = store_columns(path)[0]
+    return _read(path, list(columns), completed_only)
+
+
+def read_inputs(path: PathLike, columns: Optional[List[str]] = None,
+                completed_only: bool = False) -> pd.DataFrame:
+    """
+    Sampled inputs indexed by iteration (variable names without prefix)
+
+    Args:
+        path: Store file
+        columns: Input variables to read (default: all)
+        completed_only: Only iterations that produced outputs
+    """
+    if columns is None:
+        columns = store_columns(path)[1]
+    df = _read(path, [INPUT_PREFIX + c for c in columns], completed_only)
+    df.columns = [c[len(INPUT_PREFIX):] for c in df.columns]
+    return df
+
+
+def load_result_store(path: PathLike = DEFAULT_RESULT_STORE) -> Tuple[pd.DataFrame, pd.DataFrame, Dict]:
+    """(results, inputs, metadata) of a store, both frames indexed by iteration"""
+    return read_results(path), read_inputs(path), read_metadata(path)
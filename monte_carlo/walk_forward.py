@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Walk-Forward Backtesting for Distribution Calibration
+======================================================
+
+Rolling-origin backtest of the fitted distributions: at every month-end
+origin each variable's distribution is refit on the trailing window and
+scored on the observations that follow (interval coverage and PIT).
+
+Refits reuse sufficient statistics instead of starting from scratch:
+- normal / lognormal: prefix sums of x and x^2 give every window's
+  moments at once
+- triangular: a sorted window is updated incrementally as the origin
+  advances, so percentiles are O(1) lookups
+
+Variables are backtested in parallel across a process pool.
+
+Usage:
+    from monte_carlo.walk_forward import load_backtest_series, run_walk_forward
+
+    series = load_backtest_series(DATA_DIR)
+    results = run_walk_forward(series, window_years=3, horizon_months=12)
+    results['hrc_price_factor']['coverage']['90']
+"""
+
+import bisect
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from monte_carlo.distribution_fitter import FIT_POOL_WORKERS
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Historical series backtested per model variable: (file, distribution type).
+# Series are used in levels; the fits are scale-equivariant, so dividing by a
+# benchmark price or the training mean does not change coverage or PIT.
+BACKTEST_SERIES = {
+    'hrc_price_factor': ('hrc_us_futures.csv', 'lognormal'),
+    'crc_price_factor': ('crc_us_spot.csv', 'lognormal'),
+    'octg_price_factor': ('octg_us_spot.csv', 'lognormal'),
+    'flat_rolled_volume': ('capacity_us.csv', 'normal'),
+    'tubular_volume': ('rig_count.csv', 'triangular'),
+    'ust_10y': ('ust_10y.csv', 'normal'),
+    'spread_bbb': ('spread_bbb.csv', 'normal'),
+}
+
+# Central prediction intervals scored at each origin
+COVERAGE_LEVELS = (0.50, 0.80, 0.90)
+
+# PIT histogram bins (uniform PIT = calibrated distribution)
+PIT_BINS = 10
+
+# Minimum observations in a training window / test block
+MIN_TRAIN_OBS = 30
+MIN_TEST_OBS = 5
+
+
+# =============================================================================
+# INCREMENTAL SUFFICIENT STATISTICS
+# =============================================================================
+
+class SortedWindow:
+    """
+    Sorted multiset of the values in a sliding window
+
+    add/remove keep the list sorted via bisection, so percentiles are
+    direct index lookups instead of a sort per refit.
+    """
+
+    def __init__(self):
+        self.values: List[float] = []
+
+    def add(self, x: float):
+        bisect.insort(self.values, x)
+
+    def remove(self, x: float):
+        del self.values[bisect.bisect_left(self.values, x)]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def percentile(self, q: float) -> float:
+        """Percentile with linear interpolation (matches np.percentile)"""
+        n = len(self.values)
+        pos = q / 100 * (n - 1)
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, n - 1)
+        return self.values[lo] + (pos - lo) * (self.values[hi] - self.values[lo])
+
+
+def window_moments(x: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count, mean and sample std (ddof=1) of x[lo:hi] for every window at once
+
+    Uses prefix sums of the shifted series, so each window costs O(1).
+    """
+    shift = x[0] if len(x) else 0.0
+    z = x - shift
+    s1 = np.concatenate([[0.0], np.cumsum(z)])
+    s2 = np.concatenate([[0.0], np.cumsum(z * z)])
+    n = (hi - lo).astype(float)
+    sum1 = s1[hi] - s1[lo]
+    sum2 = s2[hi] - s2[lo]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = sum1 / n
+        var = np.maximum(sum2 - sum1 * mean, 0.0) / (n - 1)
+    return n, mean + shift, np.sqrt(var)
+
+
+def _triangular_params(window: SortedWindow, mean: float) -> Tuple[float, float, float]:
+    """Triangular (min, mode, max) matching DistributionFitter._fit_triangular"""
+    min_val = window.percentile(1)
+    max_val = window.percentile(99)
+    mode_val = float(np.clip(3 * mean - min_val - max_val, min_val, max_val))
+    if mode_val == min_val or mode_val == max_val:
+        mode_val = window.percentile(50)
+    return min_val, mode_val, max_val
+
+
+# =============================================================================
+# ORIGINS
+# =============================================================================
+
+def month_end_origins(dates: np.ndarray, window_years: Optional[float],
+                      horizon_months: int) -> np.ndarray:
+    """
+    Month-end origins with a full training window behind and a full horizon ahead
+
+    Args:
+        dates: Sorted observation dates (datetime64)
+        window_years: Training window length (None = expanding from first date)
+        horizon_months: Test horizon after each origin
+
+    Returns:
+        Array of origin dates (datetime64[ns])
+    """
+    first, last = pd.Timestamp(dates[0]), pd.Timestamp(dates[-1])
+    start = first + pd.DateOffset(years=window_years) if window_years else first
+    end = last - pd.DateOffset(months=horizon_months)
+    if end < start:
+        return np.array([], dtype='datetime64[ns]')
+    return pd.date_range(start, end, freq='ME').values
+
+
+# =============================================================================
+# BACKTEST ENGINE
+# =============================================================================
+
+def backtest_series(
+    dates: np.ndarray,
+    values: np.ndarray,
+    dist_type: str,
+    window_years: Optional[float] = 3,
+    horizon_months: int = 12,
+    levels: Tuple[float, ...] = COVERAGE_LEVELS,
+    pit_bins: int = PIT_BINS
+) -> dict:
+    """
+    Walk-forward backtest of one series
+
+    At each month-end origin the distribution is refit on the trailing
+    window (dates in (origin - window, origin]) and scored on the
+    observations in (origin, origin + horizon].
+
+    Args:
+        dates: Observation dates
+        values: Observations (levels)
+        dist_type: 'normal', 'lognormal' or 'triangular'
+        window_years: Training window (None = expanding window)
+        horizon_months: Test horizon after each origin
+        levels: Central interval coverage levels to score
+        pit_bins: Number of PIT histogram bins
+
+    Returns:
+        Dict with pooled coverage per level, PIT histogram, coverage by
+        origin year and a per-origin table
+    """
+    order = np.argsort(dates, kind='stable')
+    dates = np.asarray(dates, dtype='datetime64[ns]')[order]
+    x = np.asarray(values, dtype=float)[order]
+    keep = ~np.isnan(x)
+    if dist_type == 'lognormal':
+        keep &= x > 0
+    dates, x = dates[keep], x[keep]
+
+    origins = month_end_origins(dates, window_years, horizon_months) if len(x) else []
+    if len(origins) == 0:
+        return {'dist_type': dist_type, 'n_origins': 0, 'valid': False,
+                'note': 'insufficient history for walk-forward backtest'}
+
+    # Window bounds for every origin: train = [train_lo, train_hi), test = [train_hi, test_hi)
+    if window_years:
+        train_start = (pd.DatetimeIndex(origins) - pd.DateOffset(years=window_years)).values
+        train_lo = np.searchsorted(dates, train_start, side='right')
+    else:
+        train_lo = np.zeros(len(origins), dtype=int)
+    train_hi = np.searchsorted(dates, origins, side='right')
+    test_end = (pd.DatetimeIndex(origins) + pd.DateOffset(months=horizon_months)).values
+    test_hi = np.searchsorted(dates, test_end, side='right')
+
+    usable = ((train_hi - train_lo) >= MIN_TRAIN_OBS) & ((test_hi - train_hi) >= MIN_TEST_OBS)
+    origins, train_lo, train_hi, test_hi = (origins[usable], train_lo[usable],
+                                            train_hi[usable], test_hi[usable])
+    if len(origins) == 0:
+        return {'dist_type': dist_type, 'n_origins': 0, 'valid': False,
+                'note': 'insufficient observations per window'}
+
+    # Refit at every origin from the sufficient statistics
+    fit_x = np.log(x) if dist_type == 'lognormal' else x
+    n_train, mean, std = window_moments(fit_x, train_lo, train_hi)
+
+    if dist_type in ('normal', 'lognormal'):
+        params = {'mean': mean, 'std': std}
+    elif dist_type == 'triangular':
+        tri = np.empty((len(origins), 3))
+        window = SortedWindow()
+        lo = hi = 0
+        for i in range(len(origins)):
+            # Slide the sorted window forward: add new, drop expired observations
+            for j in range(hi, train_hi[i]):
+                window.add(x[j])
+            for j in range(lo, min(train_lo[i], train_hi[i])):
+                window.remove(x[j])
+            lo, hi = train_lo[i], train_hi[i]
+            tri[i] = _triangular_params(window, mean[i])
+        params = {'min': tri[:, 0], 'mode': tri[:, 1], 'max': tri[:, 2]}
+    else:
+        raise ValueError(f"Unsupported distribution type for walk-forward: {dist_type}")
+
+    # PIT of every test observation under its origin's fit, in one pass
+    n_test = test_hi - train_hi
+    origin_id = np.repeat(np.arange(len(origins)), n_test)
+    obs_idx = np.arange(n_test.sum()) - np.repeat(np.cumsum(n_test) - n_test, n_test) + \
+        np.repeat(train_hi, n_test)
+    pit = _cdf(dist_type, {k: v[origin_id] for k, v in params.items()}, fit_x[obs_idx])
+
+    # Coverage of central intervals follows directly from the PIT
+    dev = np.abs(pit - 0.5)
+    coverage = {f"{int(round(level * 100))}": float(np.mean(dev <= level / 2)) for level in levels}
+    inside_90 = dev <= 0.45
+    origin_cov90 = np.bincount(origin_id, weights=inside_90, minlength=len(origins)) / n_test
+
+    hist, _ = np.histogram(pit, bins=pit_bins, range=(0.0, 1.0))
+    pit_hist = hist / hist.sum()
+
+    origin_years = pd.DatetimeIndex(origins).year
+    by_year = pd.Series(origin_cov90).groupby(origin_years).mean()
+
+    table = pd.DataFrame({
+        'origin': pd.DatetimeIndex(origins).strftime('%Y-%m-%d'),
+        'n_train': n_train.astype(int),
+        'n_test': n_test,
+        'coverage_90': origin_cov90,
+        'mean_pit': np.bincount(origin_id, weights=pit, minlength=len(origins)) / n_test,
+    })
+    for k, v in params.items():
+        table[k] = v
+
+    coverage_error = {k: coverage[k] - int(k) / 100 for k in coverage}
+
+    return {
+        'dist_type': dist_type,
+        'n_origins': int(len(origins)),
+        'first_origin': table['origin'].iloc[0],
+        'last_origin': table['origin'].iloc[-1],
+        'n_scored': int(len(pit)),
+        'coverage': coverage,
+        'coverage_error': coverage_error,
+        'pit_histogram': [float(v) for v in pit_hist],
+        'pit_max_deviation': float(np.max(np.abs(pit_hist - 1.0 / pit_bins))),
+        'coverage_90_by_year': {int(y): float(v) for y, v in by_year.items()},
+        'worst_origin_coverage_90': float(origin_cov90.min()),
+        'origins': table.to_dict(orient='records'),
+        'valid': coverage['90'] > 0.60 if '90' in coverage else True,
+    }
+
+
+def _cdf(dist_type: str, params: dict, x: np.ndarray) -> np.ndarray:
+    """Vectorized CDF (per-element parameters); lognormal x is already in logs"""
+    if dist_type in ('normal', 'lognormal'):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return stats.norm.cdf((x - params['mean']) / params['std'])
+    width = params['max'] - params['min']
+    c = np.where(width > 0, (params['mode'] - params['min']) / np.where(width > 0, width, 1), 0.5)
+    return stats.triang.cdf(x, c, loc=params['min'], scale=width)
+
+
+def _backtest_job(args: tuple) -> dict:
+    """Pool worker: backtest one variable"""
+    dates, values, dist_type, kwargs = args
+    return backtest_series(dates, values, dist_type, **kwargs)
+
+
+def run_walk_forward(
+    series: Dict[str, Tuple[np.ndarray, np.ndarray, str]],
+    window_years: Optional[float] = 3,
+    horizon_months: int = 12,
+    n_workers: int = FIT_POOL_WORKERS
+) -> Dict[str, dict]:
+    """
+    Walk-forward backtest of several variables in parallel
+
+    Args:
+        series: Mapping of variable -> (dates, values, dist_type)
+        window_years: Training window (None = expanding window)
+        horizon_months: Test horizon after each origin
+        n_workers: Worker processes (1 = run in-process)
+
+    Returns:
+        Mapping of variable -> backtest_series() result
+    """
+    kwargs = {'window_years': window_years, 'horizon_months': horizon_months}
+    jobs = {name: (dates, values, dist_type, kwargs) for name, (dates, values, dist_type) in series.items()}
+
+    results = {}
+    if n_workers > 1 and len(jobs) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(jobs))) as pool:
+                names = list(jobs)
+                for name, result in zip(names, pool.map(_backtest_job, [jobs[n] for n in names])):
+                    results[name] = result
+        except (BrokenProcessPool, OSError):
+            # No usable pool; run the remaining variables in-process
+            pass
+    for name, job in jobs.items():
+        if name not in results:
+            results[name] = _backtest_job(job)
+
+    return {name: results[name] for name in jobs}
+
+
+def load_backtest_series(data_dir: Path, end_date: Optional[str] = None,
+                         variables: Optional[List[str]] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray, str]]:
+    """
+    Load the BACKTEST_SERIES histories from processed Bloomberg exports
+
+    Args:
+        data_dir: Directory with processed CSVs (date, value)
+        end_date: Optional last date to include
+        variables: Subset of BACKTEST_SERIES keys (default: all)
+
+    Returns:
+        Mapping of variable -> (dates, values, dist_type); missing files are skipped
+    """
+    series = {}
+    for name in variables or BACKTEST_SERIES:
+        filename, dist_type = BACKTEST_SERIES[name]
+        filepath = Path(data_dir) / filename
+        if not filepath.exists():
+            continue
+        df = pd.read_csv(filepath, parse_dates=['date']).sort_values('date')
+        if end_date is not None:
+            df = df[df['date'] <= end_date]
+        series[name] = (df['date'].values, df['value'].values.astype(float), dist_type)
+    return series
@@ -61,6 +61,11 @@ SEVERE_DOWNTURN_EBITDA_DROP = 0.40  # 40% EBITDA decline in severe downturn
 INTEREST_RATE_SHOCK = 0.02          # +200bps rate shock
 YEN_DEPRECIATION_SHOCK = 0.15       # 15% yen weakening
 
+# Combined-shock grid parameters
+YEN_DEBT_TRANSLATION = 1 / 3        # Share of a yen move passing through to USD debt (15% → +5%)
+MIN_STRESS_COVERAGE = 2.0           # Coverage floor for liquidity adequacy
+STRESS_GRID_AXES = ('ebitda_drop', 'rate_shock', 'fx_move', 'synergy_realization', 'nsa_timing')
+
 
 # =============================================================================
 # DATA CLASSES
@@ -216,6 +221,86 @@ class StressTestResult:
     recovery_path: str = ""
 
 
+@dataclass
+class StressGridResult:
+    """Combined-shock stress grid over STRESS_GRID_AXES
+
+    Metric arrays have one dimension per axis, in STRESS_GRID_AXES order.
+    """
+
+    axes: Dict[str, np.ndarray]
+
+    # Stressed metrics
+    ebitda_usd: np.ndarray
+    debt_usd: np.ndarray
+    debt_to_ebitda: np.ndarray
+    interest_coverage: np.ndarray
+    liquidity_usd: np.ndarray  # Year 1 cash + revolver + FCF - NSA spend ($M)
+
+    @property
+    def n_points(self) -> int:
+        return int(self.debt_to_ebitda.size)
+
+    @property
+    def headroom(self) -> Dict[str, np.ndarray]:
+        """Distance to each threshold (negative = breach)"""
+        return {
+            'leverage': MAX_DEBT_TO_EBITDA_IG - self.debt_to_ebitda,
+            'coverage': self.interest_coverage - MIN_STRESS_COVERAGE,
+            'liquidity': self.liquidity_usd,
+        }
+
+    @property
+    def breaches(self) -> Dict[str, np.ndarray]:
+        """Boolean breach masks by metric, plus 'any' for a joint breach"""
+        masks = {name: h < 0 for name, h in self.headroom.items()}
+        masks['any'] = masks['leverage'] | masks['coverage'] | masks['liquidity']
+        return masks
+
+    def breach_surface(self, metric: str = 'leverage',
+                       row_axis: str = 'ebitda_drop',
+                       col_axis: str = 'rate_shock') -> pd.DataFrame:
+        """Share of grid points breaching, projected onto two axes
+
+        Remaining axes are averaged out, so a cell of 1.0 means every
+        combination of the other shocks breaches at that (row, col) point.
+        """
+        mask = self.breaches[metric]
+        i, j = STRESS_GRID_AXES.index(row_axis), STRESS_GRID_AXES.index(col_axis)
+        other = tuple(k for k in range(mask.ndim) if k not in (i, j))
+        surface = mask.mean(axis=other)
+        if i > j:
+            surface = surface.T
+        return pd.DataFrame(surface,
+                            index=pd.Index(self.axes[row_axis], name=row_axis),
+                            columns=pd.Index(self.axes[col_axis], name=col_axis))
+
+    def min_headroom_points(self, metric: str = 'leverage', n: int = 10) -> pd.DataFrame:
+        """Grid points with the smallest headroom for a metric"""
+        flat = self.headroom[metric].ravel()
+        n = min(n, flat.size)
+        idx = np.argpartition(flat, n - 1)[:n]
+        idx = idx[np.argsort(flat[idx])]
+        return self.to_frame().iloc[idx].reset_index(drop=True)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Flatten the grid to one row per shock combination"""
+        grids = np.meshgrid(*(self.axes[a] for a in STRESS_GRID_AXES), indexing='ij')
+        headroom = self.headroom
+        data = {a: g.ravel() for a, g in zip(STRESS_GRID_AXES, grids)}
+        data.update({
+            'ebitda_usd': self.ebitda_usd.ravel(),
+            'debt_usd': self.debt_usd.ravel(),
+            'debt_to_ebitda': self.debt_to_ebitda.ravel(),
+            'interest_coverage': self.interest_coverage.ravel(),
+            'liquidity_usd': self.liquidity_usd.ravel(),
+            'leverage_headroom': headroom['leverage'].ravel(),
+            'coverage_headroom': headroom['coverage'].ravel(),
+            'breach_any': self.breaches['any'].ravel(),
+        })
+        return pd.DataFrame(data)
+
+
 @dataclass
 class DealCapacityVerdict:
     """Final assessment of Nippon's deal capacity"""
@@ -507,6 +592,112 @@ def run_stress_test(profile: NipponFinancialProfile,
     )
 
 
+def run_stress_grid(profile: Optional[NipponFinancialProfile],
+                     pro_forma: ProFormaMetrics,
+                     ebitda_drops=None,
+                     rate_shocks=None,
+                     fx_moves=None,
+                     synergy_realizations=None,
+                     nsa_timings=None,
+                     nsa_schedule: NSACommitmentSchedule = None,
+                     funding_gap: FundingGapAnalysis = None,
+                     fx_rate: float = FX_RATE_JPY_USD) -> StressGridResult:
+    """Evaluate joint shocks over a full grid as one array computation
+
+    Each shock axis is broadcast against the others, so the result covers
+    every combination of:
+    - ebitda_drop: fractional EBITDA decline (0.25 = run_stress_test "downturn")
+    - rate_shock: parallel rate increase on all debt (0.02 = +200bps)
+    - fx_move: yen move vs USD, positive = weaker yen (0.15 = "yen_weak")
+    - synergy_realization: share of run-rate synergies achieved in Year 1
+    - nsa_timing: shift of the NSA schedule in years (-1 = one year early)
+
+    Zero shocks at the pro forma synergy realization and nsa_timing=0 reproduce
+    the Year 1 pro forma metrics. NSA spend pulled into Year 1 beyond the base
+    schedule is assumed debt-funded at bond rates.
+
+    profile is only read to compute funding_gap, so it may be None when a
+    precomputed funding_gap is passed.
+    """
+
+    if nsa_schedule is None:
+        nsa_schedule = NSACommitmentSchedule()
+    if funding_gap is None:
+        if profile is None:
+            raise ValueError("run_stress_grid needs a profile or a precomputed funding_gap")
+        funding_gap = analyze_funding_gap(profile, pro_forma, nsa_schedule, fx_rate=fx_rate)
+
+    synergy_run_rate = (pro_forma.stabilized_ebitda_usd - pro_forma.pre_deal_ebitda_usd -
+                        pro_forma.uss_ebitda_contribution)
+    base_realization = (pro_forma.synergy_value_year_1 / synergy_run_rate
+                        if synergy_run_rate > 0 else 0.0)
+
+    axes = {
+        'ebitda_drop': np.linspace(0.0, 0.50, 11) if ebitda_drops is None else ebitda_drops,
+        'rate_shock': np.linspace(0.0, 0.03, 7) if rate_shocks is None else rate_shocks,
+        'fx_move': np.linspace(-0.20, 0.30, 11) if fx_moves is None else fx_moves,
+        'synergy_realization': (np.array([0.0, base_realization, 0.5, 1.0])
+                                if synergy_realizations is None else synergy_realizations),
+        'nsa_timing': np.array([-1, 0, 1, 2]) if nsa_timings is None else nsa_timings,
+    }
+    axes = {name: np.atleast_1d(np.asarray(values, dtype=float)) for name, values in axes.items()}
+
+    # Reshape each axis so it broadcasts along its own dimension
+    n_axes = len(STRESS_GRID_AXES)
+    shaped = {}
+    for k, name in enumerate(STRESS_GRID_AXES):
+        shape = [1] * n_axes
+        shape[k] = -1
+        shaped[name] = axes[name].reshape(shape)
+
+    # NSA spend landing in Year 1: every scheduled year y with y + shift <= 1
+    schedule = nsa_schedule.get_annual_schedule()
+    sched_years = np.array(list(schedule.keys()), dtype=float)
+    sched_spend = np.array(list(schedule.values()), dtype=float)
+    nsa_y1 = ((sched_years[None, :] + axes['nsa_timing'][:, None]) <= 1) @ sched_spend
+    base_nsa_y1 = sched_spend[sched_years <= 1].sum()
+    nsa_y1 = nsa_y1.reshape(shaped['nsa_timing'].shape)
+    accelerated_debt = np.maximum(0.0, nsa_y1 - base_nsa_y1)
+
+    # EBITDA: swap Year 1 synergies for the sampled realization, then apply the drop
+    ebitda_ex_synergy = pro_forma.post_deal_ebitda_usd - pro_forma.synergy_value_year_1
+    ebitda = ((ebitda_ex_synergy + synergy_run_rate * shaped['synergy_realization']) *
+              (1 - shaped['ebitda_drop']))
+
+    # Debt: yen translation on existing debt plus debt-funded NSA acceleration
+    fx_mult = 1 + shaped['fx_move'] * YEN_DEBT_TRANSLATION
+    debt = pro_forma.post_deal_debt_usd * fx_mult + accelerated_debt
+
+    # Interest: translated base interest, rate shock on all debt, new NSA debt at bond rates
+    interest = (pro_forma.post_deal_interest_expense * fx_mult +
+                debt * shaped['rate_shock'] +
+                accelerated_debt * (US_10YR_TREASURY + BOND_SPREAD))
+
+    # Liquidity: Year 1 cash + revolver + stressed FCF, less NSA spend
+    base_ebitda = pro_forma.post_deal_ebitda_usd
+    stressed_fcf = (funding_gap.operating_fcf_annual - (base_ebitda - ebitda) -
+                    (interest - pro_forma.post_deal_interest_expense))
+    liquidity = (funding_gap.cash_available + funding_gap.credit_facility_headroom +
+                 stressed_fcf - nsa_y1)
+
+    full_shape = tuple(len(axes[a]) for a in STRESS_GRID_AXES)
+    ebitda, debt, interest, liquidity = (np.broadcast_to(a, full_shape)
+                                         for a in (ebitda, debt, interest, liquidity))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        leverage = np.where(ebitda > 0, debt / ebitda, 999.0)
+        coverage = np.where(interest > 0, ebitda / interest, 0.0)
+
+    return StressGridResult(
+        axes=axes,
+        ebitda_usd=ebitda,
+        debt_usd=debt,
+        debt_to_ebitda=leverage,
+        interest_coverage=coverage,
+        liquidity_usd=liquidity,
+    )
+
+
 def assess_deal_capacity(profile: NipponFinancialProfile,
                           fx_rate: float = FX_RATE_JPY_USD) -> DealCapacityVerdict:
     """Generate final deal capacity assessment"""
@@ -701,6 +892,25 @@ def get_stress_test_table(profile: NipponFinancialProfile,
     return pd.DataFrame(data)
 
 
+def get_stress_grid_summary_table(grid: StressGridResult) -> pd.DataFrame:
+    """Generate breach-rate and worst-point summary for a stress grid"""
+
+    breaches = grid.breaches
+    data = []
+    for metric in ['leverage', 'coverage', 'liquidity']:
+        worst = grid.min_headroom_points(metric, n=1).iloc[0]
+        row = {
+            "Metric": metric.title(),
+            "Breach Share": f"{breaches[metric].mean():.1%}",
+            "Min Headroom": (f"{worst['liquidity_usd']:,.0f}" if metric == 'liquidity'
+                             else f"{worst[f'{metric}_headroom']:.2f}x"),
+        }
+        row.update({axis: worst[axis] for axis in STRESS_GRID_AXES})
+        data.append(row)
+
+    return pd.DataFrame(data)
+
+
 def export_capacity_analysis(output_dir: Path = None) -> Dict[str, Path]:
     """Export all capacity analysis to CSV files"""
 
@@ -827,6 +1037,11 @@ def main():
         print(f"  IG Breach: {'Yes' if result.breaches_ig_threshold else 'No'}")
         print(f"  Risk Level: {result.covenant_breach_risk}")
 
+    grid = run_stress_grid(profile, pro_forma, funding_gap=funding_gap)
+    print(f"\nCombined-Shock Grid ({grid.n_points:,} scenarios):")
+    print(f"  Any Breach: {grid.breaches['any'].mean():.1%}")
+    print(get_stress_grid_summary_table(grid).to_string(index=False))
+
     # Final verdict
     verdict = assess_deal_capacity(profile)
 
@@ -14,12 +14,23 @@ Key Features:
 - IRP-adjusted WACC for cross-border valuation
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields as dataclass_fields, replace
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import atexit
+import copy
+import dataclasses
+import hashlib
+import os
+import threading
 import pandas as pd
 import numpy as np
 
+from instrumentation import count, get_profiler, profiled, run_profiled, timed
+
 # =============================================================================
 # OPTIONAL WACC MODULE INTEGRATION
 # =============================================================================
@@ -243,6 +254,8 @@ try:
         get_probability_details,
         get_probability_distribution_description,
         apply_probability_weights_to_scenarios,
+        get_calibrated_factor_sets,
+        get_calibration_data_version,
     )
     _scenario_calibrator_funcs = {
         'get_scenario_factors': get_scenario_factors,
@@ -254,6 +267,8 @@ try:
         'get_probability_details': get_probability_details,
         'get_probability_distribution_description': get_probability_distribution_description,
         'apply_probability_weights_to_scenarios': apply_probability_weights_to_scenarios,
+        'get_calibrated_factor_sets': get_calibrated_factor_sets,
+        'get_calibration_data_version': get_calibration_data_version,
     }
     SCENARIO_CALIBRATION_AVAILABLE = True
 except ImportError:
@@ -494,9 +509,9 @@ class SegmentVolumePrice:
     product_mix: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SteelPriceScenario:
-    """Steel price scenario assumptions"""
+    """Steel price scenario assumptions (immutable; derive with with_overrides)"""
     name: str
     description: str
 
@@ -520,10 +535,14 @@ class SteelPriceScenario:
     # FX factor adjusts USSE realized prices: realized_price *= (eur_usd_rate / 1.08)
     eur_usd_rate: float = 1.08
 
+    def with_overrides(self, **changes) -> 'SteelPriceScenario':
+        """Copy with the given fields changed"""
+        return replace(self, **changes)
 
-@dataclass
+
+@dataclass(frozen=True)
 class VolumeScenario:
-    """Volume/demand scenario assumptions"""
+    """Volume/demand scenario assumptions (immutable; derive with with_overrides)"""
     name: str
     description: str
 
@@ -539,6 +558,10 @@ class VolumeScenario:
     usse_growth_adj: float
     tubular_growth_adj: float
 
+    def with_overrides(self, **changes) -> 'VolumeScenario':
+        """Copy with the given fields changed"""
+        return replace(self, **changes)
+
 
 @dataclass
 class MacroScenario:
@@ -703,7 +726,7 @@ class CapitalProject:
 # SYNERGY AND TECHNOLOGY TRANSFER DATACLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class SynergyRampSchedule:
     """Year-by-year synergy realization (0.0-1.0)"""
     schedule: Dict[int, float] = field(default_factory=dict)
@@ -712,8 +735,12 @@ class SynergyRampSchedule:
         """Get realization factor for a given year"""
         return self.schedule.get(year, 0.0)
 
+    def get_realization_array(self, years: List[int]) -> np.ndarray:
+        """Get realization factors for a sequence of years"""
+        return np.array([self.schedule.get(year, 0.0) for year in years], dtype=float)
 
-@dataclass
+
+@dataclass(frozen=True)
 class OperatingSynergies:
     """Cost synergies from combined operations"""
     procurement_savings_annual: float = 0.0  # $M at run-rate
@@ -733,7 +760,7 @@ class OperatingSynergies:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class TechnologyTransfer:
     """Technology and operational improvements from Nippon know-how"""
     yield_improvement_pct: float = 0.0       # e.g., 0.02 = 2% yield improvement
@@ -745,7 +772,7 @@ class TechnologyTransfer:
     confidence: float = 0.70
 
 
-@dataclass
+@dataclass(frozen=True)
 class RevenueSynergies:
     """Revenue enhancement opportunities"""
     cross_sell_revenue_annual: float = 0.0  # $M additional revenue at run-rate
@@ -764,7 +791,7 @@ class RevenueSynergies:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class IntegrationCosts:
     """One-time integration and restructuring costs"""
     it_integration_cost: float = 0.0  # $M total IT integration
@@ -789,8 +816,12 @@ class IntegrationCosts:
         restructuring_cost = self.restructuring_cost * self.restructuring_spend_schedule.get(year, 0.0)
         return it_cost + cultural_cost + restructuring_cost
 
+    def get_cost_array(self, years: List[int]) -> np.ndarray:
+        """Get integration costs for a sequence of years"""
+        return np.array([self.get_cost_for_year(year) for year in years], dtype=float)
 
-@dataclass
+
+@dataclass(frozen=True)
 class SynergyAssumptions:
     """Complete synergy package for the merger"""
     name: str = "Default"
@@ -803,7 +834,7 @@ class SynergyAssumptions:
     overall_execution_factor: float = 1.0  # Additional haircut for execution risk
 
 
-@dataclass
+@dataclass(frozen=True)
 class FinancingAssumptions:
     """Assumptions for how USS would finance large capital programs standalone"""
     # Current balance sheet (Source: USS 10-K FY2023, CIQ reconciliation ±$25M net debt)
@@ -830,9 +861,13 @@ class FinancingAssumptions:
     equity_issuance_costs: float = 0.03  # 3% underwriting/issuance costs
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelScenario:
-    """Complete scenario combining price, volume, and WACC assumptions"""
+    """Complete scenario combining price, volume, and WACC assumptions
+
+    Scenarios are immutable so presets can be shared between callers; use
+    with_overrides() to derive variations.
+    """
     name: str
     scenario_type: ScenarioType
     description: str
@@ -888,6 +923,31 @@ class ModelScenario:
     # Values: multiplicative factors (e.g., 1.044 means 4.4% premium to benchmark)
     realization_factors: Optional[Dict[str, float]] = None
 
+    def with_overrides(self, **changes) -> 'ModelScenario':
+        """
+        Copy with the given fields changed; the original is untouched
+
+        Price and volume fields (e.g. hrc_us_factor, tubular_volume_factor)
+        are routed to the nested scenarios. Unchanged nested objects are
+        shared rather than copied.
+        """
+        own_fields = {f.name for f in dataclass_fields(self)}
+        price_fields = {f.name for f in dataclass_fields(SteelPriceScenario)}
+        volume_fields = {f.name for f in dataclass_fields(VolumeScenario)}
+
+        own = {k: v for k, v in changes.items() if k in own_fields}
+        price = {k: v for k, v in changes.items() if k not in own_fields and k in price_fields}
+        volume = {k: v for k, v in changes.items() if k not in own_fields and k in volume_fields}
+        unknown = set(changes) - set(own) - set(price) - set(volume)
+        if unknown:
+            raise TypeError(f"Unknown scenario fields: {sorted(unknown)}")
+
+        if price:
+            own['price_scenario'] = replace(own.get('price_scenario', self.price_scenario), **price)
+        if volume:
+            own['volume_scenario'] = replace(own.get('volume_scenario', self.volume_scenario), **volume)
+        return replace(self, **own)
+
 
 # =============================================================================
 # BENCHMARK INTEGRATION
@@ -1318,7 +1378,8 @@ def get_futures_optimistic_volume_scenario() -> VolumeScenario:
 
 def _apply_calibration_factors_to_scenario(
     base_scenario: ModelScenario,
-    calibration_mode: str = None
+    calibration_mode: str = None,
+    live_factors: bool = False
 ) -> ModelScenario:
     """
     Apply calibration factors to a ModelScenario based on the selected mode.
@@ -1333,6 +1394,8 @@ def _apply_calibration_factors_to_scenario(
     Args:
         base_scenario: The base ModelScenario to modify
         calibration_mode: One of 'fixed', 'bloomberg', 'hybrid', or None
+        live_factors: Use factors recalculated from current Bloomberg data
+            (cached by data version) instead of the static factor tables
 
     Returns:
         ModelScenario with potentially updated price factors
@@ -1360,7 +1423,10 @@ def _apply_calibration_factors_to_scenario(
 
     try:
         mode_enum = ScenarioCalibrationMode(calibration_mode)
-        factors = get_scenario_factors(calibration_name, mode_enum)
+        if live_factors:
+            factors = get_calibrated_factor_sets()[mode_enum].get(calibration_name)
+        else:
+            factors = get_scenario_factors(calibration_name, mode_enum)
 
         if factors:
             # Create a new price scenario with calibrated factors
@@ -1374,48 +1440,86 @@ def _apply_calibration_factors_to_scenario(
                 octg_factor=factors.octg,
                 annual_price_growth=factors.annual_price_growth,
             )
-
-            # Create a new scenario with updated price factors
-            # Using dataclass replace pattern (manual since we're using @dataclass)
-            return ModelScenario(
-                name=base_scenario.name,
-                scenario_type=base_scenario.scenario_type,
-                description=base_scenario.description,
-                price_scenario=calibrated_price,
-                volume_scenario=base_scenario.volume_scenario,
-                uss_wacc=base_scenario.uss_wacc,
-                terminal_growth=base_scenario.terminal_growth,
-                exit_multiple=base_scenario.exit_multiple,
-                us_10yr=base_scenario.us_10yr,
-                japan_10yr=base_scenario.japan_10yr,
-                nippon_equity_risk_premium=base_scenario.nippon_equity_risk_premium,
-                nippon_credit_spread=base_scenario.nippon_credit_spread,
-                nippon_debt_ratio=base_scenario.nippon_debt_ratio,
-                nippon_tax_rate=base_scenario.nippon_tax_rate,
-                override_irp=base_scenario.override_irp,
-                manual_nippon_usd_wacc=base_scenario.manual_nippon_usd_wacc,
-                include_projects=base_scenario.include_projects,
-                probability_weight=base_scenario.probability_weight,
-                financing=base_scenario.financing,
-                use_benchmark_multiples=base_scenario.use_benchmark_multiples,
-                synergies=base_scenario.synergies,
-                use_verified_wacc=base_scenario.use_verified_wacc,
-                wacc_audit_trail=base_scenario.wacc_audit_trail,
-                use_bloomberg_prices=base_scenario.use_bloomberg_prices,
-                bloomberg_price_override=base_scenario.bloomberg_price_override,
-            )
+            return replace(base_scenario, price_scenario=calibrated_price)
     except (ValueError, KeyError):
         pass
 
     return base_scenario
 
 
+# =============================================================================
+# SCENARIO PRESET REGISTRY
+# =============================================================================
+
+PRESET_CACHE_SIZE = 16  # (calibration, probability, live, data version) combinations kept
+
+_preset_cache: 'OrderedDict[tuple, Dict[ScenarioType, ModelScenario]]' = OrderedDict()
+_preset_cache_stats = {'hits': 0, 'misses': 0}
+
+
+class _FrozenDict(dict):
+    """Read-only dict for shared presets (repr, copies and pickling match dict)"""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("preset dicts are shared and read-only; copy with dict(...)")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class _FrozenList(list):
+    """Read-only list for shared presets (repr, copies and pickling match list)"""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("preset lists are shared and read-only; copy with list(...)")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+def _freeze(value):
+    """Deep read-only copy of a preset value (nested dataclasses are frozen)"""
+    if isinstance(value, dict):
+        return _FrozenDict({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(_freeze(v) for v in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return replace(value, **{f.name: _freeze(getattr(value, f.name))
+                                 for f in dataclass_fields(value) if f.init})
+    return value
+
+
+def clear_scenario_preset_cache():
+    """Drop all memoized scenario presets."""
+    _preset_cache.clear()
+    _preset_cache_stats.update(hits=0, misses=0)
+
+
+def get_scenario_preset_cache_stats() -> Dict[str, int]:
+    """Return hit/miss counts and current size of the preset registry."""
+    return {**_preset_cache_stats, 'size': len(_preset_cache)}
+
+
 def get_scenario_presets(
     calibration_mode: Optional[str] = None,
-    probability_mode: Optional[str] = None
+    probability_mode: Optional[str] = None,
+    live_factors: bool = False
 ) -> Dict[ScenarioType, ModelScenario]:
     """Return all pre-built scenario configurations
 
+    Presets are built once per (calibration_mode, probability_mode,
+    live_factors, Bloomberg data version) and shared: the scenarios and
+    everything nested in them (financing, synergies, realization_factors,
+    include_projects) are read-only, so derive variations with
+    scenario.with_overrides(...). The returned dict itself is a fresh copy
+    and may be modified.
+
     Scenarios calibrated to historical data (1990-2023):
     - Severe Downturn: 0-25th percentile (historical frequency: 24%)
     - Downside: 25-40th percentile (historical frequency: 30%)
@@ -1437,7 +1541,35 @@ def get_scenario_presets(
             - None: Use default hardcoded probability weights
             - 'fixed': Symmetric probability distribution
             - 'bloomberg': Percentile-based distribution from historical data
+        live_factors: With a calibration mode, take price factors recalculated
+            from the current Bloomberg data (see get_calibrated_factor_sets)
+            instead of the static tables. Refreshing the data updates them.
     """
+    data_version = None
+    if live_factors and calibration_mode and SCENARIO_CALIBRATION_AVAILABLE:
+        data_version = get_calibration_data_version()
+    key = (calibration_mode, probability_mode, bool(live_factors), data_version)
+
+    presets = _preset_cache.get(key)
+    if presets is not None:
+        _preset_cache.move_to_end(key)
+        _preset_cache_stats['hits'] += 1
+    else:
+        _preset_cache_stats['misses'] += 1
+        presets = {st: _freeze(scenario) for st, scenario in
+                   _build_scenario_presets(calibration_mode, probability_mode, live_factors).items()}
+        _preset_cache[key] = presets
+        if len(_preset_cache) > PRESET_CACHE_SIZE:
+            _preset_cache.popitem(last=False)
+    return dict(presets)
+
+
+def _build_scenario_presets(
+    calibration_mode: Optional[str],
+    probability_mode: Optional[str],
+    live_factors: bool
+) -> Dict[ScenarioType, ModelScenario]:
+    """Build every preset scenario from scratch (see get_scenario_presets)."""
 
     presets = {
         ScenarioType.SEVERE_DOWNTURN: ModelScenario(
@@ -1925,7 +2057,7 @@ def get_scenario_presets(
         calibrated_presets = {}
         for scenario_type, scenario in presets.items():
             calibrated_presets[scenario_type] = _apply_calibration_factors_to_scenario(
-                scenario, calibration_mode
+                scenario, calibration_mode, live_factors
             )
         presets = calibrated_presets
 
@@ -2107,6 +2239,177 @@ def get_synergy_presets() -> Dict[str, SynergyAssumptions]:
     }
 
 
+# =============================================================================
+# SYNERGY ENGINE
+# =============================================================================
+
+SYNERGY_TAX_RATE = 0.169  # Cash tax rate applied to synergy EBITDA
+
+# Synergy component columns as (vector key, schedule column)
+SYNERGY_COLUMNS = [
+    ('operating_synergy', 'Operating_Synergy'),
+    ('technology_synergy', 'Technology_Synergy'),
+    ('revenue_synergy', 'Revenue_Synergy'),
+    ('integration_cost', 'Integration_Cost'),
+    ('total_synergy_ebitda', 'Total_Synergy_EBITDA'),
+]
+
+
+def synergy_parameter_arrays(synergies: List[Optional[SynergyAssumptions]],
+                             years: List[int]) -> Dict[str, np.ndarray]:
+    """Flatten SynergyAssumptions into parameter arrays for compute_synergy_vectors.
+
+    Scalars become (n,) arrays and ramp/integration schedules (n, n_years)
+    arrays, one row per assumption set. None or disabled sets get
+    enabled=False and contribute zero synergy.
+    """
+    n = len(synergies)
+    n_years = len(years)
+    params = {
+        'enabled': np.zeros(n, dtype=bool),
+        'execution_factor': np.ones(n),
+        'operating_run_rate': np.zeros(n),
+        'operating_ramp': np.zeros((n, n_years)),
+        'yield_improvement_pct': np.zeros(n),
+        'yield_margin_impact': np.zeros(n),
+        'quality_price_premium_pct': np.zeros(n),
+        'conversion_cost_reduction_pct': np.zeros(n),
+        'technology_confidence': np.zeros(n),
+        'technology_ramp': np.zeros((n, n_years)),
+        'revenue_run_rate': np.zeros(n),
+        'revenue_ramp': np.zeros((n, n_years)),
+        'integration_cost': np.zeros((n, n_years)),
+    }
+
+    for i, syn in enumerate(synergies):
+        if syn is None or not syn.enabled:
+            continue
+        tech = syn.technology
+        params['enabled'][i] = True
+        params['execution_factor'][i] = syn.overall_execution_factor
+        params['operating_run_rate'][i] = syn.operating.get_total_run_rate()
+        params['operating_ramp'][i] = syn.operating.ramp_schedule.get_realization_array(years)
+        params['yield_improvement_pct'][i] = tech.yield_improvement_pct
+        params['yield_margin_impact'][i] = tech.yield_margin_impact
+        params['quality_price_premium_pct'][i] = tech.quality_price_premium_pct
+        params['conversion_cost_reduction_pct'][i] = tech.conversion_cost_reduction_pct
+        params['technology_confidence'][i] = tech.confidence
+        params['technology_ramp'][i] = tech.ramp_schedule.get_realization_array(years)
+        params['revenue_run_rate'][i] = syn.revenue.get_run_rate_ebitda()
+        params['revenue_ramp'][i] = syn.revenue.ramp_schedule.get_realization_array(years)
+        params['integration_cost'][i] = syn.integration.get_cost_array(years)
+
+    return params
+
+
+@profiled('synergy.compute_vectors')
+def compute_synergy_vectors(params: Dict[str, np.ndarray], revenue: np.ndarray,
+                            ebitda: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute synergy components for every assumption set and year at once.
+
+    Args:
+        params: Arrays from synergy_parameter_arrays (or sampled equivalents)
+        revenue: Consolidated revenue by year ($M), shape (n_years,) or (n, n_years)
+        ebitda: Consolidated EBITDA by year ($M), same shape as revenue
+
+    Returns:
+        Dict of (n, n_years) arrays keyed by SYNERGY_COLUMNS vector keys
+    """
+    def col(name):
+        return np.asarray(params[name], dtype=float)[:, None]
+
+    revenue = np.atleast_2d(np.asarray(revenue, dtype=float))
+    ebitda = np.atleast_2d(np.asarray(ebitda, dtype=float))
+    exec_factor = col('execution_factor')
+
+    operating = col('operating_run_rate') * params['operating_ramp'] * exec_factor
+
+    # Yield: 1% yield gain = ~0.8% margin; quality premium flows through at ~50%;
+    # conversion savings on the cost base (revenue - EBITDA) at 20% flowthrough
+    yield_boost = revenue * col('yield_improvement_pct') * col('yield_margin_impact')
+    quality_boost = revenue * col('quality_price_premium_pct') * 0.5
+    conversion_savings = (revenue - ebitda) * col('conversion_cost_reduction_pct') * 0.2
+    technology = ((yield_boost + quality_boost + conversion_savings) *
+                  col('technology_confidence') * params['technology_ramp'] * exec_factor)
+
+    revenue_synergy = col('revenue_run_rate') * params['revenue_ramp'] * exec_factor
+    integration = np.asarray(params['integration_cost'], dtype=float)
+
+    enabled = np.asarray(params['enabled'], dtype=bool)[:, None]
+    vectors = {
+        'operating_synergy': operating,
+        'technology_synergy': technology,
+        'revenue_synergy': revenue_synergy,
+        'integration_cost': integration,
+    }
+    vectors = {k: np.where(enabled, np.broadcast_to(v, operating.shape), 0.0) for k, v in vectors.items()}
+    vectors['total_synergy_ebitda'] = (vectors['operating_synergy'] + vectors['technology_synergy'] +
+                                       vectors['revenue_synergy'] - vectors['integration_cost'])
+    return vectors
+
+
+def calculate_synergy_vectors(synergies: List[Optional[SynergyAssumptions]], years: List[int],
+                              revenue: np.ndarray, ebitda: np.ndarray) -> Dict[str, np.ndarray]:
+    """Synergy components for a batch of SynergyAssumptions over all years."""
+    return compute_synergy_vectors(synergy_parameter_arrays(synergies, years), revenue, ebitda)
+
+
+@profiled('synergy.enterprise_value')
+def synergy_enterprise_value(synergy_ebitda: np.ndarray, wacc, terminal_growth,
+                             exit_multiple) -> np.ndarray:
+    """Blended DCF enterprise value added by synergy EBITDA, one value per row.
+
+    The DCF is linear in FCF and terminal EBITDA, so this equals
+    calculate_dcf(apply_synergy_ebitda(df, s))['ev_blended'] minus the same
+    valuation with zero synergies, without re-running the DCF per row.
+
+    Args:
+        synergy_ebitda: Net synergy EBITDA, shape (n, n_years)
+        wacc: Discount rate, scalar or (n,)
+        terminal_growth: Terminal growth rate, scalar or (n,)
+        exit_multiple: Exit EV/EBITDA multiple, scalar or (n,)
+
+    Returns:
+        (n,) array of incremental enterprise value ($M)
+    """
+    synergy_ebitda = np.atleast_2d(np.asarray(synergy_ebitda, dtype=float))
+    n, n_years = synergy_ebitda.shape
+    wacc = np.broadcast_to(np.asarray(wacc, dtype=float), (n,))
+    growth = np.broadcast_to(np.asarray(terminal_growth, dtype=float), (n,))
+    multiple = np.broadcast_to(np.asarray(exit_multiple, dtype=float), (n,))
+
+    discount = (1.0 / (1.0 + wacc[:, None])) ** np.arange(1, n_years + 1)
+    synergy_fcf = synergy_ebitda * (1 - SYNERGY_TAX_RATE)
+    pv_fcf = (synergy_fcf * discount).sum(axis=1)
+
+    spread = wacc - growth
+    tv_gordon = np.where(spread > 0, synergy_fcf[:, -1] * (1 + growth) / np.where(spread > 0, spread, 1.0), 0.0)
+    tv_exit = synergy_ebitda[:, -1] * multiple
+    return pv_fcf + (tv_gordon + tv_exit) / 2 * discount[:, -1]
+
+
+@profiled('synergy.apply_ebitda')
+def apply_synergy_ebitda(consolidated: pd.DataFrame, synergy_ebitda: np.ndarray) -> pd.DataFrame:
+    """Add synergy EBITDA to a consolidated projection and recompute downstream cash flow.
+
+    Args:
+        consolidated: Consolidated projection (one row per year, in model year order)
+        synergy_ebitda: Net synergy EBITDA by year ($M), aligned with consolidated rows
+
+    Returns:
+        New DataFrame with Total_EBITDA, NOPAT, Gross_CF, FCF and EBITDA_Margin updated
+    """
+    df = consolidated.copy()
+    df['Total_EBITDA'] = df['Total_EBITDA'] + synergy_ebitda
+    nopat = (df['Total_EBITDA'] - df['DA']) * (1 - SYNERGY_TAX_RATE)
+    df['NOPAT'] = nopat
+    df['Gross_CF'] = nopat + df['DA']
+    df['FCF'] = df['Gross_CF'] - df['Total_CapEx'] + df['Delta_WC']
+    revenue = df['Revenue']
+    df['EBITDA_Margin'] = np.where(revenue > 0, df['Total_EBITDA'] / revenue.where(revenue > 0, 1.0), 0.0)
+    return df
+
+
 # =============================================================================
 # SEGMENT CONFIGURATIONS
 # =============================================================================
@@ -2362,6 +2665,53 @@ def get_capital_projects() -> Dict[str, CapitalProject]:
     }
 
 
+# =============================================================================
+# STAGE CACHE
+# =============================================================================
+
+# Scenario fields read by each stage of run_full_analysis(). Valuation-only
+# inputs (WACC, terminal growth, exit multiple, IRP) never reach the projection,
+# so changing them reuses the cached segment projection.
+STAGE_DEPENDENCIES = {
+    'projection': ('price_scenario', 'volume_scenario', 'include_projects', 'realization_factors'),
+    'wacc': ('uss_wacc', 'use_verified_wacc', 'us_10yr', 'japan_10yr',
+             'nippon_equity_risk_premium', 'nippon_credit_spread', 'nippon_debt_ratio',
+             'nippon_tax_rate', 'override_irp', 'manual_nippon_usd_wacc'),
+    'financing': ('financing', 'uss_wacc'),
+    'synergies': ('synergies', 'terminal_growth'),
+    'dcf': ('name', 'terminal_growth', 'exit_multiple', 'use_benchmark_multiples'),
+}
+
+# Upstream stages whose outputs each stage consumes
+STAGE_UPSTREAM = {
+    'projection': (),
+    'wacc': (),
+    'financing': ('projection',),
+    'synergies': ('projection', 'wacc'),
+    'dcf': ('projection', 'wacc', 'financing', 'synergies'),
+}
+
+STAGE_CACHE_SIZE = 32  # Entries kept per stage (LRU)
+
+_stage_cache: Dict[str, 'OrderedDict[str, object]'] = {stage: OrderedDict() for stage in STAGE_DEPENDENCIES}
+_stage_cache_stats: Dict[str, Dict[str, int]] = {stage: {'hits': 0, 'misses': 0} for stage in STAGE_DEPENDENCIES}
+
+
+def clear_stage_cache():
+    """Drop all cached stage outputs (e.g. after segment or project data changes on disk)."""
+    for stage in _stage_cache:
+        _stage_cache[stage].clear()
+        _stage_cache_stats[stage] = {'hits': 0, 'misses': 0}
+
+
+def get_stage_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return hit/miss counts and current size for each stage cache."""
+    return {
+        stage: {**_stage_cache_stats[stage], 'size': len(_stage_cache[stage])}
+        for stage in _stage_cache
+    }
+
+
 # =============================================================================
 # MODEL ENGINE
 # =============================================================================
@@ -2377,7 +2727,8 @@ class PriceVolumeModel:
                          Only applies to incremental projects (not BR2 which is committed)
     """
 
-    def __init__(self, scenario: ModelScenario, execution_factor: float = 1.0, custom_benchmarks: dict = None, progress_callback=None):
+    def __init__(self, scenario: ModelScenario, execution_factor: float = 1.0, custom_benchmarks: dict = None, progress_callback=None,
+                 use_stage_cache: bool = True):
         """
         Initialize PriceVolumeModel
 
@@ -2386,11 +2737,14 @@ class PriceVolumeModel:
             execution_factor: Execution risk factor for Nippon Commitments (0.5-1.0)
             custom_benchmarks: Optional custom benchmark prices dict
             progress_callback: Optional function(percent, message) for progress updates
+            use_stage_cache: Reuse cached stage outputs from earlier runs whose
+                             upstream inputs match (see STAGE_DEPENDENCIES)
         """
         self.scenario = scenario
         self.execution_factor = execution_factor
         self.custom_benchmarks = custom_benchmarks or BENCHMARK_PRICES_2023
         self.progress_callback = progress_callback
+        self.use_stage_cache = use_stage_cache
         self.years = list(range(2024, 2034))
         self.segments = get_segment_configs()
         self.projects = get_capital_projects()
@@ -2405,6 +2759,46 @@ class PriceVolumeModel:
         if self.progress_callback is not None:
             self.progress_callback(percent, message)
 
+    def _stage_key(self, stage: str, upstream_keys: Dict[str, str]) -> str:
+        """Hash the scenario fields and upstream stage keys a stage depends on."""
+        fields = tuple(repr(getattr(self.scenario, name, None)) for name in STAGE_DEPENDENCIES[stage])
+        if stage == 'projection':
+            # Model-level inputs that also feed the projection
+            fields += (
+                repr(self.execution_factor),
+                repr(sorted(self.custom_benchmarks.items())),
+                repr(self.years),
+                repr(self.segments),
+                repr(self.projects),
+            )
+        upstream = tuple(upstream_keys[u] for u in STAGE_UPSTREAM[stage])
+        return hashlib.md5(repr((stage, fields, upstream)).encode()).hexdigest()
+
+    def _cached_stage(self, stage: str, upstream_keys: Dict[str, str], compute):
+        """Return a stage's output from the cache, computing and storing it on a miss.
+
+        Records the stage key in upstream_keys so downstream stages can chain on it.
+        Callers always receive a private copy, so mutating results is safe.
+        """
+        key = self._stage_key(stage, upstream_keys)
+        upstream_keys[stage] = key
+
+        if not self.use_stage_cache:
+            return compute()
+
+        cache = _stage_cache[stage]
+        if key in cache:
+            cache.move_to_end(key)
+            _stage_cache_stats[stage]['hits'] += 1
+            return copy.deepcopy(cache[key])
+
+        _stage_cache_stats[stage]['misses'] += 1
+        result = compute()
+        cache[key] = copy.deepcopy(result)
+        if len(cache) > STAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
     def get_benchmark_price(self, benchmark_type: str, year: int) -> float:
         """Calculate benchmark price for a given year, including tariff adjustment"""
         base_price = self.custom_benchmarks.get(benchmark_type, 700)
@@ -2641,6 +3035,7 @@ class PriceVolumeModel:
         # Maintenance capex: volume (kt) × $/ton / 1000 = $M
         return (effective_volume * project.maintenance_capex_per_ton) / 1000
 
+    @profiled('model.build_segment_projection')
     def build_segment_projection(self, segment: Segment) -> pd.DataFrame:
         """Build full projection for a segment"""
         seg = self.segments[segment]
@@ -2718,6 +3113,7 @@ class PriceVolumeModel:
 
         return pd.DataFrame(results)
 
+    @profiled('model.build_consolidated')
     def build_consolidated(self) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
         """Build consolidated projection from all segments with progress tracking"""
         segment_dfs = {}
@@ -2733,27 +3129,28 @@ class PriceVolumeModel:
 
         # Consolidate
         self._report_progress(38, "Consolidating segments...")
-        consolidated = []
-        metrics = ['Revenue', 'Total_EBITDA', 'DA', 'NOPAT', 'Gross_CF', 'Total_CapEx', 'Delta_WC', 'FCF']
+        with timed('model.consolidate_segments'):
+            consolidated = []
+            metrics = ['Revenue', 'Total_EBITDA', 'DA', 'NOPAT', 'Gross_CF', 'Total_CapEx', 'Delta_WC', 'FCF']
+
+            for year in self.years:
+                row = {'Year': year}
+                for metric in metrics:
+                    row[metric] = sum(
+                        df[df['Year'] == year][metric].values[0]
+                        for df in segment_dfs.values()
+                    )
 
-        for year in self.years:
-            row = {'Year': year}
-            for metric in metrics:
-                row[metric] = sum(
-                    df[df['Year'] == year][metric].values[0]
+                # Weighted average volume and price
+                total_volume = sum(
+                    df[df['Year'] == year]['Volume_000tons'].values[0]
                     for df in segment_dfs.values()
                 )
+                row['Total_Volume_000tons'] = total_volume
+                row['Avg_Price_per_ton'] = row['Revenue'] * 1000 / total_volume if total_volume > 0 else 0
+                row['EBITDA_Margin'] = row['Total_EBITDA'] / row['Revenue'] if row['Revenue'] > 0 else 0
 
-            # Weighted average volume and price
-            total_volume = sum(
-                df[df['Year'] == year]['Volume_000tons'].values[0]
-                for df in segment_dfs.values()
-            )
-            row['Total_Volume_000tons'] = total_volume
-            row['Avg_Price_per_ton'] = row['Revenue'] * 1000 / total_volume if total_volume > 0 else 0
-            row['EBITDA_Margin'] = row['Total_EBITDA'] / row['Revenue'] if row['Revenue'] > 0 else 0
-
-            consolidated.append(row)
+                consolidated.append(row)
 
         return pd.DataFrame(consolidated), segment_dfs
 
@@ -2768,77 +3165,41 @@ class PriceVolumeModel:
         - integration_cost: $M one-time integration costs
         - total_synergy_ebitda: Net synergy EBITDA contribution
         """
-        syn = self.scenario.synergies
-
-        # If synergies not enabled, return zeros
-        if syn is None or not syn.enabled:
-            return {
-                'operating_synergy': 0.0,
-                'technology_synergy': 0.0,
-                'revenue_synergy': 0.0,
-                'integration_cost': 0.0,
-                'total_synergy_ebitda': 0.0
-            }
-
-        exec_factor = syn.overall_execution_factor
-
-        # Operating synergies
-        op = syn.operating
-        op_ramp = op.ramp_schedule.get_realization(year)
-        operating_synergy = (
-            op.procurement_savings_annual * op.procurement_confidence +
-            op.logistics_savings_annual * op.logistics_confidence +
-            op.overhead_savings_annual * op.overhead_confidence
-        ) * op_ramp * exec_factor
-
-        # Technology transfer synergies
-        tech = syn.technology
-        tech_ramp = tech.ramp_schedule.get_realization(year)
-
-        # Calculate technology EBITDA impact based on segment revenues
-        technology_synergy = 0.0
         year_data = consolidated_df[consolidated_df['Year'] == year]
         if len(year_data) > 0:
-            total_revenue = year_data['Revenue'].values[0]
-            current_ebitda = year_data['Total_EBITDA'].values[0]
-
-            # Yield improvement: 1% yield gain = ~0.8% margin improvement (industry rule of thumb)
-            # 2% yield improvement = 1.6% margin = $240M on $15B revenue
-            yield_ebitda_boost = total_revenue * tech.yield_improvement_pct * tech.yield_margin_impact
-
-            # Quality price premium: premium on revenue flows through at ~50% margin
-            # 2% price premium on $15B = $300M revenue -> $150M EBITDA
-            quality_ebitda_boost = total_revenue * tech.quality_price_premium_pct * 0.5
-
-            # Conversion cost reduction: applied to cost base (~85% of revenue at 15% margin)
-            # 4% reduction on $12.75B cost base = $510M -> but EBITDA impact is the savings
-            cost_base = total_revenue - current_ebitda
-            conversion_savings = cost_base * tech.conversion_cost_reduction_pct * 0.2  # 20% flowthrough to EBITDA
-
-            # Combined technology synergy
-            technology_synergy = (yield_ebitda_boost + quality_ebitda_boost + conversion_savings) * tech.confidence * tech_ramp * exec_factor
+            revenue = year_data['Revenue'].values[:1]
+            ebitda = year_data['Total_EBITDA'].values[:1]
+        else:
+            # No projection for this year: technology synergy has no revenue base
+            revenue = ebitda = np.zeros(1)
 
-        # Revenue synergies
-        rev = syn.revenue
-        rev_ramp = rev.ramp_schedule.get_realization(year)
-        revenue_synergy = (
-            rev.cross_sell_revenue_annual * rev.cross_sell_margin * rev.cross_sell_confidence +
-            rev.product_mix_revenue_uplift * rev.product_mix_margin * rev.product_mix_confidence
-        ) * rev_ramp * exec_factor
+        vectors = calculate_synergy_vectors([self.scenario.synergies], [year], revenue, ebitda)
+        return {key: float(vectors[key][0, 0]) for key, _ in SYNERGY_COLUMNS}
 
-        # Integration costs (one-time, deducted from EBITDA)
-        integration_cost = syn.integration.get_cost_for_year(year)
+    @profiled('synergy.build_schedules')
+    def build_synergy_schedules(self, consolidated_df: pd.DataFrame,
+                                synergies: Dict[str, Optional[SynergyAssumptions]]) -> Dict[str, pd.DataFrame]:
+        """Build year-by-year synergy schedules for many SynergyAssumptions at once
 
-        # Net synergy EBITDA
-        total_synergy_ebitda = operating_synergy + technology_synergy + revenue_synergy - integration_cost
+        All components for all assumption sets and years are computed in one
+        array pass (see compute_synergy_vectors), e.g. to sweep get_synergy_presets().
 
-        return {
-            'operating_synergy': operating_synergy,
-            'technology_synergy': technology_synergy,
-            'revenue_synergy': revenue_synergy,
-            'integration_cost': integration_cost,
-            'total_synergy_ebitda': total_synergy_ebitda
-        }
+        Returns:
+            Dict mapping each key of synergies to a build_synergy_schedule-style DataFrame
+        """
+        years = consolidated_df['Year'].astype(int).tolist()
+        vectors = calculate_synergy_vectors(
+            list(synergies.values()), years,
+            consolidated_df['Revenue'].values, consolidated_df['Total_EBITDA'].values)
+
+        schedules = {}
+        for i, name in enumerate(synergies):
+            schedule = pd.DataFrame({'Year': years})
+            for key, column in SYNERGY_COLUMNS:
+                schedule[column] = vectors[key][i]
+            schedule['Cumulative_Synergy'] = np.cumsum(vectors['total_synergy_ebitda'][i])
+            schedules[name] = schedule
+        return schedules
 
     def build_synergy_schedule(self, consolidated_df: pd.DataFrame,
                                 segment_dfs: Dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -2853,25 +3214,9 @@ class PriceVolumeModel:
         - Total_Synergy_EBITDA: Net synergy contribution
         - Cumulative_Synergy: Running total
         """
-        results = []
-        cumulative = 0.0
-
-        for year in self.years:
-            impact = self.calculate_synergy_impact(year, consolidated_df, segment_dfs)
-            cumulative += impact['total_synergy_ebitda']
-
-            results.append({
-                'Year': year,
-                'Operating_Synergy': impact['operating_synergy'],
-                'Technology_Synergy': impact['technology_synergy'],
-                'Revenue_Synergy': impact['revenue_synergy'],
-                'Integration_Cost': impact['integration_cost'],
-                'Total_Synergy_EBITDA': impact['total_synergy_ebitda'],
-                'Cumulative_Synergy': cumulative
-            })
-
-        return pd.DataFrame(results)
+        return self.build_synergy_schedules(consolidated_df, {'scenario': self.scenario.synergies})['scenario']
 
+    @profiled('synergy.value')
     def calculate_synergy_value(self, synergy_schedule: pd.DataFrame, wacc: float) -> Dict:
         """Calculate NPV of synergies
 
@@ -2891,12 +3236,12 @@ class PriceVolumeModel:
             }
 
         # Get FCF from synergies (EBITDA less taxes, assume 16.9% cash tax)
-        synergy_fcf = synergy_schedule['Total_Synergy_EBITDA'].values * (1 - 0.169)
+        synergy_fcf = synergy_schedule['Total_Synergy_EBITDA'].values * (1 - SYNERGY_TAX_RATE)
 
         # Discount synergy FCF
         n_years = len(synergy_fcf)
-        discount_factors = [(1 / (1 + wacc)) ** (i + 1) for i in range(n_years)]
-        pv_synergies = sum(f * d for f, d in zip(synergy_fcf, discount_factors))
+        discount_factors = (1 / (1 + wacc)) ** np.arange(1, n_years + 1)
+        pv_synergies = float(synergy_fcf @ discount_factors)
 
         # Terminal value of run-rate synergies (at year 10 run-rate)
         terminal_synergy = synergy_fcf[-1] * (1 + self.scenario.terminal_growth)
@@ -2916,6 +3261,36 @@ class PriceVolumeModel:
             'synergy_value_per_share': npv_synergies / 225.0  # Assuming 225M shares
         }
 
+    def calculate_synergy_sweep(self, consolidated_df: pd.DataFrame,
+                                synergies: Dict[str, Optional[SynergyAssumptions]],
+                                wacc: float) -> pd.DataFrame:
+        """Value many synergy packages against one projection
+
+        Args:
+            consolidated_df: Consolidated projection from build_consolidated
+            synergies: Named SynergyAssumptions (e.g. get_synergy_presets())
+            wacc: Discount rate for synergies and the Nippon DCF
+
+        Returns:
+            DataFrame with one row per package: synergy NPV, run-rate, integration
+            costs and the resulting Nippon share price
+        """
+        schedules = self.build_synergy_schedules(consolidated_df, synergies)
+        rows = []
+        for name, schedule in schedules.items():
+            value = self.calculate_synergy_value(schedule, wacc)
+            adjusted = apply_synergy_ebitda(consolidated_df, schedule['Total_Synergy_EBITDA'].values)
+            dcf = self.calculate_dcf(adjusted, wacc, None)
+            rows.append({
+                'Synergy Case': name,
+                'NPV Synergies ($M)': value['npv_synergies'],
+                'Run-Rate Synergies ($M)': value['run_rate_synergies'],
+                'Integration Costs ($M)': value['total_integration_costs'],
+                'Synergy Value ($/sh)': value['synergy_value_per_share'],
+                'Value to Nippon ($/sh)': dcf['share_price'],
+            })
+        return pd.DataFrame(rows)
+
     def calculate_irp_wacc(self) -> Tuple[float, float, Optional[dict]]:
         """Calculate JPY WACC and IRP-adjusted USD WACC
 
@@ -2974,6 +3349,7 @@ class PriceVolumeModel:
 
         return jpy_wacc, usd_wacc, audit_trail
 
+    @profiled('model.calculate_financing_impact')
     def calculate_financing_impact(self, df: pd.DataFrame) -> Dict:
         """Calculate the impact of financing capital projects on USS standalone value.
 
@@ -3141,6 +3517,7 @@ class PriceVolumeModel:
 
         return pd.DataFrame(rows)
 
+    @profiled('model.calculate_dcf')
     def calculate_dcf(self, df: pd.DataFrame, wacc: float,
                        financing_impact: Optional[Dict] = None) -> Dict:
         """Calculate DCF valuation
@@ -3243,6 +3620,60 @@ class PriceVolumeModel:
             'used_benchmark_multiple': s.use_benchmark_multiples and effective_multiple != s.exit_multiple
         }
 
+    def _calculate_waccs(self) -> Tuple[float, float, float, dict]:
+        """Resolve USS WACC and Nippon JPY/USD WACCs with audit trail.
+
+        Returns:
+            Tuple of (uss_wacc, jpy_wacc, usd_wacc, wacc_audit_trail)
+        """
+        # Build WACC audit trail
+        wacc_audit_trail = {
+            'source': 'scenario parameters',
+            'uss': None,
+            'nippon': None,
+        }
+
+        # USS WACC: optionally load from module
+        uss_wacc = self.scenario.uss_wacc
+        if self.scenario.use_verified_wacc and WACC_MODULE_AVAILABLE:
+            verified_uss_wacc, uss_audit = get_verified_uss_wacc()
+            if verified_uss_wacc is not None:
+                uss_wacc = verified_uss_wacc
+                wacc_audit_trail['uss'] = uss_audit
+                wacc_audit_trail['source'] = 'wacc-calculations module'
+
+        # Nippon WACC: calculate with optional verification
+        jpy_wacc, usd_wacc, nippon_audit = self.calculate_irp_wacc()
+        if nippon_audit:
+            wacc_audit_trail['nippon'] = nippon_audit.get('nippon')
+            wacc_audit_trail['source'] = 'wacc-calculations module'
+
+        return uss_wacc, jpy_wacc, usd_wacc, wacc_audit_trail
+
+    @profiled('synergy.stage')
+    def _calculate_synergy_stage(self, consolidated: pd.DataFrame,
+                                 segment_dfs: Dict[str, pd.DataFrame],
+                                 usd_wacc: float) -> Tuple[Optional[pd.DataFrame], Optional[Dict], pd.DataFrame]:
+        """Build synergy schedule and value, and the synergy-adjusted projection.
+
+        Returns:
+            Tuple of (synergy_schedule, synergy_value, consolidated_for_nippon).
+            Without enabled synergies the schedule and value are None and the
+            unadjusted consolidated projection is returned.
+        """
+        if self.scenario.synergies is None or not self.scenario.synergies.enabled:
+            return None, None, consolidated
+
+        synergy_schedule = self.build_synergy_schedule(consolidated, segment_dfs)
+        synergy_value = self.calculate_synergy_value(synergy_schedule, usd_wacc)
+
+        # Add synergy EBITDA to consolidated for Nippon valuation, recalculate FCF
+        consolidated_with_synergies = apply_synergy_ebitda(
+            consolidated, synergy_schedule['Total_Synergy_EBITDA'].values)
+
+        return synergy_schedule, synergy_value, consolidated_with_synergies
+
+    @profiled('model.run_full_analysis')
     def run_full_analysis(self) -> Dict:
         """Run complete analysis and return all results with progress tracking
 
@@ -3264,97 +3695,49 @@ class PriceVolumeModel:
         - Loads USS WACC from wacc-calculations module
         - Loads Nippon WACC from wacc-calculations module
         - Populates wacc_audit_trail in results
+
+        Each stage (projection, wacc, financing, synergies, dcf) is cached on the
+        scenario fields it reads (STAGE_DEPENDENCIES) and its upstream stages, so
+        re-running with only WACC, terminal growth or exit multiple changed skips
+        the segment projection.
         """
+        # Stage keys chain each stage's cache entry to its upstream inputs
+        stage_keys = {}
+
         # Step 1: Build Projections (0-40%)
         self._report_progress(0, "Building segment projections...")
-        consolidated, segment_dfs = self.build_consolidated()
+        consolidated, segment_dfs = self._cached_stage('projection', stage_keys, self.build_consolidated)
         self._report_progress(40, "Projections complete")
 
         # Step 2: Calculate WACCs (40-45%)
         self._report_progress(42, "Calculating WACC...")
-
-        # Build WACC audit trail
-        wacc_audit_trail = {
-            'source': 'scenario parameters',
-            'uss': None,
-            'nippon': None,
-        }
-
-        # USS WACC: optionally load from module
-        uss_wacc = self.scenario.uss_wacc
-        if self.scenario.use_verified_wacc and WACC_MODULE_AVAILABLE:
-            verified_uss_wacc, uss_audit = get_verified_uss_wacc()
-            if verified_uss_wacc is not None:
-                uss_wacc = verified_uss_wacc
-                wacc_audit_trail['uss'] = uss_audit
-                wacc_audit_trail['source'] = 'wacc-calculations module'
-
-        # Nippon WACC: calculate with optional verification
-        jpy_wacc, usd_wacc, nippon_audit = self.calculate_irp_wacc()
-        if nippon_audit:
-            wacc_audit_trail['nippon'] = nippon_audit.get('nippon')
-            wacc_audit_trail['source'] = 'wacc-calculations module'
-
+        uss_wacc, jpy_wacc, usd_wacc, wacc_audit_trail = self._cached_stage(
+            'wacc', stage_keys, self._calculate_waccs)
         self._report_progress(45, "WACC calculated")
 
         # Step 3: Financing Impact (45-55%)
         self._report_progress(47, "Analyzing financing requirements...")
-        financing_impact = self.calculate_financing_impact(consolidated)
+        financing_impact = self._cached_stage(
+            'financing', stage_keys, lambda: self.calculate_financing_impact(consolidated))
         self._report_progress(55, "Financing analysis complete")
 
-        # Step 4: USS DCF (55-65%)
-        self._report_progress(57, "Running USS valuation...")
-        val_uss = self.calculate_dcf(consolidated, uss_wacc, financing_impact)
-        self._report_progress(65, "USS valuation complete")
-
-        # Steps 5-6: Synergies (65-80%)
-        synergy_schedule = None
-        synergy_value = None
-
-        if self.scenario.synergies is not None and self.scenario.synergies.enabled:
-            self._report_progress(67, "Building synergy schedule...")
-            synergy_schedule = self.build_synergy_schedule(consolidated, segment_dfs)
-            self._report_progress(72, "Calculating synergy value...")
-            synergy_value = self.calculate_synergy_value(synergy_schedule, usd_wacc)
-            self._report_progress(75, "Adjusting for synergies...")
-
-            # Create synergy-adjusted consolidated for Nippon valuation
-            # Add synergy EBITDA to consolidated, recalculate FCF
-            consolidated_with_synergies = consolidated.copy()
-            for idx, row in consolidated_with_synergies.iterrows():
-                year = row['Year']
-                synergy_row = synergy_schedule[synergy_schedule['Year'] == year]
-                if len(synergy_row) > 0:
-                    synergy_ebitda = synergy_row['Total_Synergy_EBITDA'].values[0]
-                    consolidated_with_synergies.at[idx, 'Total_EBITDA'] += synergy_ebitda
-                    # Recalculate downstream metrics
-                    new_ebitda = consolidated_with_synergies.at[idx, 'Total_EBITDA']
-                    da = consolidated_with_synergies.at[idx, 'DA']
-                    new_ebit = new_ebitda - da
-                    new_nopat = new_ebit * (1 - 0.169)  # 16.9% cash tax rate
-                    new_gross_cf = new_nopat + da
-                    capex = consolidated_with_synergies.at[idx, 'Total_CapEx']
-                    delta_wc = consolidated_with_synergies.at[idx, 'Delta_WC']
-                    new_fcf = new_gross_cf - capex + delta_wc
-
-                    consolidated_with_synergies.at[idx, 'NOPAT'] = new_nopat
-                    consolidated_with_synergies.at[idx, 'Gross_CF'] = new_gross_cf
-                    consolidated_with_synergies.at[idx, 'FCF'] = new_fcf
-                    consolidated_with_synergies.at[idx, 'EBITDA_Margin'] = new_ebitda / row['Revenue'] if row['Revenue'] > 0 else 0
-
-            # Step 7: Nippon DCF with synergies (80-95%)
-            self._report_progress(80, "Synergies incorporated")
-            self._report_progress(82, "Running Nippon valuation...")
-            val_nippon = self.calculate_dcf(consolidated_with_synergies, usd_wacc, None)
-            self._report_progress(95, "Nippon valuation complete")
-        else:
-            # Nippon view without synergies
-            self._report_progress(80, "Skipping synergies")
-            self._report_progress(82, "Running Nippon valuation...")
-            val_nippon = self.calculate_dcf(consolidated, usd_wacc, None)
-            self._report_progress(95, "Nippon valuation complete")
-
-        # Step 8: Assembly (95-100%)
+        # Step 4: Synergies (55-75%) - apply ONLY to the Nippon view
+        has_synergies = self.scenario.synergies is not None and self.scenario.synergies.enabled
+        self._report_progress(60, "Building synergy schedule..." if has_synergies else "Skipping synergies")
+        synergy_schedule, synergy_value, consolidated_with_synergies = self._cached_stage(
+            'synergies', stage_keys,
+            lambda: self._calculate_synergy_stage(consolidated, segment_dfs, usd_wacc))
+        self._report_progress(75, "Synergies incorporated" if has_synergies else "Synergies skipped")
+
+        # Step 5: USS DCF with financing impact, Nippon DCF with synergies (75-95%)
+        self._report_progress(80, "Running USS and Nippon valuations...")
+        val_uss, val_nippon = self._cached_stage(
+            'dcf', stage_keys,
+            lambda: (self.calculate_dcf(consolidated, uss_wacc, financing_impact),
+                     self.calculate_dcf(consolidated_with_synergies, usd_wacc, None)))
+        self._report_progress(95, "Valuations complete")
+
+        # Step 6: Assembly (95-100%)
         self._report_progress(97, "Assembling results...")
 
         results = {
@@ -3381,10 +3764,31 @@ class PriceVolumeModel:
 # SCENARIO COMPARISON
 # =============================================================================
 
+def comparison_execution_factor(scenario_type: ScenarioType, execution_factor: float = 1.0) -> float:
+    """Execution factor compare_scenarios applies to a preset
+
+    The requested factor applies to Nippon Commitments only; Project Failure
+    is fixed at 0.5 and every other preset runs at 1.0.
+    """
+    if scenario_type == ScenarioType.PROJECT_FAILURE:
+        return 0.5
+    if scenario_type == ScenarioType.NIPPON_COMMITMENTS:
+        return execution_factor
+    return 1.0
+
+
+# Columns of compare_scenarios(), in order
+SCENARIO_COMPARISON_COLUMNS = [
+    'Scenario', 'USS - No Sale ($/sh)', 'Value to Nippon ($/sh)', 'vs $55 Offer', 'WACC Advantage',
+    '10Y FCF ($B)', 'Implied EV/EBITDA', 'Avg EBITDA Margin', '2033 Revenue ($B)',
+]
+
+
 def compare_scenarios(scenario_types: List[ScenarioType] = None,
                       execution_factor: float = 1.0,
                       custom_benchmarks: dict = None,
-                      progress_bar=None) -> pd.DataFrame:
+                      progress_bar=None,
+                      analyses: Dict[ScenarioType, dict] = None) -> pd.DataFrame:
     """Run and compare multiple scenarios
 
     Args:
@@ -3392,6 +3796,8 @@ def compare_scenarios(scenario_types: List[ScenarioType] = None,
         execution_factor: Execution factor to apply to Nippon Commitments scenario (0.5-1.0)
         custom_benchmarks: Optional custom benchmark prices dict (default: use BENCHMARK_PRICES_2023)
         progress_bar: Optional Streamlit progress bar for tracking
+        analyses: Optional run_full_analysis() results by scenario type, already
+            run with the same execution factors and benchmarks; missing ones are run here
     """
 
     if scenario_types is None:
@@ -3408,15 +3814,13 @@ def compare_scenarios(scenario_types: List[ScenarioType] = None,
                 progress_pct = int((i / len(scenario_types)) * 100)
                 progress_bar.progress(progress_pct, text=f"Calculating scenario: {st.name} ({i}/{len(scenario_types)})")
 
-            # Apply execution factor to Nippon Commitments; Project Failure uses fixed 0.5
-            if st == ScenarioType.PROJECT_FAILURE:
-                ef = 0.5
-            elif st == ScenarioType.NIPPON_COMMITMENTS:
-                ef = execution_factor
+            if analyses is not None and st in analyses:
+                analysis = analyses[st]
             else:
-                ef = 1.0
-            model = PriceVolumeModel(presets[st], execution_factor=ef, custom_benchmarks=custom_benchmarks)
-            analysis = model.run_full_analysis()
+                # Apply execution factor to Nippon Commitments; Project Failure uses fixed 0.5
+                ef = comparison_execution_factor(st, execution_factor)
+                model = PriceVolumeModel(presets[st], execution_factor=ef, custom_benchmarks=custom_benchmarks)
+                analysis = model.run_full_analysis()
 
             # Calculate implied EV/EBITDA multiple
             ebitda_2024 = analysis['consolidated'].loc[analysis['consolidated']['Year'] == 2024, 'Total_EBITDA'].values[0]
@@ -3434,7 +3838,7 @@ def compare_scenarios(scenario_types: List[ScenarioType] = None,
                 '2033 Revenue ($B)': analysis['consolidated']['Revenue'].iloc[-1] / 1000
             })
 
-    return pd.DataFrame(results)
+    return pd.DataFrame(results, columns=SCENARIO_COMPARISON_COLUMNS)
 
 
 def calculate_probability_weighted_valuation(
@@ -3443,7 +3847,8 @@ def calculate_probability_weighted_valuation(
     custom_benchmarks: dict = None,
     progress_bar=None,
     calibration_mode: Optional[str] = None,
-    probability_mode: Optional[str] = None
+    probability_mode: Optional[str] = None,
+    analyses: Dict[ScenarioType, dict] = None
 ) -> Dict[str, any]:
     """
     Calculate probability-weighted expected value across scenarios
@@ -3455,6 +3860,8 @@ def calculate_probability_weighted_valuation(
         progress_bar: Optional Streamlit progress bar for tracking
         calibration_mode: Optional calibration mode ('fixed', 'bloomberg', 'hybrid')
         probability_mode: Optional probability mode ('fixed', 'bloomberg')
+        analyses: Optional run_full_analysis() results by scenario type (run
+            with custom_benchmarks); missing ones are run here
 
     Returns:
         Dict with weighted metrics and scenario breakdown
@@ -3503,8 +3910,11 @@ def calculate_probability_weighted_valuation(
             progress_pct = int((i / len(weighted_scenarios)) * 100)
             progress_bar.progress(progress_pct, text=f"Calculating scenario: {scenario.name} ({i}/{len(weighted_scenarios)})")
 
-        model = PriceVolumeModel(scenario, custom_benchmarks=custom_benchmarks)
-        analysis = model.run_full_analysis()
+        if analyses is not None and scenario_type in analyses:
+            analysis = analyses[scenario_type]
+        else:
+            model = PriceVolumeModel(scenario, custom_benchmarks=custom_benchmarks)
+            analysis = model.run_full_analysis()
         results[scenario_type] = {
             'name': scenario.name,
             'uss_value_per_share': analysis['val_uss']['share_price'],
@@ -3556,6 +3966,217 @@ def calculate_probability_weighted_valuation(
     }
 
 
+# =============================================================================
+# BATCH VALUATION GRIDS
+# =============================================================================
+# Dashboard sweeps (football field, price sensitivity) are declared as lists of
+# ValuationPoints and valued together: cached points return immediately, the
+# rest run on a shared worker pool that stays warm between reruns. The pool and
+# cache are shared by dashboard session threads, so both are guarded by locks.
+
+VALUATION_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+VALUATION_GRID_CACHE_SIZE = 256
+
+_valuation_pool = None
+_valuation_pool_lock = threading.Lock()
+_valuation_grid_cache = OrderedDict()
+_valuation_grid_lock = threading.Lock()
+
+
+@dataclass
+class ValuationPoint:
+    """One scenario to value as part of a sweep"""
+    label: str
+    scenario: ModelScenario
+    execution_factor: float = 1.0
+    group: str = ""
+
+
+def build_sensitivity_scenario(base: ModelScenario, price_factor: Optional[float] = None,
+                               exit_multiple: Optional[float] = None) -> ModelScenario:
+    """Copy the valuation inputs of a scenario, optionally flattening prices or the exit multiple
+
+    Args:
+        base: Scenario whose volumes, WACC inputs and projects are kept
+        price_factor: Uniform factor applied to every benchmark (None = keep base prices)
+        exit_multiple: Exit EV/EBITDA multiple (None = keep base multiple)
+    """
+    price_scenario = base.price_scenario
+    if price_factor is not None:
+        price_scenario = SteelPriceScenario(
+            name="Test", description="Test",
+            hrc_us_factor=price_factor, crc_us_factor=price_factor, coated_us_factor=price_factor,
+            hrc_eu_factor=price_factor, octg_factor=price_factor,
+            annual_price_growth=base.price_scenario.annual_price_growth
+        )
+    return ModelScenario(
+        name="Test", scenario_type=ScenarioType.CUSTOM, description="Test",
+        price_scenario=price_scenario,
+        volume_scenario=base.volume_scenario,
+        uss_wacc=base.uss_wacc,
+        terminal_growth=base.terminal_growth,
+        exit_multiple=base.exit_multiple if exit_multiple is None else exit_multiple,
+        us_10yr=base.us_10yr,
+        japan_10yr=base.japan_10yr,
+        nippon_equity_risk_premium=base.nippon_equity_risk_premium,
+        nippon_credit_spread=base.nippon_credit_spread,
+        nippon_debt_ratio=base.nippon_debt_ratio,
+        nippon_tax_rate=base.nippon_tax_rate,
+        override_irp=base.override_irp,
+        manual_nippon_usd_wacc=base.manual_nippon_usd_wacc,
+        include_projects=base.include_projects
+    )
+
+
+def preset_points(presets: Dict[ScenarioType, ModelScenario], execution_factor: float = 1.0,
+                  group: str = "scenarios") -> List[ValuationPoint]:
+    """Grid points for scenario presets (execution factor applies to Nippon Commitments only)"""
+    return [
+        ValuationPoint(label=st.name, scenario=preset, group=group,
+                       execution_factor=execution_factor if st == ScenarioType.NIPPON_COMMITMENTS else 1.0)
+        for st, preset in presets.items()
+    ]
+
+
+def price_factor_points(base: ModelScenario, price_factors: List[float],
+                        group: str = "price") -> List[ValuationPoint]:
+    """Grid points flattening all benchmark prices to each factor"""
+    return [ValuationPoint(label=f"{pf:.0%}", scenario=build_sensitivity_scenario(base, price_factor=pf),
+                           group=group)
+            for pf in price_factors]
+
+
+def exit_multiple_points(base: ModelScenario, exit_multiples: List[float],
+                         group: str = "exit_multiple") -> List[ValuationPoint]:
+    """Grid points varying the exit EV/EBITDA multiple"""
+    return [ValuationPoint(label=f"{em:.1f}x", scenario=build_sensitivity_scenario(base, exit_multiple=em),
+                           group=group)
+            for em in exit_multiples]
+
+
+def _value_grid_point(args) -> Dict[str, float]:
+    """Value one grid point (module level so worker processes can run it)"""
+    scenario, execution_factor, custom_benchmarks = args
+    analysis = PriceVolumeModel(scenario, execution_factor=execution_factor,
+                                custom_benchmarks=custom_benchmarks).run_full_analysis()
+    return {
+        'USS - No Sale ($/sh)': analysis['val_uss']['share_price'],
+        'Value to Nippon ($/sh)': analysis['val_nippon']['share_price'],
+        'USS EV ($M)': analysis['val_uss']['ev_blended'],
+        'Nippon EV ($M)': analysis['val_nippon']['ev_blended'],
+    }
+
+
+def _grid_point_key(point: ValuationPoint, custom_benchmarks: Optional[dict]) -> str:
+    payload = repr((point.scenario, point.execution_factor, sorted((custom_benchmarks or {}).items())))
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+def get_valuation_pool(n_workers: int = VALUATION_POOL_WORKERS) -> ProcessPoolExecutor:
+    """Shared worker pool for valuation grids, created on first use and kept warm
+
+    n_workers sizes the pool when it is created; a live pool is reused as is,
+    since other threads may still have work queued on it.
+    """
+    global _valuation_pool
+    with _valuation_pool_lock:
+        if _valuation_pool is None:
+            _valuation_pool = ProcessPoolExecutor(max_workers=n_workers)
+        return _valuation_pool
+
+
+def shutdown_valuation_pool(pool: Optional[ProcessPoolExecutor] = None):
+    """Stop the shared valuation worker pool, if running
+
+    Args:
+        pool: Only stop the shared pool if it is still this one (so a caller
+            recovering from a broken pool does not stop its replacement)
+    """
+    global _valuation_pool
+    with _valuation_pool_lock:
+        if _valuation_pool is None or (pool is not None and pool is not _valuation_pool):
+            return
+        stopping, _valuation_pool = _valuation_pool, None
+    stopping.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_valuation_pool)
+
+
+def clear_valuation_grid_cache():
+    """Drop cached grid point valuations"""
+    with _valuation_grid_lock:
+        _valuation_grid_cache.clear()
+
+
+def run_valuation_grid(points: List[ValuationPoint], custom_benchmarks: dict = None,
+                       n_workers: int = VALUATION_POOL_WORKERS,
+                       progress_callback=None) -> pd.DataFrame:
+    """Value a list of grid points, reusing cached results and the shared worker pool
+
+    Args:
+        points: Declarative grid (see preset_points, price_factor_points, exit_multiple_points)
+        custom_benchmarks: Optional custom benchmark prices dict
+        n_workers: Worker processes for uncached points (1 = run in this process)
+        progress_callback: Optional callable(completed, total, label), called as
+            each point finishes (in completion order when running in parallel)
+
+    Returns:
+        DataFrame with one row per point, in input order: Group, Label and the
+        USS / Nippon share prices and enterprise values
+    """
+    total = len(points)
+    keys = [_grid_point_key(p, custom_benchmarks) for p in points]
+    values = {}
+    completed = 0
+
+    def record(i, value):
+        nonlocal completed
+        values[i] = value
+        with _valuation_grid_lock:
+            _valuation_grid_cache[keys[i]] = value
+            _valuation_grid_cache.move_to_end(keys[i])
+            while len(_valuation_grid_cache) > VALUATION_GRID_CACHE_SIZE:
+                _valuation_grid_cache.popitem(last=False)
+        completed += 1
+        if progress_callback:
+            progress_callback(completed, total, points[i].label)
+
+    pending = []
+    for i, key in enumerate(keys):
+        with _valuation_grid_lock:
+            cached = _valuation_grid_cache.get(key)
+        if cached is not None:
+            record(i, cached)
+        else:
+            pending.append(i)
+    count('grid.cache_hits', total - len(pending))
+    count('grid.points_valued', len(pending))
+
+    args = {i: (points[i].scenario, points[i].execution_factor, custom_benchmarks) for i in pending}
+    if n_workers > 1 and len(pending) > 1:
+        profiler = get_profiler()
+        pool = None
+        try:
+            pool = get_valuation_pool(n_workers)
+            futures = {pool.submit(run_profiled, _value_grid_point, args[i], profiler.enabled): i
+                       for i in pending}
+            for future in as_completed(futures):
+                value, worker_profile = future.result()
+                profiler.merge(worker_profile)
+                record(futures[future], value)
+        except (BrokenProcessPool, CancelledError):
+            # Pool died (e.g. worker killed) or was stopped; finish the remaining points in-process
+            shutdown_valuation_pool(pool)
+    for i in pending:
+        if i not in values:
+            record(i, _value_grid_point(args[i]))
+
+    return pd.DataFrame([
+        {'Group': p.group, 'Label': p.label, **values[i]} for i, p in enumerate(points)
+    ])
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -16,12 +16,23 @@ Limitations (documented transparently):
 - COVID structural break in 2020Q2-Q3
 - Price dominates: macro adds ~21.5pp to R² (73% -> 95%)
 
+The revenue/HRC base and all indicators are aligned once into a quarter-indexed
+panel; each (analysis, indicator) pair runs as a cached task on a process pool
+(cache in local/demand_cache, keyed on the task's input data).
+
 Usage:
     python scripts/advanced_demand_analysis.py [--output-dir audit-verification] [--chart-dir charts]
+                                               [--workers N] [--no-cache]
 """
 
+import hashlib
+import inspect
+import os
+import pickle
 import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
@@ -41,8 +52,7 @@ from statsmodels.stats.diagnostic import acorr_ljungbox
 # Reuse data loading from demand_driver_analysis
 sys.path.insert(0, str(Path(__file__).parent))
 from demand_driver_analysis import (
-    load_quarterly_revenue, load_all_indicators, load_steel_prices_quarterly,
-    INDICATORS, STEEL_PRICES,
+    get_feature_store, INDICATORS, STEEL_PRICES,
 )
 
 # Suppress warnings for cleaner output
@@ -50,73 +60,301 @@ warnings.filterwarnings('ignore', category=FutureWarning)
 
 
 # ---------------------------------------------------------------------------
-# 1. Granger Causality Tests
+# 0. Aligned Indicator Panel & Analysis Cache
 # ---------------------------------------------------------------------------
+# Every analysis below works on the same revenue / HRC base. The panel aligns
+# it with all indicators once (quarter index, NaN where an indicator has no
+# data), and each (analysis, indicator) pair is an independent task that is
+# cached on its inputs and scheduled on a process pool.
 
-def run_granger_causality(
+# Disk cache for the panel and task results (alongside local/wrds_cache)
+DEMAND_CACHE_DIR = Path(__file__).parent.parent / 'local' / 'demand_cache'
+
+# Bump when panel construction or an analysis changes so stale results are ignored
+ANALYSIS_CACHE_VERSION = 1
+
+# Worker processes for analysis tasks (leave one core for the caller)
+ANALYSIS_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+# statsmodels 0.15 removed the verbose argument
+_GRANGER_KWARGS = {'verbose': False} if 'verbose' in inspect.signature(grangercausalitytests).parameters else {}
+
+
+def _frame_hash(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame (values and column names, not index)"""
+    h = hashlib.md5(str(list(df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()[:16]
+
+
+def panel_source_hash(
     revenue_df: pd.DataFrame,
     indicators: Dict[str, pd.DataFrame],
     steel_prices: Dict[str, pd.DataFrame],
-    max_lag: int = 4,
+) -> str:
+    """Hash of every input the indicator panel is built from."""
+    h = hashlib.md5(f"v{ANALYSIS_CACHE_VERSION}".encode())
+    h.update(_frame_hash(revenue_df[['fiscal_year', 'fiscal_quarter', 'revenue']]).encode())
+    h.update(_frame_hash(steel_prices['HRC US']).encode())
+    for name, ind_df in indicators.items():
+        h.update(name.encode())
+        h.update(_frame_hash(ind_df).encode())
+    return h.hexdigest()[:16]
+
+
+def build_indicator_panel(
+    revenue_df: pd.DataFrame,
+    indicators: Dict[str, pd.DataFrame],
+    steel_prices: Dict[str, pd.DataFrame],
+    cache_dir: Optional[Path] = None,
 ) -> pd.DataFrame:
     """
-    Test Granger causality: does each indicator predict revenue beyond HRC price?
-
-    Method: bivariate Granger test (indicator -> revenue), controlling for HRC
-    by testing residuals after removing HRC effect.
+    Quarter-indexed panel: revenue, hrc_price, revenue_residual (HRC effect
+    removed) and one column per indicator, over the revenue/HRC quarters.
 
-    Returns DataFrame with F-test and chi-squared p-values per indicator/lag.
+    With cache_dir the panel is stored as parquet keyed by panel_source_hash,
+    and reused until any input changes. Returns an empty DataFrame if HRC US
+    is unavailable.
     """
-    # Merge all data to common quarters
     if 'HRC US' not in steel_prices:
-        print("  WARNING: HRC US price not available, skipping Granger tests")
         return pd.DataFrame()
 
-    hrc = steel_prices['HRC US']
-    base = revenue_df.merge(hrc, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-    base = base.rename(columns={'indicator_value': 'hrc_price'})
-    base = base.sort_values(['fiscal_year', 'fiscal_quarter']).reset_index(drop=True)
+    source_hash = panel_source_hash(revenue_df, indicators, steel_prices)
+    path = cache_dir / f'indicator_panel_{source_hash}.parquet' if cache_dir is not None else None
+    if path is not None and path.exists():
+        panel = pd.read_parquet(path)
+    else:
+        hrc = steel_prices['HRC US'].rename(columns={'indicator_value': 'hrc_price'})
+        panel = revenue_df[['fiscal_year', 'fiscal_quarter', 'revenue']].merge(
+            hrc, on=['fiscal_year', 'fiscal_quarter'], how='inner'
+        )
+        panel = panel.sort_values(['fiscal_year', 'fiscal_quarter']).reset_index(drop=True)
+
+        # Residualize revenue (remove HRC price effect)
+        mask = panel['revenue'].notna() & panel['hrc_price'].notna()
+        slope, intercept, _, _, _ = stats.linregress(panel.loc[mask, 'hrc_price'], panel.loc[mask, 'revenue'])
+        panel['revenue_residual'] = panel['revenue'] - (slope * panel['hrc_price'] + intercept)
+
+        keys = ['fiscal_year', 'fiscal_quarter']
+        columns = {
+            name: panel[keys].merge(ind_df, on=keys, how='left')['indicator_value'].values
+            for name, ind_df in indicators.items()
+        }
+        panel = pd.concat([panel, pd.DataFrame(columns, index=panel.index)], axis=1)
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in path.parent.glob('indicator_panel_*.parquet'):
+                stale.unlink()
+            panel.to_parquet(path, index=False)
 
-    # Residualize revenue (remove HRC price effect)
-    mask = base['revenue'].notna() & base['hrc_price'].notna()
-    slope, intercept, _, _, _ = stats.linregress(base.loc[mask, 'hrc_price'], base.loc[mask, 'revenue'])
-    base['revenue_residual'] = base['revenue'] - (slope * base['hrc_price'] + intercept)
+    panel.index = pd.PeriodIndex.from_fields(
+        year=panel['fiscal_year'], quarter=panel['fiscal_quarter'], freq='Q'
+    ).rename('quarter')
+    panel.attrs['source_hash'] = source_hash
+    panel.attrs['indicators'] = list(indicators)
+    return panel
 
-    results = []
-    for name, ind_df in indicators.items():
-        merged = base.merge(ind_df, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-        merged = merged.sort_values(['fiscal_year', 'fiscal_quarter']).reset_index(drop=True)
 
-        if len(merged) < 15:
-            continue
+def indicator_frame(panel: pd.DataFrame, name: str) -> pd.DataFrame:
+    """Panel rows where an indicator is observed, with it as 'indicator_value'."""
+    rows = panel[panel[name].notna()]
+    frame = rows[['fiscal_year', 'fiscal_quarter', 'revenue', 'hrc_price', 'revenue_residual']].copy()
+    frame['indicator_value'] = rows[name]
+    return frame
 
-        # Prepare bivariate series: [revenue_residual, indicator]
-        data = merged[['revenue_residual', 'indicator_value']].dropna()
-        if len(data) < 15:
-            continue
 
+# Returned by AnalysisCache.get for a miss (task results may themselves be None)
+_MISS = object()
+
+
+class AnalysisCache:
+    """
+    Analysis task results keyed by (analysis, indicator, lag, window, input hash)
+
+    The input hash covers exactly the rows a task reads, so adding an
+    indicator or refreshing one series only recomputes the affected tasks.
+    With a path the cache persists between runs (pickle, versioned).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else None
+        self.entries: Dict[str, object] = {}
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None and self.path.exists():
+            try:
+                with open(self.path, 'rb') as f:
+                    stored = pickle.load(f)
+                if stored.get('version') == ANALYSIS_CACHE_VERSION:
+                    self.entries = stored.get('results', {})
+            except (pickle.UnpicklingError, EOFError, OSError, AttributeError):
+                # Corrupt cache file, start empty
+                self.entries = {}
+
+    @staticmethod
+    def key(kind: str, indicator: Optional[str], lag: Optional[int],
+            window: Optional[int], data_hash: str) -> str:
+        return f"{kind}:{indicator}:{lag}:{window}:{data_hash}"
+
+    def get(self, key: str):
+        """Cached result, or _MISS"""
+        if key not in self.entries:
+            self.misses += 1
+            return _MISS
+        self.hits += 1
+        return self.entries[key]
+
+    def put(self, key: str, result):
+        self.entries[key] = result
+
+    def save(self):
+        """Write the cache to its path (no-op for in-memory caches)"""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'wb') as f:
+            pickle.dump({'version': ANALYSIS_CACHE_VERSION, 'results': self.entries}, f)
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.entries)}
+
+
+def _analysis_job(task: tuple):
+    """Pool worker: run one (kind, indicator, data, params) analysis task."""
+    kind, name, data, params = task
+    return ANALYSIS_TASKS[kind](name, data, **params)
+
+
+def run_analysis_tasks(
+    tasks: List[tuple],
+    cache: Optional[AnalysisCache] = None,
+    n_workers: int = ANALYSIS_POOL_WORKERS,
+) -> List[object]:
+    """
+    Run analysis tasks, computing only cache misses.
+
+    Args:
+        tasks: (kind, indicator, data, params) tuples; params may carry
+               'max_lag' / 'window', which are part of the cache key
+        cache: Result cache (None = no caching)
+        n_workers: Worker processes for the misses (1 = run in-process)
+
+    Returns:
+        Task results in input order
+    """
+    results: List[object] = [None] * len(tasks)
+    pending = {}
+    for i, task in enumerate(tasks):
+        kind, name, data, params = task
+        key = None
+        if cache is not None:
+            key = AnalysisCache.key(kind, name, params.get('max_lag'), params.get('window'), _frame_hash(data))
+            cached = cache.get(key)
+            if cached is not _MISS:
+                results[i] = cached
+                continue
+        pending[i] = key
+
+    computed = {}
+    if n_workers > 1 and len(pending) > 1:
         try:
-            gc_results = grangercausalitytests(data.values, maxlag=min(max_lag, len(data) // 5), verbose=False)
-
-            for lag, res in gc_results.items():
-                f_test = res[0]['ssr_ftest']
-                chi2_test = res[0]['ssr_chi2test']
-                results.append({
-                    'indicator': name,
-                    'lag': lag,
-                    'f_stat': f_test[0],
-                    'f_pvalue': f_test[1],
-                    'chi2_stat': chi2_test[0],
-                    'chi2_pvalue': chi2_test[1],
-                    'n': len(data),
-                    'significant_005': f_test[1] < 0.05,
-                    'significant_010': f_test[1] < 0.10,
-                })
-        except Exception as e:
-            print(f"  Granger test failed for {name}: {e}")
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(pending))) as pool:
+                indices = list(pending)
+                for i, result in zip(indices, pool.map(_analysis_job, [tasks[i] for i in indices])):
+                    computed[i] = result
+        except (BrokenProcessPool, OSError):
+            # No usable pool (e.g. restricted sandbox); run what is left in-process
+            pass
+    for i in pending:
+        if i not in computed:
+            computed[i] = _analysis_job(tasks[i])
+
+    for i, result in computed.items():
+        # Failed tasks (reported as an error string) are not cached
+        if pending[i] is not None and not isinstance(result, str):
+            cache.put(pending[i], result)
+        results[i] = result
+    return results
+
+
+# ---------------------------------------------------------------------------
+# 1. Granger Causality Tests
+# ---------------------------------------------------------------------------
+
+def _granger_task(name: str, merged: pd.DataFrame, max_lag: int):
+    """Granger rows for one indicator, or an error string."""
+    if len(merged) < 15:
+        return []
+
+    # Prepare bivariate series: [revenue_residual, indicator]
+    data = merged[['revenue_residual', 'indicator_value']].dropna()
+    if len(data) < 15:
+        return []
+
+    try:
+        gc_results = grangercausalitytests(data.values, maxlag=min(max_lag, len(data) // 5), **_GRANGER_KWARGS)
+    except Exception as e:
+        return str(e)
+
+    rows = []
+    for lag, res in gc_results.items():
+        f_test = res[0]['ssr_ftest']
+        chi2_test = res[0]['ssr_chi2test']
+        rows.append({
+            'indicator': name,
+            'lag': lag,
+            'f_stat': f_test[0],
+            'f_pvalue': f_test[1],
+            'chi2_stat': chi2_test[0],
+            'chi2_pvalue': chi2_test[1],
+            'n': len(data),
+            'significant_005': f_test[1] < 0.05,
+            'significant_010': f_test[1] < 0.10,
+        })
+    return rows
+
+
+def granger_tasks(panel: pd.DataFrame, max_lag: int = 4) -> List[tuple]:
+    return [('granger', name, indicator_frame(panel, name), {'max_lag': max_lag})
+            for name in panel.attrs['indicators']]
+
+
+def _collect_granger(tasks: List[tuple], results: List[object]) -> pd.DataFrame:
+    rows = []
+    for (_, name, _, _), result in zip(tasks, results):
+        if isinstance(result, str):
+            print(f"  Granger test failed for {name}: {result}")
             continue
+        rows.extend(result)
+    return pd.DataFrame(rows)
 
-    return pd.DataFrame(results)
+
+def run_granger_causality(
+    revenue_df: pd.DataFrame,
+    indicators: Dict[str, pd.DataFrame],
+    steel_prices: Dict[str, pd.DataFrame],
+    max_lag: int = 4,
+    panel: Optional[pd.DataFrame] = None,
+    cache: Optional[AnalysisCache] = None,
+    n_workers: int = ANALYSIS_POOL_WORKERS,
+) -> pd.DataFrame:
+    """
+    Test Granger causality: does each indicator predict revenue beyond HRC price?
+
+    Method: bivariate Granger test (indicator -> revenue), controlling for HRC
+    by testing residuals after removing HRC effect.
+
+    Returns DataFrame with F-test and chi-squared p-values per indicator/lag.
+    """
+    if panel is None:
+        panel = build_indicator_panel(revenue_df, indicators, steel_prices)
+    if panel.empty:
+        print("  WARNING: HRC US price not available, skipping Granger tests")
+        return pd.DataFrame()
+
+    tasks = granger_tasks(panel, max_lag)
+    return _collect_granger(tasks, run_analysis_tasks(tasks, cache, n_workers))
 
 
 def summarize_granger(gc_df: pd.DataFrame) -> pd.DataFrame:
@@ -134,60 +372,45 @@ def summarize_granger(gc_df: pd.DataFrame) -> pd.DataFrame:
 # 2. Subperiod Stability Analysis
 # ---------------------------------------------------------------------------
 
-def subperiod_stability(
-    revenue_df: pd.DataFrame,
-    indicators: Dict[str, pd.DataFrame],
-    steel_prices: Dict[str, pd.DataFrame],
-) -> pd.DataFrame:
-    """
-    Test stability of correlations across subperiods:
-    - Pre-COVID (2015Q1-2019Q4) vs Post-COVID (2020Q1-2024Q4)
-    - Expansion (PMI > 50) vs Contraction (PMI <= 50)
-    """
-    if 'HRC US' not in steel_prices:
-        return pd.DataFrame()
+def _subperiod_task(name: str, merged: pd.DataFrame):
+    """Full and partial correlations for one indicator in each subperiod."""
+    rows = []
+    periods = [
+        ('Pre-COVID', merged[merged['fiscal_year'] <= 2019]),
+        ('Post-COVID', merged[merged['fiscal_year'] >= 2020]),
+        ('Full', merged),
+    ]
+    for period_name, period_df in periods:
+        if len(period_df) < 8:
+            continue
 
-    hrc = steel_prices['HRC US']
-    base = revenue_df.merge(hrc, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-    base = base.rename(columns={'indicator_value': 'hrc_price'})
+        # Full correlation
+        r_full, p_full = stats.pearsonr(period_df['indicator_value'], period_df['revenue'])
 
-    # Residualize revenue
-    mask = base['revenue'].notna() & base['hrc_price'].notna()
-    slope, intercept, _, _, _ = stats.linregress(base.loc[mask, 'hrc_price'], base.loc[mask, 'revenue'])
-    base['revenue_residual'] = base['revenue'] - (slope * base['hrc_price'] + intercept)
+        # Partial correlation (price removed)
+        r_partial, p_partial = np.nan, np.nan
+        if period_df['revenue_residual'].notna().sum() >= 8:
+            r_partial, p_partial = stats.pearsonr(period_df['indicator_value'], period_df['revenue_residual'])
 
-    # Define subperiods
-    pre_covid = base[base['fiscal_year'] <= 2019]
-    post_covid = base[base['fiscal_year'] >= 2020]
+        rows.append({
+            'indicator': name,
+            'period': period_name,
+            'n': len(period_df),
+            'r_full': r_full,
+            'p_full': p_full,
+            'r_partial': r_partial,
+            'p_partial': p_partial,
+        })
+    return rows
 
-    results = []
-    for name, ind_df in indicators.items():
-        for period_name, period_df in [('Pre-COVID', pre_covid), ('Post-COVID', post_covid), ('Full', base)]:
-            merged = period_df.merge(ind_df, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-            if len(merged) < 8:
-                continue
 
-            # Full correlation
-            r_full, p_full = stats.pearsonr(merged['indicator_value'], merged['revenue'])
-
-            # Partial correlation (price removed)
-            r_partial, p_partial = np.nan, np.nan
-            if 'revenue_residual' in merged.columns and merged['revenue_residual'].notna().sum() >= 8:
-                r_partial, p_partial = stats.pearsonr(merged['indicator_value'], merged['revenue_residual'])
-
-            results.append({
-                'indicator': name,
-                'period': period_name,
-                'n': len(merged),
-                'r_full': r_full,
-                'p_full': p_full,
-                'r_partial': r_partial,
-                'p_partial': p_partial,
-            })
+def subperiod_tasks(panel: pd.DataFrame) -> List[tuple]:
+    return [('subperiod', name, indicator_frame(panel, name), {})
+            for name in panel.attrs['indicators']]
 
-    df = pd.DataFrame(results)
 
-    # Flag unstable indicators (sign flip or significance loss)
+def _stability_flags(df: pd.DataFrame) -> pd.DataFrame:
+    """Flag unstable indicators (sign flip or significance loss)."""
     stability_flags = []
     for name in df['indicator'].unique():
         ind = df[df['indicator'] == name]
@@ -211,8 +434,33 @@ def subperiod_stability(
             'magnitude_change': magnitude_change,
             'stable': not sign_flip and (magnitude_change < 0.40 if not np.isnan(magnitude_change) else False),
         })
+    return pd.DataFrame(stability_flags)
 
-    return df, pd.DataFrame(stability_flags)
+
+def _collect_subperiod(results: List[object]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    df = pd.DataFrame([row for rows in results for row in rows])
+    return df, _stability_flags(df)
+
+
+def subperiod_stability(
+    revenue_df: pd.DataFrame,
+    indicators: Dict[str, pd.DataFrame],
+    steel_prices: Dict[str, pd.DataFrame],
+    panel: Optional[pd.DataFrame] = None,
+    cache: Optional[AnalysisCache] = None,
+    n_workers: int = ANALYSIS_POOL_WORKERS,
+) -> pd.DataFrame:
+    """
+    Test stability of correlations across subperiods:
+    - Pre-COVID (2015Q1-2019Q4) vs Post-COVID (2020Q1-2024Q4)
+    - Expansion (PMI > 50) vs Contraction (PMI <= 50)
+    """
+    if panel is None:
+        panel = build_indicator_panel(revenue_df, indicators, steel_prices)
+    if panel.empty:
+        return pd.DataFrame()
+
+    return _collect_subperiod(run_analysis_tasks(subperiod_tasks(panel), cache, n_workers))
 
 
 def compute_composite_indicator_score(
@@ -281,72 +529,92 @@ def compute_composite_indicator_score(
 # 3. Rolling Window Analysis
 # ---------------------------------------------------------------------------
 
+def _rolling_task(name: str, merged: pd.DataFrame, window: int):
+    """Rolling correlation of one indicator with the revenue residual."""
+    if len(merged) < window + 4:
+        return None
+
+    # Time index for plotting
+    dates = pd.PeriodIndex.from_fields(
+        year=merged['fiscal_year'], quarter=merged['fiscal_quarter'], freq='Q'
+    ).to_timestamp()
+
+    rolling_r = []
+    for i in range(window, len(merged) + 1):
+        window_data = merged.iloc[i-window:i]
+        if window_data['revenue_residual'].notna().sum() >= 8 and window_data['indicator_value'].notna().sum() >= 8:
+            r, _ = stats.pearsonr(window_data['indicator_value'], window_data['revenue_residual'])
+            rolling_r.append({
+                'date': dates[i - 1],
+                'fiscal_year': window_data['fiscal_year'].iloc[-1],
+                'fiscal_quarter': window_data['fiscal_quarter'].iloc[-1],
+                'r': r,
+                'n': len(window_data),
+            })
+
+    return pd.DataFrame(rolling_r) if rolling_r else None
+
+
+def rolling_tasks(panel: pd.DataFrame, window: int = 12) -> List[tuple]:
+    return [('rolling', name, indicator_frame(panel, name), {'window': window})
+            for name in panel.attrs['indicators']]
+
+
+def _collect_rolling(tasks: List[tuple], results: List[object]) -> Dict[str, pd.DataFrame]:
+    return {name: result for (_, name, _, _), result in zip(tasks, results) if result is not None}
+
+
 def rolling_correlation(
     revenue_df: pd.DataFrame,
     indicators: Dict[str, pd.DataFrame],
     steel_prices: Dict[str, pd.DataFrame],
     window: int = 12,
     top_n: int = 6,
+    panel: Optional[pd.DataFrame] = None,
+    cache: Optional[AnalysisCache] = None,
+    n_workers: int = ANALYSIS_POOL_WORKERS,
 ) -> Dict[str, pd.DataFrame]:
     """
     Compute 12-quarter rolling correlation for top indicators.
     Returns dict of indicator_name -> DataFrame with rolling r values.
     """
-    if 'HRC US' not in steel_prices:
+    if panel is None:
+        panel = build_indicator_panel(revenue_df, indicators, steel_prices)
+    if panel.empty:
         return {}
 
-    hrc = steel_prices['HRC US']
-    base = revenue_df.merge(hrc, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-    base = base.rename(columns={'indicator_value': 'hrc_price'})
-    base = base.sort_values(['fiscal_year', 'fiscal_quarter']).reset_index(drop=True)
-
-    # Residualize
-    mask = base['revenue'].notna() & base['hrc_price'].notna()
-    slope, intercept, _, _, _ = stats.linregress(base.loc[mask, 'hrc_price'], base.loc[mask, 'revenue'])
-    base['revenue_residual'] = base['revenue'] - (slope * base['hrc_price'] + intercept)
-
-    # Create time index for plotting
-    base['date'] = pd.to_datetime(
-        base['fiscal_year'].astype(str) + 'Q' + base['fiscal_quarter'].astype(str)
-    )
+    tasks = rolling_tasks(panel, window)
+    return _collect_rolling(tasks, run_analysis_tasks(tasks, cache, n_workers))
 
-    rolling_results = {}
-    for name, ind_df in indicators.items():
-        merged = base.merge(ind_df, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-        merged = merged.sort_values(['fiscal_year', 'fiscal_quarter']).reset_index(drop=True)
 
-        if len(merged) < window + 4:
-            continue
+# ---------------------------------------------------------------------------
+# 4. VAR Model
+# ---------------------------------------------------------------------------
 
-        # Rolling correlation with revenue residual
-        rolling_r = []
-        for i in range(window, len(merged) + 1):
-            window_data = merged.iloc[i-window:i]
-            if window_data['revenue_residual'].notna().sum() >= 8 and window_data['indicator_value'].notna().sum() >= 8:
-                r, _ = stats.pearsonr(window_data['indicator_value'], window_data['revenue_residual'])
-                rolling_r.append({
-                    'date': window_data['date'].iloc[-1] if 'date' in window_data.columns else i,
-                    'fiscal_year': window_data['fiscal_year'].iloc[-1],
-                    'fiscal_quarter': window_data['fiscal_quarter'].iloc[-1],
-                    'r': r,
-                    'n': len(window_data),
-                })
+# Energy indicator added to the trivariate VAR
+VAR_ENERGY_INDICATOR = 'WTI Crude'
 
-        if rolling_r:
-            rolling_results[name] = pd.DataFrame(rolling_r)
 
-    return rolling_results
+def var_task(panel: pd.DataFrame, max_lag: int = 4) -> tuple:
+    """VAR task on the revenue/HRC base (plus WTI where available)."""
+    wti_available = VAR_ENERGY_INDICATOR in panel.attrs['indicators']
+    if wti_available:
+        base = panel[panel[VAR_ENERGY_INDICATOR].notna()]
+        base = base[['hrc_price', 'revenue', VAR_ENERGY_INDICATOR]].rename(
+            columns={VAR_ENERGY_INDICATOR: 'wti_crude'})
+    else:
+        base = panel[['hrc_price', 'revenue']]
+    return ('var', VAR_ENERGY_INDICATOR if wti_available else None,
+            base.reset_index(drop=True), {'max_lag': max_lag})
 
 
-# ---------------------------------------------------------------------------
-# 4. VAR Model
-# ---------------------------------------------------------------------------
-
 def run_var_analysis(
     revenue_df: pd.DataFrame,
     steel_prices: Dict[str, pd.DataFrame],
     indicators: Dict[str, pd.DataFrame],
     max_lag: int = 4,
+    panel: Optional[pd.DataFrame] = None,
+    cache: Optional[AnalysisCache] = None,
 ) -> Dict:
     """
     Fit parsimonious VAR models:
@@ -356,22 +624,25 @@ def run_var_analysis(
     All series differenced if non-stationary (ADF test).
     Returns dict with model diagnostics, IRFs, and FEVD.
     """
-    if 'HRC US' not in steel_prices:
+    if panel is None:
+        panel = build_indicator_panel(revenue_df, indicators, steel_prices)
+    if panel.empty:
         return {}
 
-    hrc = steel_prices['HRC US']
-    base = revenue_df.merge(hrc, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-    base = base.rename(columns={'indicator_value': 'hrc_price'})
-    base = base.sort_values(['fiscal_year', 'fiscal_quarter']).reset_index(drop=True)
+    return _collect_var(run_analysis_tasks([var_task(panel, max_lag)], cache, n_workers=1)[0])
 
-    # Add WTI if available
-    wti_available = 'WTI Crude' in indicators
-    if wti_available:
-        wti = indicators['WTI Crude']
-        base = base.merge(wti, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-        base = base.rename(columns={'indicator_value': 'wti_crude'})
-        base = base.sort_values(['fiscal_year', 'fiscal_quarter']).reset_index(drop=True)
 
+def _collect_var(results: Dict) -> Dict:
+    results = dict(results)
+    for warning in results.pop('warnings', []):
+        print(f"  {warning}")
+    return results
+
+
+def _var_task(name: Optional[str], base: pd.DataFrame, max_lag: int) -> Dict:
+    """Fit both VAR models; messages are returned under 'warnings'."""
+    wti_available = name is not None
+    messages = []
     results = {}
 
     # ADF stationarity tests
@@ -429,7 +700,8 @@ def run_var_analysis(
     results['n_obs'] = len(var_data)
 
     if len(var_data) < 15:
-        print("  WARNING: Not enough observations for VAR model")
+        messages.append("WARNING: Not enough observations for VAR model")
+        results['warnings'] = messages
         return results
 
     # --- Model 1: Bivariate [HRC, Revenue] ---
@@ -485,7 +757,7 @@ def run_var_analysis(
         }
 
     except Exception as e:
-        print(f"  Model 1 VAR failed: {e}")
+        messages.append(f"Model 1 VAR failed: {e}")
         results['model1'] = {'error': str(e)}
 
     # --- Model 2: Trivariate [HRC, WTI, Revenue] ---
@@ -537,12 +809,59 @@ def run_var_analysis(
             }
 
         except Exception as e:
-            print(f"  Model 2 VAR failed: {e}")
+            messages.append(f"Model 2 VAR failed: {e}")
             results['model2'] = {'error': str(e)}
 
+    results['warnings'] = messages
     return results
 
 
+ANALYSIS_TASKS = {
+    'granger': _granger_task,
+    'subperiod': _subperiod_task,
+    'rolling': _rolling_task,
+    'var': _var_task,
+}
+
+
+def run_demand_pipeline(
+    panel: pd.DataFrame,
+    max_lag: int = 4,
+    window: int = 12,
+    cache: Optional[AnalysisCache] = None,
+    n_workers: int = ANALYSIS_POOL_WORKERS,
+) -> Dict:
+    """
+    Granger, subperiod, rolling and VAR analyses on one panel, as a single
+    batch of tasks on one process pool.
+
+    Returns dict with 'granger' (DataFrame), 'subperiod' and 'stability'
+    (DataFrames), 'rolling' (indicator -> DataFrame) and 'var' (dict).
+    """
+    groups = {
+        'granger': granger_tasks(panel, max_lag),
+        'subperiod': subperiod_tasks(panel),
+        'rolling': rolling_tasks(panel, window),
+        'var': [var_task(panel, max_lag)],
+    }
+    tasks = [task for group in groups.values() for task in group]
+    results = run_analysis_tasks(tasks, cache, n_workers)
+
+    split, start = {}, 0
+    for kind, group in groups.items():
+        split[kind] = results[start:start + len(group)]
+        start += len(group)
+
+    subperiod_df, stability_df = _collect_subperiod(split['subperiod'])
+    return {
+        'granger': _collect_granger(groups['granger'], split['granger']),
+        'subperiod': subperiod_df,
+        'stability': stability_df,
+        'rolling': _collect_rolling(groups['rolling'], split['rolling']),
+        'var': _collect_var(split['var'][0]),
+    }
+
+
 # ---------------------------------------------------------------------------
 # 5. Plotting
 # ---------------------------------------------------------------------------
@@ -987,6 +1306,10 @@ def main():
     parser = argparse.ArgumentParser(description='Advanced USS Demand Analysis')
     parser.add_argument('--output-dir', default='audit-verification')
     parser.add_argument('--chart-dir', default='charts')
+    parser.add_argument('--workers', type=int, default=ANALYSIS_POOL_WORKERS,
+                        help='Worker processes for analysis tasks (1 = serial)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Ignore the panel/result cache in {DEMAND_CACHE_DIR}')
     args = parser.parse_args()
 
     output_dir = Path(args.output_dir)
@@ -997,19 +1320,43 @@ def main():
     data_dir = Path('data')
     price_dir = Path('market-data/exports/processed')
 
-    # Load data
+    # Load data (from the demand feature store, shared with demand_driver_analysis)
     print("Loading data...")
-    revenue_df = load_quarterly_revenue(data_dir)
-    indicators = load_all_indicators(price_dir)
-    steel_prices = load_steel_prices_quarterly(price_dir)
+    try:
+        store = get_feature_store(data_dir, price_dir, cache_dir=None if args.no_cache else DEMAND_CACHE_DIR)
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    revenue_df = store.revenue_frame()
+    indicators = store.indicator_frames()
+    steel_prices = store.steel_price_frames()
 
     print(f"  Revenue: {len(revenue_df)} quarters")
     print(f"  Indicators: {len(indicators)}")
     print(f"  Steel prices: {len(steel_prices)}")
 
+    # One aligned panel; every analysis below is a cached task on it
+    cache_dir = None if args.no_cache else DEMAND_CACHE_DIR
+    panel = build_indicator_panel(revenue_df, indicators, steel_prices, cache_dir=cache_dir)
+    cache = AnalysisCache(cache_dir / 'analysis_results.pkl' if cache_dir is not None else None)
+    if panel.empty:
+        print("  WARNING: HRC US price not available, skipping analyses")
+        gc_df, subperiod_df, stability_df, rolling_results, var_results = (
+            pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), {}, {})
+    else:
+        print(f"  Panel: {len(panel)} quarters x {len(panel.attrs['indicators'])} indicators "
+              f"({panel.index[0]}-{panel.index[-1]})")
+        pipeline = run_demand_pipeline(panel, max_lag=4, window=12, cache=cache, n_workers=args.workers)
+        cache.save()
+        gc_df = pipeline['granger']
+        subperiod_df, stability_df = pipeline['subperiod'], pipeline['stability']
+        rolling_results = pipeline['rolling']
+        var_results = pipeline['var']
+        stats_ = cache.stats()
+        print(f"  Analysis tasks: {stats_['hits']} cached, {stats_['misses']} computed")
+
     # Phase 1: Granger Causality
     print("\n1. Granger Causality Tests...")
-    gc_df = run_granger_causality(revenue_df, indicators, steel_prices, max_lag=4)
     gc_summary = summarize_granger(gc_df)
 
     if not gc_summary.empty:
@@ -1023,7 +1370,6 @@ def main():
 
     # Phase 2: Subperiod Stability
     print("\n2. Subperiod Stability Analysis...")
-    subperiod_df, stability_df = subperiod_stability(revenue_df, indicators, steel_prices)
     if not stability_df.empty:
         stable_count = stability_df['stable'].sum()
         total = len(stability_df)
@@ -1034,12 +1380,10 @@ def main():
 
     # Phase 3: Rolling Window
     print("\n3. Rolling Window Analysis...")
-    rolling_results = rolling_correlation(revenue_df, indicators, steel_prices, window=12)
     print(f"  Computed rolling correlations for {len(rolling_results)} indicators")
 
     # Phase 4: VAR Model
     print("\n4. VAR Model Analysis...")
-    var_results = run_var_analysis(revenue_df, steel_prices, indicators, max_lag=4)
 
     if 'model1' in var_results and 'error' not in var_results.get('model1', {}):
         m1 = var_results['model1']
@@ -28,7 +28,7 @@ from scipy import stats
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from monte_carlo.distribution_fitter import (
-    DistributionFitter, FitResult, validate_distribution_params
+    DistributionFitter, FitResult, FitCache, FIT_POOL_WORKERS, validate_distribution_params
 )
 
 
@@ -40,6 +40,9 @@ DATA_DIR = Path(__file__).parent.parent / 'market-data' / 'exports' / 'processed
 WRDS_DIR = Path(__file__).parent.parent / 'local' / 'wrds_cache'
 OUTPUT_DIR = Path(__file__).parent.parent / 'monte_carlo'
 
+# Fitted distributions keyed by series hash + cutoff; only changed series are refit
+FIT_CACHE_FILE = 'fit_cache.json'
+
 # Cutoff date for distribution fitting
 # USS Board approved Nippon deal on December 18, 2023
 # Use data only up to this date to avoid information leakage
@@ -81,11 +84,104 @@ def load_peer_fundamentals() -> pd.DataFrame:
     return pd.read_csv(filepath)
 
 
+# =============================================================================
+# HISTORICAL SERIES
+# =============================================================================
+
+# Fits run on each historical series: variable -> [(dist_type, bounds), ...]
+SERIES_FITS = {
+    'hrc_price_factor': [('lognormal', None)],
+    'crc_price_factor': [('lognormal', None)],
+    'octg_price_factor': [('lognormal', None)],
+    'flat_rolled_volume': [('normal', None), ('beta', (0.70, 1.30))],
+    'tubular_volume': [('triangular', None)],
+    'ust_10y': [('normal', None)],
+    'spread_bbb': [('normal', None)],
+}
+
+
+def _window(df: pd.DataFrame, start: str, cutoff: str) -> np.ndarray:
+    """Values between start and cutoff (inclusive)"""
+    mask = (df['date'] >= start) & (df['date'] <= cutoff)
+    return df.loc[mask, 'value'].values
+
+
+def load_fit_series(cutoff_date: str = None) -> dict:
+    """
+    Load every historical series that gets a fitted distribution
+
+    Args:
+        cutoff_date: Only use data up to this date (default: BOARD_VOTE_CUTOFF_DATE)
+
+    Returns:
+        Dict of series name -> array, already filtered and normalized to factors.
+        Series with missing or insufficient data are omitted.
+    """
+    cutoff = cutoff_date or BOARD_VOTE_CUTOFF_DATE
+    series = {}
+
+    # HRC futures: factor vs 2023 baseline over the recent window
+    hrc_futures = load_csv_data('hrc_us_futures.csv')
+    if hrc_futures is not None and len(hrc_futures) > 100:
+        factors = _window(hrc_futures, LOOKBACK_START_DATE, cutoff) / BENCHMARK_PRICES_2023['hrc_us']
+        if len(factors) > 100:
+            series['hrc_price_factor'] = factors
+
+    # CRC / OCTG spot: fall back to full pre-cutoff history if the window is thin
+    for name, filename, benchmark in [('crc_price_factor', 'crc_us_spot.csv', 'crc_us'),
+                                      ('octg_price_factor', 'octg_us_spot.csv', 'octg_us')]:
+        data = load_csv_data(filename)
+        if data is not None and len(data) > 50:
+            factors = _window(data, LOOKBACK_START_DATE, cutoff) / BENCHMARK_PRICES_2023[benchmark]
+            if len(factors) < 50:
+                factors = data.loc[data['date'] <= cutoff, 'value'].values / BENCHMARK_PRICES_2023[benchmark]
+            series[name] = factors
+
+    # Capacity utilization and rig count, normalized to factor around the mean
+    capacity_data = load_csv_data('capacity_us.csv')
+    if capacity_data is not None and len(capacity_data) > 100:
+        recent_capacity = _window(capacity_data, '2015-01-01', cutoff)
+        series['flat_rolled_volume'] = recent_capacity / np.mean(recent_capacity)
+
+    rig_data = load_csv_data('rig_count.csv')
+    if rig_data is not None and len(rig_data) > 50:
+        recent_rigs = _window(rig_data, '2015-01-01', cutoff)
+        series['tubular_volume'] = recent_rigs / np.mean(recent_rigs)
+
+    # Rates: 2020 to cutoff for relevance
+    for name, filename in [('ust_10y', 'ust_10y.csv'), ('spread_bbb', 'spread_bbb.csv')]:
+        data = load_csv_data(filename)
+        if data is not None and len(data) > 100:
+            series[name] = _window(data, '2020-01-01', cutoff)
+
+    return series
+
+
+def fit_historical_series(fitter: DistributionFitter, series: dict,
+                          n_workers: int = FIT_POOL_WORKERS) -> dict:
+    """
+    Run every SERIES_FITS fit in one batch across the process pool
+
+    Fits land in the fitter's cache, so the analyze_* steps that follow
+    read them back instead of refitting.
+
+    Returns:
+        Dict of (series name, dist_type) -> FitResult
+    """
+    jobs = {
+        (name, dist_type): (series[name], dist_type, bounds)
+        for name, fits in SERIES_FITS.items() if name in series
+        for dist_type, bounds in fits
+    }
+    return fitter.fit_batch(jobs, n_workers)
+
+
 # =============================================================================
 # PRICE FACTOR ANALYSIS
 # =============================================================================
 
-def analyze_price_factors(fitter: DistributionFitter, cutoff_date: str = None) -> dict:
+def analyze_price_factors(fitter: DistributionFitter, cutoff_date: str = None,
+                          series: dict = None) -> dict:
     """
     Analyze steel price data to fit distributions for price factors
 
@@ -94,62 +190,47 @@ def analyze_price_factors(fitter: DistributionFitter, cutoff_date: str = None) -
     Args:
         fitter: DistributionFitter instance
         cutoff_date: Only use data up to this date (default: BOARD_VOTE_CUTOFF_DATE)
+        series: Pre-loaded output of load_fit_series (loaded if None)
     """
     results = {}
     cutoff = cutoff_date or BOARD_VOTE_CUTOFF_DATE
+    if series is None:
+        series = load_fit_series(cutoff)
 
     # HRC US - Primary driver
     print(f"\n  Analyzing HRC US prices (data through {cutoff})...")
-    hrc_futures = load_csv_data('hrc_us_futures.csv')
-    hrc_spot = load_csv_data('hrc_us_spot.csv')
+    if 'hrc_price_factor' in series:
+        # Price factors relative to 2023 baseline over the recent window
+        recent_factors = series['hrc_price_factor']
 
-    if hrc_futures is not None and len(hrc_futures) > 100:
-        # Apply cutoff date filter
-        pre_cutoff = hrc_futures['date'] <= cutoff
-
-        # Calculate price factors relative to 2023 baseline
-        factors = hrc_futures.loc[pre_cutoff, 'value'].values / BENCHMARK_PRICES_2023['hrc_us']
-
-        # Use recent data window
-        recent_mask = (hrc_futures['date'] >= LOOKBACK_START_DATE) & (hrc_futures['date'] <= cutoff)
-        recent_factors = hrc_futures.loc[recent_mask, 'value'].values / BENCHMARK_PRICES_2023['hrc_us']
-
-        if len(recent_factors) > 100:
-            # Fit lognormal (prices are non-negative, often right-skewed)
-            result = fitter.fit_distribution(recent_factors, 'lognormal')
-            result.data_source = 'hrc_us_futures.csv'
-
-            results['hrc_price_factor'] = {
-                'distribution_type': result.distribution_type,
-                'parameters': result.parameters,
-                'data_source': result.data_source,
-                'n_observations': result.n_observations,
-                'goodness_of_fit': result.goodness_of_fit,
-                'rationale': f"Fitted to {len(recent_factors)} daily HRC futures prices (2019-2025). "
-                            f"Lognormal selected for non-negative, mean-reverting commodity prices.",
-                'sample_statistics': {
-                    'mean': float(np.mean(recent_factors)),
-                    'std': float(np.std(recent_factors)),
-                    'min': float(np.min(recent_factors)),
-                    'max': float(np.max(recent_factors)),
-                    'p05': float(np.percentile(recent_factors, 5)),
-                    'p95': float(np.percentile(recent_factors, 95))
-                }
+        # Fit lognormal (prices are non-negative, often right-skewed)
+        result = fitter.fit_distribution(recent_factors, 'lognormal')
+        result.data_source = 'hrc_us_futures.csv'
+
+        results['hrc_price_factor'] = {
+            'distribution_type': result.distribution_type,
+            'parameters': result.parameters,
+            'data_source': result.data_source,
+            'n_observations': result.n_observations,
+            'goodness_of_fit': result.goodness_of_fit,
+            'rationale': f"Fitted to {len(recent_factors)} daily HRC futures prices (2019-2025). "
+                        f"Lognormal selected for non-negative, mean-reverting commodity prices.",
+            'sample_statistics': {
+                'mean': float(np.mean(recent_factors)),
+                'std': float(np.std(recent_factors)),
+                'min': float(np.min(recent_factors)),
+                'max': float(np.max(recent_factors)),
+                'p05': float(np.percentile(recent_factors, 5)),
+                'p95': float(np.percentile(recent_factors, 95))
             }
-            print(f"    HRC: {result.distribution_type}, mean={np.mean(recent_factors):.3f}, "
-                  f"KS p={result.goodness_of_fit['ks_p_value']:.3f}")
+        }
+        print(f"    HRC: {result.distribution_type}, mean={np.mean(recent_factors):.3f}, "
+              f"KS p={result.goodness_of_fit['ks_p_value']:.3f}")
 
     # CRC US
     print(f"  Analyzing CRC US prices (data through {cutoff})...")
-    crc_data = load_csv_data('crc_us_spot.csv')
-
-    if crc_data is not None and len(crc_data) > 50:
-        # Apply cutoff date filter
-        recent_mask = (crc_data['date'] >= LOOKBACK_START_DATE) & (crc_data['date'] <= cutoff)
-        recent_factors = crc_data.loc[recent_mask, 'value'].values / BENCHMARK_PRICES_2023['crc_us']
-        if len(recent_factors) < 50:
-            pre_cutoff = crc_data['date'] <= cutoff
-            recent_factors = crc_data.loc[pre_cutoff, 'value'].values / BENCHMARK_PRICES_2023['crc_us']
+    if 'crc_price_factor' in series:
+        recent_factors = series['crc_price_factor']
 
         result = fitter.fit_distribution(recent_factors, 'lognormal')
         result.data_source = 'crc_us_spot.csv'
@@ -171,15 +252,8 @@ def analyze_price_factors(fitter: DistributionFitter, cutoff_date: str = None) -
 
     # OCTG US
     print(f"  Analyzing OCTG US prices (data through {cutoff})...")
-    octg_data = load_csv_data('octg_us_spot.csv')
-
-    if octg_data is not None and len(octg_data) > 50:
-        # Apply cutoff date filter
-        recent_mask = (octg_data['date'] >= LOOKBACK_START_DATE) & (octg_data['date'] <= cutoff)
-        recent_factors = octg_data.loc[recent_mask, 'value'].values / BENCHMARK_PRICES_2023['octg_us']
-        if len(recent_factors) < 50:
-            pre_cutoff = octg_data['date'] <= cutoff
-            recent_factors = octg_data.loc[pre_cutoff, 'value'].values / BENCHMARK_PRICES_2023['octg_us']
+    if 'octg_price_factor' in series:
+        recent_factors = series['octg_price_factor']
 
         result = fitter.fit_distribution(recent_factors, 'lognormal')
         result.data_source = 'octg_us_spot.csv'
@@ -229,28 +303,25 @@ def analyze_price_factors(fitter: DistributionFitter, cutoff_date: str = None) -
 # VOLUME FACTOR ANALYSIS
 # =============================================================================
 
-def analyze_volume_factors(fitter: DistributionFitter, cutoff_date: str = None) -> dict:
+def analyze_volume_factors(fitter: DistributionFitter, cutoff_date: str = None,
+                           series: dict = None) -> dict:
     """
     Analyze capacity utilization and volume data
 
     Args:
         fitter: DistributionFitter instance
         cutoff_date: Only use data up to this date (default: BOARD_VOTE_CUTOFF_DATE)
+        series: Pre-loaded output of load_fit_series (loaded if None)
     """
     results = {}
     cutoff = cutoff_date or BOARD_VOTE_CUTOFF_DATE
+    if series is None:
+        series = load_fit_series(cutoff)
 
     print(f"\n  Analyzing capacity utilization (data through {cutoff})...")
-    capacity_data = load_csv_data('capacity_us.csv')
-
-    if capacity_data is not None and len(capacity_data) > 100:
-        # Capacity utilization is percentage, normalize to factor (1.0 = average)
-        recent_mask = (capacity_data['date'] >= '2015-01-01') & (capacity_data['date'] <= cutoff)
-        recent_capacity = capacity_data.loc[recent_mask, 'value'].values
-
-        # Normalize to factor around mean
-        mean_capacity = np.mean(recent_capacity)
-        factors = recent_capacity / mean_capacity
+    if 'flat_rolled_volume' in series:
+        # Capacity utilization normalized to factor around mean (1.0 = average)
+        factors = series['flat_rolled_volume']
 
         # Flat-rolled: closely tracks overall industry
         result = fitter.fit_distribution(factors, 'normal')
@@ -269,7 +340,7 @@ def analyze_volume_factors(fitter: DistributionFitter, cutoff_date: str = None)
             'data_source': 'capacity_us.csv',
             'n_observations': result.n_observations,
             'goodness_of_fit': result.goodness_of_fit,
-            'rationale': f"Based on {len(recent_capacity)} weekly US capacity utilization readings. "
+            'rationale': f"Based on {len(factors)} weekly US capacity utilization readings. "
                         f"Normal distribution reflects symmetric demand shocks.",
             'sample_statistics': {
                 'mean': float(np.mean(factors)),
@@ -293,16 +364,9 @@ def analyze_volume_factors(fitter: DistributionFitter, cutoff_date: str = None)
 
     # Tubular: correlated with oil/gas activity
     print(f"  Analyzing tubular volume drivers (data through {cutoff})...")
-    rig_data = load_csv_data('rig_count.csv')
-    wti_data = load_csv_data('wti_crude.csv')
-
-    if rig_data is not None and len(rig_data) > 50:
-        recent_mask = (rig_data['date'] >= '2015-01-01') & (rig_data['date'] <= cutoff)
-        recent_rigs = rig_data.loc[recent_mask, 'value'].values
-
-        # Normalize rig count to factor
-        mean_rigs = np.mean(recent_rigs)
-        rig_factors = recent_rigs / mean_rigs
+    if 'tubular_volume' in series:
+        # Rig count normalized to factor
+        rig_factors = series['tubular_volume']
 
         # Tubular has higher volatility, triangular captures asymmetry
         result = fitter.fit_distribution(rig_factors, 'triangular')
@@ -331,24 +395,25 @@ def analyze_volume_factors(fitter: DistributionFitter, cutoff_date: str = None)
 # WACC / DISCOUNT RATE ANALYSIS
 # =============================================================================
 
-def analyze_wacc_components(fitter: DistributionFitter, cutoff_date: str = None) -> dict:
+def analyze_wacc_components(fitter: DistributionFitter, cutoff_date: str = None,
+                            series: dict = None) -> dict:
     """
     Analyze Treasury yields and credit spreads for WACC distribution
 
     Args:
         fitter: DistributionFitter instance
         cutoff_date: Only use data up to this date (default: BOARD_VOTE_CUTOFF_DATE)
+        series: Pre-loaded output of load_fit_series (loaded if None)
     """
     results = {}
     cutoff = cutoff_date or BOARD_VOTE_CUTOFF_DATE
+    if series is None:
+        series = load_fit_series(cutoff)
 
     print(f"\n  Analyzing 10Y Treasury yields (data through {cutoff})...")
-    treasury_data = load_csv_data('ust_10y.csv')
-
-    if treasury_data is not None and len(treasury_data) > 100:
-        # Use recent window (2020 to cutoff) for relevance
-        recent_mask = (treasury_data['date'] >= '2020-01-01') & (treasury_data['date'] <= cutoff)
-        recent_yields = treasury_data.loc[recent_mask, 'value'].values
+    if 'ust_10y' in series:
+        # Recent window (2020 to cutoff) for relevance
+        recent_yields = series['ust_10y']
 
         # Treasury yields are roughly normal
         result = fitter.fit_distribution(recent_yields, 'normal')
@@ -360,11 +425,8 @@ def analyze_wacc_components(fitter: DistributionFitter, cutoff_date: str = None)
         print(f"    10Y Treasury: mean={rf_mean:.2f}%, std={rf_std:.2f}%")
 
     print(f"  Analyzing BBB credit spreads (data through {cutoff})...")
-    spread_data = load_csv_data('spread_bbb.csv')
-
-    if spread_data is not None and len(spread_data) > 100:
-        recent_mask = (spread_data['date'] >= '2020-01-01') & (spread_data['date'] <= cutoff)
-        recent_spreads = spread_data.loc[recent_mask, 'value'].values
+    if 'spread_bbb' in series:
+        recent_spreads = series['spread_bbb']
 
         # Credit spreads are often right-skewed (widen more than tighten)
         # But normal is reasonable approximation for moderate ranges
@@ -618,6 +680,47 @@ def analyze_new_variables(fitter: DistributionFitter) -> dict:
     }
     print(f"    Revenue synergy: beta(3,4) on [0.30, 0.90]")
 
+    # Technology transfer realization
+    results['technology_synergy_factor'] = {
+        'distribution_type': 'beta',
+        'parameters': {
+            'alpha': 4,
+            'beta': 2,
+            'min': 0.30,
+            'max': 0.95
+        },
+        'data_source': 'M&A synergy realization studies',
+        'n_observations': 0,
+        'goodness_of_fit': {'expert': True},
+        'rationale': "Technology transfer (yield, quality, conversion cost) realization. "
+                    "Beta(4,2) on [0.30, 0.95] gives mean ~73%, centred on the 70% preset confidence."
+    }
+    print(f"    Technology synergy: beta(4,2) on [0.30, 0.95]")
+
+    # Synergy ramp delay (years)
+    results['synergy_ramp_delay'] = {
+        'distribution_type': 'triangular',
+        'parameters': {'min': 0.0, 'mode': 0.0, 'max': 2.0},
+        'data_source': 'M&A integration timelines',
+        'n_observations': 0,
+        'goodness_of_fit': {'expert': True},
+        'rationale': "Years by which synergy ramp schedules slip. Most integrations run on plan; "
+                    "large cross-border deals commonly slip 1-2 years."
+    }
+    print(f"    Synergy ramp delay: triangular(0, 0, 2) years")
+
+    # Integration cost overrun
+    results['integration_cost_overrun'] = {
+        'distribution_type': 'triangular',
+        'parameters': {'min': 0.90, 'mode': 1.00, 'max': 1.50},
+        'data_source': 'M&A integration cost studies',
+        'n_observations': 0,
+        'goodness_of_fit': {'expert': True},
+        'rationale': "Integration costs vs plan. Right-skewed: overruns of up to 50% "
+                    "are more likely than savings."
+    }
+    print(f"    Integration cost overrun: triangular(0.90, 1.00, 1.50)")
+
     # Working capital efficiency
     if peer_data is not None:
         # Could derive from peer working capital metrics
@@ -745,13 +848,16 @@ def get_default_correlations() -> dict:
 # MAIN ANALYSIS
 # =============================================================================
 
-def run_analysis(output_dir: Path, cutoff_date: str = None) -> dict:
+def run_analysis(output_dir: Path, cutoff_date: str = None,
+                 n_workers: int = FIT_POOL_WORKERS, use_cache: bool = True) -> dict:
     """
     Run full distribution analysis and generate config
 
     Args:
         output_dir: Directory to save config file
         cutoff_date: Only use data up to this date (default: BOARD_VOTE_CUTOFF_DATE)
+        n_workers: Worker processes for distribution fits
+        use_cache: Reuse fits from output_dir/FIT_CACHE_FILE for unchanged series
 
     Returns:
         Configuration dictionary
@@ -764,20 +870,26 @@ def run_analysis(output_dir: Path, cutoff_date: str = None) -> dict:
     print(f"\nCUTOFF DATE: {cutoff}")
     print("(Using only data available before USS Board approved Nippon deal)")
 
-    fitter = DistributionFitter()
+    cache = FitCache(output_dir / FIT_CACHE_FILE if use_cache else None)
+    fitter = DistributionFitter(cache=cache, cutoff_date=cutoff)
     all_variables = {}
 
+    # Fit every historical series up front; unchanged series come from the cache
+    series = load_fit_series(cutoff)
+    fit_historical_series(fitter, series, n_workers)
+    print(f"\nFits: {cache.hits} cached, {cache.misses} refit")
+
     # Analyze each category
     print("\n[1/6] PRICE FACTORS")
-    price_results = analyze_price_factors(fitter, cutoff)
+    price_results = analyze_price_factors(fitter, cutoff, series)
     all_variables.update(price_results)
 
     print("\n[2/6] VOLUME FACTORS")
-    volume_results = analyze_volume_factors(fitter, cutoff)
+    volume_results = analyze_volume_factors(fitter, cutoff, series)
     all_variables.update(volume_results)
 
     print("\n[3/6] WACC COMPONENTS")
-    wacc_results = analyze_wacc_components(fitter, cutoff)
+    wacc_results = analyze_wacc_components(fitter, cutoff, series)
     all_variables.update(wacc_results)
 
     print("\n[4/6] TERMINAL VALUE")
@@ -831,6 +943,7 @@ def run_analysis(output_dir: Path, cutoff_date: str = None) -> dict:
     output_file = output_dir / 'distributions_config.json'
     with open(output_file, 'w') as f:
         json.dump(config, f, indent=2)
+    cache.save()
 
     print(f"\n{'=' * 70}")
     print(f"Configuration saved to: {output_file}")
@@ -861,12 +974,24 @@ def main():
         default=BOARD_VOTE_CUTOFF_DATE,
         help=f'Data cutoff date (default: {BOARD_VOTE_CUTOFF_DATE} - USS Board vote)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=FIT_POOL_WORKERS,
+        help='Worker processes for distribution fits (1 = serial)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Refit every series instead of reusing {FIT_CACHE_FILE}'
+    )
     args = parser.parse_args()
 
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    config = run_analysis(output_dir, cutoff_date=args.cutoff_date)
+    config = run_analysis(output_dir, cutoff_date=args.cutoff_date,
+                          n_workers=args.workers, use_cache=not args.no_cache)
 
     # Print summary table
     print("\n" + "=" * 70)
@@ -5,17 +5,47 @@ Provides a unified interface to access peer company benchmarks from multiple
 data sources (Capital IQ, WRDS, manual operational data).
 """
 
+import warnings
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 # Handle import from different contexts (scripts dir vs parent dir)
 try:
-    from data_loader import USSteelDataLoader
+    from data_loader import get_shared_loader, source_file_hash
 except ModuleNotFoundError:
-    from scripts.data_loader import USSteelDataLoader
+    from scripts.data_loader import get_shared_loader, source_file_hash
+
+
+# Bump when the peer index layout or its inputs change
+PEER_INDEX_VERSION = 1
+
+STAT_COLUMNS = ['Min', 'Q1', 'Median', 'Mean', 'Q3', 'Max', 'Count']
+
+# Categories of get_benchmark_summary, in order
+SUMMARY_CATEGORIES = ['Valuation', 'Margins', 'Leverage']
+
+# Capital IQ multiple columns -> standardized names (later entries win)
+MULTIPLE_COLUMNS = {
+    'TEV/EBITDA LTM': 'tev_ebitda',
+    'TEV/EBITDA LTM - Latest': 'tev_ebitda',
+    'TEV/Total Revenues LTM': 'tev_revenue',
+    'TEV/Total Revenues LTM - Latest': 'tev_revenue',
+    'P/Diluted EPS Before Extra LTM': 'pe_ratio',
+    'P/Diluted EPS Before Extra LTM - Latest': 'pe_ratio',
+}
+
+# Percentile-rank metric -> peer summary columns to rank against (first found)
+RANK_COLUMNS = {
+    'ebitda_margin': ['ebitda_margin', 'EBITDA Margin %', 'EBITDA Margin', 'LTM EBITDA Margin'],
+    'revenue': ['revenue', 'LTM Total Revenue ', 'Total Revenues LTM', 'Revenue'],
+    'ebitda': ['ebitda', 'LTM EBITDA ', 'EBITDA LTM'],
+    'tev_ebitda': ['TEV/EBITDA LTM - Latest', 'TEV/EBITDA LTM'],
+    'capacity_mtons': ['capacity_mtons'],
+    'shipments_mtons': ['shipments_mtons'],
+}
 
 
 @dataclass
@@ -76,6 +106,204 @@ class GrowthStats:
         }
 
 
+def summary_stats(columns: List[Tuple[str, str, np.ndarray]]) -> pd.DataFrame:
+    """Min/Q1/Median/Mean/Q3/Max/Count of many value vectors in one pass
+
+    Args:
+        columns: (category, metric, values) triples; NaNs are ignored and the
+            vectors may differ in length
+
+    Returns:
+        DataFrame with Category, Metric and STAT_COLUMNS, one row per triple
+    """
+    if not columns:
+        return pd.DataFrame(columns=['Category', 'Metric'] + STAT_COLUMNS)
+    width = max(len(values) for _, _, values in columns)
+    block = np.full((max(width, 1), len(columns)), np.nan)
+    for j, (_, _, values) in enumerate(columns):
+        block[:len(values), j] = values
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)   # all-NaN columns
+        q = np.nanquantile(block, [0.0, 0.25, 0.5, 0.75, 1.0], axis=0)
+        mean = np.nanmean(block, axis=0)
+    return pd.DataFrame({
+        'Category': [c for c, _, _ in columns],
+        'Metric': [m for _, m, _ in columns],
+        'Min': q[0], 'Q1': q[1], 'Median': q[2], 'Mean': mean, 'Q3': q[3], 'Max': q[4],
+        'Count': (~np.isnan(block)).sum(axis=0),
+    })
+
+
+def _numeric(series: pd.Series) -> np.ndarray:
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+
+
+@dataclass
+class PeerMetricsIndex:
+    """Peer benchmark statistics precomputed once per data version
+
+    stats holds every (category, metric) summary from one vectorized
+    build, indexed by (Category, Metric); rank_values holds sorted peer
+    vectors so percentile ranks are a binary search; companies holds each
+    peer's metrics as one row.
+    """
+    version: tuple
+    stats: pd.DataFrame
+    rank_values: Dict[str, np.ndarray]
+    companies: pd.DataFrame
+    uss: Dict
+
+    def category_stats(self, category: str) -> Dict[str, BenchmarkStats]:
+        """BenchmarkStats by metric for one category"""
+        if category not in self.stats.index.get_level_values(0):
+            return {}
+        rows = self.stats.loc[category]
+        return {
+            metric: BenchmarkStats(min=row.Min, q1=row.Q1, median=row.Median, mean=row.Mean,
+                                   q3=row.Q3, max=row.Max, count=int(row.Count))
+            for metric, row in zip(rows.index, rows.itertuples())
+        }
+
+    def summary(self, categories: List[str]) -> pd.DataFrame:
+        """Stats rows of the given categories (Category, Metric and STAT_COLUMNS)"""
+        present = [c for c in categories if c in self.stats.index.get_level_values(0)]
+        if not present:
+            return pd.DataFrame(columns=['Category', 'Metric'] + STAT_COLUMNS)
+        return self.stats.loc[present].reset_index()
+
+    def percentile(self, key: str, value: float) -> float:
+        """Share of peers (in %) strictly below value, O(log n)"""
+        values = self.rank_values[key]
+        return np.searchsorted(values, value, side='left') / len(values) * 100
+
+    def company(self, ticker: str) -> pd.Series:
+        """All indexed metrics of the first peer whose name contains ticker"""
+        match = self.companies.index.str.contains(ticker, na=False, regex=False)
+        return self.companies[match].iloc[0] if match.any() else pd.Series(dtype=float)
+
+
+# Rank key of the EBITDA margin computed from LTM EBITDA / LTM revenue
+LTM_MARGIN_KEY = '__ltm_ebitda_margin__'
+
+# Rank keys of the steel operational fallbacks (capacity, shipments)
+STEEL_RANK_KEYS = {'capacity_mtons': 'steel:capacity_mtons',
+                   'shipments_mtons': 'steel:shipments_mtons'}
+
+# Peer indexes by (data directory, data version), shared by all BenchmarkData instances
+_peer_index_cache: Dict[tuple, PeerMetricsIndex] = {}
+
+
+def clear_peer_index_cache():
+    """Drop all precomputed peer indexes"""
+    _peer_index_cache.clear()
+
+
+# =============================================================================
+# Growth Panel
+# =============================================================================
+
+# Bump when the growth panel layout or its inputs change
+GROWTH_PANEL_VERSION = 1
+
+# Sources of the multi-year growth analysis
+WRDS_FUNDAMENTALS_PATH = Path(__file__).parent.parent / 'local' / 'wrds_cache' / 'peer_fundamentals.csv'
+USS_FINANCIALS_PATH = Path(__file__).parent.parent / 'audit-verification' / 'evidence' / 'USS Financial Statements.xlsx'
+
+USS_TICKER = 'X'
+USS_COMPANY_NAME = 'United States Steel'
+
+
+@dataclass
+class GrowthPanel:
+    """Aligned (ticker x metric x year) panel with growth analytics for all windows
+
+    Rows are the WRDS peers (as loaded) followed by USS. values holds
+    each row's metrics by year (NaN where missing) and present marks the
+    (row, year) pairs found in the source. cagr[r, m, i, j] is the CAGR
+    from years[i] to years[j] (NaN unless both values are positive and
+    j > i); yoy[r, m, j] is the growth from the previous calendar year.
+    """
+    version: tuple
+    tickers: List[str]
+    company_names: List[str]
+    metrics: List[str]
+    uss_metrics: List[str]
+    years: np.ndarray
+    values: np.ndarray
+    present: np.ndarray
+    peer_mask: np.ndarray
+
+    def __post_init__(self):
+        v = self.values
+        periods = (self.years[None, :] - self.years[:, None]).astype(float)
+        start, end = v[..., :, None], v[..., None, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.cagr = np.where((start > 0) & (end > 0) & (periods > 0),
+                                 (end / start) ** (1 / periods) - 1, np.nan)
+            self.yoy = np.full(v.shape, np.nan)
+            consecutive = np.diff(self.years) == 1
+            prev, cur = v[..., :-1], v[..., 1:]
+            self.yoy[..., 1:] = np.where((prev > 0) & consecutive, cur / prev - 1, np.nan)
+
+    @property
+    def n_peers(self) -> int:
+        return len(self.tickers) - 1
+
+    def metric_pos(self, metric: str) -> Optional[int]:
+        return self.metrics.index(metric) if metric in self.metrics else None
+
+    def _year_pos(self, year: int) -> Optional[int]:
+        i = np.searchsorted(self.years, year)
+        return int(i) if i < len(self.years) and self.years[i] == year else None
+
+    def _window(self, start_year: int, end_year: int) -> slice:
+        return slice(int(np.searchsorted(self.years, start_year, side='left')),
+                     int(np.searchsorted(self.years, end_year, side='right')))
+
+    def window_cagr(self, start_year: int, end_year: int) -> np.ndarray:
+        """(row, metric) CAGRs from start_year to end_year, NaN where unavailable"""
+        i, j = self._year_pos(start_year), self._year_pos(end_year)
+        if i is None or j is None:
+            return np.full(self.values.shape[:2], np.nan)
+        return self.cagr[:, :, i, j]
+
+    def rolling_cagr(self, window_years: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Start years and (row, metric, start) CAGRs of every window_years window"""
+        starts = self.years[np.isin(self.years + window_years, self.years)]
+        i = np.searchsorted(self.years, starts)
+        j = np.searchsorted(self.years, starts + window_years)
+        return starts, self.cagr[:, :, i, j]
+
+    def volatility(self, start_year: int, end_year: int) -> np.ndarray:
+        """(row, metric) sample std of year-over-year growth within the window"""
+        yoy = self.yoy[:, :, self._window(start_year + 1, end_year)]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)   # fewer than 2 years
+            return np.nanstd(yoy, axis=2, ddof=1)
+
+    def drawdowns(self, start_year: int, end_year: int) -> np.ndarray:
+        """(row, metric, year) decline from the running peak within the window"""
+        v = self.values[:, :, self._window(start_year, end_year)]
+        peak = np.fmax.accumulate(v, axis=2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(peak > 0, v / peak - 1, np.nan)
+
+    def max_drawdown(self, start_year: int, end_year: int) -> np.ndarray:
+        """(row, metric) largest decline from a running peak within the window"""
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)   # no values
+            return np.nanmin(self.drawdowns(start_year, end_year), axis=2)
+
+
+# Growth panels by data version (only the latest is kept)
+_growth_panel_cache: Dict[tuple, GrowthPanel] = {}
+
+
+def clear_growth_panel_cache():
+    """Drop the cached growth panel"""
+    _growth_panel_cache.clear()
+
+
 class BenchmarkData:
     """
     Unified accessor for steel competitor benchmark data.
@@ -132,7 +360,8 @@ class BenchmarkData:
             project_root = Path(__file__).parent.parent
             data_dir = project_root / data_dir
 
-        self.loader = USSteelDataLoader(str(data_dir))
+        # Capital IQ tables are parsed once per process (and cached on disk)
+        self.loader = get_shared_loader(str(data_dir))
         self._cache: Dict = {}
 
     def _get_comps_data(self) -> Dict[str, pd.DataFrame]:
@@ -166,53 +395,109 @@ class BenchmarkData:
         )
 
     # =========================================================================
-    # Valuation Multiples
+    # Peer Metrics Index
     # =========================================================================
 
-    def get_peer_multiples(self, primary_only: bool = False) -> Dict[str, BenchmarkStats]:
+    def get_peer_index(self) -> PeerMetricsIndex:
         """
-        Get valuation multiple benchmarks for peer companies.
+        Peer statistics index for the current data version.
 
-        Args:
-            primary_only: If True, only use primary US comps (STLD, NUE, CLF)
-
-        Returns:
-            Dict mapping multiple name to BenchmarkStats
+        Built once per (data directory, Capital IQ file hashes) and shared
+        by all instances; a changed export builds a new one.
         """
+        version = (PEER_INDEX_VERSION,
+                   source_file_hash(self.loader.comps_file),
+                   source_file_hash(self.loader.financials_file))
+        key = (str(self.loader.data_dir.resolve()), version)
+        index = _peer_index_cache.get(key)
+        if index is None:
+            index = self._build_peer_index(version)
+            for stale in [k for k in _peer_index_cache if k[0] == key[0]]:
+                del _peer_index_cache[stale]
+            _peer_index_cache[key] = index
+        return index
+
+    def _build_peer_index(self, version: tuple) -> PeerMetricsIndex:
+        """Collect every peer metric vector and summarize them in one pass"""
         comps = self._get_comps_data()
+        columns = []       # (category, metric, values)
+        companies = []     # per-company frames with (category, metric) columns
+
+        def add(category: str, df: pd.DataFrame, names: Dict[str, str]):
+            # names maps source column -> metric; later columns win
+            metrics = {name: col for col, name in names.items() if col in df.columns}
+            values = {name: _numeric(df[col]) for name, col in metrics.items()}
+            columns.extend((category, name, v) for name, v in values.items())
+            if values and 'Company Name' in df.columns:
+                companies.append(pd.DataFrame(
+                    {(category, name): v for name, v in values.items()},
+                    index=pd.Index(df['Company Name'].astype(str), name='Company Name')))
+
+        # Valuation multiples: trading multiples, else financial data
+        df = comps.get('trading_multiples', comps.get('financial_data'))
+        if df is not None and not df.empty:
+            add('Valuation', df, MULTIPLE_COLUMNS)
+            if 'Company Name' in df.columns:
+                mask = df['Company Name'].str.contains('|'.join(self.PRIMARY_COMPS), na=False)
+                columns.extend(('Valuation (Primary)', name, v[mask.to_numpy()])
+                               for category, name, v in list(columns) if category == 'Valuation')
 
-        # Try to get from trading multiples or financial data
-        df = None
-        if 'trading_multiples' in comps:
-            df = comps['trading_multiples']
-        elif 'financial_data' in comps:
-            df = comps['financial_data']
+        margins = self.get_peer_margins()
+        add('Margins', margins, {
+            col: col.lower().replace(' ', '_').replace('%', '').strip('_')
+            for col in margins.columns if col != 'Company Name' and 'Margin' in col
+        })
 
-        if df is None or df.empty:
-            return {}
+        leverage = self.get_peer_leverage()
+        add('Leverage', leverage, {
+            col: col.lower().replace(' ', '_').replace('/', '_').strip('_')
+            for col in leverage.columns if col != 'Company Name'
+        })
 
-        # Filter to primary comps if requested
-        if primary_only:
-            mask = df['Company Name'].str.contains('|'.join(self.PRIMARY_COMPS), na=False)
-            df = df[mask]
+        # Percentile-rank vectors: every peer summary column plus fallbacks
+        rank = {}
+        peer_summary = self.get_peer_summary()
+        for col in peer_summary.columns:
+            rank[col] = _numeric(peer_summary[col])
+        if 'LTM EBITDA ' in peer_summary.columns and 'LTM Total Revenue ' in peer_summary.columns:
+            rank[LTM_MARGIN_KEY] = rank['LTM EBITDA '] / rank['LTM Total Revenue ']
+        try:
+            steel = self._get_steel_metrics()
+        except Exception:
+            steel = {}
+        if 'capacity' in steel and 'Raw_Capacity_Mtons' in steel['capacity'].columns:
+            rank[STEEL_RANK_KEYS['capacity_mtons']] = _numeric(steel['capacity']['Raw_Capacity_Mtons'])
+        if 'shipments' in steel and 'Shipments_Ktons' in steel['shipments'].columns:
+            rank[STEEL_RANK_KEYS['shipments_mtons']] = _numeric(steel['shipments']['Shipments_Ktons']) / 1000
+        rank_values = {}
+        for key, values in rank.items():
+            rank_values[key] = np.sort(values[~np.isnan(values)])
+            columns.append(('Rank', key, rank_values[key]))
+
+        stats = summary_stats(columns).set_index(['Category', 'Metric'])
+        if companies:
+            companies = pd.concat([c[~c.index.duplicated()] for c in companies], axis=1)
+        else:
+            companies = pd.DataFrame()
+        return PeerMetricsIndex(version=version, stats=stats, rank_values=rank_values,
+                                companies=companies, uss=self.get_uss_metrics())
 
-        result = {}
+    # =========================================================================
+    # Valuation Multiples
+    # =========================================================================
 
-        # Map column names to standardized names
-        column_mapping = {
-            'TEV/EBITDA LTM': 'tev_ebitda',
-            'TEV/EBITDA LTM - Latest': 'tev_ebitda',
-            'TEV/Total Revenues LTM': 'tev_revenue',
-            'TEV/Total Revenues LTM - Latest': 'tev_revenue',
-            'P/Diluted EPS Before Extra LTM': 'pe_ratio',
-            'P/Diluted EPS Before Extra LTM - Latest': 'pe_ratio',
-        }
+    def get_peer_multiples(self, primary_only: bool = False) -> Dict[str, BenchmarkStats]:
+        """
+        Get valuation multiple benchmarks for peer companies.
 
-        for col, name in column_mapping.items():
-            if col in df.columns:
-                result[name] = self._calculate_stats(df[col])
+        Args:
+            primary_only: If True, only use primary US comps (STLD, NUE, CLF)
 
-        return result
+        Returns:
+            Dict mapping multiple name to BenchmarkStats
+        """
+        category = 'Valuation (Primary)' if primary_only else 'Valuation'
+        return self.get_peer_index().category_stats(category)
 
     def get_exit_multiple_range(self, multiple: str = 'tev_ebitda') -> Dict[str, float]:
         """
@@ -271,19 +556,7 @@ class BenchmarkData:
 
     def get_margin_stats(self) -> Dict[str, BenchmarkStats]:
         """Get statistical summary of peer margins."""
-        margins = self.get_peer_margins()
-
-        if margins.empty:
-            return {}
-
-        result = {}
-        for col in margins.columns:
-            if col != 'Company Name' and 'Margin' in col:
-                # Standardize name
-                name = col.lower().replace(' ', '_').replace('%', '').strip('_')
-                result[name] = self._calculate_stats(margins[col])
-
-        return result
+        return self.get_peer_index().category_stats('Margins')
 
     # =========================================================================
     # Leverage & Credit
@@ -312,18 +585,7 @@ class BenchmarkData:
 
     def get_leverage_stats(self) -> Dict[str, BenchmarkStats]:
         """Get statistical summary of peer leverage metrics."""
-        leverage = self.get_peer_leverage()
-
-        if leverage.empty:
-            return {}
-
-        result = {}
-        for col in leverage.columns:
-            if col != 'Company Name':
-                name = col.lower().replace(' ', '_').replace('/', '_').strip('_')
-                result[name] = self._calculate_stats(leverage[col])
-
-        return result
+        return self.get_peer_index().category_stats('Leverage')
 
     # =========================================================================
     # Steel Operational Metrics
@@ -465,59 +727,17 @@ class BenchmarkData:
         Returns:
             DataFrame with metrics as rows and statistics as columns
         """
-        rows = []
-
-        # Valuation multiples
-        multiples = self.get_peer_multiples()
-        for name, stats in multiples.items():
-            rows.append({
-                'Category': 'Valuation',
-                'Metric': name,
-                'Min': stats.min,
-                'Q1': stats.q1,
-                'Median': stats.median,
-                'Mean': stats.mean,
-                'Q3': stats.q3,
-                'Max': stats.max,
-                'Count': stats.count
-            })
-
-        # Margins
-        margin_stats = self.get_margin_stats()
-        for name, stats in margin_stats.items():
-            rows.append({
-                'Category': 'Margins',
-                'Metric': name,
-                'Min': stats.min,
-                'Q1': stats.q1,
-                'Median': stats.median,
-                'Mean': stats.mean,
-                'Q3': stats.q3,
-                'Max': stats.max,
-                'Count': stats.count
-            })
-
-        # Leverage
-        leverage_stats = self.get_leverage_stats()
-        for name, stats in leverage_stats.items():
-            rows.append({
-                'Category': 'Leverage',
-                'Metric': name,
-                'Min': stats.min,
-                'Q1': stats.q1,
-                'Median': stats.median,
-                'Mean': stats.mean,
-                'Q3': stats.q3,
-                'Max': stats.max,
-                'Count': stats.count
-            })
-
-        return pd.DataFrame(rows)
+        summary = self.get_peer_index().summary(SUMMARY_CATEGORIES)
+        return summary.astype({'Count': int})
 
     def clear_cache(self):
         """Clear the data cache."""
         self._cache.clear()
         self.loader.clear_cache()
+        data_dir = str(self.loader.data_dir.resolve())
+        for key in [k for k in _peer_index_cache if k[0] == data_dir]:
+            del _peer_index_cache[key]
+        _growth_panel_cache.clear()
 
     # =========================================================================
     # USS Comparison Methods
@@ -687,73 +907,40 @@ class BenchmarkData:
         Returns:
             Dict with USS value, percentile, and peer distribution, or None if unavailable
         """
-        uss = self.get_uss_metrics()
-        peer_summary = self.get_peer_summary()
-
-        # Handle different metric names
+        index = self.get_peer_index()
         metric_lower = metric.lower()
 
         # Get USS value
-        uss_value = uss.get(metric_lower)
+        uss_value = index.uss.get(metric_lower)
         if uss_value is None:
             return None
 
-        # Try to get peer values from summary
-        peer_values = None
-
-        if not peer_summary.empty:
-            # Map metric name to possible column names
-            column_mappings = {
-                'ebitda_margin': ['ebitda_margin', 'EBITDA Margin %', 'EBITDA Margin', 'LTM EBITDA Margin'],
-                'revenue': ['revenue', 'LTM Total Revenue ', 'Total Revenues LTM', 'Revenue'],
-                'ebitda': ['ebitda', 'LTM EBITDA ', 'EBITDA LTM'],
-                'tev_ebitda': ['TEV/EBITDA LTM - Latest', 'TEV/EBITDA LTM'],
-                'capacity_mtons': ['capacity_mtons'],
-                'shipments_mtons': ['shipments_mtons'],
-            }
-
-            # If looking for EBITDA margin, calculate it from revenue and EBITDA
-            if metric_lower == 'ebitda_margin' and 'LTM EBITDA ' in peer_summary.columns and 'LTM Total Revenue ' in peer_summary.columns:
-                peer_values = (peer_summary['LTM EBITDA '] / peer_summary['LTM Total Revenue ']).dropna()
-
-            for col_name in column_mappings.get(metric_lower, [metric]):
-                if col_name in peer_summary.columns:
-                    peer_values = peer_summary[col_name].dropna()
-                    break
-
-        # If no peer values from summary, try steel metrics for capacity/shipments
-        if peer_values is None or peer_values.empty:
-            if metric_lower in ['capacity_mtons', 'shipments_mtons']:
-                steel = self._get_steel_metrics()
-                if metric_lower == 'capacity_mtons' and 'capacity' in steel:
-                    cap_df = steel['capacity']
-                    if 'Raw_Capacity_Mtons' in cap_df.columns:
-                        peer_values = cap_df['Raw_Capacity_Mtons'].dropna()
-                elif metric_lower == 'shipments_mtons' and 'shipments' in steel:
-                    ship_df = steel['shipments']
-                    if 'Shipments_Ktons' in ship_df.columns:
-                        peer_values = ship_df['Shipments_Ktons'].dropna() / 1000  # Convert to Mtons
-
-        if peer_values is None or peer_values.empty:
+        # Peer vector: computed LTM margin, overridden by the first matching
+        # peer summary column, then the steel operational fallback
+        key = None
+        if metric_lower == 'ebitda_margin' and LTM_MARGIN_KEY in index.rank_values:
+            key = LTM_MARGIN_KEY
+        for col_name in RANK_COLUMNS.get(metric_lower, [metric]):
+            if col_name in index.rank_values:
+                key = col_name
+                break
+        if key is None or len(index.rank_values[key]) == 0:
+            key = STEEL_RANK_KEYS.get(metric_lower)
+        if key is None or len(index.rank_values.get(key, ())) == 0:
             return None
 
-        peer_values = peer_values.sort_values()
-
-        # Calculate percentile
-        below_count = (peer_values < uss_value).sum()
-        percentile = below_count / len(peer_values) * 100
-
+        stats = index.stats.loc[('Rank', key)]
         return {
             'metric': metric,
             'uss_value': uss_value,
-            'percentile': percentile,
-            'peer_min': peer_values.min(),
-            'peer_q1': peer_values.quantile(0.25),
-            'peer_median': peer_values.median(),
-            'peer_q3': peer_values.quantile(0.75),
-            'peer_max': peer_values.max(),
-            'peer_count': len(peer_values),
-            'vs_median': 'above' if uss_value > peer_values.median() else 'below'
+            'percentile': index.percentile(key, uss_value),
+            'peer_min': stats['Min'],
+            'peer_q1': stats['Q1'],
+            'peer_median': stats['Median'],
+            'peer_q3': stats['Q3'],
+            'peer_max': stats['Max'],
+            'peer_count': int(stats['Count']),
+            'vs_median': 'above' if uss_value > stats['Median'] else 'below'
         }
 
     # =========================================================================
@@ -786,7 +973,7 @@ class BenchmarkData:
             return self._cache['wrds_fundamentals']
 
         # Try to load from cache file
-        wrds_path = Path(__file__).parent.parent / 'local' / 'wrds_cache' / 'peer_fundamentals.csv'
+        wrds_path = WRDS_FUNDAMENTALS_PATH
 
         if not wrds_path.exists():
             return pd.DataFrame()
@@ -839,85 +1026,23 @@ class BenchmarkData:
     def _get_uss_financial_data(self) -> pd.DataFrame:
         """Load USS historical financial data from Excel.
 
+        The parsed table is kept in the shared loader's cache (memory and
+        parquet, keyed by the workbook's hash).
+
         Returns:
             DataFrame with USS financials by year
         """
         if 'uss_financials' in self._cache:
             return self._cache['uss_financials']
 
-        uss_path = Path(__file__).parent.parent / 'audit-verification' / 'evidence' / 'USS Financial Statements.xlsx'
+        uss_path = USS_FINANCIALS_PATH
 
         if not uss_path.exists():
             return pd.DataFrame()
 
         try:
-            # Read income statement
-            income_df = pd.read_excel(uss_path, sheet_name='US Steel_Income Statement', header=None)
-
-            # Find the header row (row 12 has years)
-            # Years are in columns 1-35 (1990-2024)
-            header_row = 12
-            years = []
-            year_cols = {}
-
-            for col in range(1, 36):
-                val = income_df.iloc[header_row, col]
-                if pd.notna(val) and 'FY' in str(val):
-                    year = int(str(val).split()[0])
-                    years.append(year)
-                    year_cols[year] = col
-
-            # Extract key metrics by row
-            def get_row_values(df, row_pattern, year_cols):
-                """Extract values for a row matching pattern."""
-                for idx in range(len(df)):
-                    cell = df.iloc[idx, 0]
-                    if pd.notna(cell) and row_pattern in str(cell):
-                        values = {}
-                        for year, col in year_cols.items():
-                            val = df.iloc[idx, col]
-                            if pd.notna(val):
-                                try:
-                                    values[year] = float(val)
-                                except (ValueError, TypeError):
-                                    pass
-                        return values
-                return {}
-
-            # Get income statement metrics (values in thousands)
-            revenue_vals = get_row_values(income_df, 'Total Revenue', year_cols)
-            net_income_vals = get_row_values(income_df, 'Net Income to Company', year_cols)
-            da_vals = get_row_values(income_df, 'Depreciation & Amort.', year_cols)
-            operating_income_vals = get_row_values(income_df, 'Operating Income', year_cols)
-
-            # Read cash flow statement for capex
-            cf_df = pd.read_excel(uss_path, sheet_name='US Steel_Cash Flow', header=None)
-            capex_vals = get_row_values(cf_df, 'Capital Expenditure', year_cols)
-
-            # Read balance sheet for total assets
-            bs_df = pd.read_excel(uss_path, sheet_name='US Steel_Balance Sheet', header=None)
-            assets_vals = get_row_values(bs_df, 'Total Assets', year_cols)
-
-            # Build DataFrame - convert from thousands to millions
-            records = []
-            for year in sorted(set(revenue_vals.keys()) | set(net_income_vals.keys())):
-                record = {
-                    'year': year,
-                    'revenue': revenue_vals.get(year, np.nan) / 1000 if year in revenue_vals else np.nan,
-                    'net_income': net_income_vals.get(year, np.nan) / 1000 if year in net_income_vals else np.nan,
-                    'depreciation': da_vals.get(year, np.nan) / 1000 if year in da_vals else np.nan,
-                    'operating_income': operating_income_vals.get(year, np.nan) / 1000 if year in operating_income_vals else np.nan,
-                    'capex': abs(capex_vals.get(year, np.nan)) / 1000 if year in capex_vals else np.nan,
-                    'total_assets': assets_vals.get(year, np.nan) / 1000 if year in assets_vals else np.nan,
-                }
-                # Calculate EBITDA = Operating Income + D&A
-                if not pd.isna(record['operating_income']) and not pd.isna(record['depreciation']):
-                    record['ebitda'] = record['operating_income'] + record['depreciation']
-                else:
-                    record['ebitda'] = np.nan
-                records.append(record)
-
-            result = pd.DataFrame(records)
+            result = self.loader.load_table('uss_financials', uss_path,
+                                            lambda: self._parse_uss_financial_data(uss_path))
             self._cache['uss_financials'] = result
             return result
 
@@ -925,6 +1050,143 @@ class BenchmarkData:
             print(f"Error loading USS financials: {e}")
             return pd.DataFrame()
 
+    @staticmethod
+    def _parse_uss_financial_data(uss_path: Path) -> pd.DataFrame:
+        """Parse USS yearly metrics ($M) from the Capital IQ statements workbook"""
+        # Read income statement (one open workbook for all three statements)
+        workbook = pd.ExcelFile(uss_path)
+        income_df = workbook.parse(sheet_name='US Steel_Income Statement', header=None)
+
+        # Find the header row (row 12 has years)
+        # Years are in columns 1-35 (1990-2024)
+        header_row = 12
+        years = []
+        year_cols = {}
+
+        for col in range(1, 36):
+            val = income_df.iloc[header_row, col]
+            if pd.notna(val) and 'FY' in str(val):
+                year = int(str(val).split()[0])
+                years.append(year)
+                year_cols[year] = col
+
+        # Extract key metrics by row
+        def get_row_values(df, row_pattern, year_cols):
+            """Extract values for a row matching pattern."""
+            for idx in range(len(df)):
+                cell = df.iloc[idx, 0]
+                if pd.notna(cell) and row_pattern in str(cell):
+                    values = {}
+                    for year, col in year_cols.items():
+                        val = df.iloc[idx, col]
+                        if pd.notna(val):
+                            try:
+                                values[year] = float(val)
+                            except (ValueError, TypeError):
+                                pass
+                    return values
+            return {}
+
+        # Get income statement metrics (values in thousands)
+        revenue_vals = get_row_values(income_df, 'Total Revenue', year_cols)
+        net_income_vals = get_row_values(income_df, 'Net Income to Company', year_cols)
+        da_vals = get_row_values(income_df, 'Depreciation & Amort.', year_cols)
+        operating_income_vals = get_row_values(income_df, 'Operating Income', year_cols)
+
+        # Read cash flow statement for capex
+        cf_df = workbook.parse(sheet_name='US Steel_Cash Flow', header=None)
+        capex_vals = get_row_values(cf_df, 'Capital Expenditure', year_cols)
+
+        # Read balance sheet for total assets
+        bs_df = workbook.parse(sheet_name='US Steel_Balance Sheet', header=None)
+        workbook.close()
+        assets_vals = get_row_values(bs_df, 'Total Assets', year_cols)
+
+        # Build DataFrame - convert from thousands to millions
+        records = []
+        for year in sorted(set(revenue_vals.keys()) | set(net_income_vals.keys())):
+            record = {
+                'year': year,
+                'revenue': revenue_vals.get(year, np.nan) / 1000 if year in revenue_vals else np.nan,
+                'net_income': net_income_vals.get(year, np.nan) / 1000 if year in net_income_vals else np.nan,
+                'depreciation': da_vals.get(year, np.nan) / 1000 if year in da_vals else np.nan,
+                'operating_income': operating_income_vals.get(year, np.nan) / 1000 if year in operating_income_vals else np.nan,
+                'capex': abs(capex_vals.get(year, np.nan)) / 1000 if year in capex_vals else np.nan,
+                'total_assets': assets_vals.get(year, np.nan) / 1000 if year in assets_vals else np.nan,
+            }
+            # Calculate EBITDA = Operating Income + D&A
+            if not pd.isna(record['operating_income']) and not pd.isna(record['depreciation']):
+                record['ebitda'] = record['operating_income'] + record['depreciation']
+            else:
+                record['ebitda'] = np.nan
+            records.append(record)
+
+        return pd.DataFrame(records)
+
+    def get_growth_panel(self) -> GrowthPanel:
+        """
+        Peer and USS growth panel for the current data version.
+
+        Built once per (WRDS fundamentals, USS financials) file hashes and
+        shared by all instances.
+        """
+        version = (GROWTH_PANEL_VERSION,
+                   source_file_hash(WRDS_FUNDAMENTALS_PATH),
+                   source_file_hash(USS_FINANCIALS_PATH))
+        panel = _growth_panel_cache.get(version)
+        if panel is None:
+            panel = self._build_growth_panel(version)
+            _growth_panel_cache.clear()
+            _growth_panel_cache[version] = panel
+        return panel
+
+    def _build_growth_panel(self, version: tuple) -> GrowthPanel:
+        """Align WRDS peer and USS yearly metrics on one (ticker, metric, year) grid"""
+        wrds_df = self._get_wrds_fundamentals()
+        uss_df = self._get_uss_financial_data()
+
+        def metric_columns(df):
+            return [c for c in df.select_dtypes('number').columns if c != 'year']
+
+        uss_metrics = metric_columns(uss_df) if not uss_df.empty else []
+        metrics = metric_columns(wrds_df) if not wrds_df.empty else []
+        metrics += [m for m in uss_metrics if m not in metrics]
+
+        tickers, names = [], []
+        if not wrds_df.empty:
+            first = wrds_df.drop_duplicates('ticker')
+            tickers = list(first['ticker'])
+            names = list(first['company_name'] if 'company_name' in first.columns else first['ticker'])
+        tickers.append(USS_TICKER)
+        names.append(USS_COMPANY_NAME)
+
+        years = np.union1d(wrds_df['year'] if not wrds_df.empty else [],
+                           uss_df['year'] if not uss_df.empty else []).astype(np.int64)
+        values = np.full((len(tickers), len(metrics), len(years)), np.nan)
+        present = np.zeros((len(tickers), len(years)), dtype=bool)
+
+        sources = []
+        if not wrds_df.empty:
+            sources.append((pd.Index(tickers[:-1]).get_indexer(wrds_df['ticker']), wrds_df))
+        if not uss_df.empty:
+            sources.append((np.full(len(uss_df), len(tickers) - 1), uss_df))
+        for rows, df in sources:
+            cols = np.searchsorted(years, df['year'].to_numpy())
+            block = df.reindex(columns=metrics).apply(pd.to_numeric, errors='coerce')
+            values[rows, :, cols] = block.to_numpy(dtype=float)
+            present[rows, cols] = True
+
+        # Peers only; BSL lacks revenue/EBITDA coverage
+        peer_mask = np.zeros((len(tickers), len(metrics)), dtype=bool)
+        peer_mask[:-1] = True
+        for m, metric in enumerate(metrics):
+            if metric in self.MEDIUM_CONFIDENCE_METRICS:
+                peer_mask[:-1, m] = [t != 'BSL' for t in tickers[:-1]]
+
+        return GrowthPanel(version=version, tickers=tickers, company_names=names,
+                           metrics=metrics, uss_metrics=uss_metrics, years=years,
+                           values=values, present=present, peer_mask=peer_mask)
+
     def get_uss_timeseries(self, metrics: List[str], start_year: int = 2019,
                           end_year: int = 2024) -> pd.DataFrame:
         """Extract USS historical timeseries for specified metrics.
@@ -937,16 +1199,20 @@ class BenchmarkData:
         Returns:
             DataFrame with year and metric columns
         """
-        uss_df = self._get_uss_financial_data()
+        panel = self.get_growth_panel()
+        uss_years = panel.present[-1]
 
-        if uss_df.empty:
+        if not uss_years.any():
             return pd.DataFrame()
 
         # Filter to requested year range
-        mask = (uss_df['year'] >= start_year) & (uss_df['year'] <= end_year)
-        result = uss_df.loc[mask, ['year'] + [m for m in metrics if m in uss_df.columns]].copy()
+        mask = uss_years & (panel.years >= start_year) & (panel.years <= end_year)
+        result = {'year': panel.years[mask]}
+        for m in metrics:
+            if m in panel.uss_metrics:
+                result[m] = panel.values[-1, panel.metric_pos(m), mask]
 
-        return result.reset_index(drop=True)
+        return pd.DataFrame(result)
 
     def get_multiyear_growth_analysis(self, metrics: List[str] = None,
                                       periods: List[int] = None) -> List[GrowthStats]:
@@ -964,77 +1230,55 @@ class BenchmarkData:
         if periods is None:
             periods = [3, 5]
 
-        # Load data sources
-        wrds_df = self._get_wrds_fundamentals()
-        uss_df = self._get_uss_financial_data()
+        panel = self.get_growth_panel()
 
-        if wrds_df.empty or uss_df.empty:
+        if panel.n_peers == 0 or not panel.present[-1].any():
             return []
 
-        results = []
         end_year = 2024  # Most recent year
 
+        # Peer CAGR vectors of every (period, metric), summarized in one pass
+        windows = []
         for period in periods:
             start_year = end_year - period
+            cagr = panel.window_cagr(start_year, end_year)
 
             for metric in metrics:
-                # Skip BSL for revenue/ebitda (no data)
-                if metric in self.MEDIUM_CONFIDENCE_METRICS:
-                    peer_data = wrds_df[wrds_df['ticker'] != 'BSL']
-                else:
-                    peer_data = wrds_df
-
-                # Calculate USS CAGR
-                uss_start = uss_df[uss_df['year'] == start_year]
-                uss_end = uss_df[uss_df['year'] == end_year]
-
-                uss_cagr = None
-                if not uss_start.empty and not uss_end.empty:
-                    start_val = uss_start[metric].iloc[0] if metric in uss_start.columns else None
-                    end_val = uss_end[metric].iloc[0] if metric in uss_end.columns else None
-                    uss_cagr = self.calculate_cagr(start_val, end_val, period)
-
-                # Calculate peer CAGRs
-                peer_cagrs = []
-                for ticker in peer_data['ticker'].unique():
-                    ticker_data = peer_data[peer_data['ticker'] == ticker]
-                    t_start = ticker_data[ticker_data['year'] == start_year]
-                    t_end = ticker_data[ticker_data['year'] == end_year]
-
-                    if not t_start.empty and not t_end.empty:
-                        start_val = t_start[metric].iloc[0] if metric in t_start.columns else None
-                        end_val = t_end[metric].iloc[0] if metric in t_end.columns else None
-                        cagr = self.calculate_cagr(start_val, end_val, period)
-                        if cagr is not None:
-                            peer_cagrs.append(cagr)
-
-                if not peer_cagrs:
+                m = panel.metric_pos(metric)
+                if m is None:
+                    continue
+                peer_cagrs = cagr[panel.peer_mask[:, m], m]
+                peer_cagrs = peer_cagrs[~np.isnan(peer_cagrs)]
+                if len(peer_cagrs) == 0:
                     continue
+                uss_cagr = None if np.isnan(cagr[-1, m]) else cagr[-1, m]
+                windows.append((period, start_year, metric, uss_cagr, peer_cagrs))
 
-                peer_series = pd.Series(peer_cagrs)
-
-                # Calculate USS percentile
-                uss_percentile = None
-                if uss_cagr is not None:
-                    below_count = (peer_series < uss_cagr).sum()
-                    uss_percentile = below_count / len(peer_series) * 100
-
-                growth_stats = GrowthStats(
-                    metric=metric,
-                    period_years=period,
-                    start_year=start_year,
-                    end_year=end_year,
-                    uss_cagr=uss_cagr,
-                    peer_min=peer_series.min(),
-                    peer_q1=peer_series.quantile(0.25),
-                    peer_median=peer_series.median(),
-                    peer_mean=peer_series.mean(),
-                    peer_q3=peer_series.quantile(0.75),
-                    peer_max=peer_series.max(),
-                    peer_count=len(peer_series),
-                    uss_percentile=uss_percentile
-                )
-                results.append(growth_stats)
+        stats = summary_stats([(str(period), metric, peer_cagrs)
+                               for period, _, metric, _, peer_cagrs in windows])
+
+        results = []
+        for (period, start_year, metric, uss_cagr, peer_cagrs), row in zip(windows, stats.itertuples()):
+            # Calculate USS percentile
+            uss_percentile = None
+            if uss_cagr is not None:
+                uss_percentile = (peer_cagrs < uss_cagr).sum() / len(peer_cagrs) * 100
+
+            results.append(GrowthStats(
+                metric=metric,
+                period_years=period,
+                start_year=start_year,
+                end_year=end_year,
+                uss_cagr=uss_cagr,
+                peer_min=row.Min,
+                peer_q1=row.Q1,
+                peer_median=row.Median,
+                peer_mean=row.Mean,
+                peer_q3=row.Q3,
+                peer_max=row.Max,
+                peer_count=len(peer_cagrs),
+                uss_percentile=uss_percentile
+            ))
 
         return results
 
@@ -1080,72 +1324,84 @@ class BenchmarkData:
         if metrics is None:
             metrics = ['revenue', 'ebitda', 'net_income', 'capex']
 
-        wrds_df = self._get_wrds_fundamentals()
-        uss_df = self._get_uss_financial_data()
+        panel = self.get_growth_panel()
 
-        if wrds_df.empty:
+        if panel.n_peers == 0:
             return pd.DataFrame()
 
-        records = []
-        available_years = sorted(wrds_df['year'].unique())
+        # Rolling periods within the years covered by the peer data
+        peer_years = panel.years[panel.present[:-1].any(axis=0)]
+        starts, cagrs = panel.rolling_cagr(window_years)
+        keep = np.isin(starts, peer_years) & (starts + window_years <= peer_years.max())
 
-        # Generate rolling periods
-        for start_year in available_years:
-            end_year = start_year + window_years
-            if end_year > max(available_years):
-                break
+        records = []
+        for start_year, cagr in zip(starts[keep], np.moveaxis(cagrs[:, :, keep], 2, 0)):
+            end_year = int(start_year) + window_years
+            label = f"{start_year}-{str(end_year)[2:]}"
 
             for metric in metrics:
-                # Skip BSL for medium confidence metrics
-                if metric in self.MEDIUM_CONFIDENCE_METRICS:
-                    peer_data = wrds_df[wrds_df['ticker'] != 'BSL']
-                else:
-                    peer_data = wrds_df
-
-                # Calculate for each peer
-                for ticker in peer_data['ticker'].unique():
-                    ticker_data = peer_data[peer_data['ticker'] == ticker]
-                    t_start = ticker_data[ticker_data['year'] == start_year]
-                    t_end = ticker_data[ticker_data['year'] == end_year]
-
-                    if not t_start.empty and not t_end.empty:
-                        start_val = t_start[metric].iloc[0] if metric in t_start.columns else None
-                        end_val = t_end[metric].iloc[0] if metric in t_end.columns else None
-                        cagr = self.calculate_cagr(start_val, end_val, window_years)
-                        if cagr is not None:
-                            company_name = t_start['company_name'].iloc[0] if 'company_name' in t_start.columns else ticker
-                            records.append({
-                                'ticker': ticker,
-                                'company_name': company_name,
-                                'metric': metric,
-                                'period_start': start_year,
-                                'period_end': end_year,
-                                'period_label': f"{start_year}-{str(end_year)[2:]}",
-                                'cagr': cagr
-                            })
-
-                # Calculate for USS
-                if not uss_df.empty and metric in uss_df.columns:
-                    uss_start = uss_df[uss_df['year'] == start_year]
-                    uss_end = uss_df[uss_df['year'] == end_year]
-
-                    if not uss_start.empty and not uss_end.empty:
-                        start_val = uss_start[metric].iloc[0]
-                        end_val = uss_end[metric].iloc[0]
-                        cagr = self.calculate_cagr(start_val, end_val, window_years)
-                        if cagr is not None:
-                            records.append({
-                                'ticker': 'X',
-                                'company_name': 'United States Steel',
-                                'metric': metric,
-                                'period_start': start_year,
-                                'period_end': end_year,
-                                'period_label': f"{start_year}-{str(end_year)[2:]}",
-                                'cagr': cagr
-                            })
+                m = panel.metric_pos(metric)
+                if m is None:
+                    continue
+                rows = np.flatnonzero(panel.peer_mask[:, m] & ~np.isnan(cagr[:, m]))
+                if metric in panel.uss_metrics and not np.isnan(cagr[-1, m]):
+                    rows = np.append(rows, len(panel.tickers) - 1)
+                for r in rows:
+                    records.append({
+                        'ticker': panel.tickers[r],
+                        'company_name': panel.company_names[r],
+                        'metric': metric,
+                        'period_start': int(start_year),
+                        'period_end': end_year,
+                        'period_label': label,
+                        'cagr': cagr[r, m]
+                    })
 
         return pd.DataFrame(records)
 
+    def get_growth_risk_analysis(self, metrics: List[str] = None, start_year: int = 2019,
+                                 end_year: int = 2024) -> pd.DataFrame:
+        """CAGR, growth volatility and max drawdown of every peer and USS.
+
+        Args:
+            metrics: List of metrics to analyze
+            start_year: First year of the window
+            end_year: Last year of the window
+
+        Returns:
+            DataFrame with columns: ticker, company_name, metric, cagr,
+            growth_volatility (std of YoY growth), max_drawdown
+        """
+        if metrics is None:
+            metrics = ['revenue', 'ebitda', 'net_income', 'capex']
+
+        panel = self.get_growth_panel()
+        positions = [(metric, panel.metric_pos(metric)) for metric in metrics
+                     if panel.metric_pos(metric) is not None]
+
+        if not positions or len(panel.years) == 0:
+            return pd.DataFrame()
+
+        cagr = panel.window_cagr(start_year, end_year)
+        volatility = panel.volatility(start_year, end_year)
+        drawdown = panel.max_drawdown(start_year, end_year)
+
+        records = []
+        for metric, m in positions:
+            rows = panel.peer_mask[:, m].copy()
+            rows[-1] = metric in panel.uss_metrics
+            for r in np.flatnonzero(rows):
+                records.append({
+                    'ticker': panel.tickers[r],
+                    'company_name': panel.company_names[r],
+                    'metric': metric,
+                    'cagr': cagr[r, m],
+                    'growth_volatility': volatility[r, m],
+                    'max_drawdown': drawdown[r, m],
+                })
+
+        return pd.DataFrame(records).dropna(subset=['cagr', 'growth_volatility', 'max_drawdown'], how='all')
+
     def get_uss_longterm_historical(self, metrics: List[str] = None) -> pd.DataFrame:
         """Get USS-only decade CAGRs from 1990s to 2020s.
 
@@ -1158,9 +1414,10 @@ class BenchmarkData:
         if metrics is None:
             metrics = ['revenue', 'ebitda', 'net_income', 'capex', 'total_assets']
 
-        uss_df = self._get_uss_financial_data()
+        panel = self.get_growth_panel()
+        uss_years = panel.years[panel.present[-1]]
 
-        if uss_df.empty:
+        if len(uss_years) == 0:
             return pd.DataFrame()
 
         # Define decades
@@ -1174,41 +1431,29 @@ class BenchmarkData:
         records = []
         for decade_name, start_year, end_year in decades:
             # Find actual available years in this decade
-            decade_data = uss_df[(uss_df['year'] >= start_year) & (uss_df['year'] <= end_year)]
+            decade_years = uss_years[(uss_years >= start_year) & (uss_years <= end_year)]
 
-            if decade_data.empty or len(decade_data) < 2:
+            if len(decade_years) < 2:
                 continue
 
-            actual_start = decade_data['year'].min()
-            actual_end = decade_data['year'].max()
-            period = actual_end - actual_start
-
-            if period <= 0:
-                continue
+            actual_start, actual_end = decade_years[0], decade_years[-1]
+            i, j = panel._year_pos(actual_start), panel._year_pos(actual_end)
 
             for metric in metrics:
-                if metric not in decade_data.columns:
+                if metric not in panel.uss_metrics:
                     continue
-
-                start_row = decade_data[decade_data['year'] == actual_start]
-                end_row = decade_data[decade_data['year'] == actual_end]
-
-                if start_row.empty or end_row.empty:
-                    continue
-
-                start_val = start_row[metric].iloc[0]
-                end_val = end_row[metric].iloc[0]
-                cagr = self.calculate_cagr(start_val, end_val, period)
+                m = panel.metric_pos(metric)
+                cagr = panel.cagr[-1, m, i, j]
 
                 records.append({
                     'decade': decade_name,
                     'metric': metric,
                     'start_year': actual_start,
                     'end_year': actual_end,
-                    'start_value': start_val,
-                    'end_value': end_val,
-                    'cagr': cagr,
-                    'years': period
+                    'start_value': panel.values[-1, m, i],
+                    'end_value': panel.values[-1, m, j],
+                    'cagr': None if np.isnan(cagr) else cagr,
+                    'years': actual_end - actual_start
                 })
 
         return pd.DataFrame(records)
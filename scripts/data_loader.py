@@ -1,12 +1,20 @@
 """
 Data Loader for U.S. Steel Financial Model
 Parses Capital IQ Excel exports into clean pandas DataFrames for analysis.
+
+Parsed tables are kept in a columnar (parquet) cache keyed by the hash of
+their source file, so the legacy .xls files are only read through xlrd
+once per file version. Use get_shared_loader() for a process-wide loader
+whose tables are parsed (or read from the cache) once per process.
 """
 
+import hashlib
+import json
+import threading
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 import warnings
 
 # Suppress pandas FutureWarning for replace() downcasting behavior
@@ -18,27 +26,69 @@ import logging
 logging.getLogger('xlrd').setLevel(logging.ERROR)
 
 
+# Bump when any parser changes so cached tables are rebuilt
+PARSED_CACHE_VERSION = 2
+DEFAULT_PARSED_CACHE_DIR = Path(__file__).parent.parent / 'local' / 'capiq_cache'
+MANIFEST_NAME = 'manifest.json'
+
+# (path, mtime, size) -> md5 of the file, so unchanged files are hashed once
+_file_hashes: Dict[tuple, str] = {}
+
+
+def source_file_hash(path: Path) -> Optional[str]:
+    """md5 of a source file's bytes (first 16 hex chars), None if missing"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_hashes:
+        _file_hashes[key] = hashlib.md5(path.read_bytes()).hexdigest()[:16]
+    return _file_hashes[key]
+
+
 class USSteelDataLoader:
     """Loads and parses U.S. Steel financial data from Capital IQ exports."""
 
-    def __init__(self, data_dir: str = "references"):
+    def __init__(self, data_dir: str = "references",
+                 cache_dir: Optional[Path] = DEFAULT_PARSED_CACHE_DIR):
+        """
+        Args:
+            data_dir: Directory with the Capital IQ .xls exports
+            cache_dir: Directory of the parsed-table cache (None = parse the
+                .xls files every time a table is first loaded)
+        """
         self.data_dir = Path(data_dir)
         self.financials_file = self.data_dir / "United States Steel Corporation Financials.xls"
         self.comps_file = self.data_dir / "Company Comparable Analysis United States Steel Corporation.xls"
         self.ma_file = self.data_dir / "United States Steel Corporation Comparable M A Transactions.xls"
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
         # Cache for loaded data
         self._cache: Dict[str, pd.DataFrame] = {}
+        self._cache_stats = {'memory': 0, 'disk': 0, 'parsed': 0}
+        self._lock = threading.RLock()
+
+        # Workbooks opened for parsing (each .xls is opened at most once)
+        self._workbooks: Dict[Path, pd.ExcelFile] = {}
 
         # Resolve sheet names (handle "US Steel_" prefix variant)
         self._sheet_map: Dict[str, str] = {}
 
+    def _workbook(self, path: Path) -> pd.ExcelFile:
+        if path not in self._workbooks:
+            self._workbooks[path] = pd.ExcelFile(path)
+        return self._workbooks[path]
+
+    def _read_sheet(self, path: Path, sheet_name: str) -> pd.DataFrame:
+        """Raw sheet (no header row) from the already opened workbook"""
+        return self._workbook(path).parse(sheet_name=sheet_name, header=None)
+
     def _resolve_sheet(self, target_name: str) -> str:
         """Resolve sheet name, handling 'US Steel_' prefix variant."""
         if not self._sheet_map:
             try:
-                xls = pd.ExcelFile(self.financials_file)
-                for sheet in xls.sheet_names:
+                for sheet in self._workbook(self.financials_file).sheet_names:
                     # Map both exact and stripped names
                     self._sheet_map[sheet] = sheet
                     stripped = sheet.replace('US Steel_', '')
@@ -47,6 +97,125 @@ class USSteelDataLoader:
                 pass
         return self._sheet_map.get(target_name, target_name)
 
+    # =========================================================================
+    # Parsed Table Cache
+    # =========================================================================
+
+    def load_table(self, key: str, source: Path, parse: Callable, use_cache: bool = True):
+        """Return a parsed table: from memory, else the parquet cache, else parse()
+
+        Args:
+            key: Table name (unique per loader)
+            source: File the table is parsed from; its hash keys the cache
+            parse: Callable building the table (DataFrame, tuple or dict of
+                DataFrames) from the source
+            use_cache: False re-parses the source and refreshes both caches
+        """
+        with self._lock:
+            if use_cache and key in self._cache:
+                self._cache_stats['memory'] += 1
+                return self._cache[key]
+
+            source_hash = source_file_hash(source)
+            value = self._read_parsed(key, source_hash) if use_cache else None
+            if value is not None:
+                self._cache_stats['disk'] += 1
+            else:
+                value = parse()
+                self._cache_stats['parsed'] += 1
+                self._write_parsed(key, source_hash, value)
+
+            self._cache[key] = value
+            return value
+
+    def _parsed_dir(self, key: str, source_hash: Optional[str]) -> Optional[Path]:
+        if self.cache_dir is None or source_hash is None:
+            return None
+        return self.cache_dir / f"{key}-v{PARSED_CACHE_VERSION}-{source_hash}"
+
+    def _read_parsed(self, key: str, source_hash: Optional[str]):
+        """Table from the parquet cache, None if absent or unreadable"""
+        path = self._parsed_dir(key, source_hash)
+        if path is None or not (path / MANIFEST_NAME).exists():
+            return None
+        try:
+            manifest = json.loads((path / MANIFEST_NAME).read_text())
+            frames = [pd.read_parquet(path / f"{i}.parquet") for i in range(len(manifest['parts']))]
+            # Parquet returns string labels as StringDtype; restore the parsed dtype
+            for frame, dtype in zip(frames, manifest['column_dtypes']):
+                if str(frame.columns.dtype) != dtype:
+                    frame.columns = frame.columns.astype(dtype)
+        except Exception:
+            return None
+        if manifest['kind'] == 'frame':
+            return frames[0]
+        if manifest['kind'] == 'tuple':
+            return tuple(frames)
+        return dict(zip(manifest['parts'], frames))
+
+    def _write_parsed(self, key: str, source_hash: Optional[str], value):
+        """Store a parsed table (DataFrame, tuple or dict of DataFrames) as parquet
+
+        The manifest is written last, so an interrupted write is never read
+        back; entries for older versions of the source are removed. Failures
+        only cost the next process a re-parse.
+        """
+        path = self._parsed_dir(key, source_hash)
+        if path is None:
+            return
+        if isinstance(value, pd.DataFrame):
+            kind, parts, frames = 'frame', ['data'], [value]
+        elif isinstance(value, tuple):
+            kind, parts, frames = 'tuple', [str(i) for i in range(len(value))], list(value)
+        else:
+            kind, parts, frames = 'dict', list(value), list(value.values())
+        try:
+            for stale in self.cache_dir.glob(f"{key}-v*"):
+                if stale != path:
+                    for f in stale.iterdir():
+                        f.unlink()
+                    stale.rmdir()
+            path.mkdir(parents=True, exist_ok=True)
+            for i, frame in enumerate(frames):
+                frame.to_parquet(path / f"{i}.parquet")
+            (path / MANIFEST_NAME).write_text(json.dumps({
+                'key': key, 'version': PARSED_CACHE_VERSION, 'source_hash': source_hash,
+                'kind': kind, 'parts': parts,
+                'column_dtypes': [str(frame.columns.dtype) for frame in frames],
+            }))
+        except Exception as e:
+            print(f"Warning: Could not cache parsed {key}: {e}")
+
+    def build_parsed_cache(self) -> Dict[str, str]:
+        """Parse every table once and store it in the parquet cache
+
+        Returns:
+            Dict of table key -> 'cached' or the error that prevented parsing
+        """
+        status = {}
+        for key, load in [
+            ('income_statement', self.load_income_statement),
+            ('balance_sheet', self.load_balance_sheet),
+            ('cash_flow', self.load_cash_flow),
+            ('ratios', self.load_ratios),
+            ('multiples', self.load_multiples),
+            ('capital_structure', self.load_capital_structure),
+            ('comparable_companies', self.load_comparable_companies),
+            ('comp_summary_stats', self.load_comp_summary_stats),
+            ('ma_transactions', self.load_ma_transactions),
+        ]:
+            try:
+                load()
+                status[key] = 'cached'
+            except Exception as e:
+                status[key] = f"error: {e}"
+        self._workbooks.clear()
+        return status
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Loads served from memory, from the parquet cache and parsed from .xls"""
+        return dict(self._cache_stats)
+
     def _clean_column_headers(self, df: pd.DataFrame, header_row: int) -> pd.DataFrame:
         """Extract period dates from header row and set as column names."""
         headers = df.iloc[header_row].tolist()
@@ -84,11 +253,10 @@ class USSteelDataLoader:
 
     def load_income_statement(self, use_cache: bool = True) -> pd.DataFrame:
         """Load income statement data."""
-        cache_key = 'income_statement'
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.load_table('income_statement', self.financials_file, self._parse_income_statement, use_cache)
 
-        df = pd.read_excel(self.financials_file, sheet_name=self._resolve_sheet('Income Statement'), header=None)
+    def _parse_income_statement(self) -> pd.DataFrame:
+        df = self._read_sheet(self.financials_file, self._resolve_sheet('Income Statement'))
 
         # Find data start row (where "Revenue" appears)
         for i, val in enumerate(df.iloc[:, 0]):
@@ -118,16 +286,14 @@ class USSteelDataLoader:
         data = self._clean_numeric(data)
         data = data.reset_index(drop=True)
 
-        self._cache[cache_key] = data
         return data
 
     def load_balance_sheet(self, use_cache: bool = True) -> pd.DataFrame:
         """Load balance sheet data."""
-        cache_key = 'balance_sheet'
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.load_table('balance_sheet', self.financials_file, self._parse_balance_sheet, use_cache)
 
-        df = pd.read_excel(self.financials_file, sheet_name=self._resolve_sheet('Balance Sheet'), header=None)
+    def _parse_balance_sheet(self) -> pd.DataFrame:
+        df = self._read_sheet(self.financials_file, self._resolve_sheet('Balance Sheet'))
 
         # Find header row (Balance Sheet as of:)
         for i, val in enumerate(df.iloc[:, 0]):
@@ -155,16 +321,14 @@ class USSteelDataLoader:
         data = self._clean_numeric(data)
         data = data.reset_index(drop=True)
 
-        self._cache[cache_key] = data
         return data
 
     def load_cash_flow(self, use_cache: bool = True) -> pd.DataFrame:
         """Load cash flow statement data."""
-        cache_key = 'cash_flow'
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.load_table('cash_flow', self.financials_file, self._parse_cash_flow, use_cache)
 
-        df = pd.read_excel(self.financials_file, sheet_name=self._resolve_sheet('Cash Flow'), header=None)
+    def _parse_cash_flow(self) -> pd.DataFrame:
+        df = self._read_sheet(self.financials_file, self._resolve_sheet('Cash Flow'))
 
         # Find header row
         for i, val in enumerate(df.iloc[:, 0]):
@@ -185,16 +349,14 @@ class USSteelDataLoader:
         data = self._clean_numeric(data)
         data = data.reset_index(drop=True)
 
-        self._cache[cache_key] = data
         return data
 
     def load_ratios(self, use_cache: bool = True) -> pd.DataFrame:
         """Load financial ratios."""
-        cache_key = 'ratios'
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.load_table('ratios', self.financials_file, self._parse_ratios, use_cache)
 
-        df = pd.read_excel(self.financials_file, sheet_name=self._resolve_sheet('Ratios'), header=None)
+    def _parse_ratios(self) -> pd.DataFrame:
+        df = self._read_sheet(self.financials_file, self._resolve_sheet('Ratios'))
 
         # Find header row
         for i, val in enumerate(df.iloc[:, 0]):
@@ -214,16 +376,14 @@ class USSteelDataLoader:
         data = self._clean_numeric(data)
         data = data.reset_index(drop=True)
 
-        self._cache[cache_key] = data
         return data
 
     def load_multiples(self, use_cache: bool = True) -> pd.DataFrame:
         """Load valuation multiples."""
-        cache_key = 'multiples'
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.load_table('multiples', self.financials_file, self._parse_multiples, use_cache)
 
-        df = pd.read_excel(self.financials_file, sheet_name=self._resolve_sheet('Multiples'), header=None)
+    def _parse_multiples(self) -> pd.DataFrame:
+        df = self._read_sheet(self.financials_file, self._resolve_sheet('Multiples'))
 
         # Find header row (For Quarter Ending)
         for i, val in enumerate(df.iloc[:, 0]):
@@ -246,16 +406,14 @@ class USSteelDataLoader:
         data = self._clean_numeric(data)
         data = data.reset_index(drop=True)
 
-        self._cache[cache_key] = data
         return data
 
     def load_capital_structure(self, use_cache: bool = True) -> pd.DataFrame:
         """Load historical capitalization data."""
-        cache_key = 'capital_structure'
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.load_table('capital_structure', self.financials_file, self._parse_capital_structure, use_cache)
 
-        df = pd.read_excel(self.financials_file, sheet_name=self._resolve_sheet('Historical Capitalization'), header=None)
+    def _parse_capital_structure(self) -> pd.DataFrame:
+        df = self._read_sheet(self.financials_file, self._resolve_sheet('Historical Capitalization'))
 
         # Find header row
         for i, val in enumerate(df.iloc[:, 0]):
@@ -275,7 +433,6 @@ class USSteelDataLoader:
         data = self._clean_numeric(data)
         data = data.reset_index(drop=True)
 
-        self._cache[cache_key] = data
         return data
 
     # =========================================================================
@@ -284,16 +441,15 @@ class USSteelDataLoader:
 
     def load_comparable_companies(self, use_cache: bool = True) -> Dict[str, pd.DataFrame]:
         """Load all comparable company analysis sheets."""
-        cache_key = 'comparable_companies'
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.load_table('comparable_companies', self.comps_file, self._parse_comparable_companies, use_cache)
 
+    def _parse_comparable_companies(self) -> Dict[str, pd.DataFrame]:
         result = {}
         sheets = ['Financial Data', 'Capital Structure', 'Financial Ratios', 'Credit Ratios', 'Implied Valuation']
 
         for sheet in sheets:
             try:
-                df = pd.read_excel(self.comps_file, sheet_name=sheet, header=None)
+                df = self._read_sheet(self.comps_file, sheet)
 
                 # Find header row (Company Name)
                 header_row = None
@@ -333,12 +489,14 @@ class USSteelDataLoader:
             except Exception as e:
                 print(f"Warning: Could not load sheet {sheet}: {e}")
 
-        self._cache[cache_key] = result
         return result
 
     def load_comp_summary_stats(self, use_cache: bool = True) -> pd.DataFrame:
         """Load summary statistics from comparable company analysis."""
-        df = pd.read_excel(self.comps_file, sheet_name='Financial Data', header=None)
+        return self.load_table('comp_summary_stats', self.comps_file, self._parse_comp_summary_stats, use_cache)
+
+    def _parse_comp_summary_stats(self) -> pd.DataFrame:
+        df = self._read_sheet(self.comps_file, 'Financial Data')
 
         # Find Summary Statistics row
         for i, val in enumerate(df.iloc[:, 0]):
@@ -362,11 +520,10 @@ class USSteelDataLoader:
         Load M&A transaction comparables.
         Returns: (transactions_df, summary_stats_df)
         """
-        cache_key = 'ma_transactions'
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.load_table('ma_transactions', self.ma_file, self._parse_ma_transactions, use_cache)
 
-        df = pd.read_excel(self.ma_file, sheet_name='Comparable M A Transactions', header=None)
+    def _parse_ma_transactions(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        df = self._read_sheet(self.ma_file, 'Comparable M A Transactions')
 
         # Header is row 6
         headers = df.iloc[6].tolist()
@@ -375,6 +532,8 @@ class USSteelDataLoader:
         transactions = df.iloc[7:16].copy()
         transactions.columns = headers
         transactions = transactions[transactions['Announced Date'].notna()]
+        # Dates as datetime64 (as the parquet cache stores them)
+        transactions['Announced Date'] = pd.to_datetime(transactions['Announced Date'], errors='coerce')
 
         # Clean numeric columns
         for col in ['Target TEV(USD mm)', 'Size(USD mm)']:
@@ -403,7 +562,6 @@ class USSteelDataLoader:
 
         summary = summary.reset_index(drop=True)
 
-        self._cache[cache_key] = (transactions, summary)
         return transactions, summary
 
     # =========================================================================
@@ -437,8 +595,35 @@ class USSteelDataLoader:
         }
 
     def clear_cache(self):
-        """Clear the data cache."""
-        self._cache.clear()
+        """Clear the in-memory data cache (the parquet cache is kept)."""
+        with self._lock:
+            self._cache.clear()
+            self._workbooks.clear()
+            self._sheet_map.clear()
+
+
+# =============================================================================
+# Shared loader
+# =============================================================================
+
+_shared_loaders: Dict[Tuple[Path, Optional[Path]], USSteelDataLoader] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_loader(data_dir: str = "references",
+                      cache_dir: Optional[Path] = DEFAULT_PARSED_CACHE_DIR) -> USSteelDataLoader:
+    """Process-wide loader for a data directory, so tables are loaded once per process"""
+    key = (Path(data_dir).resolve(), Path(cache_dir).resolve() if cache_dir is not None else None)
+    with _shared_lock:
+        if key not in _shared_loaders:
+            _shared_loaders[key] = USSteelDataLoader(data_dir, cache_dir)
+        return _shared_loaders[key]
+
+
+def clear_shared_loaders():
+    """Drop all shared loaders (and their in-memory tables)"""
+    with _shared_lock:
+        _shared_loaders.clear()
 
 
 # =============================================================================
@@ -447,7 +632,7 @@ class USSteelDataLoader:
 
 def load_financials(data_dir: str = "references") -> Dict[str, pd.DataFrame]:
     """Quick load of all financial statement data."""
-    loader = USSteelDataLoader(data_dir)
+    loader = get_shared_loader(data_dir)
     return {
         'income_statement': loader.load_income_statement(),
         'balance_sheet': loader.load_balance_sheet(),
@@ -460,7 +645,7 @@ def load_financials(data_dir: str = "references") -> Dict[str, pd.DataFrame]:
 
 def load_comps(data_dir: str = "references") -> Dict[str, pd.DataFrame]:
     """Quick load of comparable company and M&A data."""
-    loader = USSteelDataLoader(data_dir)
+    loader = get_shared_loader(data_dir)
     ma_trans, ma_summary = loader.load_ma_transactions()
     return {
         'comparable_companies': loader.load_comparable_companies(),
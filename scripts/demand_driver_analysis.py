@@ -15,13 +15,19 @@ Indicators analyzed:
                        Mfg IP, Building Permits, GDP, Steel Capacity Util,
                        Steel Import Price Index, Trade Balance
 
+All analyses read a quarter-indexed feature store (revenue, steel prices and
+indicators with lagged columns) that is built once per set of source files and
+cached in local/demand_cache.
+
 Usage:
     python scripts/demand_driver_analysis.py [--output-dir audit-verification]
 """
 
+import hashlib
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -183,52 +189,294 @@ def load_steel_prices_quarterly(price_dir: Path) -> Dict[str, pd.DataFrame]:
 
 
 # ---------------------------------------------------------------------------
-# Correlation Analysis
+# Feature Store
 # ---------------------------------------------------------------------------
+# One quarter-indexed frame holds revenue, steel prices and every indicator
+# (plus lagged copies), so analyses select columns instead of re-merging
+# quarterly frames. It is rebuilt only when a source file changes.
 
-def correlate_with_revenue(
-    revenue_df: pd.DataFrame,
-    indicator_df: pd.DataFrame,
-    max_lag_quarters: int = 4,
-) -> List[Dict]:
-    """Correlate an indicator with revenue at various lags."""
-    rows = []
-    for lag in range(max_lag_quarters + 1):
-        ind = indicator_df.copy()
-        if lag > 0:
-            # Shift indicator backward by lag quarters
-            ind['fiscal_quarter'] = ind['fiscal_quarter'] + lag
-            ind['fiscal_year'] = ind['fiscal_year'] + (ind['fiscal_quarter'] - 1) // 4
-            ind['fiscal_quarter'] = ((ind['fiscal_quarter'] - 1) % 4) + 1
-
-        merged = revenue_df.merge(ind, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-        if len(merged) < 8:
-            continue
+ROOT_DIR = Path(__file__).parent.parent
+DEFAULT_DATA_DIR = ROOT_DIR / 'data'
+DEFAULT_PRICE_DIR = ROOT_DIR / 'market-data' / 'exports' / 'processed'
+REVENUE_FILE = 'uss_quarterly_revenue.csv'
 
-        r, p = stats.pearsonr(merged['indicator_value'], merged['revenue'])
-        rho, p_s = stats.spearmanr(merged['indicator_value'], merged['revenue'])
-
-        # Also correlate with EBITDA
-        r_ebitda, p_ebitda = np.nan, np.nan
-        if 'ebitda' in merged.columns and merged['ebitda'].notna().sum() >= 8:
-            r_ebitda, p_ebitda = stats.pearsonr(merged['indicator_value'], merged['ebitda'])
-
-        rows.append({
-            'lag_quarters': lag,
-            'n': len(merged),
-            'r_revenue': r, 'p_revenue': p,
-            'rho_revenue': rho,
-            'r_ebitda': r_ebitda, 'p_ebitda': p_ebitda,
-        })
+# Disk cache for the store and lag correlations (shared with advanced_demand_analysis)
+FEATURE_STORE_DIR = ROOT_DIR / 'local' / 'demand_cache'
+
+# Bump when store construction or the lag correlations change
+FEATURE_STORE_VERSION = 1
+
+DEFAULT_MAX_LAG = 4
+
+# Minimum overlapping quarters for a lag correlation to be reported
+MIN_LAG_OBS = 8
+
+QUARTER_KEYS = ['fiscal_year', 'fiscal_quarter']
+REVENUE_COLUMNS = ['revenue', 'ebitda']
+
+
+def lag_column(name: str, lag: int) -> str:
+    """Store column holding an indicator lagged by `lag` quarters."""
+    return name if lag == 0 else f"{name} (lag {lag}Q)"
+
+
+def feature_source_hash(data_dir: Path, price_dir: Path) -> str:
+    """Hash of the revenue export and every indicator / steel price file."""
+    revenue_path = Path(data_dir) / REVENUE_FILE
+    if not revenue_path.exists():
+        raise FileNotFoundError(f"{revenue_path} not found. Run scripts/fetch_uss_quarterly.py first")
+    h = hashlib.md5(f"v{FEATURE_STORE_VERSION}".encode())
+    h.update(revenue_path.read_bytes())
+    for filename in [info['file'] for info in INDICATORS.values()] + list(STEEL_PRICES.values()):
+        path = Path(price_dir) / filename
+        h.update(filename.encode())
+        h.update(path.read_bytes() if path.exists() else b'missing')
+    return h.hexdigest()[:16]
+
+
+@dataclass
+class DemandFeatureStore:
+    """
+    Quarter-indexed revenue, steel price and indicator columns
+
+    frame has a contiguous quarterly PeriodIndex spanning all sources (NaN
+    where a series has no data), so lag k of an indicator is a plain shift.
+    """
+    frame: pd.DataFrame
+    indicators: List[str]
+    steel_prices: List[str]
+    max_lag: int
+    source_hash: str
+    cache_dir: Optional[Path] = None
+    _lag_correlations: Optional[pd.DataFrame] = field(default=None, repr=False)
+
+    def revenue_frame(self) -> pd.DataFrame:
+        """Revenue quarters (fiscal keys, revenue, ebitda)."""
+        rows = self.frame[self.frame['revenue'].notna()]
+        return rows[QUARTER_KEYS + REVENUE_COLUMNS].reset_index(drop=True)
+
+    def series_frame(self, name: str, lag: int = 0) -> pd.DataFrame:
+        """Quarters where a series is observed, as (fiscal keys, indicator_value)."""
+        column = lag_column(name, lag)
+        rows = self.frame[self.frame[column].notna()]
+        frame = rows[QUARTER_KEYS].reset_index(drop=True)
+        frame['indicator_value'] = rows[column].values
+        return frame
+
+    def indicator_frames(self) -> Dict[str, pd.DataFrame]:
+        """Indicators in the load_all_indicators() layout."""
+        return {name: self.series_frame(name) for name in self.indicators}
+
+    def steel_price_frames(self) -> Dict[str, pd.DataFrame]:
+        """Steel prices in the load_steel_prices_quarterly() layout."""
+        return {name: self.series_frame(name) for name in self.steel_prices}
+
+    def lag_matrix(self, names: Optional[List[str]] = None) -> Tuple[np.ndarray, List[Tuple[str, int]]]:
+        """(quarters x indicators*lags) values and the (indicator, lag) of each column."""
+        names = self.indicators if names is None else names
+        labels = [(name, lag) for name in names for lag in range(self.max_lag + 1)]
+        columns = [lag_column(name, lag) for name, lag in labels]
+        return self.frame[columns].to_numpy(dtype=float), labels
+
+    def lag_correlations(self) -> pd.DataFrame:
+        """lag_correlations() of this store, computed once per source hash."""
+        if self._lag_correlations is None:
+            path = (self.cache_dir / f'lag_correlations_L{self.max_lag}_{self.source_hash}.parquet'
+                    if self.cache_dir is not None else None)
+            if path is not None and path.exists():
+                self._lag_correlations = pd.read_parquet(path)
+            else:
+                self._lag_correlations = lag_correlations(self)
+                if path is not None:
+                    _replace_cached(path, f'lag_correlations_L{self.max_lag}_*.parquet', self._lag_correlations)
+        return self._lag_correlations
 
-    return rows
 
+def _replace_cached(path: Path, pattern: str, frame: pd.DataFrame):
+    """Write a parquet cache file, dropping older versions of it.
 
-def decompose_price_volume(
+    pattern matches the files with the same parameters (e.g. max_lag), so
+    only other source hashes are dropped.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in path.parent.glob(pattern):
+        stale.unlink()
+    frame.to_parquet(path, index=False)
+
+
+def _quarter_index(frame: pd.DataFrame) -> pd.PeriodIndex:
+    return pd.PeriodIndex.from_fields(
+        year=frame['fiscal_year'], quarter=frame['fiscal_quarter'], freq='Q'
+    ).rename('quarter')
+
+
+def build_feature_frame(
     revenue_df: pd.DataFrame,
     indicators: Dict[str, pd.DataFrame],
     steel_prices: Dict[str, pd.DataFrame],
+    max_lag: int = DEFAULT_MAX_LAG,
 ) -> pd.DataFrame:
+    """Align quarterly revenue, steel prices and indicators on one quarter index."""
+    series = {'revenue': revenue_df.set_index(_quarter_index(revenue_df))[REVENUE_COLUMNS]}
+    for name, q in {**steel_prices, **indicators}.items():
+        series[name] = q.set_index(_quarter_index(q))['indicator_value'].rename(name)
+
+    quarters = pd.Index([])
+    for values in series.values():
+        quarters = quarters.union(values.index)
+    index = pd.period_range(quarters.min(), quarters.max(), freq='Q', name='quarter')
+
+    columns = {
+        'fiscal_year': index.year.astype(int),
+        'fiscal_quarter': index.quarter.astype(int),
+    }
+    revenue = series.pop('revenue').reindex(index)
+    columns.update({c: revenue[c].values for c in REVENUE_COLUMNS})
+    for name, values in series.items():
+        aligned = values.reindex(index)
+        columns[name] = aligned.values
+        if name in indicators:
+            for lag in range(1, max_lag + 1):
+                columns[lag_column(name, lag)] = aligned.shift(lag).values
+    return pd.DataFrame(columns, index=index)
+
+
+def build_feature_store(
+    data_dir: Path = DEFAULT_DATA_DIR,
+    price_dir: Path = DEFAULT_PRICE_DIR,
+    max_lag: int = DEFAULT_MAX_LAG,
+    cache_dir: Optional[Path] = FEATURE_STORE_DIR,
+) -> DemandFeatureStore:
+    """
+    Build (or read from cache_dir) the feature store for the source files.
+
+    The store is kept as parquet keyed by feature_source_hash, so a later
+    run only re-reads the CSVs when one of them changed.
+    """
+    data_dir, price_dir = Path(data_dir), Path(price_dir)
+    source_hash = feature_source_hash(data_dir, price_dir)
+    path = cache_dir / f'feature_store_L{max_lag}_{source_hash}.parquet' if cache_dir is not None else None
+
+    if path is not None and path.exists():
+        frame = pd.read_parquet(path)
+        frame.index = _quarter_index(frame)
+    else:
+        frame = build_feature_frame(
+            load_quarterly_revenue(data_dir),
+            load_all_indicators(price_dir),
+            load_steel_prices_quarterly(price_dir),
+            max_lag,
+        )
+        if path is not None:
+            _replace_cached(path, f'feature_store_L{max_lag}_*.parquet', frame)
+
+    return DemandFeatureStore(
+        frame=frame,
+        indicators=[name for name in INDICATORS if name in frame.columns],
+        steel_prices=[name for name in STEEL_PRICES if name in frame.columns],
+        max_lag=max_lag,
+        source_hash=source_hash,
+        cache_dir=cache_dir,
+    )
+
+
+_feature_store_cache: Dict[tuple, DemandFeatureStore] = {}
+
+
+def get_feature_store(
+    data_dir: Path = DEFAULT_DATA_DIR,
+    price_dir: Path = DEFAULT_PRICE_DIR,
+    max_lag: int = DEFAULT_MAX_LAG,
+    cache_dir: Optional[Path] = FEATURE_STORE_DIR,
+) -> DemandFeatureStore:
+    """Process-wide feature store, rebuilt when a source file changes."""
+    key = (Path(data_dir).resolve(), Path(price_dir).resolve(), max_lag,
+           feature_source_hash(data_dir, price_dir))
+    if key not in _feature_store_cache:
+        _feature_store_cache[key] = build_feature_store(data_dir, price_dir, max_lag, cache_dir)
+    return _feature_store_cache[key]
+
+
+def clear_feature_store_cache():
+    """Drop in-memory feature stores (the parquet cache is kept)."""
+    _feature_store_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Correlation Analysis
+# ---------------------------------------------------------------------------
+
+def pairwise_pearson(X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pearson r of every column of X with y, over rows where both are observed.
+
+    Returns (r, two-sided p, n) arrays with one entry per column; r and p are
+    NaN where fewer than 3 pairs overlap.
+    """
+    mask = ~np.isnan(X) & ~np.isnan(y)[:, None]
+    n = mask.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = np.where(mask, X, 0.0).sum(axis=0) / n
+        y_mean = np.where(mask, y[:, None], 0.0).sum(axis=0) / n
+        dx = np.where(mask, X - x_mean, 0.0)
+        dy = np.where(mask, y[:, None] - y_mean, 0.0)
+        r = (dx * dy).sum(axis=0) / np.sqrt((dx ** 2).sum(axis=0) * (dy ** 2).sum(axis=0))
+        r = np.clip(r, -1.0, 1.0)
+        dof = n - 2
+        t = r * np.sqrt(dof / (1.0 - r ** 2))
+        p = 2 * stats.t.sf(np.abs(t), dof)
+    r = np.where(n > 2, r, np.nan)
+    p = np.where(n > 2, np.where(np.abs(r) == 1.0, 0.0, p), np.nan)
+    return r, p, n
+
+
+def pairwise_spearman(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Spearman rho of every column of X with y, over rows where both are observed."""
+    mask = ~np.isnan(X) & ~np.isnan(y)[:, None]
+    x_ranks = pd.DataFrame(np.where(mask, X, np.nan)).rank().to_numpy()
+    y_ranks = pd.DataFrame(np.where(mask, y[:, None], np.nan)).rank().to_numpy()
+    n = mask.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        dx = np.where(mask, x_ranks - (n + 1) / 2, 0.0)
+        dy = np.where(mask, y_ranks - (n + 1) / 2, 0.0)
+        rho = (dx * dy).sum(axis=0) / np.sqrt((dx ** 2).sum(axis=0) * (dy ** 2).sum(axis=0))
+    return np.where(n > 2, rho, np.nan)
+
+
+def lag_correlations(store: DemandFeatureStore) -> pd.DataFrame:
+    """
+    Correlate every indicator, at lags 0..max_lag quarters, with revenue and EBITDA.
+
+    Lag k pairs revenue in quarter t with the indicator in quarter t-k. All
+    indicator x lag columns are correlated in one pass; combinations with
+    fewer than MIN_LAG_OBS overlapping quarters are dropped.
+    """
+    X, labels = store.lag_matrix()
+    revenue = store.frame['revenue'].to_numpy(dtype=float)
+    r, p, n = pairwise_pearson(X, revenue)
+    rho = pairwise_spearman(X, revenue)
+    r_ebitda, p_ebitda, n_ebitda = pairwise_pearson(X, store.frame['ebitda'].to_numpy(dtype=float))
+    enough_ebitda = n_ebitda >= MIN_LAG_OBS
+
+    result = pd.DataFrame({
+        'lag_quarters': [lag for _, lag in labels],
+        'n': n,
+        'r_revenue': r, 'p_revenue': p,
+        'rho_revenue': rho,
+        'r_ebitda': np.where(enough_ebitda, r_ebitda, np.nan),
+        'p_ebitda': np.where(enough_ebitda, p_ebitda, np.nan),
+        'indicator': [name for name, _ in labels],
+    })
+    return result[result['n'] >= MIN_LAG_OBS].reset_index(drop=True)
+
+
+def _price_base(store: DemandFeatureStore) -> pd.DataFrame:
+    """Store rows with both revenue and the HRC US price."""
+    frame = store.frame
+    return frame[frame['revenue'].notna() & frame['HRC US'].notna()]
+
+
+def decompose_price_volume(store: DemandFeatureStore) -> pd.DataFrame:
     """
     Decompose: do indicators predict revenue AFTER controlling for steel prices?
 
@@ -236,101 +484,60 @@ def decompose_price_volume(
     after regressing out HRC US price effect.
     """
     # Use HRC US as the primary price control
-    if 'HRC US' not in steel_prices:
+    if 'HRC US' not in store.steel_prices:
         return pd.DataFrame()
 
-    hrc = steel_prices['HRC US']
-    base = revenue_df.merge(hrc, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-    base = base.rename(columns={'indicator_value': 'hrc_price'})
-
-    # Revenue residuals after removing price effect
-    mask = base['revenue'].notna() & base['hrc_price'].notna()
-    if mask.sum() < 10:
+    base = _price_base(store)
+    if len(base) < 10:
         return pd.DataFrame()
 
-    slope, intercept, _, _, _ = stats.linregress(base.loc[mask, 'hrc_price'], base.loc[mask, 'revenue'])
-    base['revenue_residual'] = base['revenue'] - (slope * base['hrc_price'] + intercept)
-    base['price_predicted'] = slope * base['hrc_price'] + intercept
+    revenue = base['revenue'].to_numpy(dtype=float)
+    hrc_price = base['HRC US'].to_numpy(dtype=float)
 
-    # Stats for the price model
-    r2_price = 1 - (base['revenue_residual'].var() / base['revenue'].var())
-
-    rows = []
-    for name, ind_df in indicators.items():
-        merged = base.merge(ind_df, on=['fiscal_year', 'fiscal_quarter'], how='inner')
-        if len(merged) < 8:
-            continue
-
-        # Full correlation (with price)
-        r_full, p_full = stats.pearsonr(merged['indicator_value'], merged['revenue'])
-
-        # Partial correlation (after removing price)
-        r_partial, p_partial = stats.pearsonr(merged['indicator_value'], merged['revenue_residual'])
-
-        # Does the indicator predict volume (revenue/price proxy)?
-        merged['implied_volume'] = merged['revenue'] / merged['hrc_price'] * 1000  # index
-        r_volume, p_volume = stats.pearsonr(merged['indicator_value'], merged['implied_volume'])
-
-        rows.append({
-            'indicator': name,
-            'category': INDICATORS[name]['category'],
-            'channel': INDICATORS[name]['channel'],
-            'n': len(merged),
-            'r_full': r_full, 'p_full': p_full,
-            'r_partial': r_partial, 'p_partial': p_partial,
-            'r_volume': r_volume, 'p_volume': p_volume,
-            'r2_price_model': r2_price,
-        })
+    # Revenue residuals after removing price effect
+    slope, intercept, _, _, _ = stats.linregress(hrc_price, revenue)
+    residual = revenue - (slope * hrc_price + intercept)
 
-    return pd.DataFrame(rows)
+    # Stats for the price model
+    r2_price = 1 - (np.var(residual, ddof=1) / np.var(revenue, ddof=1))
+
+    # Full, partial (after removing price) and implied-volume correlations, all indicators at once
+    X = base[store.indicators].to_numpy(dtype=float)
+    r_full, p_full, n = pairwise_pearson(X, revenue)
+    r_partial, p_partial, _ = pairwise_pearson(X, residual)
+    r_volume, p_volume, _ = pairwise_pearson(X, revenue / hrc_price * 1000)  # index
+
+    rows = pd.DataFrame({
+        'indicator': store.indicators,
+        'category': [INDICATORS[name]['category'] for name in store.indicators],
+        'channel': [INDICATORS[name]['channel'] for name in store.indicators],
+        'n': n,
+        'r_full': r_full, 'p_full': p_full,
+        'r_partial': r_partial, 'p_partial': p_partial,
+        'r_volume': r_volume, 'p_volume': p_volume,
+        'r2_price_model': r2_price,
+    })
+    return rows[rows['n'] >= MIN_LAG_OBS].reset_index(drop=True)
 
 
-def multivariate_model(
-    revenue_df: pd.DataFrame,
-    indicators: Dict[str, pd.DataFrame],
-    steel_prices: Dict[str, pd.DataFrame],
-    top_n: int = 5,
-) -> Dict:
+def multivariate_model(store: DemandFeatureStore, top_n: int = 5) -> Dict:
     """
     Build a multivariate regression: Revenue ~ HRC + top N macro indicators.
 
     Returns model stats and incremental R² from adding macro indicators.
     """
-    if 'HRC US' not in steel_prices:
+    if 'HRC US' not in store.steel_prices:
         return {}
 
-    # Start with HRC as base
-    hrc = steel_prices['HRC US'].rename(columns={'indicator_value': 'hrc_price'})
-    base = revenue_df.merge(hrc, on=['fiscal_year', 'fiscal_quarter'], how='inner')
+    base = _price_base(store)
 
-    # Find best concurrent indicators by partial correlation
-    partial_corrs = []
-    for name, ind_df in indicators.items():
-        merged = base.merge(
-            ind_df.rename(columns={'indicator_value': name}),
-            on=['fiscal_year', 'fiscal_quarter'], how='inner'
-        )
-        if len(merged) < 15:
-            continue
-        # Quick partial correlation check
-        mask = merged[['revenue', 'hrc_price', name]].notna().all(axis=1)
-        if mask.sum() < 15:
-            continue
-        partial_corrs.append((name, merged, mask.sum()))
-
-    if not partial_corrs:
+    # Indicators with more than 15 quarters alongside revenue and HRC
+    counts = base[store.indicators].notna().sum()
+    available_indicators = [name for name in store.indicators if counts[name] > 15]
+    if not available_indicators:
         return {}
 
-    # Build combined dataset with all indicators
-    combined = base.copy()
-    available_indicators = []
-    for name, _, _ in partial_corrs:
-        ind_df = indicators[name].rename(columns={'indicator_value': name})
-        combined = combined.merge(ind_df, on=['fiscal_year', 'fiscal_quarter'], how='left')
-        if combined[name].notna().sum() > 15:
-            available_indicators.append(name)
-
-    combined = combined.dropna(subset=['revenue', 'hrc_price'] + available_indicators[:top_n])
+    combined = base.dropna(subset=available_indicators[:top_n])
 
     if len(combined) < 15:
         return {}
@@ -338,7 +545,7 @@ def multivariate_model(
     from numpy.linalg import lstsq
 
     # Model 1: Revenue ~ HRC only
-    X1 = np.column_stack([combined['hrc_price'].values, np.ones(len(combined))])
+    X1 = np.column_stack([combined['HRC US'].values, np.ones(len(combined))])
     y = combined['revenue'].values
     beta1, res1, _, _ = lstsq(X1, y, rcond=None)
     ss_res1 = np.sum((y - X1 @ beta1) ** 2)
@@ -347,7 +554,8 @@ def multivariate_model(
 
     # Model 2: Revenue ~ HRC + top macro indicators
     feature_names = ['hrc_price'] + available_indicators[:top_n]
-    X2 = np.column_stack([combined[f].values for f in feature_names] + [np.ones(len(combined))])
+    columns = ['HRC US'] + available_indicators[:top_n]
+    X2 = np.column_stack([combined[c].values for c in columns] + [np.ones(len(combined))])
     beta2, res2, _, _ = lstsq(X2, y, rcond=None)
     ss_res2 = np.sum((y - X2 @ beta2) ** 2)
     r2_full = 1 - ss_res2 / ss_tot
@@ -451,8 +659,7 @@ def plot_decomposition(decomp_df: pd.DataFrame, output_dir: Path):
 
 
 def plot_top_indicators_scatter(
-    revenue_df: pd.DataFrame,
-    indicators: Dict[str, pd.DataFrame],
+    store: DemandFeatureStore,
     top_names: List[str],
     output_dir: Path,
 ):
@@ -462,8 +669,10 @@ def plot_top_indicators_scatter(
 
     for idx, name in enumerate(top_names[:n_plots]):
         ax = axes[idx // 3][idx % 3]
-        ind_df = indicators[name]
-        merged = revenue_df.merge(ind_df, on=['fiscal_year', 'fiscal_quarter'], how='inner')
+        rows = store.frame[store.frame['revenue'].notna() & store.frame[name].notna()]
+        merged = pd.DataFrame({
+            'fiscal_year': rows['fiscal_year'], 'revenue': rows['revenue'], 'indicator_value': rows[name],
+        })
 
         ax.scatter(merged['indicator_value'], merged['revenue'],
                    c=merged['fiscal_year'], cmap='viridis', s=50, edgecolors='white', linewidth=0.3)
@@ -682,27 +891,22 @@ def main():
 
     # Load data
     print("Loading data...")
-    revenue_df = load_quarterly_revenue(data_dir)
-    indicators = load_all_indicators(price_dir)
-    steel_prices = load_steel_prices_quarterly(price_dir)
+    try:
+        store = get_feature_store(data_dir, price_dir, max_lag=4)
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
 
-    print(f"  Revenue: {len(revenue_df)} quarters")
-    print(f"  Indicators loaded: {len(indicators)}")
-    print(f"  Steel prices: {len(steel_prices)}")
-    for name in sorted(indicators.keys()):
-        n = len(indicators[name])
-        print(f"    {name}: {n} quarterly obs")
+    observed = store.frame[store.indicators].notna().sum()
+    print(f"  Revenue: {store.frame['revenue'].notna().sum()} quarters")
+    print(f"  Indicators loaded: {len(store.indicators)}")
+    print(f"  Steel prices: {len(store.steel_prices)}")
+    for name in sorted(store.indicators):
+        print(f"    {name}: {observed[name]} quarterly obs")
 
     # Phase 1: Lag analysis for all indicators
     print("\nPhase 1: Correlation lag analysis...")
-    all_lag_results = []
-    for name, ind_df in indicators.items():
-        results = correlate_with_revenue(revenue_df, ind_df, max_lag_quarters=4)
-        for r in results:
-            r['indicator'] = name
-        all_lag_results.extend(results)
-
-    lag_df = pd.DataFrame(all_lag_results)
+    lag_df = store.lag_correlations()
     print(f"  Computed {len(lag_df)} indicator × lag combinations")
 
     # Print top correlations
@@ -715,7 +919,7 @@ def main():
 
     # Phase 2: Price vs volume decomposition
     print("\nPhase 2: Price vs volume decomposition...")
-    decomp_df = decompose_price_volume(revenue_df, indicators, steel_prices)
+    decomp_df = decompose_price_volume(store)
     if len(decomp_df) > 0:
         print(f"  Decomposed {len(decomp_df)} indicators")
 
@@ -740,7 +944,7 @@ def main():
 
     # Phase 3: Multivariate model
     print("\nPhase 3: Multivariate model...")
-    mv_result = multivariate_model(revenue_df, indicators, steel_prices, top_n=5)
+    mv_result = multivariate_model(store, top_n=5)
     if mv_result:
         print(f"  Price-only R²: {mv_result['r2_price_only']:.3f}")
         print(f"  Full model R²: {mv_result['r2_full']:.3f} (+{mv_result['incremental_r2']:.3f})")
@@ -752,7 +956,7 @@ def main():
     if len(decomp_df) > 0:
         plot_decomposition(decomp_df, chart_dir)
     top_names = best['indicator'].tolist()
-    plot_top_indicators_scatter(revenue_df, indicators, top_names, chart_dir)
+    plot_top_indicators_scatter(store, top_names, chart_dir)
     plot_multivariate_r2(mv_result, chart_dir)
 
     # Save data
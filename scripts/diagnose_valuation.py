@@ -76,9 +76,7 @@ def run_diagnostic():
     # Sensitivity: what price growth gives $39? $55?
     print(f"\n=== PRICE GROWTH SENSITIVITY ===")
     for pg in [0.0, 0.005, 0.01, 0.015, 0.02]:
-        from copy import deepcopy
-        test_scenario = deepcopy(base)
-        test_scenario.price_scenario.annual_price_growth = pg
+        test_scenario = base.with_overrides(annual_price_growth=pg)
         test_model = PriceVolumeModel(test_scenario)
         test_results = test_model.run_full_analysis()
         sp_uss = test_results['val_uss'].get('share_price', 0)
@@ -16,14 +16,25 @@ Exports comprehensive Excel workbooks with:
 Uses styling patterns from create_audit_excel.py.
 """
 
+import re
+import weakref
+import zipfile
+from collections import deque
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from copy import copy
+from dataclasses import replace
 from io import BytesIO
 from datetime import datetime
+from itertools import product
 from typing import Dict, List, Optional, Any
 import pandas as pd
 import numpy as np
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.utils import get_column_letter
 
@@ -31,10 +42,44 @@ from price_volume_model import (
     PriceVolumeModel, ModelScenario, ScenarioType,
     get_scenario_presets, get_segment_configs, get_capital_projects,
     compare_scenarios, calculate_probability_weighted_valuation,
-    BENCHMARK_PRICES_2023, Segment, get_synergy_presets, SynergyAssumptions
+    BENCHMARK_PRICES_2023, Segment, get_synergy_presets, SynergyAssumptions,
+    ValuationPoint, preset_points, get_valuation_pool, shutdown_valuation_pool,
+    VALUATION_POOL_WORKERS, SCENARIO_COMPARISON_COLUMNS
 )
 
 
+# Named cell styles shared by every exported workbook
+HEADER_STYLE = 'Model Header'
+SECTION_STYLE = 'Model Section'
+DATA_STYLES = {
+    None: 'Model Data',
+    'positive': 'Model Positive',
+    'negative': 'Model Negative',
+    'derived': 'Model Derived',
+}
+
+# Metrics in the peer analysis sheet's historical section
+PEER_METRICS = ['revenue', 'ebitda', 'net_income', 'capex']
+
+# Threads gathering sheet data (peer benchmarks, scenario valuations)
+# while the other sheets are written
+EXPORT_PREFETCH_WORKERS = 2
+
+
+def written_cells(ws, remove: bool = False):
+    """((row, col), cell) pairs of the cells a worksheet actually holds
+
+    openpyxl has no public accessor for its sparse cell store (iter_rows
+    creates every empty cell in the used range), so this reads it directly;
+    requirements.txt pins openpyxl to the minor release this was checked
+    against. With remove=True the store is emptied once read.
+    """
+    cells = list(ws._cells.items())
+    if remove:
+        ws._cells.clear()
+    return cells
+
+
 class ExcelStyler:
     """Centralized Excel styling for consistent workbook appearance"""
 
@@ -79,24 +124,59 @@ class ExcelStyler:
         self.decimal_format = '#,##0.00'
         self.multiple_format = '0.0"x"'
 
+        # Workbooks whose named styles are registered
+        self._registered = weakref.WeakSet()
+
+    def _named_styles(self) -> List[NamedStyle]:
+        """Shared cell styles (one style record per kind instead of per cell)"""
+        data_alignment = Alignment(horizontal='right', vertical='center')
+        styles = [
+            NamedStyle(name=HEADER_STYLE, font=self.header_font, fill=self.header_fill,
+                       border=self.thin_border,
+                       alignment=Alignment(horizontal='center', vertical='center', wrap_text=True)),
+            NamedStyle(name=SECTION_STYLE, font=self.section_font, fill=self.section_fill,
+                       border=self.thin_border, alignment=Alignment(horizontal='left', vertical='center')),
+            NamedStyle(name=DATA_STYLES[None], font=copy(DEFAULT_FONT), border=self.thin_border,
+                       alignment=data_alignment),
+            NamedStyle(name=DATA_STYLES['positive'], font=self.positive_font, fill=self.positive_fill,
+                       border=self.thin_border, alignment=data_alignment),
+            NamedStyle(name=DATA_STYLES['negative'], font=self.negative_font, fill=self.negative_fill,
+                       border=self.thin_border, alignment=data_alignment),
+            NamedStyle(name=DATA_STYLES['derived'], font=copy(DEFAULT_FONT), fill=self.derived_fill,
+                       border=self.thin_border, alignment=data_alignment),
+        ]
+        return styles
+
+    def register_styles(self, wb: Workbook):
+        """Add the shared named styles to a workbook (once per workbook)"""
+        if wb in self._registered:
+            return
+        existing = set(wb.named_styles)
+        for style in self._named_styles():
+            if style.name not in existing:
+                wb.add_named_style(style)
+        self._registered.add(wb)
+
+    def _apply(self, ws, cell, style_name: str):
+        """Apply a named style, keeping the cell's number format"""
+        self.register_styles(ws.parent)
+        number_format = cell.number_format
+        cell.style = style_name
+        if number_format != 'General':
+            cell.number_format = number_format
+
     def style_header_row(self, ws, row: int, start_col: int, end_col: int):
         """Apply header styling to a row"""
         for col in range(start_col, end_col + 1):
-            cell = ws.cell(row=row, column=col)
-            cell.fill = self.header_fill
-            cell.font = self.header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            cell.border = self.thin_border
+            self._apply(ws, ws.cell(row=row, column=col), HEADER_STYLE)
 
     def style_section_header(self, ws, row: int, text: str, start_col: int, end_col: int):
         """Create a section header spanning multiple columns"""
         ws.merge_cells(start_row=row, start_column=start_col, end_row=row, end_column=end_col)
         cell = ws.cell(row=row, column=start_col)
         cell.value = text
-        cell.fill = self.section_fill
-        cell.font = self.section_font
-        cell.alignment = Alignment(horizontal='left', vertical='center')
-        for col in range(start_col, end_col + 1):
+        self._apply(ws, cell, SECTION_STYLE)
+        for col in range(start_col + 1, end_col + 1):
             ws.cell(row=row, column=col).border = self.thin_border
 
     def style_data_cell(self, ws, row: int, col: int, value_type: str = None):
@@ -104,42 +184,59 @@ class ExcelStyler:
 
         Args:
             value_type: 'positive', 'negative', 'derived', or None
+                (None keeps any fill already set on the cell)
         """
         cell = ws.cell(row=row, column=col)
-        cell.border = self.thin_border
-        cell.alignment = Alignment(horizontal='right', vertical='center')
-
-        if value_type == 'positive':
-            cell.fill = self.positive_fill
-            cell.font = self.positive_font
-        elif value_type == 'negative':
-            cell.fill = self.negative_fill
-            cell.font = self.negative_font
-        elif value_type == 'derived':
-            cell.fill = self.derived_fill
+        fill = cell.fill if value_type is None and cell.has_style and cell.fill.fill_type else None
+        self._apply(ws, cell, DATA_STYLES.get(value_type, DATA_STYLES[None]))
+        if fill is not None:
+            cell.fill = copy(fill)
 
     def auto_column_width(self, ws, min_width: int = 10, max_width: int = 50):
-        """Auto-adjust column widths based on content"""
-        for column_cells in ws.columns:
-            length = max(len(str(cell.value or '')) for cell in column_cells)
-            length = max(min_width, min(length + 2, max_width))
-            ws.column_dimensions[column_cells[0].column_letter].width = length
+        """Auto-adjust column widths based on content
+
+        One pass over the cells actually written (iterating rows or
+        columns would materialize every empty cell in the used range);
+        columns are sized from their longest value, clamped to
+        [min_width, max_width].
+        """
+        lengths = {}
+        for (_, col), cell in written_cells(ws):
+            if cell.value is not None:
+                length = len(str(cell.value))
+                if length > lengths.get(col, 0):
+                    lengths[col] = length
+        for col in range(1, ws.max_column + 1):
+            width = max(min_width, min(lengths.get(col, 0) + 2, max_width))
+            ws.column_dimensions[get_column_letter(col)].width = width
 
 
 class ModelExporter:
     """Export financial model to Excel workbook"""
 
     def __init__(self, scenario: ModelScenario, execution_factor: float = 1.0,
-                 custom_benchmarks: dict = None):
+                 custom_benchmarks: dict = None, analysis: Dict = None,
+                 peer_data: Dict = None):
+        """
+        Args:
+            scenario: Scenario to export
+            execution_factor: Execution factor the analysis was run with
+            custom_benchmarks: Optional custom benchmark prices dict
+            analysis: run_full_analysis() result the caller already has for
+                this scenario (None = run the model here)
+            peer_data: _load_peer_analysis_data() result shared between
+                exports (None = load it here)
+        """
         self.scenario = scenario
         self.execution_factor = execution_factor
         self.custom_benchmarks = custom_benchmarks or BENCHMARK_PRICES_2023
         self.styler = ExcelStyler()
         self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.peer_data = peer_data
 
-        # Run the model
+        # Run the model (unless the caller passed its analysis)
         self.model = PriceVolumeModel(scenario, execution_factor, custom_benchmarks)
-        self.analysis = self.model.run_full_analysis()
+        self.analysis = analysis if analysis is not None else self.model.run_full_analysis()
 
         # Segment enum mapping for dynamic EBITDA calculation
         self._segment_map = {
@@ -174,34 +271,64 @@ class ModelExporter:
         Returns:
             BytesIO object containing the Excel file
         """
-        wb = Workbook()
+        return self._build_workbook()
 
-        # Create all sheets
-        self._create_cover_sheet(wb)
-        self._create_assumptions_sheet(wb)
-        self._create_dcf_sheet(wb, 'uss')
-        self._create_dcf_sheet(wb, 'nippon')
-        self._create_fcf_reconciliation_sheet(wb)
-        self._create_consolidated_sheet(wb)
+    def export_multi_scenario(self, scenario_types: List[ScenarioType] = None,
+                              comparison: pd.DataFrame = None,
+                              pw_results: Dict = None,
+                              calibration_mode: Optional[str] = None,
+                              probability_mode: Optional[str] = None) -> BytesIO:
+        """Export multi-scenario comparison to Excel workbook
 
-        # Segment sheets
-        for segment in Segment:
-            self._create_segment_sheet(wb, segment.value)
+        Args:
+            scenario_types: List of scenarios to compare (default: all presets)
+            comparison: compare_scenarios() result the caller already has
+                (None = compute it here)
+            pw_results: calculate_probability_weighted_valuation() result the
+                caller already has, computed with the modes below (None =
+                compute it here)
+            calibration_mode: Calibration mode of the probability-weighted valuation
+            probability_mode: Probability mode of the probability-weighted valuation
 
-        self._create_wacc_sheet(wb)
-        self._create_projects_sheet(wb)
-        self._create_equity_bridge_sheet(wb)
-        self._create_financing_sheet(wb)
+        Returns:
+            BytesIO object containing the Excel file
+        """
+        pw_modes = {'calibration_mode': calibration_mode, 'probability_mode': probability_mode}
+        return self._build_workbook(multi=True, scenario_types=scenario_types,
+                                    comparison=comparison, pw_results=pw_results, pw_modes=pw_modes)
 
-        # Add synergy sheet if synergies are enabled
-        if self.analysis.get('synergy_schedule') is not None:
-            self._create_synergy_sheet(wb)
+    def _build_workbook(self, multi: bool = False, scenario_types: List[ScenarioType] = None,
+                        comparison: pd.DataFrame = None, pw_results: Dict = None,
+                        pw_modes: Dict = None) -> BytesIO:
+        """Write all sheets and save the workbook
 
-        # Add peer analysis sheet with graceful failure handling
-        try:
-            self._create_peer_analysis_sheet(wb)
-        except Exception as e:
-            print(f"Warning: Could not create peer analysis sheet: {e}")
+        Peer benchmarks and (for multi-scenario exports) scenario valuations
+        are gathered on worker threads while the model sheets are written.
+        """
+        wb = Workbook()
+        self.styler.register_styles(wb)
+
+        with ThreadPoolExecutor(max_workers=EXPORT_PREFETCH_WORKERS) as pool:
+            if self.peer_data is None:
+                peer_data = pool.submit(self._load_peer_analysis_data)
+            if multi:
+                valuations = pool.submit(self._scenario_valuations, scenario_types, comparison, pw_results,
+                                         pw_modes)
+
+            self._create_model_sheets(wb)
+
+            # Add peer analysis sheet with graceful failure handling
+            try:
+                self._create_peer_analysis_sheet(
+                    wb, self.peer_data if self.peer_data is not None else peer_data.result())
+            except Exception as e:
+                print(f"Warning: Could not create peer analysis sheet: {e}")
+
+            # Add multi-scenario sheets
+            if multi:
+                comparison, pw_results = valuations.result()
+                self._create_scenario_comparison_sheet(wb, scenario_types, comparison)
+                self._create_probability_weighted_sheet(wb, pw_results, pw_modes)
 
         # Remove default empty sheet if it exists
         if 'Sheet' in wb.sheetnames and len(wb.sheetnames) > 1:
@@ -213,19 +340,8 @@ class ModelExporter:
         output.seek(0)
         return output
 
-    def export_multi_scenario(self, scenario_types: List[ScenarioType] = None) -> BytesIO:
-        """Export multi-scenario comparison to Excel workbook
-
-        Args:
-            scenario_types: List of scenarios to compare (default: all presets)
-
-        Returns:
-            BytesIO object containing the Excel file
-        """
-        # Start with single scenario export
-        wb = Workbook()
-
-        # Create all sheets from single scenario
+    def _create_model_sheets(self, wb: Workbook):
+        """Write the scenario's own sheets (cover through synergies)"""
         self._create_cover_sheet(wb)
         self._create_assumptions_sheet(wb)
         self._create_dcf_sheet(wb, 'uss')
@@ -233,6 +349,7 @@ class ModelExporter:
         self._create_fcf_reconciliation_sheet(wb)
         self._create_consolidated_sheet(wb)
 
+        # Segment sheets
         for segment in Segment:
             self._create_segment_sheet(wb, segment.value)
 
@@ -245,24 +362,41 @@ class ModelExporter:
         if self.analysis.get('synergy_schedule') is not None:
             self._create_synergy_sheet(wb)
 
-        # Add peer analysis sheet with graceful failure handling
-        try:
-            self._create_peer_analysis_sheet(wb)
-        except Exception as e:
-            print(f"Warning: Could not create peer analysis sheet: {e}")
+    def _scenario_valuations(self, scenario_types: List[ScenarioType] = None,
+                             comparison: pd.DataFrame = None, pw_results: Dict = None,
+                             pw_modes: Dict = None) -> tuple:
+        """Scenario comparison and probability-weighted results, computing only what is missing
 
-        # Add multi-scenario sheets
-        self._create_scenario_comparison_sheet(wb, scenario_types)
-        self._create_probability_weighted_sheet(wb)
+        The comparison runs first so the weighted valuation reuses its
+        cached model stages.
 
-        # Remove default empty sheet
-        if 'Sheet' in wb.sheetnames and len(wb.sheetnames) > 1:
-            del wb['Sheet']
+        Returns:
+            (comparison DataFrame, probability-weighted dict or error message)
+        """
+        if comparison is None:
+            comparison = self._scenario_comparison(scenario_types)
+        if pw_results is None:
+            pw_results = self._probability_weighted(**(pw_modes or {}))
+        return comparison, pw_results
+
+    def _scenario_comparison(self, scenario_types: List[ScenarioType] = None) -> pd.DataFrame:
+        return compare_scenarios(
+            scenario_types=scenario_types,
+            execution_factor=self.execution_factor,
+            custom_benchmarks=self.custom_benchmarks
+        )
 
-        output = BytesIO()
-        wb.save(output)
-        output.seek(0)
-        return output
+    def _probability_weighted(self, calibration_mode: Optional[str] = None,
+                              probability_mode: Optional[str] = None):
+        """Probability-weighted valuation, or the error message if it cannot be computed"""
+        try:
+            return calculate_probability_weighted_valuation(
+                custom_benchmarks=self.custom_benchmarks,
+                calibration_mode=calibration_mode,
+                probability_mode=probability_mode
+            )
+        except ValueError as e:
+            return str(e)
 
     def _create_cover_sheet(self, wb: Workbook):
         """Create cover sheet with title, timestamp, and key metrics"""
@@ -626,16 +760,16 @@ class ModelExporter:
             multiplier = extra[0] if extra and extra[0] is not None else 1
             calc_func = extra[1] if len(extra) > 1 else None
 
-            total = 0
-            for col_idx, year in enumerate(years, 2):
-                year_data = consolidated[consolidated['Year'] == year]
-                if col_name:
-                    value = year_data[col_name].values[0] * multiplier
-                elif calc_func:
-                    value = calc_func(year_data).values[0] * multiplier
-                else:
-                    value = 0
+            # Whole row at once (consolidated has one row per year, in order)
+            if col_name:
+                row_values = consolidated[col_name].to_numpy() * multiplier
+            elif calc_func:
+                row_values = calc_func(consolidated).to_numpy() * multiplier
+            else:
+                row_values = np.zeros(len(years))
 
+            total = 0
+            for col_idx, value in enumerate(row_values.tolist(), 2):
                 cell = ws.cell(row=row, column=col_idx, value=value)
                 cell.number_format = self.styler.currency_format
                 value_type = 'positive' if value > 0 else 'negative' if value < 0 else None
@@ -654,9 +788,7 @@ class ModelExporter:
         row += 1
         ws.cell(row=row, column=1, value="EBITDA Margin")
         self.styler.style_data_cell(ws, row, 1, 'derived')
-        for col_idx, year in enumerate(years, 2):
-            year_data = consolidated[consolidated['Year'] == year]
-            margin = year_data['EBITDA_Margin'].values[0]
+        for col_idx, margin in enumerate(consolidated['EBITDA_Margin'].tolist(), 2):
             cell = ws.cell(row=row, column=col_idx, value=margin)
             cell.number_format = self.styler.percent_format
             self.styler.style_data_cell(ws, row, col_idx, 'derived')
@@ -685,21 +817,15 @@ class ModelExporter:
         self.styler.style_header_row(ws, row, 1, len(headers))
         row += 1
 
-        for _, data_row in consolidated.iterrows():
-            for col, header in enumerate(headers, 1):
-                value = data_row[header]
-                cell = ws.cell(row=row, column=col, value=value)
-
-                # Apply number format based on column
-                if header in ['EBITDA_Margin']:
-                    cell.number_format = self.styler.percent_format
-                elif header in ['Avg_Price_per_ton']:
-                    cell.number_format = self.styler.currency_format
-                elif header not in ['Year']:
-                    cell.number_format = self.styler.number_format
-
-                self.styler.style_data_cell(ws, row, col)
-            row += 1
+        # Number format based on column
+        formats = [
+            self.styler.percent_format if header in ['EBITDA_Margin']
+            else self.styler.currency_format if header in ['Avg_Price_per_ton']
+            else None if header in ['Year']
+            else self.styler.number_format
+            for header in headers
+        ]
+        self._write_table_rows(ws, row, consolidated, formats)
 
         self.styler.auto_column_width(ws)
 
@@ -725,23 +851,31 @@ class ModelExporter:
         self.styler.style_header_row(ws, row, 1, len(headers))
         row += 1
 
-        for _, data_row in segment_df.iterrows():
-            for col, header in enumerate(headers, 1):
-                value = data_row[header]
-                cell = ws.cell(row=row, column=col, value=value)
+        # Number format based on column
+        formats = [
+            self.styler.percent_format if header in ['EBITDA_Margin']
+            else self.styler.currency_format if header in ['Price_per_ton']
+            else None if header in ['Year', 'Segment']
+            else self.styler.number_format
+            for header in headers
+        ]
+        self._write_table_rows(ws, row, segment_df, formats)
 
-                # Apply number format based on column
-                if header in ['EBITDA_Margin']:
-                    cell.number_format = self.styler.percent_format
-                elif header in ['Price_per_ton']:
-                    cell.number_format = self.styler.currency_format
-                elif header not in ['Year', 'Segment']:
-                    cell.number_format = self.styler.number_format
+        self.styler.auto_column_width(ws)
 
-                self.styler.style_data_cell(ws, row, col)
-            row += 1
+    def _write_table_rows(self, ws, start_row: int, df: pd.DataFrame, formats: List[Optional[str]]):
+        """Write a DataFrame's rows as styled data cells
 
-        self.styler.auto_column_width(ws)
+        Args:
+            start_row: First row to write
+            formats: Number format per column (None = leave as General)
+        """
+        for row, values in enumerate(df.itertuples(index=False, name=None), start_row):
+            for col, (value, fmt) in enumerate(zip(values, formats), 1):
+                cell = ws.cell(row=row, column=col, value=value)
+                if fmt:
+                    cell.number_format = fmt
+                self.styler.style_data_cell(ws, row, col)
 
     def _create_wacc_sheet(self, wb: Workbook):
         """Create WACC analysis sheet"""
@@ -1289,10 +1423,13 @@ class ModelExporter:
         for col in range(5, len(headers) + 2):
             ws.column_dimensions[get_column_letter(col)].width = 12
 
-    def _create_peer_analysis_sheet(self, wb: Workbook):
-        """Create Multi-Year Peer Analysis sheet with CAGR comparisons"""
-        ws = wb.create_sheet("Multi-Year Peer Analysis")
+    def _load_peer_analysis_data(self) -> Dict:
+        """Benchmark series for the peer analysis sheet
 
+        Returns:
+            Dict of the BenchmarkData results used by the sheet, or
+            {'error': message} if benchmark data is unavailable
+        """
         try:
             # Import benchmark data
             import sys
@@ -1303,6 +1440,29 @@ class ModelExporter:
             from benchmark_data import BenchmarkData
 
             benchmark = BenchmarkData()
+            return {
+                'uss_ts': benchmark.get_uss_timeseries(PEER_METRICS, 2019, 2024),
+                'peer_ts': {metric: benchmark.get_peer_timeseries(metric, 2019, 2024) for metric in PEER_METRICS},
+                'growth_stats': benchmark.get_multiyear_growth_analysis(),
+                'rolling_data': benchmark.get_rolling_period_analysis(['revenue', 'net_income'], 3),
+                'longterm_data': benchmark.get_uss_longterm_historical(),
+            }
+        except Exception as e:
+            return {'error': str(e)}
+
+    def _create_peer_analysis_sheet(self, wb: Workbook, peer_data: Dict = None):
+        """Create Multi-Year Peer Analysis sheet with CAGR comparisons
+
+        Args:
+            peer_data: Result of _load_peer_analysis_data (None = load it here)
+        """
+        ws = wb.create_sheet("Multi-Year Peer Analysis")
+        if peer_data is None:
+            peer_data = self._load_peer_analysis_data()
+
+        try:
+            if 'error' in peer_data:
+                raise RuntimeError(peer_data['error'])
 
             # Title
             ws['A1'] = "MULTI-YEAR PEER ANALYSIS"
@@ -1320,10 +1480,10 @@ class ModelExporter:
             row += 2
 
             # Get USS timeseries
-            uss_ts = benchmark.get_uss_timeseries(['revenue', 'ebitda', 'net_income', 'capex'], 2019, 2024)
+            uss_ts = peer_data['uss_ts']
 
             if not uss_ts.empty:
-                metrics = ['revenue', 'ebitda', 'net_income', 'capex']
+                metrics = PEER_METRICS
                 years = sorted(uss_ts['year'].unique())
 
                 for metric in metrics:
@@ -1353,7 +1513,7 @@ class ModelExporter:
                     row += 1
 
                     # Peer rows
-                    peer_ts = benchmark.get_peer_timeseries(metric, 2019, 2024)
+                    peer_ts = peer_data['peer_ts'][metric]
                     if not peer_ts.empty:
                         for ticker in sorted(peer_ts['ticker'].unique()):
                             ticker_data = peer_ts[peer_ts['ticker'] == ticker]
@@ -1378,7 +1538,7 @@ class ModelExporter:
             row += 2
 
             # Get growth analysis
-            growth_stats = benchmark.get_multiyear_growth_analysis()
+            growth_stats = peer_data['growth_stats']
 
             if growth_stats:
                 # Headers
@@ -1435,7 +1595,7 @@ class ModelExporter:
             self.styler.style_section_header(ws, row, "SECTION 3: ROLLING 3-YEAR CAGR BY PERIOD", 1, 8)
             row += 2
 
-            rolling_data = benchmark.get_rolling_period_analysis(['revenue', 'net_income'], 3)
+            rolling_data = peer_data['rolling_data']
 
             if not rolling_data.empty:
                 for metric in ['revenue', 'net_income']:
@@ -1500,7 +1660,7 @@ class ModelExporter:
             ws.cell(row=row, column=1).font = Font(italic=True, color="666666")
             row += 2
 
-            longterm_data = benchmark.get_uss_longterm_historical()
+            longterm_data = peer_data['longterm_data']
 
             if not longterm_data.empty:
                 # Headers
@@ -1553,8 +1713,13 @@ class ModelExporter:
             ws['A5'] = f"Error loading peer analysis data: {str(e)}"
             ws['A6'] = "This section requires benchmark_data.py and peer_fundamentals.csv"
 
-    def _create_scenario_comparison_sheet(self, wb: Workbook, scenario_types: List[ScenarioType] = None):
-        """Create scenario comparison sheet"""
+    def _create_scenario_comparison_sheet(self, wb: Workbook, scenario_types: List[ScenarioType] = None,
+                                          comparison: pd.DataFrame = None):
+        """Create scenario comparison sheet
+
+        Args:
+            comparison: compare_scenarios() result (None = run the comparison here)
+        """
         ws = wb.create_sheet("Scenario Comparison")
 
         # Title
@@ -1562,16 +1727,13 @@ class ModelExporter:
         ws['A1'].font = self.styler.title_font
 
         # Run comparison
-        comparison = compare_scenarios(
-            scenario_types=scenario_types,
-            execution_factor=self.execution_factor,
-            custom_benchmarks=self.custom_benchmarks
-        )
+        if comparison is None:
+            comparison = self._scenario_comparison(scenario_types)
 
         row = 3
 
-        # Headers
-        headers = list(comparison.columns)
+        # Headers (only compare_scenarios() columns; callers may have added their own)
+        headers = [c for c in SCENARIO_COMPARISON_COLUMNS if c in comparison.columns]
         for col, header in enumerate(headers, 1):
             ws.cell(row=row, column=col, value=header)
         self.styler.style_header_row(ws, row, 1, len(headers))
@@ -1596,22 +1758,31 @@ class ModelExporter:
 
         self.styler.auto_column_width(ws)
 
-    def _create_probability_weighted_sheet(self, wb: Workbook):
-        """Create probability-weighted valuation sheet"""
+    def _create_probability_weighted_sheet(self, wb: Workbook, pw_results=None, pw_modes: Dict = None):
+        """Create probability-weighted valuation sheet
+
+        Args:
+            pw_results: calculate_probability_weighted_valuation() result, or
+                an error message (None = run the valuation here)
+            pw_modes: calibration_mode / probability_mode of the valuation
+                (noted on the sheet when not the defaults)
+        """
         ws = wb.create_sheet("Probability-Weighted")
+        pw_modes = pw_modes or {}
 
         # Title
         ws['A1'] = "PROBABILITY-WEIGHTED EXPECTED VALUE"
         ws['A1'].font = self.styler.title_font
+        if any(pw_modes.values()):
+            ws['A2'] = (f"Calibration mode: {pw_modes.get('calibration_mode') or 'default'}, "
+                        f"probability mode: {pw_modes.get('probability_mode') or 'default'}")
 
         row = 3
 
-        try:
-            pw_results = calculate_probability_weighted_valuation(
-                custom_benchmarks=self.custom_benchmarks
-            )
-        except ValueError as e:
-            ws.cell(row=row, column=1, value=f"Error calculating probability-weighted value: {str(e)}")
+        if pw_results is None:
+            pw_results = self._probability_weighted(**pw_modes)
+        if isinstance(pw_results, str):
+            ws.cell(row=row, column=1, value=f"Error calculating probability-weighted value: {pw_results}")
             return
 
         # Summary metrics
@@ -1682,7 +1853,7 @@ def get_export_filename(scenario_name: str, export_type: str = "single") -> str:
 
     Args:
         scenario_name: Name of the scenario
-        export_type: 'single' or 'multi'
+        export_type: 'single', 'multi', 'formula', 'batch' or 'batch_zip'
 
     Returns:
         Filename string
@@ -1692,6 +1863,10 @@ def get_export_filename(scenario_name: str, export_type: str = "single") -> str:
 
     if export_type == "multi":
         return f"USS_Model_Comparison_{timestamp}.xlsx"
+    elif export_type == "batch":
+        return f"USS_Model_Batch_{timestamp}.xlsx"
+    elif export_type == "batch_zip":
+        return f"USS_Model_Batch_{timestamp}.zip"
     elif export_type == "formula":
         return f"USS_Model_Formula_{scenario_slug}_{timestamp}.xlsx"
     else:
@@ -1706,16 +1881,21 @@ class FormulaModelExporter:
     """
 
     def __init__(self, scenario: ModelScenario, execution_factor: float = 1.0,
-                 custom_benchmarks: dict = None):
+                 custom_benchmarks: dict = None, analysis: Dict = None):
+        """
+        Args:
+            analysis: run_full_analysis() result the caller already has for
+                this scenario (None = run the model here)
+        """
         self.scenario = scenario
         self.execution_factor = execution_factor
         self.custom_benchmarks = custom_benchmarks or BENCHMARK_PRICES_2023
         self.styler = ExcelStyler()
         self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # Run model to get projection data
+        # Run model to get projection data (unless the caller passed its analysis)
         self.model = PriceVolumeModel(scenario, execution_factor, custom_benchmarks)
-        self.analysis = self.model.run_full_analysis()
+        self.analysis = analysis if analysis is not None else self.model.run_full_analysis()
 
         self.years = list(range(2024, 2034))
         self.num_years = len(self.years)
@@ -1726,6 +1906,7 @@ class FormulaModelExporter:
     def export_with_formulas(self) -> BytesIO:
         """Export model with working Excel formulas"""
         wb = Workbook()
+        self.styler.register_styles(wb)
 
         # Create sheets in order
         self._create_inputs_sheet(wb)
@@ -2297,3 +2478,351 @@ class FormulaModelExporter:
         ws.column_dimensions['B'].width = 18
         ws.column_dimensions['C'].width = 18
         ws.column_dimensions['D'].width = 15
+
+
+# =============================================================================
+# BATCH EXPORT
+# =============================================================================
+# Review packs export many scenarios at once (every preset x calibration mode,
+# or a parameter grid). Analyses run on the shared valuation pool a few
+# scenarios ahead of the writer; each scenario's sheets are written with the
+# ModelExporter sheet writers and streamed straight out - into a write-only
+# workbook, or as one workbook per scenario in a zip - so memory stays flat
+# however many scenarios the pack holds.
+
+# Calibration modes of a full review pack (None = default preset factors)
+CALIBRATION_MODES = [None, 'fixed', 'bloomberg', 'hybrid']
+
+# Short sheet names for the combined workbook (Excel caps names at 31 chars);
+# segment sheets use the segment name
+BATCH_SHEET_NAMES = {
+    'Cover': 'Summary',
+    'Key Assumptions': 'Assumptions',
+    'DCF Valuation - USS': 'DCF USS',
+    'DCF Valuation - Nippon': 'DCF Nippon',
+    'FCF Reconciliation': 'FCF Recon',
+    'Consolidated Financials': 'Consolidated',
+    'WACC Analysis': 'WACC',
+    'Capital Projects': 'Projects',
+    'Equity Bridge': 'Equity Bridge',
+    'Financing Impact': 'Financing',
+    'Synergy Analysis': 'Synergies',
+}
+
+BATCH_INDEX_SHEET = 'Batch Index'
+BATCH_INDEX_COLUMNS = [
+    ('#', 6, None),
+    ('Scenario', 45, None),
+    ('Sheet Prefix', 14, None),
+    ('USS - No Sale ($/sh)', 20, '$#,##0.00'),
+    ('Value to Nippon ($/sh)', 22, '$#,##0.00'),
+    ('USS EV ($M)', 16, '$#,##0'),
+    ('Nippon EV ($M)', 16, '$#,##0'),
+]
+
+# Analyses computed ahead of the writer, per pool worker (bounds memory)
+BATCH_PREFETCH_PER_WORKER = 2
+
+
+def scenario_grid(base: ModelScenario, **params) -> List[ModelScenario]:
+    """Every combination of parameter values applied to a base scenario
+
+    Args:
+        base: Scenario the overrides apply to
+        **params: Field name -> list of values; any with_overrides() field,
+            e.g. uss_wacc=[0.09, 0.10], hrc_us_factor=[0.9, 1.0, 1.1]
+
+    Returns:
+        Scenarios in itertools.product order, named
+        "<base name> (field=value, ...)"
+    """
+    names = list(params)
+    scenarios = []
+    for values in product(*(params[name] for name in names)):
+        changes = dict(zip(names, values))
+        label = ", ".join(f"{k}={v:g}" if isinstance(v, float) else f"{k}={v}"
+                          for k, v in changes.items())
+        scenarios.append(base.with_overrides(name=f"{base.name} ({label})", **changes))
+    return scenarios
+
+
+def preset_calibration_points(calibration_modes: List[Optional[str]] = None,
+                              scenario_types: List[ScenarioType] = None,
+                              execution_factor: float = 1.0) -> List[ValuationPoint]:
+    """Every preset under every calibration mode, as batch export points
+
+    Args:
+        calibration_modes: Modes to include (default: CALIBRATION_MODES)
+        scenario_types: Presets to include (default: all)
+        execution_factor: Applied to Nippon Commitments only, as in preset_points
+
+    Returns:
+        Points grouped by mode; scenarios are renamed "<preset> [<mode>]" so
+        each sheet set says which calibration it used
+    """
+    points = []
+    for mode in (CALIBRATION_MODES if calibration_modes is None else calibration_modes):
+        group = mode or 'default'
+        presets = get_scenario_presets(calibration_mode=mode)
+        if scenario_types is not None:
+            presets = {st: presets[st] for st in scenario_types}
+        for point in preset_points(presets, execution_factor, group=group):
+            label = f"{point.scenario.name} [{group}]"
+            points.append(replace(point, label=label, scenario=point.scenario.with_overrides(name=label)))
+    return points
+
+
+def _batch_analysis(args) -> Dict:
+    """Full analysis of one batch scenario (module level so worker processes can run it)"""
+    scenario, execution_factor, custom_benchmarks = args
+    return PriceVolumeModel(scenario, execution_factor=execution_factor,
+                            custom_benchmarks=custom_benchmarks).run_full_analysis()
+
+
+def _batch_sheet_name(prefix: str, title: str) -> str:
+    short = BATCH_SHEET_NAMES.get(title, title.replace('Segment - ', ''))
+    return f"{prefix} {short}"[:31]
+
+
+def _batch_slug(label: str) -> str:
+    return re.sub(r'[^A-Za-z0-9]+', '_', label).strip('_')[:60]
+
+
+def _cell_style(cell) -> Dict:
+    """Named style and formatting of a cell, to apply to write-only cells"""
+    return {
+        'style': cell.style,
+        'font': copy(cell.font),
+        'fill': copy(cell.fill),
+        'border': copy(cell.border),
+        'alignment': copy(cell.alignment),
+        'protection': copy(cell.protection),
+        'number_format': cell.number_format,
+    }
+
+
+def stream_sheet(src, dst, styles: Dict = None):
+    """Move a finished worksheet into a write-only worksheet, then close it
+
+    Rows are emitted from the source's cell store (empty cells are never
+    materialized), which is left empty, and the closed sheet is flushed to
+    disk, so no cell of either stays in memory.
+
+    Args:
+        src: Worksheet written by the sheet writers
+        dst: Empty worksheet of a write-only workbook with the shared named
+            styles registered
+        styles: Cache of source style id -> formatting, shared by sheets of
+            the same source workbook
+    """
+    styles = {} if styles is None else styles
+    for key, dim in src.column_dimensions.items():
+        if dim.customWidth:
+            dst.column_dimensions[key].width = dim.width
+    for merged in src.merged_cells.ranges:
+        dst.merged_cells.add(merged.coord)
+
+    # Take the cells out of the source: cells and sheet reference each other,
+    # so emptying it here frees them as soon as they are written
+    rows = {}
+    for (row, col), cell in written_cells(src, remove=True):
+        rows.setdefault(row, {})[col] = cell
+
+    next_row = 1
+    for row in sorted(rows):
+        for _ in range(next_row, row):
+            dst.append([])
+        cells = rows[row]
+        values = [None] * max(cells)
+        for col, cell in cells.items():
+            if not cell.has_style:
+                values[col - 1] = cell.value
+                continue
+            out = WriteOnlyCell(dst, value=cell.value)
+            key = cell.style_id
+            if key not in styles:
+                styles[key] = _cell_style(cell)
+            for name, value in styles[key].items():
+                setattr(out, name, value)
+            values[col - 1] = out
+        dst.append(values)
+        next_row = row + 1
+        del rows[row]
+    dst.close()
+
+
+class BatchModelExporter:
+    """Export many scenarios into one review pack
+
+    Takes a list of scenarios (e.g. scenario_grid()) or ValuationPoints
+    (e.g. preset_calibration_points()) and writes every scenario's detailed
+    sheet set, either into one workbook (export_workbook) or as one workbook
+    per scenario in a zip archive (export_zip).
+    """
+
+    def __init__(self, scenarios: List, execution_factor: float = 1.0,
+                 custom_benchmarks: dict = None, n_workers: int = VALUATION_POOL_WORKERS):
+        """
+        Args:
+            scenarios: ModelScenarios and/or ValuationPoints (points keep
+                their own label and execution factor)
+            execution_factor: Execution factor for plain scenarios
+            custom_benchmarks: Optional custom benchmark prices dict
+            n_workers: Worker processes for the analyses (1 = run in this process)
+        """
+        self.points = [
+            s if isinstance(s, ValuationPoint)
+            else ValuationPoint(label=s.name, scenario=s, execution_factor=execution_factor)
+            for s in scenarios
+        ]
+        self.custom_benchmarks = custom_benchmarks
+        self.n_workers = n_workers
+        self.styler = ExcelStyler()
+        self._peer_data = None
+
+    def iter_analyses(self):
+        """Yield (index, point, analysis) in input order
+
+        Analyses run on the shared valuation pool, at most
+        BATCH_PREFETCH_PER_WORKER per worker ahead of the consumer, so only
+        a handful are held at once. Runs in-process with n_workers=1 or if
+        the pool is unavailable.
+        """
+        args = [(p.scenario, p.execution_factor, self.custom_benchmarks) for p in self.points]
+        done = 0
+        if self.n_workers > 1 and len(args) > 1:
+            pending = deque()
+            pool = None
+            try:
+                pool = get_valuation_pool(self.n_workers)
+                ahead = BATCH_PREFETCH_PER_WORKER * self.n_workers
+                while done < len(args):
+                    while done + len(pending) < len(args) and len(pending) < ahead:
+                        pending.append(pool.submit(_batch_analysis, args[done + len(pending)]))
+                    analysis = pending.popleft().result()
+                    yield done, self.points[done], analysis
+                    done += 1
+            except (BrokenProcessPool, CancelledError, OSError):
+                # Pool died (e.g. worker killed); finish the remaining scenarios in-process
+                shutdown_valuation_pool(pool)
+            finally:
+                for future in pending:
+                    future.cancel()
+        for i in range(done, len(args)):
+            yield i, self.points[i], _batch_analysis(args[i])
+
+    def _exporter(self, point: ValuationPoint, analysis: Dict) -> ModelExporter:
+        exporter = ModelExporter(point.scenario, point.execution_factor, self.custom_benchmarks,
+                                 analysis=analysis, peer_data=self._peer_data)
+        exporter.styler = self.styler
+        if self._peer_data is None:
+            # Benchmarks do not depend on the scenario: load them once per pack
+            self._peer_data = exporter.peer_data = exporter._load_peer_analysis_data()
+        return exporter
+
+    def _index_row(self, number: int, prefix: str, point: ValuationPoint, analysis: Dict) -> list:
+        val_uss, val_nippon = analysis['val_uss'], analysis['val_nippon']
+        return [number, point.label, prefix, val_uss['share_price'], val_nippon['share_price'],
+                val_uss['ev_blended'], val_nippon['ev_blended']]
+
+    def _index_cell(self, ws, value, style: str, number_format: str = None) -> WriteOnlyCell:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        if number_format:
+            cell.number_format = number_format
+        return cell
+
+    def export_workbook(self, output=None, progress_callback=None):
+        """Write every scenario into one workbook
+
+        The workbook opens with an index of all scenarios, followed by each
+        scenario's sheets prefixed with its number ("01 Summary",
+        "01 DCF USS", ...) and a single peer analysis sheet.
+
+        Args:
+            output: File path or binary file object (None = new BytesIO)
+            progress_callback: Optional callable(completed, total, label)
+
+        Returns:
+            output (a BytesIO rewound to the start if none was given)
+        """
+        wb = Workbook(write_only=True)
+        self.styler.register_styles(wb)
+        width = max(2, len(str(len(self.points))))
+
+        index = wb.create_sheet(BATCH_INDEX_SHEET)
+        for col, (_, col_width, _) in enumerate(BATCH_INDEX_COLUMNS, 1):
+            index.column_dimensions[get_column_letter(col)].width = col_width
+        index.append([self._index_cell(index, header, HEADER_STYLE) for header, _, _ in BATCH_INDEX_COLUMNS])
+
+        exporter = None
+        for i, point, analysis in self.iter_analyses():
+            exporter = self._exporter(point, analysis)
+            prefix = f"{i + 1:0{width}d}"
+            scratch = Workbook()
+            exporter._create_model_sheets(scratch)
+            styles = {}
+            for ws in scratch.worksheets:
+                stream_sheet(ws, wb.create_sheet(_batch_sheet_name(prefix, ws.title)), styles)
+            del scratch
+
+            row = self._index_row(i + 1, prefix, point, analysis)
+            index.append([
+                self._index_cell(index, value, DATA_STYLES[None], fmt)
+                for value, (_, _, fmt) in zip(row, BATCH_INDEX_COLUMNS)
+            ])
+            if progress_callback:
+                progress_callback(i + 1, len(self.points), point.label)
+
+        # Peer benchmarks are the same for every scenario: one sheet per pack
+        if exporter is not None:
+            try:
+                scratch = Workbook()
+                exporter._create_peer_analysis_sheet(scratch, self._peer_data)
+                ws = scratch["Multi-Year Peer Analysis"]
+                stream_sheet(ws, wb.create_sheet(ws.title))
+            except Exception as e:
+                print(f"Warning: Could not create peer analysis sheet: {e}")
+
+        target = BytesIO() if output is None else output
+        wb.save(target)
+        if output is None:
+            target.seek(0)
+        return target
+
+    def export_zip(self, output=None, progress_callback=None):
+        """Write one full single-scenario workbook per scenario into a zip archive
+
+        Each workbook is added to the archive as soon as it is written and
+        then released. The archive also holds batch_index.csv with the key
+        values of every scenario.
+
+        Args:
+            output: File path or binary file object (None = new BytesIO)
+            progress_callback: Optional callable(completed, total, label)
+
+        Returns:
+            output (a BytesIO rewound to the start if none was given)
+        """
+        target = BytesIO() if output is None else output
+        width = max(2, len(str(len(self.points))))
+        rows = []
+        # Workbooks are already compressed; store them as they are
+        with zipfile.ZipFile(target, 'w', compression=zipfile.ZIP_STORED) as zf:
+            for i, point, analysis in self.iter_analyses():
+                prefix = f"{i + 1:0{width}d}"
+                workbook = self._exporter(point, analysis).export_single_scenario()
+                name = f"{prefix}_{_batch_slug(point.label)}.xlsx"
+                zf.writestr(name, workbook.getvalue())
+                del workbook
+                rows.append(self._index_row(i + 1, name, point, analysis))
+                if progress_callback:
+                    progress_callback(i + 1, len(self.points), point.label)
+
+            columns = [header for header, _, _ in BATCH_INDEX_COLUMNS]
+            columns[2] = 'File'
+            zf.writestr('batch_index.csv', pd.DataFrame(rows, columns=columns).to_csv(index=False))
+
+        if output is None:
+            target.seek(0)
+        return target
@@ -18,7 +18,7 @@ Usage:
 
 import sys
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
@@ -105,39 +105,158 @@ def aggregate_prices_annual(price_df: pd.DataFrame) -> pd.Series:
 # Correlation Analysis
 # ---------------------------------------------------------------------------
 
-def bootstrap_correlation_ci(x, y, n_boot: int = 10000, alpha: float = 0.05,
-                              rng: np.random.RandomState = None) -> Tuple[float, float]:
-    """Bootstrap confidence interval for Pearson r.
+# Resamples with a (near) constant series are dropped. Variances are taken on
+# standardized data, so this is relative to each series' own spread.
+DEGENERATE_VAR = 1e-12
+
+# Minimum valid resamples for a bootstrap interval
+MIN_VALID_BOOT = 100
+
+BOOTSTRAP_METHODS = ('percentile', 'bca')
+
 
-    Returns (ci_lo, ci_hi) from percentile bootstrap.
+def bootstrap_counts(n: int, n_boot: int, rng: np.random.RandomState) -> np.ndarray:
+    """Resample counts (n_boot, n): how often each observation is drawn.
+
+    Draws the full (n_boot, n) index matrix at once; the index stream is the
+    same as n_boot successive rng.randint(0, n, size=n) calls.
     """
-    x, y = np.array(x, dtype=float), np.array(y, dtype=float)
-    mask = ~(np.isnan(x) | np.isnan(y))
-    x, y = x[mask], y[mask]
-    n = len(x)
-    if n < 3:
-        return (np.nan, np.nan)
-
-    if rng is None:
-        rng = np.random.RandomState(42)
-
-    boot_r = np.empty(n_boot)
-    for i in range(n_boot):
-        idx = rng.randint(0, n, size=n)
-        bx, by = x[idx], y[idx]
-        # Skip degenerate samples
-        if np.std(bx) < 1e-10 or np.std(by) < 1e-10:
-            boot_r[i] = np.nan
-        else:
-            boot_r[i] = np.corrcoef(bx, by)[0, 1]
+    idx = rng.randint(0, n, size=(n_boot, n))
+    flat = (idx + n * np.arange(n_boot)[:, None]).ravel()
+    return np.bincount(flat, minlength=n_boot * n).reshape(n_boot, n).astype(float)
+
+
+def _standardize(a: np.ndarray) -> np.ndarray:
+    """Center and scale columns (constant columns are only centered)."""
+    a = a - a.mean(axis=0)
+    scale = a.std(axis=0)
+    return a / np.where(scale > 0, scale, 1.0)
+
+
+def _correlation_from_moments(n, sx, sy, sxx, syy, sxy) -> np.ndarray:
+    """Pearson r from weighted moment sums; NaN where either series is constant."""
+    mx, my = sx / n, sy / n
+    vx = sxx / n - mx ** 2
+    vy = syy / n - my ** 2
+    cov = sxy / n - mx * my
+    degenerate = (vx < DEGENERATE_VAR) | (vy < DEGENERATE_VAR)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = cov / np.sqrt(vx * vy)
+    r[degenerate] = np.nan
+    return np.clip(r, -1.0, 1.0)
+
 
-    boot_r = boot_r[~np.isnan(boot_r)]
-    if len(boot_r) < 100:
-        return (np.nan, np.nan)
+def bootstrap_correlations(counts: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Bootstrap Pearson r for many pairs sharing one resample matrix.
+
+    Args:
+        counts: (n_boot, n) resample counts from bootstrap_counts()
+        x, y: (n, n_pairs) observations, one column per pair
+
+    Returns:
+        (n_boot, n_pairs) resampled correlations (NaN for degenerate draws)
+    """
+    x, y = _standardize(x), _standardize(y)
+    n = counts.sum(axis=1, keepdims=True)
+    return _correlation_from_moments(
+        n, counts @ x, counts @ y, counts @ (x * x), counts @ (y * y), counts @ (x * y)
+    )
+
+
+def jackknife_correlations(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Leave-one-out Pearson r (n, n_pairs) from full-sample moment sums."""
+    x, y = _standardize(x), _standardize(y)
+    m = len(x) - 1
+    return _correlation_from_moments(
+        m, x.sum(0) - x, y.sum(0) - y,
+        (x * x).sum(0) - x * x, (y * y).sum(0) - y * y, (x * y).sum(0) - x * y,
+    )
+
+
+def _bca_levels(boot_r: np.ndarray, r_hat: float, jack_r: np.ndarray,
+                alpha: float) -> Tuple[float, float]:
+    """Bias-corrected and accelerated percentile levels (in %) for one pair."""
+    z0 = stats.norm.ppf(np.mean(boot_r < r_hat))
+    diff = np.nanmean(jack_r) - jack_r[~np.isnan(jack_r)]
+    denom = 6.0 * np.sum(diff ** 2) ** 1.5
+    a = np.sum(diff ** 3) / denom if denom > 0 else 0.0
+
+    levels = []
+    for z_alpha in stats.norm.ppf([alpha / 2, 1 - alpha / 2]):
+        adjusted = z0 + (z0 + z_alpha) / (1 - a * (z0 + z_alpha))
+        levels.append(100 * stats.norm.cdf(adjusted))
+    return levels[0], levels[1]
+
+
+def bootstrap_correlation_ci_batch(
+    pairs: Sequence[Tuple[Sequence[float], Sequence[float]]],
+    n_boot: int = 10000,
+    alpha: float = 0.05,
+    rng: np.random.RandomState = None,
+    method: str = 'percentile',
+) -> List[Tuple[float, float]]:
+    """Bootstrap confidence intervals for Pearson r of many (x, y) pairs at once.
+
+    Pairs with the same number of complete observations share one resample
+    matrix, and every correlation in the group comes from one set of
+    matrix-product moment sums.
+
+    Args:
+        pairs: (x, y) sequences; NaNs are dropped per pair
+        n_boot: Bootstrap resamples
+        alpha: Two-sided significance level
+        rng: Random state; by default each group draws from RandomState(42),
+             matching a bootstrap_correlation_ci() call per pair
+        method: 'percentile' or 'bca' (bias-corrected and accelerated)
+
+    Returns:
+        (ci_lo, ci_hi) per pair, in input order; NaN when n < 3 or fewer
+        than MIN_VALID_BOOT resamples are usable
+    """
+    if method not in BOOTSTRAP_METHODS:
+        raise ValueError(f"Unknown bootstrap method: {method}")
+
+    results = [(np.nan, np.nan)] * len(pairs)
+    groups: Dict[int, List[Tuple[int, np.ndarray, np.ndarray]]] = {}
+    for i, (x, y) in enumerate(pairs):
+        x, y = np.array(x, dtype=float), np.array(y, dtype=float)
+        mask = ~(np.isnan(x) | np.isnan(y))
+        if mask.sum() >= 3:
+            groups.setdefault(int(mask.sum()), []).append((i, x[mask], y[mask]))
+
+    for n, members in groups.items():
+        group_rng = rng if rng is not None else np.random.RandomState(42)
+        x = np.column_stack([m[1] for m in members])
+        y = np.column_stack([m[2] for m in members])
+        boot = bootstrap_correlations(bootstrap_counts(n, n_boot, group_rng), x, y)
+        if method == 'bca':
+            r_hat = (_standardize(x) * _standardize(y)).mean(axis=0)
+            jack = jackknife_correlations(x, y)
+
+        for col, (i, _, _) in enumerate(members):
+            boot_r = boot[:, col]
+            boot_r = boot_r[~np.isnan(boot_r)]
+            if len(boot_r) < MIN_VALID_BOOT:
+                continue
+            levels = (100 * alpha / 2, 100 * (1 - alpha / 2))
+            if method == 'bca':
+                levels = _bca_levels(boot_r, r_hat[col], jack[:, col], alpha)
+                if not np.all(np.isfinite(levels)):
+                    continue
+            ci_lo, ci_hi = np.percentile(boot_r, levels)
+            results[i] = (ci_lo, ci_hi)
+
+    return results
+
+
+def bootstrap_correlation_ci(x, y, n_boot: int = 10000, alpha: float = 0.05,
+                              rng: np.random.RandomState = None,
+                              method: str = 'percentile') -> Tuple[float, float]:
+    """Bootstrap confidence interval for Pearson r.
 
-    ci_lo = np.percentile(boot_r, 100 * alpha / 2)
-    ci_hi = np.percentile(boot_r, 100 * (1 - alpha / 2))
-    return (ci_lo, ci_hi)
+    Returns (ci_lo, ci_hi) from percentile (or BCa) bootstrap.
+    """
+    return bootstrap_correlation_ci_batch([(x, y)], n_boot, alpha, rng, method)[0]
 
 
 def pearson_with_ci(x, y, alpha: float = 0.05) -> Dict:
@@ -202,6 +321,15 @@ def quarterly_correlation_analysis(
     return pd.DataFrame(rows)
 
 
+# (metric label, column) pairs correlated against each segment's benchmark
+ANNUAL_SEGMENT_METRICS = [
+    ('Revenue', 'revenue'),
+    ('EBITDA Margin', 'margin'),
+    ('Rev/Ton', 'rev_per_ton'),
+    ('Realized Price', 'realized_price'),
+]
+
+
 def segment_annual_analysis(
     prices: Dict[str, pd.DataFrame],
 ) -> pd.DataFrame:
@@ -209,7 +337,7 @@ def segment_annual_analysis(
     Annual segment revenue/margin vs relevant price benchmarks.
     Only 5 observations (2019-2023) — directional, not statistically robust.
     """
-    rows = []
+    rows, pairs = [], []
     for seg_name, data in USS_SEGMENT_DATA.items():
         df_seg = pd.DataFrame(data, columns=['year', 'revenue', 'ebitda', 'shipments', 'realized_price'])
         df_seg['margin'] = df_seg['ebitda'] / df_seg['revenue']
@@ -231,53 +359,20 @@ def segment_annual_analysis(
         if len(df_seg) < 3:
             continue
 
-        # Revenue vs benchmark price
-        rev_corr = pearson_with_ci(df_seg['benchmark_price'], df_seg['revenue'])
-        boot_lo, boot_hi = bootstrap_correlation_ci(df_seg['benchmark_price'], df_seg['revenue'])
-        rev_corr.update({
-            'segment': seg_name, 'metric': 'Revenue', 'benchmark': price_key,
-            'ci_lo_boot': boot_lo, 'ci_hi_boot': boot_hi,
-            'ci_width': boot_hi - boot_lo if not np.isnan(boot_lo) else np.nan,
-            'ci_method': 'bootstrap+fisher',
-            'quality': 'reliable' if (not np.isnan(boot_lo) and boot_lo > 0) or (not np.isnan(boot_hi) and boot_hi < 0) else 'directional',
-        })
-        rows.append(rev_corr)
+        for metric, column in ANNUAL_SEGMENT_METRICS:
+            corr = pearson_with_ci(df_seg['benchmark_price'], df_seg[column])
+            corr.update({'segment': seg_name, 'metric': metric, 'benchmark': price_key})
+            rows.append(corr)
+            pairs.append((df_seg['benchmark_price'], df_seg[column]))
 
-        # Margin vs benchmark price
-        margin_corr = pearson_with_ci(df_seg['benchmark_price'], df_seg['margin'])
-        boot_lo, boot_hi = bootstrap_correlation_ci(df_seg['benchmark_price'], df_seg['margin'])
-        margin_corr.update({
-            'segment': seg_name, 'metric': 'EBITDA Margin', 'benchmark': price_key,
+    # All segment × metric bootstraps in one batch
+    for corr, (boot_lo, boot_hi) in zip(rows, bootstrap_correlation_ci_batch(pairs)):
+        corr.update({
             'ci_lo_boot': boot_lo, 'ci_hi_boot': boot_hi,
             'ci_width': boot_hi - boot_lo if not np.isnan(boot_lo) else np.nan,
             'ci_method': 'bootstrap+fisher',
             'quality': 'reliable' if (not np.isnan(boot_lo) and boot_lo > 0) or (not np.isnan(boot_hi) and boot_hi < 0) else 'directional',
         })
-        rows.append(margin_corr)
-
-        # Revenue per ton vs benchmark price
-        rpt_corr = pearson_with_ci(df_seg['benchmark_price'], df_seg['rev_per_ton'])
-        boot_lo, boot_hi = bootstrap_correlation_ci(df_seg['benchmark_price'], df_seg['rev_per_ton'])
-        rpt_corr.update({
-            'segment': seg_name, 'metric': 'Rev/Ton', 'benchmark': price_key,
-            'ci_lo_boot': boot_lo, 'ci_hi_boot': boot_hi,
-            'ci_width': boot_hi - boot_lo if not np.isnan(boot_lo) else np.nan,
-            'ci_method': 'bootstrap+fisher',
-            'quality': 'reliable' if (not np.isnan(boot_lo) and boot_lo > 0) or (not np.isnan(boot_hi) and boot_hi < 0) else 'directional',
-        })
-        rows.append(rpt_corr)
-
-        # Realized price vs benchmark (realization factor validation)
-        real_corr = pearson_with_ci(df_seg['benchmark_price'], df_seg['realized_price'])
-        boot_lo, boot_hi = bootstrap_correlation_ci(df_seg['benchmark_price'], df_seg['realized_price'])
-        real_corr.update({
-            'segment': seg_name, 'metric': 'Realized Price', 'benchmark': price_key,
-            'ci_lo_boot': boot_lo, 'ci_hi_boot': boot_hi,
-            'ci_width': boot_hi - boot_lo if not np.isnan(boot_lo) else np.nan,
-            'ci_method': 'bootstrap+fisher',
-            'quality': 'reliable' if (not np.isnan(boot_lo) and boot_lo > 0) or (not np.isnan(boot_hi) and boot_hi < 0) else 'directional',
-        })
-        rows.append(real_corr)
 
     return pd.DataFrame(rows)
 
@@ -337,7 +432,7 @@ def segment_quarterly_analysis(
         print("  No WRDS quarterly segment data available; skipping quarterly segment analysis")
         return pd.DataFrame()
 
-    rows = []
+    rows, pairs = [], []
     for seg_name in wrds_df['segment'].unique():
         seg_df = wrds_df[wrds_df['segment'] == seg_name].copy()
         if len(seg_df) < 5:
@@ -358,15 +453,12 @@ def segment_quarterly_analysis(
 
         # Revenue vs benchmark
         rev_corr = pearson_with_ci(merged['price_avg'], merged['revenue'])
-        boot_lo, boot_hi = bootstrap_correlation_ci(merged['price_avg'], merged['revenue'])
         rev_corr.update({
             'segment': seg_name, 'metric': 'Revenue', 'benchmark': price_key,
             'frequency': 'quarterly',
-            'ci_lo_boot': boot_lo, 'ci_hi_boot': boot_hi,
-            'ci_width': boot_hi - boot_lo if not np.isnan(boot_lo) else np.nan,
-            'quality': 'reliable' if (not np.isnan(boot_lo) and boot_lo > 0) else 'directional',
         })
         rows.append(rev_corr)
+        pairs.append((merged['price_avg'], merged['revenue']))
 
         # Operating profit margin vs benchmark (if operating_profit available)
         if 'operating_profit' in merged.columns and merged['operating_profit'].notna().sum() >= 5:
@@ -375,15 +467,19 @@ def segment_quarterly_analysis(
             if len(merged_clean) >= 5:
                 margins = merged_clean['operating_profit'] / merged_clean['revenue']
                 margin_corr = pearson_with_ci(merged_clean['price_avg'], margins)
-                boot_lo, boot_hi = bootstrap_correlation_ci(merged_clean['price_avg'], margins)
                 margin_corr.update({
                     'segment': seg_name, 'metric': 'Op. Margin', 'benchmark': price_key,
                     'frequency': 'quarterly',
-                    'ci_lo_boot': boot_lo, 'ci_hi_boot': boot_hi,
-                    'ci_width': boot_hi - boot_lo if not np.isnan(boot_lo) else np.nan,
-                    'quality': 'reliable' if (not np.isnan(boot_lo) and boot_lo > 0) else 'directional',
                 })
                 rows.append(margin_corr)
+                pairs.append((merged_clean['price_avg'], margins))
+
+    for corr, (boot_lo, boot_hi) in zip(rows, bootstrap_correlation_ci_batch(pairs)):
+        corr.update({
+            'ci_lo_boot': boot_lo, 'ci_hi_boot': boot_hi,
+            'ci_width': boot_hi - boot_lo if not np.isnan(boot_lo) else np.nan,
+            'quality': 'reliable' if (not np.isnan(boot_lo) and boot_lo > 0) else 'directional',
+        })
 
     return pd.DataFrame(rows)
 
@@ -5,24 +5,38 @@ Monte Carlo Analysis and Visualization
 
 Runs Monte Carlo simulation and generates comprehensive visualizations.
 
+Charts are rendered from aggregates computed once per run, in a process
+pool, and skipped when their inputs are unchanged since the last run
+(see render_charts).
+
 Usage:
-    python scripts/run_monte_carlo_analysis.py [--simulations 10000]
+    python scripts/run_monte_carlo_analysis.py [--simulations 10000] [--force-charts]
 """
 
 import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 import sys
+from typing import Callable, Optional
 
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
+from matplotlib import cbook
 from scipy import stats
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from monte_carlo import MonteCarloEngine
+from monte_carlo.result_store import DEFAULT_RESULT_STORE, file_hash, write_result_store
 
 # Output directory for charts
 CHARTS_DIR = Path(__file__).parent.parent / 'charts'
@@ -126,40 +140,244 @@ def run_simulation(n_simulations: int = 10000, n_workers: int = 1) -> tuple:
     return mc, results
 
 
-def plot_share_price_distribution(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+# =============================================================================
+# CHART DATA
+# =============================================================================
+
+OFFER_PRICE = 55.0
+
+# Percentiles used anywhere in the charts (one np.percentile call per series)
+PERCENTILE_LEVELS = (1, 5, 10, 25, 33, 50, 67, 75, 90, 95, 99)
+
+# Histogram bin counts used by the charts
+HIST_BINS = (40, 50)
+
+# CDF curves are drawn through at most this many empirical points
+CDF_GRID_POINTS = 2000
+
+# Scatter plots draw a fixed subsample above this size (trend lines use all points)
+SCATTER_MAX_POINTS = 20000
+
+KEY_INPUT_VARS = [
+    'hrc_price_factor', 'crc_price_factor', 'octg_price_factor',
+    'flat_rolled_volume', 'tubular_volume', 'uss_wacc',
+    'terminal_growth', 'exit_multiple', 'gary_works_execution'
+]
+
+HEATMAP_VARS = [
+    'hrc_price_factor', 'crc_price_factor', 'coated_price_factor', 'octg_price_factor',
+    'flat_rolled_volume', 'mini_mill_volume', 'tubular_volume',
+    'uss_wacc', 'terminal_growth', 'exit_multiple',
+    'gary_works_execution', 'mon_valley_execution'
+]
+
+TREND_VARS = ['hrc_price_factor', 'uss_wacc']
+
+# HRC percentile cuts for the scenario box plots
+SCENARIO_CUTS = {'quartiles': (25, 75), 'terciles': (33, 67)}
+
+
+def chart_sources(mc: MonteCarloEngine) -> tuple:
+    """
+    Aligned chart inputs of a finished run
+
+    Results come back in completion order and without failed iterations;
+    inputs are matched to them by iteration so every row pairs an input
+    draw with its own outputs.
+
+    Returns:
+        (nippon share prices, uss share prices, inputs DataFrame)
+    """
+    results = mc.simulation_results
+    inputs = mc.simulation_inputs
+    if 'iteration' in results.columns:
+        results = results.sort_values('iteration')
+        inputs = inputs.loc[results['iteration'].to_numpy()]
+    nippon = results['nippon_share_price'].to_numpy(dtype=float)
+    uss = results['uss_share_price'].to_numpy(dtype=float)
+    return nippon, uss, inputs.reset_index(drop=True).astype(float)
+
+
+def _digest(*arrays) -> str:
+    h = hashlib.md5()
+    for arr in arrays:
+        h.update(np.ascontiguousarray(arr).tobytes())
+    return h.hexdigest()
+
+
+def source_digests(nippon: np.ndarray, uss: np.ndarray, inputs: pd.DataFrame) -> dict:
+    """md5 of each chart source ('nippon', 'uss', 'inputs')"""
+    return {
+        'nippon': _digest(nippon),
+        'uss': _digest(uss),
+        'inputs': _digest(np.array(inputs.columns, dtype=str), inputs.to_numpy()),
+    }
+
+
+def _histogram(values: np.ndarray, bins: int) -> tuple:
+    counts, edges = np.histogram(values, bins=bins)
+    width = np.diff(edges)
+    return counts / (counts.sum() * width), edges
+
+
+def _cdf_grid(sorted_values: np.ndarray) -> tuple:
+    n = len(sorted_values)
+    if n <= CDF_GRID_POINTS:
+        idx = np.arange(n)
+    else:
+        idx = np.unique(np.linspace(0, n - 1, CDF_GRID_POINTS).round().astype(int))
+    return sorted_values[idx], (idx + 1) / n
+
+
+def _summary(values: np.ndarray, sorted_values: np.ndarray) -> dict:
+    n = len(values)
+    pct = dict(zip(PERCENTILE_LEVELS, np.percentile(sorted_values, PERCENTILE_LEVELS)))
+    return {
+        'n': n,
+        'mean': float(np.mean(values)),
+        'std': float(np.std(values)),
+        'median': pct[50],
+        'pct': pct,
+        'min': float(sorted_values[0]),
+        'max': float(sorted_values[-1]),
+        'prob_below_offer': np.searchsorted(sorted_values, OFFER_PRICE, side='left') / n,
+        'prob_above_75': 1 - np.searchsorted(sorted_values, 75, side='right') / n,
+        'prob_above_100': 1 - np.searchsorted(sorted_values, 100, side='right') / n,
+    }
+
+
+def _correlations(inputs: pd.DataFrame, outputs: dict) -> pd.DataFrame:
+    """Pearson correlation of every input with every output, as one matrix product"""
+    x = inputs.to_numpy()
+    x_std = x.std(axis=0)
+    zx = np.divide(x - x.mean(axis=0), x_std, out=np.zeros_like(x), where=x_std > 0)
+    corr = {}
+    for key, y in outputs.items():
+        y_std = y.std()
+        zy = (y - y.mean()) / y_std if y_std > 0 else np.zeros_like(y)
+        corr[key] = zx.T @ zy / len(y)
+    return pd.DataFrame(corr, index=inputs.columns)
+
+
+class ChartData:
+    """
+    Shared aggregates for the Monte Carlo charts
+
+    Built once per run from the aligned results: histograms, CDF grids,
+    percentile tables, input/output correlations, trend lines and
+    box-plot statistics. Charts only read from it, so one instance can be
+    shipped to every render worker.
+    """
+
+    def __init__(self, nippon: np.ndarray, uss: np.ndarray, inputs: pd.DataFrame):
+        self.series = {'nippon': nippon, 'uss': uss, 'premium': nippon - uss}
+        self.n = len(nippon)
+
+        self.stats = {}
+        self.cdf = {}
+        self.histograms = {}
+        for key, values in self.series.items():
+            sorted_values = np.sort(values)
+            self.stats[key] = _summary(values, sorted_values)
+            self.cdf[key] = _cdf_grid(sorted_values)
+            for bins in HIST_BINS:
+                self.histograms[key, bins] = _histogram(values, bins)
+
+        self.input_columns = list(inputs.columns)
+        self.correlations = _correlations(inputs, {'nippon': nippon, 'uss': uss})
+        heatmap_vars = [v for v in HEATMAP_VARS if v in inputs.columns]
+        self.input_corr = inputs[heatmap_vars].corr()
+
+        self.input_histograms = {}
+        for var in KEY_INPUT_VARS:
+            if var in inputs.columns:
+                data = inputs[var].to_numpy()
+                self.input_histograms[var] = (_histogram(data, 40), float(np.mean(data)), float(np.std(data)))
+
+        if self.n > SCATTER_MAX_POINTS:
+            idx = np.sort(np.random.default_rng(0).choice(self.n, SCATTER_MAX_POINTS, replace=False))
+        else:
+            idx = np.arange(self.n)
+        self.scatter = {'nippon': nippon[idx]}
+        self.trends = {}
+        for var in TREND_VARS:
+            x = inputs[var].to_numpy()
+            self.scatter[var] = x[idx]
+            self.trends[var] = (np.polyfit(x, nippon, 1), float(x.min()), float(x.max()))
+
+        self.boxes = {}
+        if 'hrc_price_factor' in inputs.columns:
+            hrc = inputs['hrc_price_factor'].to_numpy()
+            for name, (lo_p, hi_p) in SCENARIO_CUTS.items():
+                lo, hi = np.percentile(hrc, [lo_p, hi_p])
+                groups = [nippon[hrc < lo], nippon[(hrc >= lo) & (hrc <= hi)], nippon[hrc > hi]]
+                self.boxes[name] = cbook.boxplot_stats(groups)
+
+    @classmethod
+    def from_engine(cls, mc: MonteCarloEngine) -> 'ChartData':
+        return cls(*chart_sources(mc))
+
+    def top_drivers(self, key: str, n: int) -> pd.Series:
+        """The n inputs most correlated (in absolute value) with an output"""
+        corr = self.correlations[key]
+        return corr.reindex(corr.abs().sort_values(ascending=False, kind='stable').index)[:n]
+
+
+def as_chart_data(data) -> ChartData:
+    """Accept either a finished engine or prebuilt ChartData"""
+    return data if isinstance(data, ChartData) else ChartData.from_engine(data)
+
+
+def _hist(ax, hist: tuple, **kwargs):
+    """Draw a precomputed density histogram"""
+    density, edges = hist
+    return ax.hist(edges[:-1], bins=edges, weights=density, **kwargs)
+
+
+def _save(save_path: Path, verbose: bool, tight: bool = True):
+    if tight:
+        plt.tight_layout()
+    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    plt.close()
+    if verbose:
+        print(f"  Saved: {save_path}")
+
+
+# =============================================================================
+# CHARTS
+# =============================================================================
+
+def plot_share_price_distribution(data, save_path: Path, verbose: bool = True):
     """Plot histogram of share price distribution"""
+    data = as_chart_data(data)
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    values = mc.simulation_results['nippon_share_price'].values
+    s = data.stats['nippon']
 
     # Histogram
-    n, bins, patches = ax.hist(values, bins=50, density=True, alpha=0.7,
-                                color='steelblue', edgecolor='white', linewidth=0.5)
+    _hist(ax, data.histograms['nippon', 50], alpha=0.7,
+          color='steelblue', edgecolor='white', linewidth=0.5)
 
     # Fit and overlay normal distribution
-    mu, std = np.mean(values), np.std(values)
-    x = np.linspace(values.min(), values.max(), 100)
+    mu, std = s['mean'], s['std']
+    x = np.linspace(s['min'], s['max'], 100)
     ax.plot(x, stats.norm.pdf(x, mu, std), 'r-', lw=2, label=f'Normal fit (μ={mu:.1f}, σ={std:.1f})')
 
     # Key percentiles
-    p5 = np.percentile(values, 5)
-    p50 = np.percentile(values, 50)
-    p95 = np.percentile(values, 95)
+    p5, p50, p95 = s['pct'][5], s['pct'][50], s['pct'][95]
 
     ax.axvline(p5, color='orange', linestyle='--', lw=2, label=f'P5: ${p5:.0f}')
     ax.axvline(p50, color='green', linestyle='-', lw=2, label=f'Median: ${p50:.0f}')
     ax.axvline(p95, color='orange', linestyle='--', lw=2, label=f'P95: ${p95:.0f}')
 
     # Nippon offer price
-    ax.axvline(55, color='red', linestyle='-', lw=3, label='Nippon Offer: $55')
+    ax.axvline(OFFER_PRICE, color='red', linestyle='-', lw=3, label='Nippon Offer: $55')
 
-    # Fill area below offer
-    below_offer = values[values < 55]
-    prob_below = len(below_offer) / len(values) * 100
+    prob_below = s['prob_below_offer'] * 100
 
     ax.set_xlabel('Share Price ($)', fontsize=12)
     ax.set_ylabel('Probability Density', fontsize=12)
-    ax.set_title(f'USS Share Price Distribution\n(n={len(values):,} simulations, {prob_below:.1f}% below $55 offer)',
+    ax.set_title(f'USS Share Price Distribution\n(n={s["n"]:,} simulations, {prob_below:.1f}% below $55 offer)',
                  fontsize=14, fontweight='bold')
     ax.legend(loc='upper right', fontsize=10)
     ax.grid(True, alpha=0.3)
@@ -169,38 +387,35 @@ def plot_share_price_distribution(mc: MonteCarloEngine, save_path: Path, verbose
     ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
 
 
-def plot_cumulative_distribution(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_cumulative_distribution(data, save_path: Path, verbose: bool = True):
     """Plot cumulative distribution function"""
+    data = as_chart_data(data)
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    values = np.sort(mc.simulation_results['nippon_share_price'].values)
-    cdf = np.arange(1, len(values) + 1) / len(values)
+    s = data.stats['nippon']
+    values, cdf = data.cdf['nippon']
 
     ax.plot(values, cdf, 'b-', lw=2)
 
     # Key reference points
-    ax.axvline(55, color='red', linestyle='-', lw=2, label='Nippon Offer: $55')
+    ax.axvline(OFFER_PRICE, color='red', linestyle='-', lw=2, label='Nippon Offer: $55')
     ax.axhline(0.5, color='gray', linestyle=':', lw=1, alpha=0.5)
 
     # Mark key percentiles
     percentiles = [5, 10, 25, 50, 75, 90, 95]
     for p in percentiles:
-        val = np.percentile(values, p)
+        val = s['pct'][p]
         ax.plot(val, p/100, 'ro', markersize=6)
         ax.annotate(f'P{p}: ${val:.0f}', (val, p/100), textcoords="offset points",
                    xytext=(10, 0), fontsize=9)
 
     # Probability below offer
-    prob_below = np.mean(values < 55)
-    ax.plot(55, prob_below, 'r^', markersize=12)
-    ax.annotate(f'{prob_below:.1%} below offer', (55, prob_below),
+    prob_below = s['prob_below_offer']
+    ax.plot(OFFER_PRICE, prob_below, 'r^', markersize=12)
+    ax.annotate(f'{prob_below:.1%} below offer', (OFFER_PRICE, prob_below),
                textcoords="offset points", xytext=(10, 10), fontsize=10, color='red')
 
     ax.set_xlabel('Share Price ($)', fontsize=12)
@@ -210,31 +425,16 @@ def plot_cumulative_distribution(mc: MonteCarloEngine, save_path: Path, verbose:
     ax.grid(True, alpha=0.3)
     ax.set_ylim(0, 1)
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
 
 
-def plot_tornado_sensitivity(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_tornado_sensitivity(data, save_path: Path, verbose: bool = True):
     """Plot tornado chart showing sensitivity to each input"""
+    data = as_chart_data(data)
     fig, ax = plt.subplots(figsize=(12, 10))
 
-    inputs = mc.simulation_inputs
-    outputs = mc.simulation_results['nippon_share_price']
-
-    # Calculate correlation of each input with output
-    correlations = {}
-    for col in inputs.columns:
-        corr = np.corrcoef(inputs[col], outputs)[0, 1]
-        correlations[col] = corr
-
-    # Sort by absolute correlation
-    sorted_vars = sorted(correlations.items(), key=lambda x: abs(x[1]), reverse=True)
-
-    # Take top 15 most impactful
-    top_vars = sorted_vars[:15]
+    # Take top 15 most impactful (by absolute correlation)
+    top_vars = list(data.top_drivers('nippon', 15).items())
 
     var_names = [v[0] for v in top_vars]
     corr_values = [v[1] for v in top_vars]
@@ -259,38 +459,25 @@ def plot_tornado_sensitivity(mc: MonteCarloEngine, save_path: Path, verbose: boo
 
     ax.set_xlim(-1, 1)
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
 
 
-def plot_input_distributions(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_input_distributions(data, save_path: Path, verbose: bool = True):
     """Plot distributions of key input variables"""
+    data = as_chart_data(data)
     fig, axes = plt.subplots(3, 3, figsize=(14, 12))
     axes = axes.flatten()
 
-    key_vars = [
-        'hrc_price_factor', 'crc_price_factor', 'octg_price_factor',
-        'flat_rolled_volume', 'tubular_volume', 'uss_wacc',
-        'terminal_growth', 'exit_multiple', 'gary_works_execution'
-    ]
-
-    inputs = mc.simulation_inputs
-
-    for i, var in enumerate(key_vars):
-        if var not in inputs.columns:
+    for i, var in enumerate(KEY_INPUT_VARS):
+        if var not in data.input_histograms:
             continue
 
         ax = axes[i]
-        data = inputs[var].values
+        hist, mean, std = data.input_histograms[var]
 
-        ax.hist(data, bins=40, density=True, alpha=0.7, color='steelblue', edgecolor='white')
+        _hist(ax, hist, alpha=0.7, color='steelblue', edgecolor='white')
 
         # Add mean and std
-        mean = np.mean(data)
-        std = np.std(data)
         ax.axvline(mean, color='red', linestyle='-', lw=2, label=f'Mean: {mean:.3f}')
         ax.axvline(mean - std, color='orange', linestyle='--', lw=1)
         ax.axvline(mean + std, color='orange', linestyle='--', lw=1, label=f'±1σ')
@@ -302,31 +489,16 @@ def plot_input_distributions(mc: MonteCarloEngine, save_path: Path, verbose: boo
         ax.grid(True, alpha=0.3)
 
     plt.suptitle('Input Variable Distributions', fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
 
 
-def plot_correlation_heatmap(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_correlation_heatmap(data, save_path: Path, verbose: bool = True):
     """Plot correlation heatmap of input variables"""
+    data = as_chart_data(data)
     fig, ax = plt.subplots(figsize=(14, 12))
 
-    inputs = mc.simulation_inputs
-
-    # Select subset of most important variables for readability
-    key_vars = [
-        'hrc_price_factor', 'crc_price_factor', 'coated_price_factor', 'octg_price_factor',
-        'flat_rolled_volume', 'mini_mill_volume', 'tubular_volume',
-        'uss_wacc', 'terminal_growth', 'exit_multiple',
-        'gary_works_execution', 'mon_valley_execution'
-    ]
-
-    available_vars = [v for v in key_vars if v in inputs.columns]
-    subset = inputs[available_vars]
-
-    corr_matrix = subset.corr()
+    corr_matrix = data.input_corr
+    available_vars = list(corr_matrix.columns)
 
     # Create heatmap
     im = ax.imshow(corr_matrix, cmap='RdBu_r', vmin=-1, vmax=1, aspect='auto')
@@ -350,81 +522,45 @@ def plot_correlation_heatmap(mc: MonteCarloEngine, save_path: Path, verbose: boo
 
     ax.set_title('Input Variable Correlation Matrix', fontsize=14, fontweight='bold')
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
-
+    _save(save_path, verbose)
 
-def plot_price_vs_valuation(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
-    """Plot scatter of HRC price factor vs share price"""
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-
-    inputs = mc.simulation_inputs
-    outputs = mc.simulation_results
 
-    # HRC Price Factor vs Share Price
-    ax = axes[0]
-    ax.scatter(inputs['hrc_price_factor'], outputs['nippon_share_price'],
-               alpha=0.3, s=10, c='steelblue')
+def _trend_panel(ax, data: ChartData, var: str, xlabel: str, title: str):
+    ax.scatter(data.scatter[var], data.scatter['nippon'], alpha=0.3, s=10, c='steelblue')
 
     # Add trend line
-    z = np.polyfit(inputs['hrc_price_factor'], outputs['nippon_share_price'], 1)
+    z, x_min, x_max = data.trends[var]
     p = np.poly1d(z)
-    x_line = np.linspace(inputs['hrc_price_factor'].min(), inputs['hrc_price_factor'].max(), 100)
+    x_line = np.linspace(x_min, x_max, 100)
     ax.plot(x_line, p(x_line), 'r-', lw=2, label=f'Trend (slope={z[0]:.1f})')
 
-    ax.axhline(55, color='red', linestyle='--', lw=2, alpha=0.7, label='$55 Offer')
-    ax.set_xlabel('HRC Price Factor', fontsize=12)
+    ax.axhline(OFFER_PRICE, color='red', linestyle='--', lw=2, alpha=0.7, label='$55 Offer')
+    ax.set_xlabel(xlabel, fontsize=12)
     ax.set_ylabel('Share Price ($)', fontsize=12)
-    ax.set_title('HRC Price Factor vs Share Price', fontsize=12, fontweight='bold')
+    ax.set_title(title, fontsize=12, fontweight='bold')
     ax.legend(fontsize=10)
     ax.grid(True, alpha=0.3)
 
-    # WACC vs Share Price
-    ax = axes[1]
-    ax.scatter(inputs['uss_wacc'], outputs['nippon_share_price'],
-               alpha=0.3, s=10, c='steelblue')
 
-    z = np.polyfit(inputs['uss_wacc'], outputs['nippon_share_price'], 1)
-    p = np.poly1d(z)
-    x_line = np.linspace(inputs['uss_wacc'].min(), inputs['uss_wacc'].max(), 100)
-    ax.plot(x_line, p(x_line), 'r-', lw=2, label=f'Trend (slope={z[0]:.1f})')
+def plot_price_vs_valuation(data, save_path: Path, verbose: bool = True):
+    """Plot scatter of HRC price factor vs share price"""
+    data = as_chart_data(data)
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
 
-    ax.axhline(55, color='red', linestyle='--', lw=2, alpha=0.7, label='$55 Offer')
-    ax.set_xlabel('USS WACC (%)', fontsize=12)
-    ax.set_ylabel('Share Price ($)', fontsize=12)
-    ax.set_title('WACC vs Share Price', fontsize=12, fontweight='bold')
-    ax.legend(fontsize=10)
-    ax.grid(True, alpha=0.3)
+    _trend_panel(axes[0], data, 'hrc_price_factor', 'HRC Price Factor', 'HRC Price Factor vs Share Price')
+    _trend_panel(axes[1], data, 'uss_wacc', 'USS WACC (%)', 'WACC vs Share Price')
 
     plt.suptitle('Key Driver Relationships', fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
 
 
-def plot_percentile_waterfall(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_percentile_waterfall(data, save_path: Path, verbose: bool = True):
     """Plot waterfall showing percentile ranges"""
+    data = as_chart_data(data)
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    values = mc.simulation_results['nippon_share_price'].values
-
-    # Calculate percentiles
-    percentiles = {
-        'P1': np.percentile(values, 1),
-        'P5': np.percentile(values, 5),
-        'P10': np.percentile(values, 10),
-        'P25': np.percentile(values, 25),
-        'P50': np.percentile(values, 50),
-        'P75': np.percentile(values, 75),
-        'P90': np.percentile(values, 90),
-        'P95': np.percentile(values, 95),
-        'P99': np.percentile(values, 99),
-    }
+    pct = data.stats['nippon']['pct']
+    percentiles = {f'P{p}': pct[p] for p in (1, 5, 10, 25, 50, 75, 90, 95, 99)}
 
     # Create bar chart of percentiles
     labels = list(percentiles.keys())
@@ -440,7 +576,7 @@ def plot_percentile_waterfall(mc: MonteCarloEngine, save_path: Path, verbose: bo
                f'${val:.0f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
 
     # Add offer line
-    ax.axhline(55, color='red', linestyle='--', lw=2, label='Nippon Offer: $55')
+    ax.axhline(OFFER_PRICE, color='red', linestyle='--', lw=2, label='Nippon Offer: $55')
 
     ax.set_xlabel('Percentile', fontsize=12)
     ax.set_ylabel('Share Price ($)', fontsize=12)
@@ -448,38 +584,29 @@ def plot_percentile_waterfall(mc: MonteCarloEngine, save_path: Path, verbose: bo
     ax.legend(fontsize=10)
     ax.grid(True, alpha=0.3, axis='y')
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
+
+
+def _scenario_boxes(ax, box_stats: list, labels: list):
+    """Box plot of precomputed statistics for low / mid / high HRC groups"""
+    box_stats = [dict(s, label=label) for s, label in zip(box_stats, labels)]
+    bp = ax.bxp(box_stats, patch_artist=True)
+    for patch, color in zip(bp['boxes'], ['#ff6b6b', '#ffd93d', '#6bcb77']):
+        patch.set_facecolor(color)
+        patch.set_alpha(0.7)
+    return box_stats
 
 
-def plot_scenario_comparison(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_scenario_comparison(data, save_path: Path, verbose: bool = True):
     """Plot box plots comparing different scenario segments"""
+    data = as_chart_data(data)
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    inputs = mc.simulation_inputs
-    outputs = mc.simulation_results['nippon_share_price'].values
-
     # Segment by HRC price scenarios
-    hrc = inputs['hrc_price_factor'].values
-
-    low_price = outputs[hrc < np.percentile(hrc, 25)]
-    mid_price = outputs[(hrc >= np.percentile(hrc, 25)) & (hrc <= np.percentile(hrc, 75))]
-    high_price = outputs[hrc > np.percentile(hrc, 75)]
-
-    data = [low_price, mid_price, high_price]
     labels = ['Low Steel Prices\n(Bottom 25%)', 'Mid Steel Prices\n(Middle 50%)', 'High Steel Prices\n(Top 25%)']
+    box_stats = _scenario_boxes(ax, data.boxes['quartiles'], labels)
 
-    bp = ax.boxplot(data, tick_labels=labels, patch_artist=True)
-
-    colors = ['#ff6b6b', '#ffd93d', '#6bcb77']
-    for patch, color in zip(bp['boxes'], colors):
-        patch.set_facecolor(color)
-        patch.set_alpha(0.7)
-
-    ax.axhline(55, color='red', linestyle='--', lw=2, label='Nippon Offer: $55')
+    ax.axhline(OFFER_PRICE, color='red', linestyle='--', lw=2, label='Nippon Offer: $55')
 
     ax.set_ylabel('Share Price ($)', fontsize=12)
     ax.set_title('Share Price Distribution by Steel Price Scenario', fontsize=14, fontweight='bold')
@@ -487,44 +614,39 @@ def plot_scenario_comparison(mc: MonteCarloEngine, save_path: Path, verbose: boo
     ax.grid(True, alpha=0.3, axis='y')
 
     # Add medians as text
-    for i, d in enumerate(data):
-        median = np.median(d)
+    for i, s in enumerate(box_stats):
+        median = s['med']
         ax.text(i + 1, median + 10, f'Median: ${median:.0f}', ha='center', fontsize=10)
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
 
 
-def plot_dual_distribution(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_dual_distribution(data, save_path: Path, verbose: bool = True):
     """Plot side-by-side histograms of USS standalone vs Nippon perspective share prices"""
+    data = as_chart_data(data)
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
 
-    uss_vals = mc.simulation_results['uss_share_price'].values
-    nip_vals = mc.simulation_results['nippon_share_price'].values
-
-    for ax, vals, label, color in [
-        (ax1, uss_vals, 'USS Standalone', '#2196F3'),
-        (ax2, nip_vals, 'Nippon Perspective', '#4CAF50'),
+    for ax, key, label, color in [
+        (ax1, 'uss', 'USS Standalone', '#2196F3'),
+        (ax2, 'nippon', 'Nippon Perspective', '#4CAF50'),
     ]:
-        mu, std = np.mean(vals), np.std(vals)
-        p5, p50, p95 = np.percentile(vals, [5, 50, 95])
+        s = data.stats[key]
+        mu, std = s['mean'], s['std']
+        p5, p50, p95 = s['pct'][5], s['pct'][50], s['pct'][95]
 
-        ax.hist(vals, bins=50, density=True, alpha=0.7, color=color, edgecolor='white', linewidth=0.5)
+        _hist(ax, data.histograms[key, 50], alpha=0.7, color=color, edgecolor='white', linewidth=0.5)
 
         # Normal fit
-        x = np.linspace(vals.min(), vals.max(), 100)
+        x = np.linspace(s['min'], s['max'], 100)
         ax.plot(x, stats.norm.pdf(x, mu, std), 'k-', lw=1.5, alpha=0.6)
 
         # Percentile lines
         ax.axvline(p5, color='orange', linestyle='--', lw=1.5, label=f'P5: ${p5:.0f}')
         ax.axvline(p50, color='darkgreen', linestyle='-', lw=2, label=f'Median: ${p50:.0f}')
         ax.axvline(p95, color='orange', linestyle='--', lw=1.5, label=f'P95: ${p95:.0f}')
-        ax.axvline(55, color='red', linestyle='-', lw=3, label='$55 Offer')
+        ax.axvline(OFFER_PRICE, color='red', linestyle='-', lw=3, label='$55 Offer')
 
-        prob_below = np.mean(vals < 55) * 100
+        prob_below = s['prob_below_offer'] * 100
         ax.set_xlabel('Share Price ($)', fontsize=11)
         ax.set_ylabel('Probability Density', fontsize=11)
         ax.set_title(f'{label}\n({prob_below:.1f}% below $55)', fontsize=13, fontweight='bold')
@@ -536,32 +658,28 @@ def plot_dual_distribution(mc: MonteCarloEngine, save_path: Path, verbose: bool
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
     plt.suptitle('Dual-Perspective Share Price Distribution', fontsize=15, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
 
 
-def plot_dual_cdf(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_dual_cdf(data, save_path: Path, verbose: bool = True):
     """Plot overlaid CDF curves for USS standalone vs Nippon perspective"""
+    data = as_chart_data(data)
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    for col, label, color in [
-        ('uss_share_price', 'USS Standalone', '#2196F3'),
-        ('nippon_share_price', 'Nippon Perspective', '#4CAF50'),
+    for key, label, color in [
+        ('uss', 'USS Standalone', '#2196F3'),
+        ('nippon', 'Nippon Perspective', '#4CAF50'),
     ]:
-        vals = np.sort(mc.simulation_results[col].values)
-        cdf = np.arange(1, len(vals) + 1) / len(vals)
+        vals, cdf = data.cdf[key]
         ax.plot(vals, cdf, color=color, lw=2.5, label=label)
 
-        prob_below = np.mean(vals < 55)
-        ax.plot(55, prob_below, 'o', color=color, markersize=10)
-        ax.annotate(f'{prob_below:.1%} below $55', (55, prob_below),
-                   textcoords="offset points", xytext=(12, -5 if col == 'uss_share_price' else 8),
+        prob_below = data.stats[key]['prob_below_offer']
+        ax.plot(OFFER_PRICE, prob_below, 'o', color=color, markersize=10)
+        ax.annotate(f'{prob_below:.1%} below $55', (OFFER_PRICE, prob_below),
+                   textcoords="offset points", xytext=(12, -5 if key == 'uss' else 8),
                    fontsize=10, color=color, fontweight='bold')
 
-    ax.axvline(55, color='red', linestyle='-', lw=2, alpha=0.7, label='$55 Offer')
+    ax.axvline(OFFER_PRICE, color='red', linestyle='-', lw=2, alpha=0.7, label='$55 Offer')
     ax.axhline(0.5, color='gray', linestyle=':', lw=1, alpha=0.5)
 
     ax.set_xlabel('Share Price ($)', fontsize=12)
@@ -571,22 +689,19 @@ def plot_dual_cdf(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
     ax.grid(True, alpha=0.3)
     ax.set_ylim(0, 1)
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
 
 
-def plot_synergy_premium(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_synergy_premium(data, save_path: Path, verbose: bool = True):
     """Plot distribution of synergy premium (nippon_price - uss_price)"""
+    data = as_chart_data(data)
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    premium = mc.simulation_results['nippon_share_price'].values - mc.simulation_results['uss_share_price'].values
-    mu, std = np.mean(premium), np.std(premium)
-    p5, p50, p95 = np.percentile(premium, [5, 50, 95])
+    s = data.stats['premium']
+    mu, std = s['mean'], s['std']
+    p5, p50, p95 = s['pct'][5], s['pct'][50], s['pct'][95]
 
-    ax.hist(premium, bins=50, density=True, alpha=0.7, color='#9C27B0', edgecolor='white', linewidth=0.5)
+    _hist(ax, data.histograms['premium', 50], alpha=0.7, color='#9C27B0', edgecolor='white', linewidth=0.5)
 
     ax.axvline(p50, color='green', linestyle='-', lw=2, label=f'Median: ${p50:.1f}')
     ax.axvline(p5, color='orange', linestyle='--', lw=1.5, label=f'P5: ${p5:.1f}')
@@ -594,7 +709,7 @@ def plot_synergy_premium(mc: MonteCarloEngine, save_path: Path, verbose: bool =
     ax.axvline(0, color='black', linestyle='-', lw=1, alpha=0.5)
 
     # What % of Nippon value comes from synergies
-    nippon_mean = np.mean(mc.simulation_results['nippon_share_price'].values)
+    nippon_mean = data.stats['nippon']['mean']
     pct_from_synergies = mu / nippon_mean * 100 if nippon_mean > 0 else 0
 
     ax.set_xlabel('Synergy Premium ($/share)', fontsize=12)
@@ -609,30 +724,24 @@ def plot_synergy_premium(mc: MonteCarloEngine, save_path: Path, verbose: bool =
     ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose)
 
 
-def plot_dual_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def plot_dual_summary_dashboard(data, save_path: Path, verbose: bool = True):
     """Create 2x3 dual-perspective summary dashboard"""
+    data = as_chart_data(data)
     fig = plt.figure(figsize=(18, 12))
     gs = fig.add_gridspec(2, 3, hspace=0.35, wspace=0.3)
 
-    uss_vals = mc.simulation_results['uss_share_price'].values
-    nip_vals = mc.simulation_results['nippon_share_price'].values
-    inputs = mc.simulation_inputs
-    premium = nip_vals - uss_vals
+    uss, nip, prem = data.stats['uss'], data.stats['nippon'], data.stats['premium']
 
     # Row 1, Col 1: USS histogram + stats
     ax1 = fig.add_subplot(gs[0, 0])
-    ax1.hist(uss_vals, bins=40, density=True, alpha=0.7, color='#2196F3', edgecolor='white')
-    ax1.axvline(55, color='red', linestyle='-', lw=2)
-    ax1.axvline(np.median(uss_vals), color='darkgreen', linestyle='-', lw=2)
-    prob_uss = np.mean(uss_vals < 55)
-    ax1.set_title(f'USS Standalone\nMedian: ${np.median(uss_vals):.0f} | P(<$55): {prob_uss:.1%}',
+    _hist(ax1, data.histograms['uss', 40], alpha=0.7, color='#2196F3', edgecolor='white')
+    ax1.axvline(OFFER_PRICE, color='red', linestyle='-', lw=2)
+    ax1.axvline(uss['median'], color='darkgreen', linestyle='-', lw=2)
+    prob_uss = uss['prob_below_offer']
+    ax1.set_title(f'USS Standalone\nMedian: ${uss["median"]:.0f} | P(<$55): {prob_uss:.1%}',
                   fontweight='bold', fontsize=10)
     ax1.set_xlabel('Share Price ($)')
     ax1.set_ylabel('Density')
@@ -640,11 +749,11 @@ def plot_dual_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose:
 
     # Row 1, Col 2: Nippon histogram + stats
     ax2 = fig.add_subplot(gs[0, 1])
-    ax2.hist(nip_vals, bins=40, density=True, alpha=0.7, color='#4CAF50', edgecolor='white')
-    ax2.axvline(55, color='red', linestyle='-', lw=2)
-    ax2.axvline(np.median(nip_vals), color='darkgreen', linestyle='-', lw=2)
-    prob_nip = np.mean(nip_vals < 55)
-    ax2.set_title(f'Nippon Perspective\nMedian: ${np.median(nip_vals):.0f} | P(<$55): {prob_nip:.1%}',
+    _hist(ax2, data.histograms['nippon', 40], alpha=0.7, color='#4CAF50', edgecolor='white')
+    ax2.axvline(OFFER_PRICE, color='red', linestyle='-', lw=2)
+    ax2.axvline(nip['median'], color='darkgreen', linestyle='-', lw=2)
+    prob_nip = nip['prob_below_offer']
+    ax2.set_title(f'Nippon Perspective\nMedian: ${nip["median"]:.0f} | P(<$55): {prob_nip:.1%}',
                   fontweight='bold', fontsize=10)
     ax2.set_xlabel('Share Price ($)')
     ax2.set_ylabel('Density')
@@ -656,17 +765,17 @@ def plot_dual_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose:
     stats_text = (
         f"{'':>16}{'USS':>10}{'Nippon':>10}\n"
         f"{'─' * 36}\n"
-        f"{'Mean':>16}${np.mean(uss_vals):>8.1f}  ${np.mean(nip_vals):>8.1f}\n"
-        f"{'Median':>16}${np.median(uss_vals):>8.1f}  ${np.median(nip_vals):>8.1f}\n"
-        f"{'Std Dev':>16}${np.std(uss_vals):>8.1f}  ${np.std(nip_vals):>8.1f}\n"
-        f"{'P5':>16}${np.percentile(uss_vals,5):>8.1f}  ${np.percentile(nip_vals,5):>8.1f}\n"
-        f"{'P95':>16}${np.percentile(uss_vals,95):>8.1f}  ${np.percentile(nip_vals,95):>8.1f}\n"
+        f"{'Mean':>16}${uss['mean']:>8.1f}  ${nip['mean']:>8.1f}\n"
+        f"{'Median':>16}${uss['median']:>8.1f}  ${nip['median']:>8.1f}\n"
+        f"{'Std Dev':>16}${uss['std']:>8.1f}  ${nip['std']:>8.1f}\n"
+        f"{'P5':>16}${uss['pct'][5]:>8.1f}  ${nip['pct'][5]:>8.1f}\n"
+        f"{'P95':>16}${uss['pct'][95]:>8.1f}  ${nip['pct'][95]:>8.1f}\n"
         f"{'─' * 36}\n"
         f"{'P(<$55)':>16}{prob_uss:>9.1%}  {prob_nip:>9.1%}\n"
-        f"{'P(>$75)':>16}{np.mean(uss_vals>75):>9.1%}  {np.mean(nip_vals>75):>9.1%}\n"
+        f"{'P(>$75)':>16}{uss['prob_above_75']:>9.1%}  {nip['prob_above_75']:>9.1%}\n"
         f"{'─' * 36}\n"
-        f"{'Synergy Premium':>16}  ${np.mean(premium):>8.1f}\n"
-        f"{'% of Nippon':>16}  {np.mean(premium)/np.mean(nip_vals)*100:>7.1f}%\n"
+        f"{'Synergy Premium':>16}  ${prem['mean']:>8.1f}\n"
+        f"{'% of Nippon':>16}  {prem['mean']/nip['mean']*100:>7.1f}%\n"
     )
     ax3.text(0.05, 0.95, stats_text, transform=ax3.transAxes, fontsize=10,
              verticalalignment='top', fontfamily='monospace',
@@ -674,11 +783,10 @@ def plot_dual_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose:
 
     # Row 2, Col 1: Dual CDF overlay
     ax4 = fig.add_subplot(gs[1, 0])
-    for vals, label, color in [(uss_vals, 'USS', '#2196F3'), (nip_vals, 'Nippon', '#4CAF50')]:
-        sorted_v = np.sort(vals)
-        cdf = np.arange(1, len(sorted_v) + 1) / len(sorted_v)
+    for key, label, color in [('uss', 'USS', '#2196F3'), ('nippon', 'Nippon', '#4CAF50')]:
+        sorted_v, cdf = data.cdf[key]
         ax4.plot(sorted_v, cdf, color=color, lw=2, label=label)
-    ax4.axvline(55, color='red', linestyle='--', lw=2)
+    ax4.axvline(OFFER_PRICE, color='red', linestyle='--', lw=2)
     ax4.axhline(0.5, color='gray', linestyle=':', alpha=0.5)
     ax4.set_xlabel('Share Price ($)')
     ax4.set_ylabel('Cumulative Probability')
@@ -689,8 +797,8 @@ def plot_dual_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose:
 
     # Row 2, Col 2: Synergy premium distribution
     ax5 = fig.add_subplot(gs[1, 1])
-    ax5.hist(premium, bins=40, density=True, alpha=0.7, color='#9C27B0', edgecolor='white')
-    ax5.axvline(np.median(premium), color='green', linestyle='-', lw=2, label=f'Median: ${np.median(premium):.1f}')
+    _hist(ax5, data.histograms['premium', 40], alpha=0.7, color='#9C27B0', edgecolor='white')
+    ax5.axvline(prem['median'], color='green', linestyle='-', lw=2, label=f'Median: ${prem["median"]:.1f}')
     ax5.axvline(0, color='black', linestyle='-', lw=1, alpha=0.5)
     ax5.set_xlabel('Premium ($/share)')
     ax5.set_ylabel('Density')
@@ -700,15 +808,15 @@ def plot_dual_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose:
 
     # Row 2, Col 3: Tornado sensitivity for both
     ax6 = fig.add_subplot(gs[1, 2])
-    corr_uss = {col: np.corrcoef(inputs[col], uss_vals)[0, 1] for col in inputs.columns}
-    corr_nip = {col: np.corrcoef(inputs[col], nip_vals)[0, 1] for col in inputs.columns}
+    corr = data.correlations
     # Sort by max absolute correlation across both
-    all_vars = sorted(inputs.columns, key=lambda c: max(abs(corr_uss[c]), abs(corr_nip[c])), reverse=True)[:10]
+    strength = corr[['uss', 'nippon']].abs().max(axis=1).sort_values(ascending=False, kind='stable')
+    all_vars = list(strength.index[:10])
     y_pos = np.arange(len(all_vars))
     bar_h = 0.35
-    ax6.barh(y_pos - bar_h/2, [corr_uss[v] for v in all_vars], height=bar_h,
+    ax6.barh(y_pos - bar_h/2, corr.loc[all_vars, 'uss'], height=bar_h,
              color='#2196F3', alpha=0.7, label='USS')
-    ax6.barh(y_pos + bar_h/2, [corr_nip[v] for v in all_vars], height=bar_h,
+    ax6.barh(y_pos + bar_h/2, corr.loc[all_vars, 'nippon'], height=bar_h,
              color='#4CAF50', alpha=0.7, label='Nippon')
     ax6.set_yticks(y_pos)
     ax6.set_yticklabels([v.replace('_', ' ').title()[:18] for v in all_vars], fontsize=8)
@@ -720,28 +828,25 @@ def plot_dual_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose:
     ax6.set_xlim(-1, 1)
 
     plt.suptitle('Dual-Perspective Monte Carlo Dashboard', fontsize=15, fontweight='bold', y=0.98)
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose, tight=False)
 
 
-def create_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose: bool = True):
+def create_summary_dashboard(data, save_path: Path, verbose: bool = True):
     """Create a comprehensive summary dashboard"""
+    data = as_chart_data(data)
     fig = plt.figure(figsize=(16, 12))
 
     # Create grid
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
 
-    values = mc.simulation_results['nippon_share_price'].values
-    inputs = mc.simulation_inputs
+    s = data.stats['nippon']
+    pct = s['pct']
 
     # 1. Main histogram (top left, spans 2 columns)
     ax1 = fig.add_subplot(gs[0, :2])
-    n, bins, patches = ax1.hist(values, bins=50, density=True, alpha=0.7,
-                                 color='steelblue', edgecolor='white')
-    ax1.axvline(55, color='red', linestyle='-', lw=3, label='$55 Offer')
-    ax1.axvline(np.median(values), color='green', linestyle='-', lw=2, label=f'Median: ${np.median(values):.0f}')
+    _hist(ax1, data.histograms['nippon', 50], alpha=0.7, color='steelblue', edgecolor='white')
+    ax1.axvline(OFFER_PRICE, color='red', linestyle='-', lw=3, label='$55 Offer')
+    ax1.axvline(s['median'], color='green', linestyle='-', lw=2, label=f'Median: ${s["median"]:.0f}')
     ax1.set_xlabel('Share Price ($)')
     ax1.set_ylabel('Density')
     ax1.set_title('Share Price Distribution', fontweight='bold')
@@ -756,27 +861,27 @@ def create_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose: boo
     SIMULATION RESULTS
     ══════════════════════
 
-    Simulations: {len(values):,}
+    Simulations: {s['n']:,}
 
     Central Tendency
     ────────────────
-    Mean:      ${np.mean(values):.2f}
-    Median:    ${np.median(values):.2f}
-    Std Dev:   ${np.std(values):.2f}
+    Mean:      ${s['mean']:.2f}
+    Median:    ${s['median']:.2f}
+    Std Dev:   ${s['std']:.2f}
 
     Percentiles
     ────────────────
-    P5:   ${np.percentile(values, 5):.0f}
-    P25:  ${np.percentile(values, 25):.0f}
-    P50:  ${np.percentile(values, 50):.0f}
-    P75:  ${np.percentile(values, 75):.0f}
-    P95:  ${np.percentile(values, 95):.0f}
+    P5:   ${pct[5]:.0f}
+    P25:  ${pct[25]:.0f}
+    P50:  ${pct[50]:.0f}
+    P75:  ${pct[75]:.0f}
+    P95:  ${pct[95]:.0f}
 
     vs $55 Offer
     ────────────────
-    P(< $55):  {np.mean(values < 55):.1%}
-    P(> $75):  {np.mean(values > 75):.1%}
-    P(> $100): {np.mean(values > 100):.1%}
+    P(< $55):  {s['prob_below_offer']:.1%}
+    P(> $75):  {s['prob_above_75']:.1%}
+    P(> $100): {s['prob_above_100']:.1%}
     """
     ax2.text(0.1, 0.95, stats_text, transform=ax2.transAxes, fontsize=10,
              verticalalignment='top', fontfamily='monospace',
@@ -784,11 +889,7 @@ def create_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose: boo
 
     # 3. Tornado chart (middle row, spans 2 columns)
     ax3 = fig.add_subplot(gs[1, :2])
-    correlations = {}
-    for col in inputs.columns:
-        corr = np.corrcoef(inputs[col], values)[0, 1]
-        correlations[col] = corr
-    sorted_vars = sorted(correlations.items(), key=lambda x: abs(x[1]), reverse=True)[:10]
+    sorted_vars = list(data.top_drivers('nippon', 10).items())
     var_names = [v[0].replace('_', ' ').title()[:20] for v in sorted_vars]
     corr_values = [v[1] for v in sorted_vars]
     colors = ['green' if c > 0 else 'red' for c in corr_values]
@@ -804,10 +905,9 @@ def create_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose: boo
 
     # 4. CDF (middle right)
     ax4 = fig.add_subplot(gs[1, 2])
-    sorted_vals = np.sort(values)
-    cdf = np.arange(1, len(sorted_vals) + 1) / len(sorted_vals)
+    sorted_vals, cdf = data.cdf['nippon']
     ax4.plot(sorted_vals, cdf, 'b-', lw=2)
-    ax4.axvline(55, color='red', linestyle='--', lw=2)
+    ax4.axvline(OFFER_PRICE, color='red', linestyle='--', lw=2)
     ax4.axhline(0.5, color='gray', linestyle=':', alpha=0.5)
     ax4.set_xlabel('Share Price ($)')
     ax4.set_ylabel('Cumulative Probability')
@@ -816,8 +916,8 @@ def create_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose: boo
 
     # 5. HRC scatter (bottom left)
     ax5 = fig.add_subplot(gs[2, 0])
-    ax5.scatter(inputs['hrc_price_factor'], values, alpha=0.2, s=5, c='steelblue')
-    ax5.axhline(55, color='red', linestyle='--', lw=2)
+    ax5.scatter(data.scatter['hrc_price_factor'], data.scatter['nippon'], alpha=0.2, s=5, c='steelblue')
+    ax5.axhline(OFFER_PRICE, color='red', linestyle='--', lw=2)
     ax5.set_xlabel('HRC Price Factor')
     ax5.set_ylabel('Share Price ($)')
     ax5.set_title('HRC Price Impact', fontweight='bold')
@@ -825,8 +925,8 @@ def create_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose: boo
 
     # 6. WACC scatter (bottom middle)
     ax6 = fig.add_subplot(gs[2, 1])
-    ax6.scatter(inputs['uss_wacc'], values, alpha=0.2, s=5, c='steelblue')
-    ax6.axhline(55, color='red', linestyle='--', lw=2)
+    ax6.scatter(data.scatter['uss_wacc'], data.scatter['nippon'], alpha=0.2, s=5, c='steelblue')
+    ax6.axhline(OFFER_PRICE, color='red', linestyle='--', lw=2)
     ax6.set_xlabel('WACC (%)')
     ax6.set_ylabel('Share Price ($)')
     ax6.set_title('WACC Impact', fontweight='bold')
@@ -834,25 +934,150 @@ def create_summary_dashboard(mc: MonteCarloEngine, save_path: Path, verbose: boo
 
     # 7. Scenario box plot (bottom right)
     ax7 = fig.add_subplot(gs[2, 2])
-    hrc = inputs['hrc_price_factor'].values
-    low = values[hrc < np.percentile(hrc, 33)]
-    mid = values[(hrc >= np.percentile(hrc, 33)) & (hrc <= np.percentile(hrc, 67))]
-    high = values[hrc > np.percentile(hrc, 67)]
-    bp = ax7.boxplot([low, mid, high], tick_labels=['Low\nPrices', 'Mid\nPrices', 'High\nPrices'], patch_artist=True)
-    for patch, color in zip(bp['boxes'], ['#ff6b6b', '#ffd93d', '#6bcb77']):
-        patch.set_facecolor(color)
-        patch.set_alpha(0.7)
-    ax7.axhline(55, color='red', linestyle='--', lw=2)
+    _scenario_boxes(ax7, data.boxes['terciles'], ['Low\nPrices', 'Mid\nPrices', 'High\nPrices'])
+    ax7.axhline(OFFER_PRICE, color='red', linestyle='--', lw=2)
     ax7.set_ylabel('Share Price ($)')
     ax7.set_title('By Price Scenario', fontweight='bold')
     ax7.grid(True, alpha=0.3, axis='y')
 
     plt.suptitle('USS/Nippon Steel Monte Carlo Analysis Summary', fontsize=16, fontweight='bold', y=0.98)
 
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    if verbose:
-        print(f"  Saved: {save_path}")
+    _save(save_path, verbose, tight=False)
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+# (title, file name, chart function, chart sources it reads)
+CHART_SPECS = [
+    ("Share Price Distribution", 'mc_share_price_distribution.png', plot_share_price_distribution, ('nippon',)),
+    ("Cumulative Distribution", 'mc_cumulative_distribution.png', plot_cumulative_distribution, ('nippon',)),
+    ("Tornado Sensitivity", 'mc_tornado_sensitivity.png', plot_tornado_sensitivity, ('nippon', 'inputs')),
+    ("Input Distributions", 'mc_input_distributions.png', plot_input_distributions, ('inputs',)),
+    ("Correlation Heatmap", 'mc_correlation_heatmap.png', plot_correlation_heatmap, ('inputs',)),
+    ("Price vs Valuation", 'mc_price_vs_valuation.png', plot_price_vs_valuation, ('nippon', 'inputs')),
+    ("Percentile Waterfall", 'mc_percentile_waterfall.png', plot_percentile_waterfall, ('nippon',)),
+    ("Scenario Comparison", 'mc_scenario_comparison.png', plot_scenario_comparison, ('nippon', 'inputs')),
+    ("Summary Dashboard", 'mc_summary_dashboard.png', create_summary_dashboard, ('nippon', 'inputs')),
+    ("Dual Distribution", 'mc_dual_distribution.png', plot_dual_distribution, ('nippon', 'uss')),
+    ("Dual CDF", 'mc_dual_cdf.png', plot_dual_cdf, ('nippon', 'uss')),
+    ("Synergy Premium", 'mc_synergy_premium.png', plot_synergy_premium, ('nippon', 'uss')),
+    ("Dual Summary Dashboard", 'mc_dual_summary_dashboard.png', plot_dual_summary_dashboard, ('nippon', 'uss', 'inputs')),
+]
+
+# Bump to force every chart to re-render
+CHART_CACHE_VERSION = 1
+
+# Input hashes of the charts last rendered into a directory
+CHART_MANIFEST = '.mc_chart_manifest.json'
+
+# Render processes (leave one core for the caller)
+CHART_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+# ChartData of the current render pool worker (set once by the initializer)
+_WORKER_CHART_DATA = None
+
+
+def chart_hashes(digests: dict) -> dict:
+    """Input hash of each chart: its sources, the plotting code and the cache version"""
+    code_hash = file_hash(Path(__file__))
+    hashes = {}
+    for _, filename, _, sources in CHART_SPECS:
+        key = [str(CHART_CACHE_VERSION), code_hash or '', filename] + [digests[s] for s in sources]
+        hashes[filename] = hashlib.md5('|'.join(key).encode()).hexdigest()
+    return hashes
+
+
+def _load_manifest(charts_dir: Path) -> dict:
+    path = charts_dir / CHART_MANIFEST
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _init_chart_worker(data: ChartData):
+    global _WORKER_CHART_DATA
+    _WORKER_CHART_DATA = data
+
+
+def _render_chart(job: tuple) -> str:
+    """Pool worker: render CHART_SPECS[index] to path"""
+    index, path = job
+    CHART_SPECS[index][2](_WORKER_CHART_DATA, Path(path), verbose=False)
+    return CHART_SPECS[index][1]
+
+
+def render_charts(
+    mc: MonteCarloEngine,
+    charts_dir: Path = CHARTS_DIR,
+    n_workers: int = CHART_POOL_WORKERS,
+    force: bool = False,
+    progress: Optional[Callable[[str], None]] = None,
+) -> dict:
+    """
+    Render all Monte Carlo charts, skipping those whose inputs are unchanged
+
+    Shared aggregates are computed once (ChartData) and the charts are
+    rendered in a process pool. A chart is skipped when its file exists
+    and its input hash matches the manifest of the last render.
+
+    Args:
+        mc: Engine after run_simulation()
+        charts_dir: Output directory
+        n_workers: Render processes (1 = render in-process)
+        force: Re-render every chart
+        progress: Called with each chart's title once it is rendered or skipped
+
+    Returns:
+        Dict with 'rendered' and 'skipped' file names
+    """
+    charts_dir = Path(charts_dir)
+    charts_dir.mkdir(parents=True, exist_ok=True)
+
+    sources = chart_sources(mc)
+    hashes = chart_hashes(source_digests(*sources))
+    manifest = {} if force else _load_manifest(charts_dir)
+
+    pending, skipped = [], []
+    for i, (title, filename, _, _) in enumerate(CHART_SPECS):
+        if manifest.get(filename) == hashes[filename] and (charts_dir / filename).exists():
+            skipped.append(filename)
+            if progress:
+                progress(title)
+        else:
+            pending.append(i)
+
+    rendered = []
+    if pending:
+        data = ChartData(*sources)
+        jobs = [(i, str(charts_dir / CHART_SPECS[i][1])) for i in pending]
+        if n_workers > 1 and len(jobs) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(n_workers, len(jobs)),
+                                         initializer=_init_chart_worker, initargs=(data,)) as pool:
+                    for (i, _), filename in zip(jobs, pool.map(_render_chart, jobs)):
+                        rendered.append(filename)
+                        if progress:
+                            progress(CHART_SPECS[i][0])
+            except (BrokenProcessPool, OSError):
+                # No usable pool (e.g. restricted sandbox); render what is left in-process
+                pass
+        for i, path in jobs:
+            title, filename, plot, _ = CHART_SPECS[i]
+            if filename in rendered:
+                continue
+            plot(data, Path(path), verbose=False)
+            rendered.append(filename)
+            if progress:
+                progress(title)
+
+    manifest.update({f: hashes[f] for f in rendered})
+    (charts_dir / CHART_MANIFEST).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return {'rendered': rendered, 'skipped': skipped}
 
 
 def main():
@@ -861,6 +1086,10 @@ def main():
                        help='Number of simulations (default: 5000)')
     parser.add_argument('--workers', '-w', type=int, default=1,
                        help='Number of parallel worker processes (default: 1)')
+    parser.add_argument('--chart-workers', type=int, default=CHART_POOL_WORKERS,
+                       help=f'Chart render processes (default: {CHART_POOL_WORKERS})')
+    parser.add_argument('--force-charts', action='store_true',
+                       help='Re-render charts even if their inputs are unchanged')
     args = parser.parse_args()
 
     # Create output directories
@@ -878,47 +1107,32 @@ def main():
     print("GENERATING VISUALIZATIONS")
     print("=" * 70)
 
-    # Define visualization tasks (with verbose=False for cleaner progress bar output)
-    visualization_tasks = [
-        ("Share Price Distribution", lambda: plot_share_price_distribution(mc, CHARTS_DIR / 'mc_share_price_distribution.png', verbose=False)),
-        ("Cumulative Distribution", lambda: plot_cumulative_distribution(mc, CHARTS_DIR / 'mc_cumulative_distribution.png', verbose=False)),
-        ("Tornado Sensitivity", lambda: plot_tornado_sensitivity(mc, CHARTS_DIR / 'mc_tornado_sensitivity.png', verbose=False)),
-        ("Input Distributions", lambda: plot_input_distributions(mc, CHARTS_DIR / 'mc_input_distributions.png', verbose=False)),
-        ("Correlation Heatmap", lambda: plot_correlation_heatmap(mc, CHARTS_DIR / 'mc_correlation_heatmap.png', verbose=False)),
-        ("Price vs Valuation", lambda: plot_price_vs_valuation(mc, CHARTS_DIR / 'mc_price_vs_valuation.png', verbose=False)),
-        ("Percentile Waterfall", lambda: plot_percentile_waterfall(mc, CHARTS_DIR / 'mc_percentile_waterfall.png', verbose=False)),
-        ("Scenario Comparison", lambda: plot_scenario_comparison(mc, CHARTS_DIR / 'mc_scenario_comparison.png', verbose=False)),
-        ("Summary Dashboard", lambda: create_summary_dashboard(mc, CHARTS_DIR / 'mc_summary_dashboard.png', verbose=False)),
-        ("Dual Distribution", lambda: plot_dual_distribution(mc, CHARTS_DIR / 'mc_dual_distribution.png', verbose=False)),
-        ("Dual CDF", lambda: plot_dual_cdf(mc, CHARTS_DIR / 'mc_dual_cdf.png', verbose=False)),
-        ("Synergy Premium", lambda: plot_synergy_premium(mc, CHARTS_DIR / 'mc_synergy_premium.png', verbose=False)),
-        ("Dual Summary Dashboard", lambda: plot_dual_summary_dashboard(mc, CHARTS_DIR / 'mc_dual_summary_dashboard.png', verbose=False)),
-    ]
-
-    # Run visualizations with progress bar
+    # Render charts with progress bar
     try:
         from tqdm import tqdm
+    except ImportError:
+        tqdm = None
+    if tqdm is not None:
         print()  # Add newline for cleaner output
-        for desc, task in tqdm(visualization_tasks, desc="Creating charts", unit="chart", ncols=100,
-                               bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]'):
-            task()
+        with tqdm(total=len(CHART_SPECS), desc="Creating charts", unit="chart", ncols=100,
+                  bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]') as bar:
+            summary = render_charts(mc, CHARTS_DIR, n_workers=args.chart_workers,
+                                    force=args.force_charts, progress=lambda title: bar.update())
         print()  # Add newline after progress bar
-    except ImportError:
+    else:
         print("  (Install tqdm for progress bar: pip install tqdm)")
-        for desc, task in visualization_tasks:
-            print(f"  Creating: {desc}...")
-            task()
+        summary = render_charts(mc, CHARTS_DIR, n_workers=args.chart_workers, force=args.force_charts,
+                                progress=lambda title: print(f"  Created: {title}"))
+    print(f"  Rendered {len(summary['rendered'])} charts, "
+          f"{len(summary['skipped'])} unchanged since the last run")
 
     # Save data
     print("\n" + "=" * 70)
     print("SAVING DATA")
     print("=" * 70)
 
-    results.to_csv(DATA_DIR / 'monte_carlo_results.csv', index=False)
-    print(f"  Saved: {DATA_DIR / 'monte_carlo_results.csv'}")
-
-    mc.simulation_inputs.to_csv(DATA_DIR / 'monte_carlo_inputs.csv', index=False)
-    print(f"  Saved: {DATA_DIR / 'monte_carlo_inputs.csv'}")
+    store_path = write_result_store(DATA_DIR / DEFAULT_RESULT_STORE.name, mc)
+    print(f"  Saved: {store_path} ({len(mc.simulation_inputs):,} iterations, inputs + outputs)")
 
     print("\n" + "=" * 70)
     print("COMPLETE")
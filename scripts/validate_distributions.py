@@ -9,7 +9,8 @@ Validation Checks:
 1. Statistical validation: Sample 100k from each distribution, verify statistics match
 2. Business bounds: 99% CI within reasonable business range
 3. Correlation validation: Joint samples produce sensible scenarios
-4. Backtesting: Fit to historical period, test coverage on out-of-sample period
+4. Backtesting: Walk-forward refits at month-end origins, scored on
+   out-of-sample interval coverage and PIT histograms
 
 Usage:
     python scripts/validate_distributions.py [--config monte_carlo/distributions_config.json]
@@ -24,12 +25,13 @@ import sys
 import numpy as np
 import pandas as pd
 from scipy import stats
-from scipy.linalg import cholesky
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from monte_carlo.distribution_fitter import validate_distribution_params
+from monte_carlo.distribution_fitter import validate_distribution_params, FIT_POOL_WORKERS
+from monte_carlo.walk_forward import load_backtest_series, run_walk_forward
+from monte_carlo.correlated_sampler import CorrelatedSampler
 
 
 # =============================================================================
@@ -57,6 +59,9 @@ BUSINESS_BOUNDS = {
     'flat_rolled_margin_factor': (0.50, 1.80),
     'operating_synergy_factor': (0.0, 1.0),
     'revenue_synergy_factor': (0.0, 1.0),
+    'technology_synergy_factor': (0.0, 1.0),
+    'synergy_ramp_delay': (0.0, 3.0),        # Years of slip
+    'integration_cost_overrun': (0.50, 2.00),
     'working_capital_efficiency': (0.50, 1.50),
     'capex_intensity_factor': (0.50, 2.00),
 }
@@ -304,7 +309,6 @@ def validate_correlations(config: dict, n_samples: int = 10000) -> dict:
     print("=" * 70)
 
     correlations = config.get('correlations', {})
-    variables = config['variables']
 
     if not correlations:
         print("  No correlations defined in config")
@@ -312,63 +316,25 @@ def validate_correlations(config: dict, n_samples: int = 10000) -> dict:
 
     rng = np.random.RandomState(42)
 
-    # Build list of variables that have correlations
-    var_names = list(variables.keys())
+    # Same compiled sampler (matrix, PSD repair, Cholesky, marginals) the engine uses
+    sampler = CorrelatedSampler.from_config(config)
+    var_names = sampler.names
     n_vars = len(var_names)
-
-    # Build correlation matrix
-    corr_matrix = np.eye(n_vars)
-
-    for i, var1 in enumerate(var_names):
-        if var1 in correlations:
-            for var2, corr_val in correlations[var1].items():
-                if var2 in var_names:
-                    j = var_names.index(var2)
-                    corr_matrix[i, j] = corr_val
-                    corr_matrix[j, i] = corr_val
-
-    # Check if positive semi-definite
-    eigenvalues = np.linalg.eigvalsh(corr_matrix)
-    is_psd = np.all(eigenvalues >= -1e-10)
+    is_psd = sampler.is_psd
 
     print(f"  Correlation matrix: {n_vars}x{n_vars}")
     print(f"  Positive semi-definite: {is_psd}")
 
     if not is_psd:
-        print(f"    WARNING: Min eigenvalue = {np.min(eigenvalues):.6f}")
-        # Make PSD by adding small value to diagonal
-        corr_matrix += np.eye(n_vars) * (abs(np.min(eigenvalues)) + 0.01)
-        D = np.diag(1.0 / np.sqrt(np.diag(corr_matrix)))
-        corr_matrix = D @ corr_matrix @ D
+        repair = sampler.repair
+        print(f"    WARNING: Min eigenvalue = {repair['min_eigenvalue_before']:.6f}")
+        print(f"    Repaired to nearest correlation matrix: Frobenius change "
+              f"{repair['frobenius_change']:.3f}, max |change| {repair['max_abs_change']:.3f} "
+              f"({' <-> '.join(repair['worst_pair'])}), {repair['n_pairs_changed']} pairs moved")
 
     # Generate correlated samples
     try:
-        L = cholesky(corr_matrix, lower=True)
-        standard_normal = rng.randn(n_samples, n_vars)
-        correlated_normal = standard_normal @ L.T
-
-        # Transform to target distributions
-        samples = {}
-        for i, var_name in enumerate(var_names):
-            uniform_samples = stats.norm.cdf(correlated_normal[:, i])
-            var_config = variables[var_name]
-            dist_type = var_config['distribution_type']
-            params = var_config['parameters']
-
-            if dist_type == 'normal':
-                samples[var_name] = stats.norm.ppf(uniform_samples, params['mean'], params['std'])
-            elif dist_type == 'lognormal':
-                samples[var_name] = stats.lognorm.ppf(uniform_samples, s=params['std'], scale=np.exp(params['mean']))
-            elif dist_type == 'triangular':
-                c = (params['mode'] - params['min']) / (params['max'] - params['min'])
-                samples[var_name] = stats.triang.ppf(uniform_samples, c, loc=params['min'], scale=params['max']-params['min'])
-            elif dist_type == 'beta':
-                beta_samples = stats.beta.ppf(uniform_samples, params['alpha'], params['beta'])
-                samples[var_name] = params['min'] + beta_samples * (params['max'] - params['min'])
-            else:
-                samples[var_name] = uniform_samples  # Fallback to uniform
-
-        samples_df = pd.DataFrame(samples)
+        samples_df = sampler.sample(n_samples, rng)
 
         # Check realized correlations
         realized_corr = samples_df.corr()
@@ -403,7 +369,7 @@ def validate_correlations(config: dict, n_samples: int = 10000) -> dict:
         print("\n  Scenario sensibility checks:")
 
         # High HRC price should come with high CRC price
-        if 'hrc_price_factor' in samples and 'crc_price_factor' in samples:
+        if 'hrc_price_factor' in samples_df and 'crc_price_factor' in samples_df:
             high_hrc = samples_df['hrc_price_factor'] > samples_df['hrc_price_factor'].quantile(0.90)
             crc_when_high_hrc = samples_df.loc[high_hrc, 'crc_price_factor'].mean()
             crc_overall = samples_df['crc_price_factor'].mean()
@@ -412,7 +378,7 @@ def validate_correlations(config: dict, n_samples: int = 10000) -> dict:
             print(f"    When HRC is high (>P90): CRC mean = {crc_when_high_hrc:.3f} vs overall {crc_overall:.3f} ({'OK' if check_ok else 'WARN'})")
 
         # Low WACC should come with lower (not higher) prices (flight to safety)
-        if 'uss_wacc' in samples and 'hrc_price_factor' in samples:
+        if 'uss_wacc' in samples_df and 'hrc_price_factor' in samples_df:
             low_wacc = samples_df['uss_wacc'] < samples_df['uss_wacc'].quantile(0.10)
             hrc_when_low_wacc = samples_df.loc[low_wacc, 'hrc_price_factor'].mean()
             hrc_overall = samples_df['hrc_price_factor'].mean()
@@ -424,6 +390,7 @@ def validate_correlations(config: dict, n_samples: int = 10000) -> dict:
         return {
             'valid': is_psd,
             'is_psd': is_psd,
+            'repair': sampler.repair,
             'correlation_checks': correlation_results,
         }
 
@@ -432,109 +399,57 @@ def validate_correlations(config: dict, n_samples: int = 10000) -> dict:
         return {'valid': False, 'error': str(e)}
 
 
-def validate_backtesting(config: dict) -> dict:
+def validate_backtesting(config: dict, window_years: float = 3, horizon_months: int = 12,
+                         n_workers: int = FIT_POOL_WORKERS) -> dict:
     """
-    Backtest distributions: fit to 2018-2020, test coverage on 2021-2023
+    Walk-forward backtest: refit each variable at every month-end origin on the
+    trailing window and score interval coverage / PIT on the following horizon
+
+    Args:
+        config: Distribution config (supplies each variable's distribution type)
+        window_years: Training window length
+        horizon_months: Out-of-sample horizon after each origin
+        n_workers: Worker processes (variables run in parallel)
 
     Returns dict with backtesting results
     """
     print("\n" + "=" * 70)
-    print("BACKTESTING VALIDATION (train 2018-2020, test 2021-2023)")
+    print(f"BACKTESTING VALIDATION (walk-forward, {window_years:g}y window, "
+          f"{horizon_months}m horizon, month-end origins)")
     print("=" * 70)
 
-    results = {}
+    series = load_backtest_series(DATA_DIR)
+    for name, (dates, values, dist_type) in series.items():
+        # Backtest the distribution family the config actually uses
+        config_type = config.get('variables', {}).get(name, {}).get('distribution_type')
+        if config_type in ('normal', 'lognormal', 'triangular'):
+            series[name] = (dates, values, config_type)
 
-    # Test HRC price factor
-    hrc_file = DATA_DIR / 'hrc_us_futures.csv'
-    if hrc_file.exists():
-        hrc_data = pd.read_csv(hrc_file, parse_dates=['date'])
-
-        # Split into train/test
-        train_mask = (hrc_data['date'] >= '2018-01-01') & (hrc_data['date'] < '2021-01-01')
-        test_mask = (hrc_data['date'] >= '2021-01-01') & (hrc_data['date'] < '2024-01-01')
-
-        train_data = hrc_data.loc[train_mask, 'value'].values / 780  # Factor
-        test_data = hrc_data.loc[test_mask, 'value'].values / 780
-
-        if len(train_data) > 100 and len(test_data) > 100:
-            # Fit lognormal to training data
-            log_train = np.log(train_data)
-            train_mu = np.mean(log_train)
-            train_sigma = np.std(log_train, ddof=1)
-
-            # Test coverage on test data
-            log_test = np.log(test_data)
-
-            # What % of test data falls within training distribution's 90% CI?
-            p05_train = np.exp(train_mu + stats.norm.ppf(0.05) * train_sigma)
-            p95_train = np.exp(train_mu + stats.norm.ppf(0.95) * train_sigma)
-
-            coverage = np.mean((test_data >= p05_train) & (test_data <= p95_train))
-
-            print(f"  HRC Price Factor:")
-            print(f"    Training period: 2018-2020 ({len(train_data)} obs)")
-            print(f"    Training 90% CI: [{p05_train:.3f}, {p95_train:.3f}]")
-            print(f"    Test period: 2021-2023 ({len(test_data)} obs)")
-            print(f"    Test data coverage: {coverage:.1%} within training 90% CI")
-
-            results['hrc_price_factor'] = {
-                'train_n': len(train_data),
-                'test_n': len(test_data),
-                'train_90_ci': [float(p05_train), float(p95_train)],
-                'test_coverage': float(coverage),
-                'valid': coverage > 0.60  # At least 60% coverage expected
-            }
-
-            if coverage < 0.70:
-                print(f"    WARNING: Low coverage suggests distribution shift between periods")
-        else:
-            print(f"  HRC: Insufficient data for backtesting")
-
-    # Test capacity utilization
-    capacity_file = DATA_DIR / 'capacity_us.csv'
-    if capacity_file.exists():
-        capacity_data = pd.read_csv(capacity_file, parse_dates=['date'])
-
-        train_mask = (capacity_data['date'] >= '2018-01-01') & (capacity_data['date'] < '2021-01-01')
-        test_mask = (capacity_data['date'] >= '2021-01-01') & (capacity_data['date'] < '2024-01-01')
-
-        train_values = capacity_data.loc[train_mask, 'value'].values
-        test_values = capacity_data.loc[test_mask, 'value'].values
-
-        if len(train_values) > 50 and len(test_values) > 50:
-            # Normalize to factors
-            train_mean = np.mean(train_values)
-            train_factors = train_values / train_mean
-            test_factors = test_values / train_mean  # Use training mean!
-
-            train_mu = np.mean(train_factors)
-            train_sigma = np.std(train_factors, ddof=1)
-
-            p05 = train_mu - 1.645 * train_sigma
-            p95 = train_mu + 1.645 * train_sigma
-
-            coverage = np.mean((test_factors >= p05) & (test_factors <= p95))
-
-            print(f"\n  Capacity Utilization Factor:")
-            print(f"    Training period: 2018-2020 ({len(train_factors)} obs)")
-            print(f"    Training 90% CI: [{p05:.3f}, {p95:.3f}]")
-            print(f"    Test period: 2021-2023 ({len(test_factors)} obs)")
-            print(f"    Test data coverage: {coverage:.1%} within training 90% CI")
-
-            results['capacity_factor'] = {
-                'train_n': len(train_factors),
-                'test_n': len(test_factors),
-                'train_90_ci': [float(p05), float(p95)],
-                'test_coverage': float(coverage),
-                'valid': coverage > 0.60
-            }
-
-    if not results:
+    if not series:
         print("  No data available for backtesting")
         return {'valid': True, 'note': 'no backtesting data available'}
 
+    results = run_walk_forward(series, window_years=window_years,
+                               horizon_months=horizon_months, n_workers=n_workers)
+
+    print(f"  {'Variable':<22} {'Type':<11} {'Origins':>7} {'50%':>7} {'80%':>7} {'90%':>7} {'PIT dev':>8}")
+    print("  " + "-" * 72)
+    for name, r in results.items():
+        if r['n_origins'] == 0:
+            print(f"  {name:<22} {r['dist_type']:<11} {'-':>7}  {r['note']}")
+            continue
+        cov = r['coverage']
+        print(f"  {name:<22} {r['dist_type']:<11} {r['n_origins']:>7} "
+              f"{cov['50']:>7.1%} {cov['80']:>7.1%} {cov['90']:>7.1%} {r['pit_max_deviation']:>8.3f}")
+
+    for name, r in results.items():
+        if r['n_origins'] and r['worst_origin_coverage_90'] < 0.30:
+            worst_year = min(r['coverage_90_by_year'], key=r['coverage_90_by_year'].get)
+            print(f"  WARNING: {name} 90% coverage drops to "
+                  f"{r['coverage_90_by_year'][worst_year]:.0%} for {worst_year} origins (regime shift)")
+
     n_valid = sum(1 for r in results.values() if r.get('valid', False))
-    print(f"\n  Summary: {n_valid}/{len(results)} backtests passed")
+    print(f"\n  Summary: {n_valid}/{len(results)} backtests passed (pooled 90% coverage > 60%)")
 
     return results
 
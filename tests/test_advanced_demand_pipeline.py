@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the aligned indicator panel and cached analysis tasks in
+scripts/advanced_demand_analysis.py.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("statsmodels")
+
+from scripts.advanced_demand_analysis import (
+    AnalysisCache,
+    build_indicator_panel,
+    run_analysis_tasks,
+    run_demand_pipeline,
+    run_granger_causality,
+    subperiod_stability,
+)
+
+
+def _quarters(start_year, n):
+    years = [start_year + i // 4 for i in range(n)]
+    quarters = [i % 4 + 1 for i in range(n)]
+    return years, quarters
+
+
+@pytest.fixture
+def inputs():
+    """40 quarters of revenue/HRC plus indicators with different coverage"""
+    rng = np.random.RandomState(11)
+    years, quarters = _quarters(2015, 40)
+    hrc = 700 + np.cumsum(rng.randn(40) * 40)
+    activity = rng.randn(40)
+    revenue = 2 * hrc + 300 * activity + rng.randn(40) * 50
+
+    revenue_df = pd.DataFrame({'fiscal_year': years, 'fiscal_quarter': quarters, 'revenue': revenue})
+    steel_prices = {'HRC US': pd.DataFrame({'fiscal_year': years, 'fiscal_quarter': quarters,
+                                            'indicator_value': hrc})}
+    indicators = {
+        'Activity': pd.DataFrame({'fiscal_year': years, 'fiscal_quarter': quarters,
+                                  'indicator_value': activity + rng.randn(40) * 0.2}),
+        'Late Series': pd.DataFrame({'fiscal_year': years[8:], 'fiscal_quarter': quarters[8:],
+                                     'indicator_value': rng.randn(32)}),
+    }
+    return revenue_df, indicators, steel_prices
+
+
+def test_panel_alignment(inputs):
+    revenue_df, indicators, steel_prices = inputs
+    panel = build_indicator_panel(revenue_df, indicators, steel_prices)
+
+    assert len(panel) == 40
+    assert str(panel.index[0]) == '2015Q1'
+    assert panel['Late Series'].isna().sum() == 8
+    assert panel.attrs['indicators'] == ['Activity', 'Late Series']
+    # Residual is orthogonal to HRC
+    assert abs(np.corrcoef(panel['revenue_residual'], panel['hrc_price'])[0, 1]) < 1e-10
+
+    assert build_indicator_panel(revenue_df, indicators, {}).empty
+
+
+def test_panel_disk_cache(inputs, tmp_path):
+    revenue_df, indicators, steel_prices = inputs
+    first = build_indicator_panel(revenue_df, indicators, steel_prices, cache_dir=tmp_path)
+    files = list(tmp_path.glob('indicator_panel_*.parquet'))
+    assert len(files) == 1
+
+    second = build_indicator_panel(revenue_df, indicators, steel_prices, cache_dir=tmp_path)
+    pd.testing.assert_frame_equal(first, second)
+
+    # Changed inputs replace the stale panel
+    changed = dict(indicators)
+    changed['Activity'] = changed['Activity'].assign(indicator_value=lambda d: d['indicator_value'] * 2)
+    build_indicator_panel(revenue_df, changed, steel_prices, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob('indicator_panel_*.parquet'))) == 1
+    assert list(tmp_path.glob('indicator_panel_*.parquet')) != files
+
+
+def test_adding_indicator_only_runs_new_tasks(inputs, tmp_path):
+    revenue_df, indicators, steel_prices = inputs
+    cache = AnalysisCache(tmp_path / 'results.pkl')
+    one = {'Activity': indicators['Activity']}
+
+    panel = build_indicator_panel(revenue_df, one, steel_prices)
+    first = run_demand_pipeline(panel, cache=cache, n_workers=1)
+    assert cache.stats()['misses'] == 4   # granger, subperiod, rolling, var
+    cache.save()
+
+    reloaded = AnalysisCache(tmp_path / 'results.pkl')
+    panel = build_indicator_panel(revenue_df, indicators, steel_prices)
+    second = run_demand_pipeline(panel, cache=reloaded, n_workers=1)
+    assert reloaded.stats()['hits'] == 4
+    assert reloaded.stats()['misses'] == 3
+
+    pd.testing.assert_frame_equal(
+        first['granger'], second['granger'][second['granger']['indicator'] == 'Activity'])
+    assert set(second['rolling']) == {'Activity', 'Late Series'}
+
+
+def test_cached_none_result_is_a_hit(inputs):
+    revenue_df = inputs[0]
+    # Too short for the rolling window, so the task result is None
+    task = ('rolling', 'Short', revenue_df.head(6), {'window': 12})
+    cache = AnalysisCache()
+    assert run_analysis_tasks([task], cache=cache, n_workers=1) == [None]
+    assert run_analysis_tasks([task], cache=cache, n_workers=1) == [None]
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+
+def test_pool_matches_serial(inputs):
+    revenue_df, indicators, steel_prices = inputs
+    serial = run_granger_causality(revenue_df, indicators, steel_prices, n_workers=1)
+    pooled = run_granger_causality(revenue_df, indicators, steel_prices, n_workers=2)
+    assert len(serial) > 0
+    pd.testing.assert_frame_equal(serial, pooled)
+
+    detail, flags = subperiod_stability(revenue_df, indicators, steel_prices, n_workers=2)
+    assert set(detail['period']) == {'Pre-COVID', 'Post-COVID', 'Full'}
+    assert set(flags['indicator']) == {'Activity', 'Late Series'}
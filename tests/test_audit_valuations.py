@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared audit valuations in audit-verification/audit_valuations.py.
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'audit-verification'))
+
+from audit_valuations import AuditValuations, comparison_points
+from model_audit import ModelAuditor
+from price_volume_model import (
+    ScenarioType,
+    ValuationPoint,
+    calculate_probability_weighted_valuation,
+    compare_scenarios,
+    get_scenario_presets,
+)
+
+
+@pytest.fixture(scope='module')
+def valuations():
+    """All preset runs, valued serially once for the module"""
+    valuations = AuditValuations(n_workers=1)
+    valuations.declare(comparison_points())
+    valuations.compute()
+    return valuations
+
+
+def test_identical_points_valued_once():
+    valuations = AuditValuations(n_workers=1)
+    base = get_scenario_presets()[ScenarioType.BASE_CASE]
+    valuations.declare([
+        ValuationPoint(label='a', scenario=base),
+        ValuationPoint(label='b', scenario=base),
+        ValuationPoint(label='c', scenario=base, execution_factor=0.5),
+    ])
+    valuations.compute()
+    assert valuations.stats == {'declared': 3, 'computed': 2, 'reused': 0}
+
+    assert valuations.preset(ScenarioType.BASE_CASE) is valuations.analysis(base, 1.0)
+    valuations.compute()
+    assert valuations.stats == {'declared': 3, 'computed': 2, 'reused': 2}
+
+
+def test_shared_analyses_match_direct_runs(valuations):
+    analyses = valuations.preset_analyses(comparison_points())
+    computed = valuations.stats['computed']
+
+    pd.testing.assert_frame_equal(compare_scenarios(analyses=analyses), compare_scenarios())
+    shared = calculate_probability_weighted_valuation(analyses=analyses)
+    direct = calculate_probability_weighted_valuation()
+    assert shared['weighted_nippon_value_per_share'] == pytest.approx(direct['weighted_nippon_value_per_share'])
+    assert shared['weighted_uss_value_per_share'] == pytest.approx(direct['weighted_uss_value_per_share'])
+    assert valuations.stats['computed'] == computed
+
+
+def test_model_audit_reuses_declared_runs(valuations):
+    computed = valuations.stats['computed']
+    auditor = ModelAuditor(valuations)
+    with contextlib.redirect_stdout(io.StringIO()):
+        auditor.run_all_tests()
+
+    # Only the volume sensitivity run is new; the presets were already valued
+    assert valuations.stats['computed'] == computed + 1
+    ranking = [t for t in auditor.tests if t.test_id == 'LC-15']
+    assert len(ranking) == 1 and ranking[0].passed is not None
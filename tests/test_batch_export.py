@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch (review pack) export in scripts/export_model.py.
+"""
+
+import sys
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.export_model import (
+    BATCH_INDEX_SHEET,
+    BatchModelExporter,
+    ModelExporter,
+    preset_calibration_points,
+    scenario_grid,
+)
+from price_volume_model import PriceVolumeModel, ScenarioType, get_scenario_presets
+
+
+@pytest.fixture(autouse=True)
+def offline_peers(monkeypatch):
+    monkeypatch.setattr(ModelExporter, '_load_peer_analysis_data', lambda self: {'error': 'offline'})
+
+
+@pytest.fixture(scope="module")
+def base():
+    return get_scenario_presets()[ScenarioType.BASE_CASE]
+
+
+def test_scenario_grid(base):
+    grid = scenario_grid(base, uss_wacc=[0.09, 0.10], hrc_us_factor=[0.9, 1.1])
+    assert len(grid) == 4
+    assert grid[1].name == f"{base.name} (uss_wacc=0.09, hrc_us_factor=1.1)"
+    assert grid[3].uss_wacc == 0.10
+    assert grid[3].price_scenario.hrc_us_factor == 1.1
+
+    points = preset_calibration_points(['fixed', None], [ScenarioType.BASE_CASE])
+    assert [p.group for p in points] == ['fixed', 'default']
+    assert points[0].scenario.name == points[0].label == f"{base.name} [fixed]"
+
+
+def test_workbook_matches_single_exports(base):
+    grid = scenario_grid(base, uss_wacc=[0.09, 0.10])
+    out = BatchModelExporter(grid, n_workers=1).export_workbook()
+    wb = load_workbook(out)
+
+    assert wb.sheetnames[0] == BATCH_INDEX_SHEET
+    assert wb.sheetnames[-1] == 'Multi-Year Peer Analysis'
+    assert '02 DCF USS' in wb.sheetnames and '02 Flat-Rolled' in wb.sheetnames
+    index = wb[BATCH_INDEX_SHEET]
+    assert index['B3'].value == grid[1].name
+
+    single = load_workbook(ModelExporter(grid[1]).export_single_scenario())
+    for title, batch_title in [('DCF Valuation - USS', '02 DCF USS'), ('Cover', '02 Summary')]:
+        expected, actual = single[title], wb[batch_title]
+        assert actual.merged_cells.ranges == expected.merged_cells.ranges
+        assert actual.column_dimensions['A'].width == expected.column_dimensions['A'].width
+        for row in expected.iter_rows():
+            for cell in row:
+                if cell.coordinate == 'B4':   # export timestamp
+                    continue
+                other = actual[cell.coordinate]
+                assert other.value == cell.value
+                assert other.style == cell.style
+                assert other.number_format == cell.number_format
+                assert repr(other.font) == repr(cell.font)
+                assert repr(other.fill) == repr(cell.fill)
+    expected_price = PriceVolumeModel(grid[1]).run_full_analysis()['val_uss']['share_price']
+    assert index['D3'].value == pytest.approx(expected_price)
+
+
+def test_zip_pack_in_input_order(base):
+    grid = scenario_grid(base, exit_multiple=[4.5, 6.0, 7.5])
+    seen = []
+    out = BatchModelExporter(grid, n_workers=2).export_zip(
+        progress_callback=lambda done, total, label: seen.append((done, total)))
+
+    archive = zipfile.ZipFile(out)
+    names = archive.namelist()
+    assert names[-1] == 'batch_index.csv'
+    assert len(names) == 4 and names[0].startswith('01_Base_Case')
+    assert seen == [(1, 3), (2, 3), (3, 3)]
+
+    index = pd.read_csv(BytesIO(archive.read('batch_index.csv')))
+    assert list(index['Scenario']) == [s.name for s in grid]
+    assert index['USS - No Sale ($/sh)'].is_monotonic_increasing
+
+    wb = load_workbook(BytesIO(archive.read(names[2])))
+    assert wb['Cover']['B5'].value == grid[2].name
+    assert 'offline' in wb['Multi-Year Peer Analysis']['A5'].value
@@ -10,6 +10,7 @@ Run with: pytest tests/test_bloomberg_integration.py -v
 """
 
 import sys
+import numpy as np
 import pytest
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -526,6 +527,84 @@ class TestRealizationMapper:
 # SCENARIO CALIBRATION MODE TESTS
 # =============================================================================
 
+class TestRealizationBatch:
+    """Tests for the array / DataFrame realization API"""
+
+    BENCHMARKS = {'hrc_us': 916, 'crc_us': 1127, 'coated_us': 1263, 'hrc_eu': 717, 'octg': 2750}
+
+    def _history(self):
+        import pandas as pd
+        rng = np.random.RandomState(3)
+        scale = 1 + 0.2 * rng.randn(12, 1)
+        base = np.array([self.BENCHMARKS[k] for k in ('hrc_us', 'crc_us', 'coated_us', 'hrc_eu', 'octg')])
+        index = pd.date_range('2021-03-31', periods=12, freq='QE')
+        return pd.DataFrame(base * scale, index=index,
+                            columns=['hrc_us', 'crc_us', 'coated_us', 'hrc_eu', 'octg'])
+
+    def test_batch_matches_dict_rows(self):
+        """Each row of the batch result equals the dict API"""
+        from bloomberg import estimate_segment_realizations, estimate_segment_realizations_batch
+
+        history = self._history()
+        batch = estimate_segment_realizations_batch(history)
+        assert list(batch.index) == list(history.index)
+        for date, row in history.iterrows():
+            expected = estimate_segment_realizations(row.to_dict())
+            for segment, value in expected.items():
+                assert batch.loc[date, segment] == pytest.approx(value, rel=1e-12)
+
+        array = estimate_segment_realizations_batch(history.to_numpy())
+        np.testing.assert_allclose(array, batch.to_numpy())
+
+    def test_missing_benchmark_columns_count_as_zero(self):
+        import pandas as pd
+        from bloomberg import estimate_segment_realizations, estimate_segment_realizations_batch
+
+        partial = {'hrc_us': 900, 'octg': 2500}
+        batch = estimate_segment_realizations_batch(pd.DataFrame([partial]))
+        expected = estimate_segment_realizations(partial)
+        assert batch.iloc[0].to_dict() == pytest.approx(expected)
+
+    def test_forecast_batch_matches_dict(self):
+        import pandas as pd
+        from bloomberg import forecast_realizations_with_change, forecast_realizations_with_change_batch
+
+        changes = pd.DataFrame({'hrc_us': [0.1, -0.2, 0.0], 'octg': [0.0, 0.05, -0.3]})
+        batch = forecast_realizations_with_change_batch(self.BENCHMARKS, changes)
+        for i, row in changes.iterrows():
+            expected = forecast_realizations_with_change(self.BENCHMARKS, row.to_dict())
+            assert batch.iloc[i].to_dict() == pytest.approx(expected)
+
+        array = forecast_realizations_with_change_batch(self.BENCHMARKS, np.zeros((2, 5)))
+        assert array.shape == (2, 4)
+
+    def test_validate_history_metrics(self):
+        from bloomberg import estimate_segment_realizations_batch, validate_realization_factors
+
+        history = self._history()
+        actual = estimate_segment_realizations_batch(history) * 1.02
+        actual.iloc[:4, actual.columns.get_loc('tubular')] = np.nan
+
+        validation = validate_realization_factors(history, actual)
+        mini = validation['mini_mill']
+        assert mini['n_periods'] == 12
+        assert mini['error_pct'] == pytest.approx(100 * (1 / 1.02 - 1))
+        assert mini['mape'] == pytest.approx(abs(mini['error_pct']))
+        assert mini['within_5pct_share'] == 1.0
+        assert validation['tubular']['n_periods'] == 8
+
+    def test_validate_history_against_quarterly_data(self, bloomberg_service):
+        from bloomberg import validate_realization_history
+
+        if bloomberg_service is None or not bloomberg_service.is_available():
+            pytest.skip("Bloomberg data not available")
+        validation = validate_realization_history(service=bloomberg_service)
+        if validation is None:
+            pytest.skip("Quarterly realized prices not available")
+        assert validation['mini_mill']['n_periods'] > 0
+        assert validation['flat_rolled']['n_periods'] == 0
+
+
 class TestScenarioCalibrationModes:
     """Tests for multi-mode scenario calibration"""
 
@@ -762,6 +841,69 @@ class TestScenarioCalibrationIntegration:
         assert fixed_ws.price_scenario.hrc_us_factor == bloomberg_ws.price_scenario.hrc_us_factor
 
 
+class TestLiveScenarioFactors:
+    """Tests for scenario factors recalculated from current Bloomberg data"""
+
+    def test_percentile_factor_table_matches_per_series(self):
+        """Padded single-pass percentiles equal per-series np.percentile"""
+        from bloomberg.scenario_calibrator import percentile_factor_table
+
+        rng = np.random.RandomState(0)
+        histories = {'hrc_us': rng.rand(50) * 1000, 'octg': rng.rand(80) * 3000}
+        baseline = {'hrc_us': 800.0, 'octg': 2500.0}
+        table = percentile_factor_table(histories, baseline, [10, 50, 90])
+
+        for col, field in enumerate(histories):
+            expected = np.percentile(histories[field], [10, 50, 90]) / baseline[field]
+            np.testing.assert_allclose(table[:, col], expected)
+
+    def test_factor_sets_cached_by_data_version(self, bloomberg_service):
+        """All modes come from one cached computation per data version"""
+        if bloomberg_service is None:
+            pytest.skip("Bloomberg data not available")
+        from bloomberg import (
+            get_calibrated_factor_sets, ScenarioCalibrationMode, BLOOMBERG_FACTORS, FIXED_FACTORS
+        )
+
+        first = get_calibrated_factor_sets()
+        assert get_calibrated_factor_sets() is first
+        assert set(first) == set(ScenarioCalibrationMode)
+
+        bloomberg = first[ScenarioCalibrationMode.BLOOMBERG]
+        assert bloomberg['base_case'] is BLOOMBERG_FACTORS['base_case']
+        assert first[ScenarioCalibrationMode.FIXED] is FIXED_FACTORS
+
+        stats = bloomberg_service.get_price_stats('hrc_us')
+        baseline = bloomberg_service.get_annual_average_prices(2023)['hrc_us']
+        assert bloomberg['downside'].hrc_us == pytest.approx(stats.percentile_25 / baseline)
+        assert bloomberg['downside'].coated_us == bloomberg['downside'].crc_us
+
+    def test_hybrid_upside_capped(self, bloomberg_service):
+        """Hybrid upside never exceeds the static caps"""
+        if bloomberg_service is None:
+            pytest.skip("Bloomberg data not available")
+        from bloomberg import get_calibrated_factor_sets, ScenarioCalibrationMode, HYBRID_FACTORS
+
+        hybrid = get_calibrated_factor_sets()[ScenarioCalibrationMode.HYBRID]
+        for name in ('modest_upside', 'optimistic'):
+            assert hybrid[name].octg <= HYBRID_FACTORS[name].octg
+            assert hybrid[name].hrc_us <= HYBRID_FACTORS[name].hrc_us
+
+    def test_presets_with_live_factors(self, bloomberg_service):
+        """get_scenario_presets(live_factors=True) uses the recalculated factors"""
+        from price_volume_model import get_scenario_presets, ScenarioType, SCENARIO_CALIBRATION_AVAILABLE
+        if bloomberg_service is None or not SCENARIO_CALIBRATION_AVAILABLE:
+            pytest.skip("Scenario calibration not available")
+        from bloomberg import get_calibrated_factor_sets, ScenarioCalibrationMode
+
+        presets = get_scenario_presets(calibration_mode='bloomberg', live_factors=True)
+        live = get_calibrated_factor_sets()[ScenarioCalibrationMode.BLOOMBERG]
+        downside = presets[ScenarioType.DOWNSIDE]
+        assert downside.price_scenario.hrc_us_factor == live['downside'].hrc_us
+        # Non-price fields carried over unchanged
+        assert downside.uss_wacc == get_scenario_presets()[ScenarioType.DOWNSIDE].uss_wacc
+
+
 # =============================================================================
 # PROBABILITY DISTRIBUTION TESTS
 # =============================================================================
@@ -0,0 +1,87 @@
+"""Tests for the shared correlated sampler used by MonteCarloEngine and validate_distributions."""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy import stats
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from monte_carlo.correlated_sampler import CorrelatedSampler
+from monte_carlo.monte_carlo_engine import MonteCarloEngine, DISTRIBUTIONS_CONFIG_PATH
+
+
+ALL_FAMILIES = {
+    'variables': {
+        'n': {'distribution_type': 'normal', 'parameters': {'mean': 1.0, 'std': 0.1}},
+        'ln': {'distribution_type': 'lognormal', 'parameters': {'mean': 0.0, 'std': 0.2}},
+        'tri': {'distribution_type': 'triangular', 'parameters': {'min': 0.5, 'mode': 0.8, 'max': 1.5}},
+        'b': {'distribution_type': 'beta', 'parameters': {'alpha': 8, 'beta': 3, 'min': 0.4, 'max': 1.0}},
+        'u': {'distribution_type': 'uniform', 'parameters': {'min': 2.0, 'max': 4.0}},
+        'tn': {'distribution_type': 'truncnorm',
+               'parameters': {'mean': 1.0, 'std': 0.5, 'min': 0.8, 'max': 2.0}},
+    },
+    'correlations': {'n': {'ln': 0.6}, 'tri': {'b': -0.4}},
+}
+
+
+@pytest.fixture(scope='module')
+def sampler():
+    return CorrelatedSampler.from_config(ALL_FAMILIES)
+
+
+def test_marginals_match_scipy(sampler):
+    samples = sampler.sample(200_000, np.random.RandomState(0))
+    expected = {
+        'n': stats.norm(1.0, 0.1),
+        'ln': stats.lognorm(s=0.2),
+        'tri': stats.triang(0.3, loc=0.5, scale=1.0),
+        'b': stats.beta(8, 3, loc=0.4, scale=0.6),
+        'u': stats.uniform(2.0, 2.0),
+        'tn': stats.truncnorm(-0.4, 2.0, loc=1.0, scale=0.5),
+    }
+    for name, dist in expected.items():
+        assert stats.kstest(samples[name], dist.cdf).statistic < 0.01, name
+
+
+def test_truncnorm_respects_bounds(sampler):
+    tn = sampler.sample(50_000, np.random.RandomState(1))['tn']
+    assert tn.min() >= 0.8 and tn.max() <= 2.0
+    assert tn.mean() == pytest.approx(stats.truncnorm(-0.4, 2.0, loc=1.0, scale=0.5).mean(), abs=0.005)
+
+
+def test_rank_correlations_follow_matrix(sampler):
+    samples = sampler.sample(100_000, np.random.RandomState(2))
+    assert np.corrcoef(np.log(samples['ln']), samples['n'])[0, 1] == pytest.approx(0.6, abs=0.01)
+    assert stats.spearmanr(samples['tri'], samples['b'])[0] < -0.3
+    assert abs(np.corrcoef(samples['u'], samples['n'])[0, 1]) < 0.02
+
+
+def test_chunks_stream_same_random_draws(sampler):
+    whole = sampler.sample(30_000, np.random.RandomState(3))
+    chunks = list(sampler.sample_chunks(30_000, chunk_size=7_000, rng=np.random.RandomState(3)))
+    assert [len(c) for c in chunks] == [7_000] * 4 + [2_000]
+    # Random-mode chunks consume the stream row-block by row-block
+    assert np.allclose(chunks[0].values, sampler.sample(7_000, np.random.RandomState(3)).values)
+    assert abs(np.mean([c['n'].mean() for c in chunks]) - whole['n'].mean()) < 0.01
+
+
+def test_engine_and_validator_share_the_kernel():
+    with open(DISTRIBUTIONS_CONFIG_PATH) as f:
+        config = json.load(f)
+    engine = MonteCarloEngine(n_simulations=5_000, use_lhs=False)
+    assert engine.sampler is engine.sampler  # compiled once
+    corr, names = engine._build_correlation_matrix()
+    assert names == list(engine.variables)
+    assert np.allclose(np.diag(corr), 1.0)
+
+    samples = engine._generate_correlated_samples()
+    assert list(samples.columns) == names
+    assert len(samples) == 5_000
+    # The validator compiles the config into the same kernel
+    config_samples = CorrelatedSampler.from_config(config).sample(5_000, np.random.RandomState(4))
+    assert list(config_samples.columns) == list(config['variables'])
+    assert np.isfinite(config_samples.values).all()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for correlation matrix construction, nearest-correlation repair
+and the compiled factor cache.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from monte_carlo.correlation import (
+    build_correlation_matrix,
+    nearest_correlation,
+    compile_correlation,
+    clear_correlation_cache,
+    get_correlation_cache_stats,
+)
+
+
+NAMES = ['a', 'b', 'c']
+INVALID = {'a': {'b': 0.95, 'c': 0.9}, 'b': {'c': 0.1}}
+
+
+def _loop_build(names, correlations):
+    """Reference double loop used before vectorization"""
+    n = len(names)
+    m = np.eye(n)
+    for i, v1 in enumerate(names):
+        for v2, rho in correlations.get(v1, {}).items():
+            if v2 in names:
+                j = names.index(v2)
+                m[i, j] = rho
+                m[j, i] = rho
+    return m
+
+
+def test_vectorized_build_matches_loop():
+    correlations = {'a': {'b': 0.5, 'z': 0.3}, 'b': {'a': 0.4, 'c': 0.2}, 'c': {'a': -0.1}}
+    np.testing.assert_array_equal(build_correlation_matrix(NAMES, correlations),
+                                  _loop_build(NAMES, correlations))
+
+
+def test_valid_matrix_unchanged():
+    raw = build_correlation_matrix(NAMES, {'a': {'b': 0.5}, 'b': {'c': 0.3}})
+    repaired, info = nearest_correlation(raw)
+    np.testing.assert_array_equal(repaired, raw)
+    assert info['iterations'] == 0
+
+
+def test_higham_repair_is_valid_and_closer_than_diagonal_shift():
+    raw = build_correlation_matrix(NAMES, INVALID)
+    assert np.linalg.eigvalsh(raw)[0] < 0
+
+    repaired, info = nearest_correlation(raw)
+    assert info['converged']
+    assert np.linalg.eigvalsh(repaired)[0] > 0
+    np.testing.assert_allclose(np.diag(repaired), 1.0)
+    np.testing.assert_allclose(repaired, repaired.T)
+
+    # Old approach: shift the diagonal then renormalize
+    min_eig = np.linalg.eigvalsh(raw)[0]
+    shifted = raw + (-min_eig + 1e-6) * np.eye(3)
+    d = np.sqrt(np.diag(shifted))
+    shifted = shifted / np.outer(d, d)
+    assert np.linalg.norm(repaired - raw) < np.linalg.norm(shifted - raw)
+
+
+def test_compile_reports_repair():
+    clear_correlation_cache()
+    factor = compile_correlation(NAMES, INVALID)
+    assert not factor.is_psd
+    report = factor.repair
+    assert report['repaired']
+    assert report['frobenius_change'] > 0
+    assert report['min_eigenvalue_before'] < 0 < report['min_eigenvalue_after']
+    assert set(report['worst_pair']) <= set(NAMES)
+    np.testing.assert_allclose(factor.cholesky @ factor.cholesky.T, factor.matrix, atol=1e-10)
+
+
+def test_compile_cache_hit_and_read_only():
+    clear_correlation_cache()
+    first = compile_correlation(NAMES, INVALID)
+    second = compile_correlation(list(NAMES), {k: dict(v) for k, v in INVALID.items()})
+    assert second is first
+    assert get_correlation_cache_stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+    with pytest.raises(ValueError):
+        first.matrix[0, 1] = 0.0
+
+    compile_correlation(NAMES, {'a': {'b': 0.1}})
+    assert get_correlation_cache_stats()['misses'] == 2
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for rolling / EWMA / regime-conditional correlation calibration
+and incremental moment updates.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "market-data"))
+
+from bloomberg.correlation_calibrator import (
+    CorrelationCalibrator,
+    PairwiseMoments,
+    ewma_decay,
+)
+
+
+@pytest.fixture
+def panel():
+    """Monthly panel with correlated columns and a late-starting series"""
+    rng = np.random.RandomState(7)
+    dates = pd.date_range('2012-01-31', periods=120, freq='ME')
+    z = rng.randn(120, 3)
+    data = pd.DataFrame({
+        'a': z[:, 0],
+        'b': 0.8 * z[:, 0] + 0.6 * z[:, 1],
+        'c': z[:, 2],
+    }, index=dates)
+    data.loc[data.index < '2015-01-01', 'c'] = np.nan
+    return data
+
+
+def test_full_matches_pandas_pairwise(panel):
+    calibrator = CorrelationCalibrator(panel, min_obs=10)
+    expected = panel.corr(min_periods=10)
+    np.testing.assert_allclose(calibrator.matrix('full').values, expected.values, atol=1e-12)
+
+
+def test_ewma_matches_pandas(panel):
+    complete = panel[['a', 'b']]
+    calibrator = CorrelationCalibrator(complete, halflife=12, min_obs=10)
+    expected = complete.ewm(halflife=12).corr().loc[complete.index[-1]]
+    np.testing.assert_allclose(calibrator.matrix('ewma').values, expected.values, atol=1e-10)
+    assert ewma_decay(12) == pytest.approx(0.5 ** (1 / 12))
+
+
+def test_rolling_history_matches_pandas(panel):
+    calibrator = CorrelationCalibrator(panel[['a', 'b']], window=24, min_obs=10)
+    ends, history = calibrator.rolling_history()
+    expected = panel['a'].rolling(24).corr(panel['b']).dropna()
+    assert len(ends) == len(expected)
+    np.testing.assert_allclose(history[:, 0, 1], expected.values, atol=1e-10)
+    np.testing.assert_allclose(history[-1], calibrator.matrix('rolling').values, atol=1e-12)
+
+
+def test_incremental_update_matches_rebuild(panel):
+    head, tail = panel.iloc[:-12], panel.iloc[-12:]
+    calibrator = CorrelationCalibrator(head, window=24, min_obs=10)
+    for date, row in tail.iterrows():
+        calibrator.update(date, row.to_dict())
+
+    rebuilt = CorrelationCalibrator(panel, window=24, min_obs=10)
+    for method in ('full', 'rolling', 'ewma'):
+        np.testing.assert_allclose(calibrator.matrix(method).values,
+                                   rebuilt.matrix(method).values, atol=1e-10)
+
+    with pytest.raises(ValueError):
+        calibrator.update(panel.index[-1], {'a': 0.0})
+
+
+def test_regime_matrices_use_dates(panel):
+    calibrator = CorrelationCalibrator(panel, min_obs=10)
+    matrices = calibrator.regime_matrices('covid')
+    assert set(matrices) == {'pre_covid', 'post_covid'}
+    pre = panel[panel.index <= '2020-02-29']
+    np.testing.assert_allclose(matrices['pre_covid'].values, pre.corr(min_periods=10).values, atol=1e-12)
+    with pytest.raises(ValueError):
+        calibrator.matrix('regime')
+
+
+def test_moments_remove_requires_equal_weights():
+    moments = PairwiseMoments(2, decay=0.9)
+    moments.add(np.array([1.0, 2.0]))
+    with pytest.raises(ValueError):
+        moments.remove(np.array([1.0, 2.0]))
+
+
+def test_engine_correlations_format(panel):
+    renamed = panel.rename(columns={'a': 'hrc_us', 'b': 'crc_us', 'c': 'ust_10y'})
+    calibrator = CorrelationCalibrator(renamed, min_obs=10)
+    corr = calibrator.engine_correlations('full')
+    expected = calibrator.matrix('full').loc['hrc_us', 'crc_us']
+    assert corr['hrc_price_factor']['crc_price_factor'] == pytest.approx(expected, abs=1e-4)
+    assert corr['hrc_price_factor']['coated_price_factor'] == pytest.approx(expected, abs=1e-4)
+    # Same source series: left to the configured CRC/coated correlation
+    assert corr.get('crc_price_factor', {}).get('coated_price_factor') != 1.0
+    assert 'coated_price_factor' not in corr.get('crc_price_factor', {})
+    assert 'us_10yr' in corr['hrc_price_factor']
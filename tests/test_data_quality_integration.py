@@ -34,14 +34,14 @@ class TestSegmentDataNotDuplicated:
 
 
 class TestDistributionsConfig:
-    """Phase 2: distributions_config.json should have 33 variables."""
+    """Phase 2: distributions_config.json should have 36 variables."""
 
     def test_variable_count(self):
         path = BASE_DIR / 'monte_carlo' / 'distributions_config.json'
         with open(path) as f:
             config = json.load(f)
-        assert len(config['variables']) == 33
-        assert config['metadata']['n_variables'] == 33
+        assert len(config['variables']) == 36
+        assert config['metadata']['n_variables'] == 36
 
     def test_realization_factors_present(self):
         path = BASE_DIR / 'monte_carlo' / 'distributions_config.json'
@@ -70,7 +70,7 @@ class TestCalibrationQualityReport:
     def test_report_categorizes_all_variables(self):
         from scripts.run_monte_carlo_analysis import report_calibration_quality
         categories, score = report_calibration_quality()
-        assert len(categories) == 33, f"Expected 33 categorized variables, got {len(categories)}"
+        assert len(categories) == 36, f"Expected 36 categorized variables, got {len(categories)}"
 
     def test_quality_score_bounded(self):
         from scripts.run_monte_carlo_analysis import report_calibration_quality
@@ -115,12 +115,12 @@ class TestDemandRankingsUsePartialR:
 
 
 class TestMCEngineVariableCount:
-    """Phase 2: MC engine should have 33 variables (29 + 4 realization factors)."""
+    """Phase 2: MC engine should have 36 variables (29 + 4 realization factors + 3 synergy drivers)."""
 
-    def test_engine_has_33_variables(self):
+    def test_engine_has_36_variables(self):
         from monte_carlo import MonteCarloEngine
         mc = MonteCarloEngine(n_simulations=10, use_config_file=True)
-        assert len(mc.variables) == 33, f"Expected 33 MC variables, got {len(mc.variables)}"
+        assert len(mc.variables) == 36, f"Expected 36 MC variables, got {len(mc.variables)}"
 
 
 class TestReferences:
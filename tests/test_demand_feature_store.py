@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the quarter-indexed demand feature store and matrix lag
+correlations in scripts/demand_driver_analysis.py.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import scripts.demand_driver_analysis as dda
+from scripts.demand_driver_analysis import (
+    build_feature_store,
+    clear_feature_store_cache,
+    decompose_price_volume,
+    get_feature_store,
+    lag_correlations,
+    multivariate_model,
+)
+
+
+def write_monthly(path, start, n, values):
+    dates = pd.date_range(start, periods=n, freq='MS')
+    pd.DataFrame({'date': dates.strftime('%Y-%m-%d'), 'value': values}).to_csv(path, index=False)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Revenue for 2015-2024 plus HRC and three indicators with different coverage"""
+    rng = np.random.RandomState(5)
+    data_dir, price_dir = tmp_path / 'data', tmp_path / 'processed'
+    data_dir.mkdir()
+    price_dir.mkdir()
+
+    quarters = pd.period_range('2015Q1', '2024Q4', freq='Q')
+    hrc = 700 + np.cumsum(rng.randn(len(quarters)) * 40)
+    pmi = 50 + rng.randn(len(quarters) + 8) * 3
+    revenue = 4 * hrc + 60 * pmi[8:] + rng.randn(len(quarters)) * 100
+    pd.DataFrame({
+        'datadate': quarters.end_time.strftime('%Y-%m-%d'),
+        'fiscal_year': quarters.year, 'fiscal_quarter': quarters.quarter,
+        'revenue': revenue, 'ebitda': revenue * 0.1 + rng.randn(len(quarters)) * 20,
+    }).to_csv(data_dir / 'uss_quarterly_revenue.csv', index=False)
+
+    write_monthly(price_dir / 'hrc_us_spot.csv', '2013-01-01', 144, np.repeat(np.r_[hrc[:8], hrc], 3)[:144])
+    # Starts two years before revenue, so lags reach back past 2015
+    write_monthly(price_dir / 'ism_pmi.csv', '2013-01-01', 144, np.repeat(pmi, 3))
+    # Only the last eight quarters: too short once lagged
+    write_monthly(price_dir / 'rig_count.csv', '2023-01-01', 24, rng.uniform(400, 800, 24))
+    write_monthly(price_dir / 'housing_starts.csv', '2015-01-01', 120, rng.uniform(1000, 1600, 120))
+    clear_feature_store_cache()
+    yield data_dir, price_dir
+    clear_feature_store_cache()
+
+
+def test_lag_correlations_match_scalar(sources):
+    data_dir, price_dir = sources
+    store = build_feature_store(data_dir, price_dir, cache_dir=None)
+    assert store.indicators == ['Housing Starts', 'ISM PMI', 'Rig Count']
+    assert store.steel_prices == ['HRC US']
+
+    result = lag_correlations(store).set_index(['indicator', 'lag_quarters'])
+    revenue = store.revenue_frame()
+    for name in store.indicators:
+        indicator = dda.load_indicator(price_dir, dda.INDICATORS[name]['file'])
+        q = dda.aggregate_to_quarterly(indicator)
+        for lag in range(5):
+            shifted = q.assign(quarter_index=q['fiscal_year'] * 4 + q['fiscal_quarter'] - 1 + lag)
+            merged = revenue.assign(quarter_index=revenue['fiscal_year'] * 4 + revenue['fiscal_quarter'] - 1)
+            merged = merged.merge(shifted[['quarter_index', 'indicator_value']], on='quarter_index')
+            if len(merged) < 8:
+                assert (name, lag) not in result.index
+                continue
+            row = result.loc[(name, lag)]
+            r, p = stats.pearsonr(merged['indicator_value'], merged['revenue'])
+            assert row['n'] == len(merged)
+            assert row['r_revenue'] == pytest.approx(r)
+            assert row['p_revenue'] == pytest.approx(p)
+            assert row['rho_revenue'] == pytest.approx(stats.spearmanr(merged['indicator_value'],
+                                                                       merged['revenue'])[0])
+            assert row['r_ebitda'] == pytest.approx(stats.pearsonr(merged['indicator_value'],
+                                                                   merged['ebitda'])[0])
+    assert ('Rig Count', 0) in result.index and ('Rig Count', 1) not in result.index
+
+
+def test_decomposition_and_multivariate(sources):
+    data_dir, price_dir = sources
+    store = build_feature_store(data_dir, price_dir, cache_dir=None)
+    decomp = decompose_price_volume(store).set_index('indicator')
+
+    base = store.frame[store.frame['revenue'].notna()]
+    slope, intercept, *_ = stats.linregress(base['HRC US'], base['revenue'])
+    residual = base['revenue'] - (slope * base['HRC US'] + intercept)
+    assert decomp.loc['ISM PMI', 'r_partial'] == pytest.approx(stats.pearsonr(base['ISM PMI'], residual)[0])
+    assert decomp.loc['ISM PMI', 'r_partial'] > 0.5
+    assert decomp.loc['Rig Count', 'n'] == 8
+
+    mv = multivariate_model(store, top_n=2)
+    assert mv['features'] == ['hrc_price', 'Housing Starts', 'ISM PMI']
+    assert mv['n'] == 40 and mv['r2_full'] > mv['r2_price_only']
+
+
+def test_store_cached_by_source_hash(sources, tmp_path, monkeypatch):
+    data_dir, price_dir = sources
+    cache_dir = tmp_path / 'cache'
+    store = get_feature_store(data_dir, price_dir, cache_dir=cache_dir)
+    lags = store.lag_correlations()
+    assert get_feature_store(data_dir, price_dir, cache_dir=cache_dir) is store
+    assert len(list(cache_dir.glob('feature_store_*.parquet'))) == 1
+    assert len(list(cache_dir.glob('lag_correlations_*.parquet'))) == 1
+
+    # A new process reads the parquet cache instead of the CSVs
+    clear_feature_store_cache()
+    monkeypatch.setattr(dda, 'load_all_indicators', lambda price_dir: pytest.fail("should come from the cache"))
+    monkeypatch.setattr(dda, 'lag_correlations', lambda store: pytest.fail("should come from the cache"))
+    cached = get_feature_store(data_dir, price_dir, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(cached.frame, store.frame, check_freq=False)
+    pd.testing.assert_frame_equal(cached.lag_correlations(), lags)
+    monkeypatch.undo()
+
+    # Changing a source file is a new store
+    write_monthly(price_dir / 'rig_count.csv', '2020-01-01', 42, np.linspace(300, 900, 42))
+    fresh = get_feature_store(data_dir, price_dir, cache_dir=cache_dir)
+    assert fresh.source_hash != store.source_hash
+    assert fresh.frame['Rig Count'].notna().sum() == 14
+    assert len(list(cache_dir.glob('feature_store_*.parquet'))) == 1
+
+
+def test_lag_settings_keep_separate_caches(sources, tmp_path):
+    data_dir, price_dir = sources
+    cache_dir = tmp_path / 'cache'
+    for max_lag in (2, 4, 2):
+        store = build_feature_store(data_dir, price_dir, max_lag=max_lag, cache_dir=cache_dir)
+        store.lag_correlations()
+    assert sorted(p.name.split('_')[-2] for p in cache_dir.glob('feature_store_*.parquet')) == ['L2', 'L4']
+    assert len(list(cache_dir.glob('lag_correlations_*.parquet'))) == 2
@@ -0,0 +1,106 @@
+"""Tests for batch fitting, fit caching and analytic goodness-of-fit in distribution_fitter."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy import stats
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from monte_carlo.distribution_fitter import (
+    DistributionFitter, FitCache, series_hash, anderson_darling_statistic,
+)
+
+
+@pytest.fixture(scope='module')
+def series():
+    rng = np.random.default_rng(7)
+    return {
+        'prices': rng.lognormal(0.0, 0.3, 400),
+        'rates': rng.normal(4.0, 0.5, 300),
+    }
+
+
+def test_cache_key_tracks_data_and_cutoff(series):
+    data = series['rates']
+    assert series_hash(data, '2023-12-18') == series_hash(data.copy(), '2023-12-18')
+    assert series_hash(data, '2023-12-18') != series_hash(data, '2024-06-30')
+    changed = data.copy()
+    changed[-1] += 0.01
+    assert series_hash(changed, '2023-12-18') != series_hash(data, '2023-12-18')
+
+
+def test_disk_cache_refits_only_changed_series(series, tmp_path):
+    path = tmp_path / 'fits.json'
+    jobs = {name: (data, 'normal', None) for name, data in series.items()}
+
+    fitter = DistributionFitter(cache=FitCache(path), cutoff_date='2023-12-18')
+    first = fitter.fit_batch(jobs, n_workers=1)
+    fitter.cache.save()
+    assert fitter.cache.stats()['misses'] == 2
+
+    refreshed = dict(jobs, rates=(np.append(series['rates'], 4.2), 'normal', None))
+    fitter = DistributionFitter(cache=FitCache(path), cutoff_date='2023-12-18')
+    second = fitter.fit_batch(refreshed, n_workers=1)
+    assert fitter.cache.stats()['hits'] == 1
+    assert fitter.cache.stats()['misses'] == 1
+    assert second['prices'].parameters == first['prices'].parameters
+    assert second['rates'].n_observations == first['rates'].n_observations + 1
+
+
+def test_cached_results_are_isolated(series):
+    fitter = DistributionFitter()
+    # Default is a private in-memory cache per fitter
+    assert isinstance(fitter.cache, FitCache) and fitter.cache is not DistributionFitter().cache
+    first = fitter.fit_distribution(series['prices'], 'lognormal')
+    first.data_source = 'mutated.csv'
+    first.parameters['mean'] = 99.0
+    second = fitter.fit_distribution(series['prices'], 'lognormal')
+    assert second.data_source is None
+    assert second.parameters['mean'] != 99.0
+
+
+def test_pool_batch_matches_serial_selection(series):
+    candidates = ['normal', 'lognormal', 'triangular']
+    pooled = DistributionFitter(cache=None).select_best_distributions(series, candidates, n_workers=2)
+    for name, data in series.items():
+        serial = DistributionFitter(cache=None).select_best_distribution(data, candidates)
+        assert pooled[name].distribution_type == serial.distribution_type
+        assert pooled[name].parameters == pytest.approx(serial.parameters)
+    assert pooled['prices'].distribution_type == 'lognormal'
+
+
+@pytest.mark.filterwarnings('ignore::FutureWarning')
+def test_goodness_of_fit_is_analytic_and_deterministic(series):
+    fitter = DistributionFitter()
+    data = series['rates']
+    result = fitter.fit_distribution(data, 'normal')
+    gof = fitter.compute_goodness_of_fit(data, result)
+    assert gof == fitter.compute_goodness_of_fit(data, result)
+
+    frozen = stats.norm(result.parameters['mean'], result.parameters['std'])
+    assert gof['cvm_statistic'] == pytest.approx(stats.cramervonmises(data, frozen.cdf).statistic)
+    assert gof['ks_statistic'] == pytest.approx(stats.kstest(data, frozen.cdf).statistic)
+    # Same A^2 as scipy's closed form for the normal case
+    assert gof['anderson_darling_statistic'] == pytest.approx(
+        stats.anderson(data, dist='norm').statistic, rel=1e-6)
+
+
+@pytest.mark.parametrize('dist_type,bounds', [
+    ('triangular', None), ('beta', (2.0, 6.0)), ('uniform', None), ('truncnorm', None),
+])
+def test_goodness_of_fit_covers_bounded_families(series, dist_type, bounds):
+    fitter = DistributionFitter()
+    result = fitter.fit_distribution(series['rates'], dist_type, bounds)
+    gof = fitter.compute_goodness_of_fit(series['rates'], result)
+    assert np.isfinite(gof['anderson_darling_statistic'])
+    assert 0.0 <= gof['cvm_p_value'] <= 1.0
+
+
+def test_anderson_darling_flags_wrong_distribution(series):
+    data = series['prices']
+    good = anderson_darling_statistic(data, stats.lognorm(s=0.3).cdf)
+    bad = anderson_darling_statistic(data, stats.norm(0.0, 1.0).cdf)
+    assert good * 10 < bad
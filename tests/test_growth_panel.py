@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized growth panel behind the multi-year growth analysis
+in scripts/benchmark_data.py.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import scripts.benchmark_data as benchmark_data
+from scripts.benchmark_data import BenchmarkData, clear_growth_panel_cache
+
+TICKERS = ['NUE', 'STLD', 'CLF', 'BSL', 'CMC']
+METRICS = ['revenue', 'ebitda', 'net_income', 'capex']
+
+
+def write_fundamentals(path, seed):
+    rng = np.random.RandomState(seed)
+    rows = []
+    for ticker in TICKERS:
+        for year in range(2015, 2025):
+            if ticker == 'CMC' and year == 2019:
+                continue
+            rows.append({
+                'ticker': ticker, 'company_name': f"{ticker} Inc.",
+                'datadate': f"{year}-12-31", 'revenue': rng.lognormal(9, 0.3),
+                'ebitda': rng.normal(1000, 600), 'net_income': rng.normal(300, 400),
+                'capex': rng.lognormal(6, 0.3),
+            })
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+@pytest.fixture
+def benchmark(tmp_path, monkeypatch):
+    """BenchmarkData over a WRDS cache file in tmp_path; counts panel builds"""
+    wrds_path = tmp_path / 'peer_fundamentals.csv'
+    write_fundamentals(wrds_path, seed=0)
+    rng = np.random.RandomState(1)
+    uss = pd.DataFrame({'year': np.arange(1995, 2025)})
+    for metric in METRICS + ['operating_income']:
+        uss[metric] = rng.lognormal(8, 0.4, len(uss))
+
+    clear_growth_panel_cache()
+    monkeypatch.setattr(benchmark_data, 'WRDS_FUNDAMENTALS_PATH', wrds_path)
+    monkeypatch.setattr(BenchmarkData, '_get_uss_financial_data', lambda self: uss)
+    builds = []
+    build = BenchmarkData._build_growth_panel
+
+    def counted(self, version):
+        builds.append(version)
+        return build(self, version)
+
+    monkeypatch.setattr(BenchmarkData, '_build_growth_panel', counted)
+    yield BenchmarkData(), wrds_path, builds
+    clear_growth_panel_cache()
+
+
+def test_cagrs_match_scalar_calculation(benchmark):
+    bench, _, _ = benchmark
+    panel = bench.get_growth_panel()
+    wrds = bench._get_wrds_fundamentals().set_index(['ticker', 'year'])
+
+    assert panel.tickers == sorted(TICKERS) + ['X']
+    for ticker in ['NUE', 'CMC']:
+        r = panel.tickers.index(ticker)
+        for metric in ['ebitda', 'capex']:
+            m = panel.metric_pos(metric)
+            for start in range(2015, 2024):
+                for end in range(start + 1, 2025):
+                    if (ticker, start) in wrds.index and (ticker, end) in wrds.index:
+                        expected = BenchmarkData.calculate_cagr(
+                            wrds.loc[(ticker, start), metric], wrds.loc[(ticker, end), metric], end - start)
+                    else:
+                        expected = None
+                    actual = panel.window_cagr(start, end)[r, m]
+                    if expected is None:
+                        assert np.isnan(actual)
+                    else:
+                        assert actual == pytest.approx(expected)
+
+    stats = {(g.metric, g.period_years): g for g in bench.get_multiyear_growth_analysis(METRICS, [3, 5])}
+    revenue = wrds.xs(2024, level='year')['revenue'] / wrds.xs(2021, level='year')['revenue']
+    peer_cagrs = (revenue.drop('BSL') ** (1 / 3) - 1).dropna()
+    assert stats['revenue', 3].peer_count == len(peer_cagrs) == 4   # BSL excluded
+    assert stats['revenue', 3].peer_median == pytest.approx(peer_cagrs.median())
+    assert stats['revenue', 3].uss_percentile == pytest.approx(
+        (peer_cagrs < stats['revenue', 3].uss_cagr).mean() * 100)
+
+
+def test_volatility_and_drawdown(benchmark):
+    bench, _, _ = benchmark
+    panel = bench.get_growth_panel()
+    risk = bench.get_growth_risk_analysis(['capex', 'revenue'], 2016, 2024).set_index(['ticker', 'metric'])
+
+    series = bench._get_wrds_fundamentals().set_index(['ticker', 'year'])['capex'].loc['NUE']
+    window = series.loc[2016:2024]
+    assert risk.loc[('NUE', 'capex'), 'growth_volatility'] == pytest.approx(window.pct_change().std())
+    assert risk.loc[('NUE', 'capex'), 'max_drawdown'] == pytest.approx((window / window.cummax() - 1).min())
+    assert ('BSL', 'revenue') not in risk.index and ('X', 'revenue') in risk.index
+
+    # The CMC gap breaks year-over-year growth across 2019
+    cmc = panel.yoy[panel.tickers.index('CMC'), panel.metric_pos('capex')]
+    assert np.isnan(cmc[panel.years == 2019]) and np.isnan(cmc[panel.years == 2020])
+
+    rolling = bench.get_rolling_period_analysis(['capex'], 3)
+    assert rolling['period_start'].min() == 2015 and rolling['period_end'].max() == 2024
+    assert set(rolling['ticker']) == set(TICKERS + ['X'])
+
+    ts = bench.get_uss_timeseries(['revenue', 'operating_income', 'missing'], 2019, 2024)
+    assert list(ts.columns) == ['year', 'revenue', 'operating_income']
+    assert list(ts['year']) == list(range(2019, 2025))
+
+
+def test_panel_built_once_per_version(benchmark):
+    bench, wrds_path, builds = benchmark
+    bench.get_multiyear_growth_analysis()
+    bench.get_uss_timeseries(METRICS)
+    BenchmarkData().get_rolling_period_analysis()
+    assert len(builds) == 1
+
+    write_fundamentals(wrds_path, seed=7)
+    fresh = BenchmarkData()
+    fresh.get_multiyear_growth_analysis()
+    assert len(builds) == 2 and builds[0] != builds[1]
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the model timers and counters in instrumentation.py.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import instrumentation
+from instrumentation import count, get_profiler, profiled, profiling, run_profiled, timed
+from price_volume_model import (
+    PriceVolumeModel,
+    ScenarioType,
+    clear_stage_cache,
+    clear_valuation_grid_cache,
+    get_scenario_presets,
+    preset_points,
+    run_valuation_grid,
+)
+
+ROOT = Path(__file__).parent.parent
+
+
+@profiled('test.square')
+def _square(x):
+    count('test.calls')
+    with timed('test.inner'):
+        return x * x
+
+
+def test_hooks_are_noops_when_disabled():
+    profiler = get_profiler()
+    assert not profiler.enabled
+    profiler.reset()
+    assert _square(3) == 9
+    assert profiler.timers == {} and profiler.counters == {}
+
+    with profiling() as prof:
+        assert _square(4) == 16
+        assert _square(5) == 25
+    assert not profiler.enabled
+    assert prof.timers['test.square'][0] == 2 and prof.timers['test.inner'][0] == 2
+    assert prof.counters == {'test.calls': 2}
+    assert len(prof.events) == 4
+
+
+def test_model_hot_paths_are_timed(tmp_path):
+    # A warm stage cache would skip the projection
+    clear_stage_cache()
+    with profiling() as prof:
+        PriceVolumeModel(get_scenario_presets()[ScenarioType.BASE_CASE]).run_full_analysis()
+
+    summary = prof.summary().set_index('timer')
+    assert summary.loc['model.build_segment_projection', 'calls'] == 4
+    for name in ['model.run_full_analysis', 'model.build_consolidated', 'model.consolidate_segments',
+                 'model.calculate_financing_impact', 'model.calculate_dcf', 'synergy.stage']:
+        assert name in summary.index
+    # Nested timers never exceed their parent
+    assert summary.loc['model.build_consolidated', 'total_ms'] <= summary.loc['model.run_full_analysis', 'total_ms']
+
+    report = prof.to_json(tmp_path / 'profile.json')
+    assert json.loads((tmp_path / 'profile.json').read_text()) == report
+    assert report['processes'] == 1
+    assert report['timers']['model.calculate_dcf']['calls'] == summary.loc['model.calculate_dcf', 'calls']
+
+    trace = prof.to_chrome_trace(tmp_path / 'profile.trace.json')['traceEvents']
+    spans = [e for e in trace if e['ph'] == 'X']
+    assert len(spans) == len(prof.events)
+    assert {'name', 'cat', 'ts', 'dur', 'pid', 'tid'} <= set(spans[0])
+
+
+def test_worker_profiles_are_merged():
+    result, snapshot = run_profiled(_square, 6, enabled=True)
+    assert result == 36 and snapshot['counters'] == {'test.calls': 1}
+    assert run_profiled(_square, 6, enabled=False) == (36, None)
+
+    clear_stage_cache()
+    clear_valuation_grid_cache()
+    presets = get_scenario_presets()
+    points = preset_points({st: presets[st] for st in (ScenarioType.BASE_CASE, ScenarioType.DOWNSIDE)})
+    with profiling() as prof:
+        run_valuation_grid(points, n_workers=2)
+    clear_valuation_grid_cache()
+
+    assert prof.counters['grid.points_valued'] == 2
+    assert prof.timers['model.run_full_analysis'][0] == 2
+    # Model timers were recorded in the workers, not this process
+    worker_pids = {pid for name, pid, *_ in prof.events if name == 'model.run_full_analysis'}
+    assert worker_pids and os.getpid() not in worker_pids
+
+
+def test_env_var_enables_and_exports(tmp_path):
+    output = tmp_path / 'run.trace.json'
+    code = ("from price_volume_model import *; "
+            "PriceVolumeModel(get_scenario_presets()[ScenarioType.BASE_CASE]).run_full_analysis()")
+    env = dict(os.environ, **{instrumentation.PROFILE_ENV_VAR: '1',
+                              instrumentation.PROFILE_OUTPUT_ENV_VAR: str(output)})
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, check=True, capture_output=True)
+
+    names = {e['name'] for e in json.loads(output.read_text())['traceEvents']}
+    assert {'model.run_full_analysis', 'model.calculate_dcf'} <= names
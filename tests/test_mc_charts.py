@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared chart aggregates and incremental chart rendering in
+scripts/run_monte_carlo_analysis.py.
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.run_monte_carlo_analysis import (
+    CHART_MANIFEST,
+    CHART_SPECS,
+    HEATMAP_VARS,
+    KEY_INPUT_VARS,
+    ChartData,
+    render_charts,
+)
+
+
+N = 400
+
+
+@pytest.fixture
+def run():
+    """Engine-like run: results in completion order, iteration 3 failed"""
+    rng = np.random.RandomState(5)
+    names = sorted(set(KEY_INPUT_VARS + HEATMAP_VARS))
+    inputs = pd.DataFrame(rng.lognormal(0, 0.2, (N, len(names))), columns=names)
+    nippon = 40 + 30 * inputs['hrc_price_factor'] - 200 * (inputs['uss_wacc'] - 1) + rng.randn(N)
+    results = pd.DataFrame({
+        'iteration': np.arange(N),
+        'nippon_share_price': nippon,
+        'uss_share_price': nippon - 10 + rng.randn(N),
+    })
+    results = results.drop(index=3).sample(frac=1, random_state=2)
+    return SimpleNamespace(simulation_inputs=inputs, simulation_results=results)
+
+
+def test_aggregates_aligned_by_iteration(run):
+    data = ChartData.from_engine(run)
+    ordered = run.simulation_results.sort_values('iteration')
+    nippon = ordered['nippon_share_price'].to_numpy()
+    inputs = run.simulation_inputs.loc[ordered['iteration']]
+
+    assert data.n == N - 1
+    s = data.stats['nippon']
+    assert s['pct'][5] == pytest.approx(np.percentile(nippon, 5))
+    assert s['prob_below_offer'] == pytest.approx(np.mean(nippon < 55))
+    assert s['prob_above_75'] == pytest.approx(np.mean(nippon > 75))
+
+    expected = np.corrcoef(inputs['hrc_price_factor'], nippon)[0, 1]
+    assert data.correlations.loc['hrc_price_factor', 'nippon'] == pytest.approx(expected)
+    assert data.top_drivers('nippon', 1).index[0] in ('hrc_price_factor', 'uss_wacc')
+
+    density, edges = data.histograms['nippon', 50]
+    assert np.sum(density * np.diff(edges)) == pytest.approx(1.0)
+    x, p = data.cdf['premium']
+    assert p[-1] == 1.0 and np.all(np.diff(x) >= 0)
+
+
+def test_render_skips_unchanged_charts(run, tmp_path):
+    first = render_charts(run, tmp_path, n_workers=2)
+    assert len(first['rendered']) == len(CHART_SPECS)
+    assert all((tmp_path / spec[1]).exists() for spec in CHART_SPECS)
+    manifest = json.loads((tmp_path / CHART_MANIFEST).read_text())
+    assert set(manifest) == {spec[1] for spec in CHART_SPECS}
+
+    second = render_charts(run, tmp_path, n_workers=1)
+    assert second['rendered'] == []
+    assert len(second['skipped']) == len(CHART_SPECS)
+
+    # Changing the USS outputs only re-renders charts that read them
+    run.simulation_results['uss_share_price'] += 1.0
+    third = render_charts(run, tmp_path, n_workers=1)
+    expected = {spec[1] for spec in CHART_SPECS if 'uss' in spec[3]}
+    assert set(third['rendered']) == expected
+
+    # A deleted chart is rendered again
+    (tmp_path / 'mc_dual_cdf.png').unlink()
+    assert render_charts(run, tmp_path, n_workers=1)['rendered'] == ['mc_dual_cdf.png']
@@ -0,0 +1,95 @@
+"""Tests for stochastic synergies in the Monte Carlo engine."""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from price_volume_model import (
+    PriceVolumeModel, ScenarioType, get_scenario_presets, get_synergy_presets,
+    synergy_parameter_arrays, calculate_synergy_vectors, apply_synergy_ebitda,
+    synergy_enterprise_value,
+)
+from monte_carlo.monte_carlo_engine import (
+    MonteCarloEngine, sample_synergy_parameters, SYNERGY_VARIABLE_BASES,
+)
+
+YEARS = list(range(2024, 2034))
+
+
+def test_base_values_reproduce_preset():
+    preset = get_synergy_presets()['base_case']
+    samples = pd.DataFrame([SYNERGY_VARIABLE_BASES] * 3)
+    sampled = sample_synergy_parameters(preset, YEARS, samples)
+    expected = synergy_parameter_arrays([preset], YEARS)
+    for key, value in expected.items():
+        assert np.allclose(sampled[key], np.repeat(value, 3, axis=0)), key
+
+
+def test_delay_overrun_and_realization_move_parameters():
+    preset = get_synergy_presets()['base_case']
+    samples = pd.DataFrame({
+        'operating_synergy_factor': [0.40, 0.80],
+        'technology_synergy_factor': [0.70, 0.70],
+        'revenue_synergy_factor': [0.55, 0.55],
+        'synergy_ramp_delay': [1.0, 0.5],
+        'integration_cost_overrun': [1.5, 1.0],
+    })
+    params = sample_synergy_parameters(preset, YEARS, samples)
+    ramp = preset.operating.ramp_schedule.get_realization_array(YEARS)
+
+    assert params['operating_run_rate'][0] == pytest.approx(preset.operating.get_total_run_rate() / 2)
+    assert np.allclose(params['operating_ramp'][0], np.concatenate([[0.0], ramp[:-1]]))
+    assert np.allclose(params['operating_ramp'][1][1:], (ramp[:-1] + ramp[1:]) / 2)
+    assert np.allclose(params['integration_cost'][0], preset.integration.get_cost_array(YEARS) * 1.5)
+
+
+def test_synergy_enterprise_value_matches_dcf():
+    scenario = get_scenario_presets()[ScenarioType.BASE_CASE]
+    model = PriceVolumeModel(scenario, use_stage_cache=False)
+    consolidated, _ = model.build_consolidated()
+    presets = [get_synergy_presets()[k] for k in ('conservative', 'optimistic')]
+    synergy_ebitda = calculate_synergy_vectors(presets, consolidated['Year'].tolist(),
+                                               consolidated['Revenue'].values,
+                                               consolidated['Total_EBITDA'].values)['total_synergy_ebitda']
+    wacc = np.array([0.07, 0.09])
+    increments = synergy_enterprise_value(synergy_ebitda, wacc, scenario.terminal_growth, scenario.exit_multiple)
+
+    base_ev = model.calculate_dcf(consolidated, 0.07)['ev_blended']
+    with_synergies = model.calculate_dcf(apply_synergy_ebitda(consolidated, synergy_ebitda[0]), 0.07)
+    assert increments[0] == pytest.approx(with_synergies['ev_blended'] - base_ev)
+    assert model.calculate_dcf(apply_synergy_ebitda(consolidated, synergy_ebitda[1]), 0.09)['ev_blended'] == \
+        pytest.approx(model.calculate_dcf(consolidated, 0.09)['ev_blended'] + increments[1])
+
+
+def test_engine_adds_synergies_to_nippon_view_only():
+    mc = MonteCarloEngine(n_simulations=12, random_seed=7)
+    assert mc.synergies.name == get_synergy_presets()['base_case'].name
+    assert {'technology_synergy_factor', 'synergy_ramp_delay', 'integration_cost_overrun'} <= set(mc.variables)
+
+    results = mc.run_simulation(verbose=False)
+    assert (results['synergy_enterprise_value'] > 0).all()
+    assert results['run_rate_synergies'].std() > 0
+
+    off = MonteCarloEngine(n_simulations=12, random_seed=7, include_synergies=False)
+    assert 'synergy_ramp_delay' not in off.variables
+    assert 'synergy_enterprise_value' not in off.run_simulation(verbose=False)
+
+
+def test_base_scenario_synergies_take_precedence():
+    base = get_scenario_presets()[ScenarioType.BASE_CASE]
+    scenario = replace(base, synergies=get_synergy_presets()['conservative'])
+    assert MonteCarloEngine(n_simulations=2, base_scenario=scenario).synergies.name == 'Conservative'
+
+
+def test_disabled_scenario_synergies_opt_out():
+    base = get_scenario_presets()[ScenarioType.BASE_CASE]
+    scenario = base.with_overrides(synergies=get_synergy_presets()['none'])
+    mc = MonteCarloEngine(n_simulations=2, base_scenario=scenario)
+    assert mc.synergies is None
+    assert 'synergy_ramp_delay' not in mc.variables
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the Excel export: reuse of caller valuations, shared named
+styles and column sizing.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import PatternFill
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import scripts.export_model as export_model
+from scripts.export_model import DATA_STYLES, HEADER_STYLE, ExcelStyler, ModelExporter
+from price_volume_model import PriceVolumeModel, ScenarioType, get_scenario_presets
+
+
+@pytest.fixture(scope="module")
+def base_analysis():
+    scenario = get_scenario_presets()[ScenarioType.BASE_CASE]
+    return scenario, PriceVolumeModel(scenario).run_full_analysis()
+
+
+def test_multi_export_reuses_caller_valuations(base_analysis, monkeypatch):
+    scenario, analysis = base_analysis
+    comparison = pd.DataFrame({'Scenario': ['Base Case'], 'USS - No Sale ($/sh)': [40.0]})
+    pw_results = "No scenarios with probability weights found"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("valuation should have been reused")
+
+    monkeypatch.setattr(PriceVolumeModel, 'run_full_analysis', fail)
+    monkeypatch.setattr(export_model, 'compare_scenarios', fail)
+    monkeypatch.setattr(export_model, 'calculate_probability_weighted_valuation', fail)
+    monkeypatch.setattr(ModelExporter, '_load_peer_analysis_data', lambda self: {'error': 'offline'})
+
+    exporter = ModelExporter(scenario, analysis=analysis)
+    wb = load_workbook(exporter.export_multi_scenario(comparison=comparison, pw_results=pw_results))
+
+    assert wb['Scenario Comparison']['A4'].value == 'Base Case'
+    assert wb['Probability-Weighted']['A3'].value.endswith(pw_results)
+    assert 'offline' in wb['Multi-Year Peer Analysis']['A5'].value
+    assert wb['Cover']['B5'].value == scenario.name
+    assert HEADER_STYLE in wb.named_styles
+
+
+def test_multi_export_writes_only_comparison_columns_and_modes(base_analysis, monkeypatch):
+    scenario, analysis = base_analysis
+    # The dashboard's Current flag must not reach the sheet
+    comparison = pd.DataFrame({'Scenario': ['Base Case'], 'USS - No Sale ($/sh)': [40.0], 'Current': [True]})
+    calls = []
+
+    def weighted(**kwargs):
+        calls.append(kwargs)
+        return "No scenarios with probability weights found"
+
+    monkeypatch.setattr(export_model, 'calculate_probability_weighted_valuation', weighted)
+    monkeypatch.setattr(ModelExporter, '_load_peer_analysis_data', lambda self: {'error': 'offline'})
+
+    exporter = ModelExporter(scenario, analysis=analysis)
+    wb = load_workbook(exporter.export_multi_scenario(comparison=comparison, calibration_mode='hybrid'))
+
+    sheet = wb['Scenario Comparison']
+    assert [sheet.cell(row=3, column=c).value for c in (1, 2, 3)] == ['Scenario', 'USS - No Sale ($/sh)', None]
+    assert calls[0]['calibration_mode'] == 'hybrid' and calls[0]['probability_mode'] is None
+    assert 'hybrid' in wb['Probability-Weighted']['A2'].value
+
+
+def test_named_styles_keep_formats_and_fills():
+    styler = ExcelStyler()
+    wb = Workbook()
+    ws = wb.active
+
+    ws.cell(row=1, column=1, value=1234.5).number_format = styler.currency_format
+    styler.style_data_cell(ws, 1, 1, 'positive')
+    assert ws['A1'].style == DATA_STYLES['positive']
+    assert ws['A1'].number_format == styler.currency_format
+    assert ws['A1'].fill.fgColor.rgb == styler.positive_fill.fgColor.rgb
+
+    # Plain data styling keeps a fill set beforehand
+    ws['B1'].fill = PatternFill(start_color="FFFFD9", end_color="FFFFD9", fill_type="solid")
+    styler.style_data_cell(ws, 1, 2)
+    assert ws['B1'].fill.fgColor.rgb.endswith("FFFFD9")
+    assert ws['B1'].border.left.style == 'thin'
+
+
+def test_auto_column_width_only_reads_written_cells():
+    styler = ExcelStyler()
+    ws = Workbook().active
+    ws['A1'] = "x" * 30
+    ws['D20'] = "short"
+    styler.auto_column_width(ws)
+
+    assert ws.column_dimensions['A'].width == 32
+    assert ws.column_dimensions['B'].width == 10
+    assert ws.column_dimensions['D'].width == 10
+    assert len(ws._cells) == 2
@@ -0,0 +1,97 @@
+"""Tests for the combined-shock stress grid in nippon_capacity_analysis."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'nippon-analysis'))
+
+from nippon_capacity_analysis import (
+    build_nippon_financial_profile, create_financing_structure,
+    calculate_pro_forma_metrics, run_stress_test, run_stress_grid, analyze_funding_gap,
+    get_stress_grid_summary_table, STRESS_GRID_AXES,
+)
+
+
+@pytest.fixture(scope='module')
+def inputs():
+    profile = build_nippon_financial_profile()
+    financing = create_financing_structure(profile)
+    pro_forma = calculate_pro_forma_metrics(profile, financing)
+    return profile, pro_forma
+
+
+def test_grid_shape_follows_axes(inputs):
+    profile, pro_forma = inputs
+    grid = run_stress_grid(profile, pro_forma, ebitda_drops=[0, 0.1, 0.2],
+                           rate_shocks=[0, 0.01], fx_moves=[0],
+                           synergy_realizations=[0.2, 1.0], nsa_timings=[0, 1])
+    assert grid.debt_to_ebitda.shape == (3, 2, 1, 2, 2)
+    assert grid.n_points == 24
+    assert len(grid.to_frame()) == 24
+    assert list(grid.to_frame().columns[:5]) == list(STRESS_GRID_AXES)
+
+
+def test_zero_shock_reproduces_pro_forma(inputs):
+    profile, pro_forma = inputs
+    grid = run_stress_grid(profile, pro_forma, ebitda_drops=[0], rate_shocks=[0],
+                           fx_moves=[0], synergy_realizations=[0.2], nsa_timings=[0])
+    assert grid.debt_to_ebitda.item() == pytest.approx(pro_forma.post_deal_debt_to_ebitda)
+    assert grid.interest_coverage.item() == pytest.approx(pro_forma.post_deal_interest_coverage)
+
+
+@pytest.mark.parametrize('scenario,kwargs', [
+    ('downturn', {'ebitda_drops': [0.25]}),
+    ('rate_shock', {'rate_shocks': [0.02]}),
+    ('yen_weak', {'fx_moves': [0.15]}),
+])
+def test_single_shocks_match_named_stress_tests(inputs, scenario, kwargs):
+    profile, pro_forma = inputs
+    defaults = dict(ebitda_drops=[0], rate_shocks=[0], fx_moves=[0],
+                    synergy_realizations=[0.2], nsa_timings=[0])
+    defaults.update(kwargs)
+    grid = run_stress_grid(profile, pro_forma, **defaults)
+    expected = run_stress_test(profile, pro_forma, scenario)
+    assert grid.debt_to_ebitda.item() == pytest.approx(expected.stressed_debt_to_ebitda)
+    assert grid.interest_coverage.item() == pytest.approx(expected.stressed_interest_coverage)
+
+
+def test_accelerated_nsa_raises_leverage_and_drains_liquidity(inputs):
+    profile, pro_forma = inputs
+    grid = run_stress_grid(profile, pro_forma, ebitda_drops=[0], rate_shocks=[0],
+                           fx_moves=[0], synergy_realizations=[0.2], nsa_timings=[-1, 0, 1])
+    leverage = grid.debt_to_ebitda.ravel()
+    liquidity = grid.liquidity_usd.ravel()
+    assert leverage[0] > leverage[1] == pytest.approx(leverage[2])
+    assert liquidity[0] < liquidity[1] < liquidity[2]
+
+
+def test_breach_surface_and_min_headroom(inputs):
+    profile, pro_forma = inputs
+    grid = run_stress_grid(profile, pro_forma)
+    surface = grid.breach_surface('leverage', 'fx_move', 'ebitda_drop')
+    assert surface.shape == (len(grid.axes['fx_move']), len(grid.axes['ebitda_drop']))
+    assert ((surface >= 0) & (surface <= 1)).all().all()
+    # Breach share is monotone in the EBITDA drop
+    assert np.all(np.diff(surface.mean(axis=0).values) >= 0)
+
+    worst = grid.min_headroom_points('leverage', n=5)
+    assert len(worst) == 5
+    assert worst['leverage_headroom'].is_monotonic_increasing
+    assert worst['leverage_headroom'].iloc[0] == pytest.approx(
+        (3.5 - grid.debt_to_ebitda).min())
+
+    summary = get_stress_grid_summary_table(grid)
+    assert list(summary['Metric']) == ['Leverage', 'Coverage', 'Liquidity']
+
+
+def test_precomputed_funding_gap_needs_no_profile(inputs):
+    profile, pro_forma = inputs
+    shocks = dict(ebitda_drops=[0, 0.2], rate_shocks=[0.01], fx_moves=[0.1])
+    funding_gap = analyze_funding_gap(profile, pro_forma)
+    grid = run_stress_grid(None, pro_forma, funding_gap=funding_gap, **shocks)
+    np.testing.assert_allclose(grid.liquidity_usd, run_stress_grid(profile, pro_forma, **shocks).liquidity_usd)
+    with pytest.raises(ValueError):
+        run_stress_grid(None, pro_forma)
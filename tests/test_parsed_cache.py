@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the parsed Capital IQ cache and shared loader in
+scripts/data_loader.py.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.data_loader import (
+    MANIFEST_NAME,
+    USSteelDataLoader,
+    clear_shared_loaders,
+    get_shared_loader,
+)
+
+REFERENCES = Path(__file__).parent.parent / 'references'
+
+
+@pytest.mark.skipif(not (REFERENCES / 'United States Steel Corporation Financials.xls').exists(),
+                    reason="Capital IQ exports not available")
+def test_cached_tables_match_parsed(tmp_path):
+    parsed = USSteelDataLoader(str(REFERENCES), cache_dir=tmp_path)
+    income = parsed.load_income_statement()
+    comps = parsed.load_comparable_companies()
+    transactions, summary = parsed.load_ma_transactions()
+    summary_stats = parsed.load_comp_summary_stats()
+    assert parsed.get_cache_stats()['parsed'] == 4
+
+    cached = USSteelDataLoader(str(REFERENCES), cache_dir=tmp_path)
+    pd.testing.assert_frame_equal(cached.load_income_statement(), income)
+    cached_comps = cached.load_comparable_companies()
+    assert list(cached_comps) == list(comps)
+    for name, frame in comps.items():
+        pd.testing.assert_frame_equal(cached_comps[name], frame)
+    cached_transactions, cached_summary = cached.load_ma_transactions()
+    pd.testing.assert_frame_equal(cached_transactions, transactions)
+    pd.testing.assert_frame_equal(cached_summary, summary)
+    # Column labels keep their parsed dtype (parquet would return StringDtype)
+    pd.testing.assert_frame_equal(cached.load_comp_summary_stats(), summary_stats)
+
+    cached.load_income_statement()
+    # Served from parquet (then memory); no workbook was opened
+    assert cached.get_cache_stats() == {'memory': 1, 'disk': 4, 'parsed': 0}
+    assert cached._workbooks == {}
+
+
+def test_changed_source_is_reparsed(tmp_path):
+    source = tmp_path / 'source.csv'
+    source.write_text("a,b\n1,2\n")
+    loader = USSteelDataLoader(str(tmp_path), cache_dir=tmp_path / 'cache')
+
+    def parse():
+        return pd.read_csv(source)
+
+    first = loader.load_table('sample', source, parse)
+    assert USSteelDataLoader(str(tmp_path), cache_dir=tmp_path / 'cache').load_table(
+        'sample', source, lambda: pytest.fail("should come from the cache")).equals(first)
+
+    source.write_text("a,b\n3,4\n")
+    fresh = USSteelDataLoader(str(tmp_path), cache_dir=tmp_path / 'cache')
+    assert fresh.load_table('sample', source, parse)['a'].tolist() == [3]
+    entries = list((tmp_path / 'cache').iterdir())
+    assert len(entries) == 1 and (entries[0] / MANIFEST_NAME).exists()
+
+    # use_cache=False re-parses even when memory holds the table
+    source.write_text("a,b\n5,6\n")
+    assert fresh.load_table('sample', source, parse)['a'].tolist() == [3]
+    assert fresh.load_table('sample', source, parse, use_cache=False)['a'].tolist() == [5]
+
+
+def test_shared_loader_per_directory(tmp_path):
+    clear_shared_loaders()
+    loader = get_shared_loader(str(tmp_path), cache_dir=None)
+    assert get_shared_loader(str(tmp_path), cache_dir=None) is loader
+    assert get_shared_loader(str(tmp_path / 'other'), cache_dir=None) is not loader
+
+    from scripts.benchmark_data import BenchmarkData
+    assert BenchmarkData(str(REFERENCES)).loader is BenchmarkData(str(REFERENCES)).loader
+    clear_shared_loaders()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the precomputed peer metrics index in scripts/benchmark_data.py.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.benchmark_data import (
+    BenchmarkData,
+    PeerMetricsIndex,
+    clear_peer_index_cache,
+    summary_stats,
+)
+
+
+N_PEERS = 40
+
+
+@pytest.fixture
+def benchmark(tmp_path, monkeypatch):
+    """BenchmarkData over synthetic comps; counts index builds"""
+    rng = np.random.RandomState(3)
+    names = [f"Peer {i} ({t})" for i, t in
+             enumerate(['NUE', 'STLD', 'CLF'] + [f"P{i}" for i in range(N_PEERS - 3)])]
+    revenue = rng.lognormal(9, 0.6, N_PEERS)
+    ebitda = revenue * rng.uniform(0.02, 0.2, N_PEERS)
+    financial = pd.DataFrame({
+        'Company Name': names,
+        'TEV/EBITDA LTM': rng.uniform(3, 11, N_PEERS),
+        'TEV/EBITDA LTM - Latest': rng.uniform(3, 11, N_PEERS),
+        'TEV/Total Revenues LTM': rng.uniform(0.2, 1.2, N_PEERS),
+        'LTM Total Revenue ': revenue,
+        'LTM EBITDA ': ebitda,
+    })
+    financial.loc[5, 'TEV/EBITDA LTM - Latest'] = np.nan
+    credit = pd.DataFrame({
+        'Company Name': names,
+        'LTM Net Debt/EBITDA': rng.uniform(0, 5, N_PEERS),
+        'Quick Ratio': rng.uniform(0.5, 2, N_PEERS),
+    })
+    comps = {'financial_data': financial, 'credit_ratios': credit}
+    uss = {'ebitda_margin': 0.106, 'revenue': 18000.0, 'capacity_mtons': 22.4}
+
+    clear_peer_index_cache()
+    monkeypatch.setattr(BenchmarkData, '_get_comps_data', lambda self: comps)
+    monkeypatch.setattr(BenchmarkData, 'get_uss_metrics', lambda self, year=2023: uss)
+    builds = []
+    build = BenchmarkData._build_peer_index
+
+    def counted(self, version):
+        builds.append(version)
+        return build(self, version)
+
+    monkeypatch.setattr(BenchmarkData, '_build_peer_index', counted)
+    yield BenchmarkData(str(tmp_path)), comps, builds
+    clear_peer_index_cache()
+
+
+def test_summary_stats_match_pandas():
+    rng = np.random.RandomState(0)
+    a, b = rng.randn(25), rng.randn(7)
+    a[[2, 9]] = np.nan
+    stats = summary_stats([('X', 'a', a), ('X', 'b', b), ('X', 'empty', np.array([]))])
+
+    for row, values in zip(stats.itertuples(), [pd.Series(a).dropna(), pd.Series(b)]):
+        assert row.Min == values.min() and row.Max == values.max()
+        assert row.Q1 == pytest.approx(values.quantile(0.25))
+        assert row.Median == pytest.approx(values.median())
+        assert row.Q3 == pytest.approx(values.quantile(0.75))
+        assert row.Mean == pytest.approx(values.mean())
+        assert row.Count == len(values)
+    assert stats['Count'].iloc[2] == 0 and np.isnan(stats['Median'].iloc[2])
+
+
+def test_category_stats_match_direct(benchmark):
+    bench, comps, _ = benchmark
+    financial, credit = comps['financial_data'], comps['credit_ratios']
+
+    multiples = bench.get_peer_multiples()
+    # The '- Latest' column wins over the plain LTM column
+    expected = financial['TEV/EBITDA LTM - Latest'].dropna()
+    assert multiples['tev_ebitda'].count == len(expected) == N_PEERS - 1
+    assert multiples['tev_ebitda'].median == pytest.approx(expected.median())
+    assert multiples['tev_ebitda'].q1 == pytest.approx(expected.quantile(0.25))
+
+    primary = bench.get_peer_multiples(primary_only=True)
+    assert primary['tev_revenue'].count == 3
+    assert primary['tev_revenue'].mean == pytest.approx(financial['TEV/Total Revenues LTM'][:3].mean())
+
+    leverage = bench.get_leverage_stats()
+    assert list(leverage) == ['ltm_net_debt_ebitda']
+    assert leverage['ltm_net_debt_ebitda'].max == credit['LTM Net Debt/EBITDA'].max()
+
+    summary = bench.get_benchmark_summary()
+    assert list(summary['Category']) == ['Valuation'] * 2 + ['Leverage']
+    assert summary['Count'].dtype == int
+
+
+def test_percentile_rank_is_share_below(benchmark):
+    bench, comps, _ = benchmark
+    financial = comps['financial_data']
+    margins = financial['LTM EBITDA '] / financial['LTM Total Revenue ']
+
+    rank = bench.get_uss_percentile_rank('ebitda_margin')
+    assert rank['percentile'] == pytest.approx((margins < 0.106).mean() * 100)
+    assert rank['peer_median'] == pytest.approx(margins.median())
+    assert rank['peer_count'] == N_PEERS
+
+    index = bench.get_peer_index()
+    values = financial['LTM Total Revenue ']
+    for v in [0.0, values.iloc[4], values.median(), 1e9]:
+        assert index.percentile('LTM Total Revenue ', v) == pytest.approx((values < v).mean() * 100)
+    assert bench.get_uss_percentile_rank('capacity_mtons') is None
+    assert bench.get_uss_percentile_rank('roa') is None
+
+    company = index.company('STLD')
+    assert company[('Leverage', 'ltm_net_debt_ebitda')] == comps['credit_ratios'].iloc[1, 1]
+
+
+def test_index_built_once_per_version(benchmark, tmp_path):
+    bench, _, builds = benchmark
+    bench.get_peer_multiples()
+    bench.get_margin_stats()
+    bench.get_uss_percentile_rank('revenue')
+    BenchmarkData(str(tmp_path)).get_benchmark_summary()
+    assert len(builds) == 1
+    assert isinstance(bench.get_peer_index(), PeerMetricsIndex)
+
+    # A new comps export is a new data version
+    bench.loader.comps_file.write_bytes(b"changed")
+    bench.get_leverage_stats()
+    assert len(builds) == 2 and builds[0] != builds[1]
+
+    bench.clear_cache()
+    bench.get_peer_multiples()
+    assert len(builds) == 3
@@ -57,7 +57,7 @@ class TestDistributionsConfig:
         assert 'tubular_realization_factor' in corrs
 
     def test_total_variables_count(self, config):
-        assert config['metadata']['n_variables'] == 33
+        assert config['metadata']['n_variables'] == 36
 
 
 class TestModelScenarioRealizationFactors:
@@ -74,10 +74,11 @@ class TestModelScenarioRealizationFactors:
         assert scenario.realization_factors is None
 
     def test_realization_factors_passed_through(self):
-        scenario = self._get_base_scenario()
+        base = self._get_base_scenario()
         rf = {'flat_rolled': 1.10, 'mini_mill': 0.95, 'usse': 1.05, 'tubular': 1.40}
-        scenario.realization_factors = rf
+        scenario = base.with_overrides(realization_factors=rf)
         assert scenario.realization_factors == rf
+        assert base.realization_factors is None
 
     def test_calculate_segment_price_uses_override(self):
         """When realization_factors is set, calculate_segment_price uses override premium."""
@@ -89,8 +90,7 @@ class TestModelScenarioRealizationFactors:
         price_base = model_base.calculate_segment_price(Segment.FLAT_ROLLED, 2024)
 
         # Override with higher realization factor
-        base_override = self._get_base_scenario()
-        base_override.realization_factors = {'flat_rolled': 1.15}
+        base_override = self._get_base_scenario().with_overrides(realization_factors={'flat_rolled': 1.15})
         model_override = PriceVolumeModel(base_override)
         price_override = model_override.calculate_segment_price(Segment.FLAT_ROLLED, 2024)
 
@@ -101,8 +101,7 @@ class TestModelScenarioRealizationFactors:
         """When realization_factors=None, price calculation unchanged."""
         from price_volume_model import PriceVolumeModel, Segment
 
-        base1 = self._get_base_scenario()
-        base1.realization_factors = None
+        base1 = self._get_base_scenario().with_overrides(realization_factors=None)
         model1 = PriceVolumeModel(base1)
         price1 = model1.calculate_segment_price(Segment.FLAT_ROLLED, 2024)
 
@@ -127,4 +126,4 @@ class TestMCEngineRealizationFactors:
     def test_total_variable_count(self):
         from monte_carlo import MonteCarloEngine
         mc = MonteCarloEngine(n_simulations=10, use_config_file=True)
-        assert len(mc.variables) == 33, f"Expected 33 variables, got {len(mc.variables)}"
+        assert len(mc.variables) == 36, f"Expected 36 variables, got {len(mc.variables)}"
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar Monte Carlo result store.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from monte_carlo.result_store import (
+    MCResultWriter,
+    load_result_store,
+    read_inputs,
+    read_metadata,
+    read_results,
+    run_metadata,
+    write_result_store,
+)
+
+
+N = 50
+
+
+@pytest.fixture
+def run():
+    """Engine-like object with 50 sampled iterations, iteration 7 failed"""
+    rng = np.random.RandomState(0)
+    inputs = pd.DataFrame({
+        'hrc_price_factor': rng.lognormal(0, 0.2, N),
+        'uss_wacc': rng.normal(0.1, 0.01, N),
+        'margin_factor': rng.normal(1, 0.05, N),
+    })
+    results = pd.DataFrame({
+        'iteration': np.arange(N),
+        'uss_share_price': rng.normal(50, 10, N),
+        'nippon_share_price': rng.normal(60, 10, N),
+        'margin_factor': inputs['margin_factor'].values,
+    })
+    # Parallel runs return iterations in completion order, minus failures
+    results = results.drop(index=7).sample(frac=1, random_state=1)
+    return SimpleNamespace(
+        n_simulations=N, random_seed=42, use_lhs=True, n_workers=4,
+        config_file_used=True, config_path=Path(__file__),
+        bloomberg_calibration_used=False,
+        base_scenario=SimpleNamespace(name='Base Case'), synergies=None,
+        simulation_inputs=inputs, simulation_results=results,
+    )
+
+
+def test_round_trip_aligned_by_iteration(run, tmp_path):
+    path = write_result_store(tmp_path / 'mc.parquet', run, chunk_size=16)
+    results, inputs, meta = load_result_store(path)
+
+    assert pq.ParquetFile(path).num_row_groups == 4
+    assert list(results.index) == [i for i in range(N) if i != 7]
+    expected = run.simulation_results.set_index('iteration').sort_index()
+    pd.testing.assert_frame_equal(results, expected, check_names=False)
+
+    # Inputs keep every sampled row; names collide with outputs without clashing
+    assert len(inputs) == N
+    pd.testing.assert_frame_equal(inputs, run.simulation_inputs, check_names=False)
+
+    all_rows = read_results(path, completed_only=False)
+    assert np.isnan(all_rows.loc[7, 'uss_share_price'])
+
+
+def test_metadata(run, tmp_path):
+    path = write_result_store(tmp_path / 'mc.parquet', run, label='test')
+    meta = read_metadata(path)
+    assert meta['random_seed'] == 42
+    assert meta['sampling_method'] == 'lhs'
+    assert meta['n_simulations'] == N
+    assert meta['calibration_mode'] == 'config'
+    assert len(meta['distributions_config_hash']) == 16
+    assert meta['input_variables'] == list(run.simulation_inputs.columns)
+    assert meta['label'] == 'test'
+
+
+def test_column_projection(run, tmp_path):
+    path = write_result_store(tmp_path / 'mc.parquet', run)
+    prices = read_results(path, columns=['nippon_share_price'])
+    assert list(prices.columns) == ['nippon_share_price']
+    wacc = read_inputs(path, columns=['uss_wacc'], completed_only=True)
+    assert list(wacc.columns) == ['uss_wacc']
+    assert 7 not in wacc.index
+
+
+def test_chunked_append_and_abort(run, tmp_path):
+    path = tmp_path / 'mc.parquet'
+    inputs, results = run.simulation_inputs, run.simulation_results
+    with MCResultWriter(path, run_metadata(run)) as writer:
+        for idx in np.array_split(np.arange(N), 5)[::-1]:
+            chunk = inputs.iloc[idx]
+            writer.write_chunk(results[results['iteration'].isin(chunk.index)], chunk)
+    assert writer.n_rows == N
+    assert sorted(read_inputs(path).index) == list(range(N))
+
+    # A failed write leaves the previous store untouched
+    with pytest.raises(RuntimeError):
+        with MCResultWriter(path, {}) as writer:
+            writer.write_chunk(results.iloc[:3], inputs.iloc[:3])
+            raise RuntimeError("worker failed")
+    assert len(read_inputs(path)) == N
+    assert not (tmp_path / 'mc.parquet.tmp').exists()
+
+
+def test_empty_run_writes_empty_store(run, tmp_path):
+    run.simulation_inputs = run.simulation_inputs.iloc[:0]
+    run.simulation_results = run.simulation_results.iloc[:0]
+    path = write_result_store(tmp_path / 'mc.parquet', run)
+    results, inputs, meta = load_result_store(path)
+    assert len(results) == 0 and len(inputs) == 0
+    assert list(inputs.columns) == meta['input_variables']
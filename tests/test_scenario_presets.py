@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the memoized scenario preset registry and immutable scenarios.
+"""
+
+import copy
+import pickle
+import sys
+from dataclasses import FrozenInstanceError, replace
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from price_volume_model import (
+    get_scenario_presets,
+    clear_scenario_preset_cache,
+    get_scenario_preset_cache_stats,
+    get_synergy_presets,
+    ScenarioType,
+    SCENARIO_CALIBRATION_AVAILABLE,
+    _freeze,
+)
+
+
+def test_presets_memoized_and_shared():
+    clear_scenario_preset_cache()
+    first = get_scenario_presets()
+    second = get_scenario_presets()
+    assert first is not second
+    assert first[ScenarioType.BASE_CASE] is second[ScenarioType.BASE_CASE]
+    assert get_scenario_preset_cache_stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+    # The returned dict is a private copy
+    first.pop(ScenarioType.BASE_CASE)
+    assert ScenarioType.BASE_CASE in get_scenario_presets()
+
+
+def test_scenarios_are_frozen():
+    base = get_scenario_presets()[ScenarioType.BASE_CASE]
+    with pytest.raises(FrozenInstanceError):
+        base.uss_wacc = 0.2
+    with pytest.raises(FrozenInstanceError):
+        base.price_scenario.hrc_us_factor = 0.5
+    with pytest.raises(FrozenInstanceError):
+        base.financing.debt_financing_pct = 0.9
+    with pytest.raises(TypeError):
+        base.include_projects.append('Gary Works BF')
+
+
+def test_nested_preset_values_are_read_only():
+    base = get_scenario_presets()[ScenarioType.BASE_CASE]
+    scenario = _freeze(replace(base, synergies=get_synergy_presets()['base_case'],
+                               realization_factors={'usse': 1.05}))
+    with pytest.raises(TypeError):
+        scenario.realization_factors['usse'] = 2.0
+    with pytest.raises(TypeError):
+        scenario.synergies.operating.ramp_schedule.schedule[2025] = 1.0
+    with pytest.raises(FrozenInstanceError):
+        scenario.synergies.operating.procurement_savings_annual = 0.0
+
+    # Same repr as plain containers (stage cache keys) and usable copies for workers
+    assert repr(scenario.realization_factors) == repr({'usse': 1.05})
+    assert pickle.loads(pickle.dumps(scenario)) == scenario
+    copied = copy.deepcopy(scenario.realization_factors)
+    assert copied == {'usse': 1.05}
+
+
+def test_with_overrides_routes_nested_fields():
+    base = get_scenario_presets()[ScenarioType.BASE_CASE]
+    derived = base.with_overrides(uss_wacc=0.12, hrc_us_factor=0.8, tubular_volume_factor=1.1)
+
+    assert derived.uss_wacc == 0.12
+    assert derived.price_scenario.hrc_us_factor == 0.8
+    assert derived.volume_scenario.tubular_volume_factor == 1.1
+    assert derived.price_scenario.octg_factor == base.price_scenario.octg_factor
+    assert base.price_scenario.hrc_us_factor != 0.8
+    assert derived.financing is base.financing
+
+    unchanged_volume = base.with_overrides(hrc_us_factor=0.8)
+    assert unchanged_volume.volume_scenario is base.volume_scenario
+
+    with pytest.raises(TypeError):
+        base.with_overrides(not_a_field=1)
+
+
+def test_probability_mode_does_not_touch_default_presets():
+    if not SCENARIO_CALIBRATION_AVAILABLE:
+        pytest.skip("Scenario calibration not available")
+    clear_scenario_preset_cache()
+    default_weight = get_scenario_presets()[ScenarioType.BASE_CASE].probability_weight
+    weighted = get_scenario_presets(probability_mode='bloomberg')
+    assert weighted[ScenarioType.BASE_CASE].probability_weight == 0.40
+    assert get_scenario_presets()[ScenarioType.BASE_CASE].probability_weight == default_weight
+    assert get_scenario_preset_cache_stats()['size'] == 2
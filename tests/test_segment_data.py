@@ -174,3 +174,36 @@ class TestBootstrapCI:
         from scripts.revenue_price_correlation import bootstrap_correlation_ci
         ci_lo, ci_hi = bootstrap_correlation_ci([1, 2], [3, 4])
         assert np.isnan(ci_lo) and np.isnan(ci_hi)
+
+    def test_bootstrap_counts_match_sequential_draws(self):
+        from scripts.revenue_price_correlation import bootstrap_counts
+        counts = bootstrap_counts(7, 20, np.random.RandomState(5))
+        rng = np.random.RandomState(5)
+        for row in counts:
+            np.testing.assert_array_equal(row, np.bincount(rng.randint(0, 7, size=7), minlength=7))
+
+    def test_batch_matches_single_pair_calls(self):
+        from scripts.revenue_price_correlation import (
+            bootstrap_correlation_ci, bootstrap_correlation_ci_batch,
+        )
+        rng = np.random.RandomState(9)
+        pairs = []
+        for n in (8, 8, 20):
+            x = rng.randn(n) * 100 + 800
+            pairs.append((x, 0.5 * x + 60 * rng.randn(n)))
+        pairs.append(([1, 2], [3, 4]))
+
+        batch = bootstrap_correlation_ci_batch(pairs, n_boot=2000)
+        for (x, y), ci in zip(pairs, batch):
+            np.testing.assert_allclose(ci, bootstrap_correlation_ci(x, y, n_boot=2000), atol=1e-12)
+
+    def test_bca_interval_contains_point_estimate(self):
+        from scripts.revenue_price_correlation import bootstrap_correlation_ci
+        rng = np.random.RandomState(42)
+        x = rng.randn(40)
+        y = 0.8 * x + 0.4 * rng.randn(40)
+        ci_lo, ci_hi = bootstrap_correlation_ci(x, y, n_boot=4000, method='bca')
+        r = np.corrcoef(x, y)[0, 1]
+        assert ci_lo <= r <= ci_hi
+        with pytest.raises(ValueError):
+            bootstrap_correlation_ci(x, y, method='studentized')
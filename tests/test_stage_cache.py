@@ -0,0 +1,73 @@
+"""Tests for stage-level caching in PriceVolumeModel.run_full_analysis."""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from price_volume_model import (
+    PriceVolumeModel, ScenarioType, get_scenario_presets, get_synergy_presets,
+    clear_stage_cache, get_stage_cache_stats,
+)
+
+
+@pytest.fixture
+def base():
+    clear_stage_cache()
+    return get_scenario_presets()[ScenarioType.BASE_CASE]
+
+
+def _values(analysis):
+    return (analysis['val_uss']['share_price'], analysis['val_nippon']['share_price'])
+
+
+def test_valuation_only_change_reuses_projection(base):
+    PriceVolumeModel(base).run_full_analysis()
+    changed = replace(base, uss_wacc=base.uss_wacc + 0.01, exit_multiple=base.exit_multiple + 1,
+                      terminal_growth=base.terminal_growth + 0.005)
+    cached = PriceVolumeModel(changed).run_full_analysis()
+
+    stats = get_stage_cache_stats()
+    assert stats['projection'] == {'hits': 1, 'misses': 1, 'size': 1}
+    assert stats['dcf']['misses'] == 2
+
+    fresh = PriceVolumeModel(changed, use_stage_cache=False).run_full_analysis()
+    assert _values(cached) == pytest.approx(_values(fresh))
+
+
+def test_price_change_invalidates_projection(base):
+    PriceVolumeModel(base).run_full_analysis()
+    price = replace(base.price_scenario, hrc_us_factor=base.price_scenario.hrc_us_factor * 0.9)
+    PriceVolumeModel(replace(base, price_scenario=price)).run_full_analysis()
+    assert get_stage_cache_stats()['projection']['misses'] == 2
+
+
+def test_execution_factor_and_projects_are_part_of_projection_key(base):
+    scenario = get_scenario_presets()[ScenarioType.NIPPON_COMMITMENTS]
+    full = PriceVolumeModel(scenario, execution_factor=1.0).run_full_analysis()
+    haircut = PriceVolumeModel(scenario, execution_factor=0.5).run_full_analysis()
+    assert get_stage_cache_stats()['projection']['misses'] == 2
+    assert full['consolidated']['Total_EBITDA'].sum() != haircut['consolidated']['Total_EBITDA'].sum()
+
+
+def test_synergy_results_match_uncached(base):
+    scenario = replace(base, synergies=get_synergy_presets()['base_case'])
+    first = PriceVolumeModel(scenario).run_full_analysis()
+    second = PriceVolumeModel(scenario).run_full_analysis()
+    fresh = PriceVolumeModel(scenario, use_stage_cache=False).run_full_analysis()
+    assert _values(first) == _values(second) == pytest.approx(_values(fresh))
+    assert first['synergy_value']['npv_synergies'] == pytest.approx(fresh['synergy_value']['npv_synergies'])
+
+
+def test_cached_outputs_are_isolated_from_caller_mutation(base):
+    first = PriceVolumeModel(base).run_full_analysis()
+    original_fcf = first['consolidated']['FCF'].sum()
+    first['consolidated']['FCF'] = 0.0
+    first['val_uss']['fcf_list'].clear()
+
+    second = PriceVolumeModel(base).run_full_analysis()
+    assert second['consolidated']['FCF'].sum() == pytest.approx(original_fcf)
+    assert len(second['val_uss']['fcf_list']) == 10
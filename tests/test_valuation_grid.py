@@ -0,0 +1,87 @@
+"""Tests for declarative valuation grids in price_volume_model."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from price_volume_model import (
+    PriceVolumeModel, ScenarioType, get_scenario_presets,
+    build_sensitivity_scenario, preset_points, price_factor_points, exit_multiple_points,
+    run_valuation_grid, clear_valuation_grid_cache, get_valuation_pool, shutdown_valuation_pool,
+)
+
+
+@pytest.fixture
+def base():
+    clear_valuation_grid_cache()
+    return get_scenario_presets()[ScenarioType.BASE_CASE]
+
+
+def test_grid_matches_individual_runs(base):
+    points = price_factor_points(base, [0.85, 1.15]) + exit_multiple_points(base, [3.5])
+    grid = run_valuation_grid(points, n_workers=1)
+
+    assert list(grid['Group']) == ['price', 'price', 'exit_multiple']
+    assert list(grid['Label']) == ['85%', '115%', '3.5x']
+    for point, (_, row) in zip(points, grid.iterrows()):
+        analysis = PriceVolumeModel(point.scenario).run_full_analysis()
+        assert row['Value to Nippon ($/sh)'] == pytest.approx(analysis['val_nippon']['share_price'])
+        assert row['USS - No Sale ($/sh)'] == pytest.approx(analysis['val_uss']['share_price'])
+
+
+def test_sensitivity_scenario_only_changes_requested_fields(base):
+    scenario = build_sensitivity_scenario(base, exit_multiple=6.5)
+    assert scenario.exit_multiple == 6.5
+    assert scenario.price_scenario == base.price_scenario
+    flat = build_sensitivity_scenario(base, price_factor=0.9)
+    assert flat.price_scenario.octg_factor == flat.price_scenario.hrc_us_factor == 0.9
+    assert flat.exit_multiple == base.exit_multiple
+
+
+def test_cached_points_skip_revaluation_and_report_progress(base):
+    points = price_factor_points(base, [0.95, 1.05])
+    first = run_valuation_grid(points, n_workers=1)
+
+    calls = []
+    second = run_valuation_grid(points, n_workers=1,
+                                progress_callback=lambda done, total, label: calls.append((done, total)))
+    assert calls == [(1, 2), (2, 2)]
+    assert second.equals(first)
+
+
+def test_execution_factor_applies_to_nippon_commitments_only(base):
+    presets = get_scenario_presets()
+    points = {p.label: p for p in preset_points(presets, execution_factor=0.6)}
+    assert points['NIPPON_COMMITMENTS'].execution_factor == 0.6
+    assert points['BASE_CASE'].execution_factor == 1.0
+
+
+def test_worker_pool_matches_in_process(base):
+    points = price_factor_points(base, [0.9, 1.1])
+    serial = run_valuation_grid(points, n_workers=1)
+    clear_valuation_grid_cache()
+    try:
+        parallel = run_valuation_grid(points, n_workers=2)
+    finally:
+        shutdown_valuation_pool()
+    assert parallel['Value to Nippon ($/sh)'].values == pytest.approx(serial['Value to Nippon ($/sh)'].values)
+
+
+def test_concurrent_grids_share_pool_and_cache(base):
+    points = price_factor_points(base, [0.8, 0.9, 1.0, 1.1, 1.2])
+    serial = run_valuation_grid(points, n_workers=1)
+    clear_valuation_grid_cache()
+    try:
+        pool = get_valuation_pool(2)
+        # A different worker count reuses the live pool instead of replacing it
+        assert get_valuation_pool(3) is pool
+        with ThreadPoolExecutor(max_workers=4) as threads:
+            grids = list(threads.map(lambda n: run_valuation_grid(points, n_workers=n), [2, 3, 2, 1]))
+    finally:
+        shutdown_valuation_pool()
+    for grid in grids:
+        assert grid['Value to Nippon ($/sh)'].values == pytest.approx(serial['Value to Nippon ($/sh)'].values)
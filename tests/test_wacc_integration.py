@@ -15,7 +15,6 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
-import copy
 
 
 class TestWACCModuleAvailability(unittest.TestCase):
@@ -184,8 +183,7 @@ class TestModelIntegration(unittest.TestCase):
             self.skipTest("WACC module not available")
 
         presets = get_scenario_presets()
-        scenario = copy.deepcopy(presets[ScenarioType.BASE_CASE])
-        scenario.use_verified_wacc = True
+        scenario = presets[ScenarioType.BASE_CASE].with_overrides(use_verified_wacc=True)
 
         model = PriceVolumeModel(scenario)
         results = model.run_full_analysis()
@@ -211,10 +209,9 @@ class TestModelIntegration(unittest.TestCase):
             self.skipTest("WACC module not available")
 
         presets = get_scenario_presets()
-        scenario = copy.deepcopy(presets[ScenarioType.BASE_CASE])
+        scenario = presets[ScenarioType.BASE_CASE].with_overrides(use_verified_wacc=True)
         original_uss_wacc = scenario.uss_wacc
 
-        scenario.use_verified_wacc = True
         model = PriceVolumeModel(scenario)
         results = model.run_full_analysis()
 
@@ -239,8 +236,7 @@ class TestModelIntegration(unittest.TestCase):
             self.skipTest("WACC module not available")
 
         presets = get_scenario_presets()
-        scenario = copy.deepcopy(presets[ScenarioType.BASE_CASE])
-        scenario.use_verified_wacc = True
+        scenario = presets[ScenarioType.BASE_CASE].with_overrides(use_verified_wacc=True)
 
         model = PriceVolumeModel(scenario)
         results = model.run_full_analysis()
@@ -260,8 +256,7 @@ class TestBackwardCompatibility(unittest.TestCase):
         )
 
         presets = get_scenario_presets()
-        scenario = copy.deepcopy(presets[ScenarioType.BASE_CASE])
-        scenario.use_verified_wacc = False
+        scenario = presets[ScenarioType.BASE_CASE].with_overrides(use_verified_wacc=False)
 
         model = PriceVolumeModel(scenario)
         results = model.run_full_analysis()
@@ -288,8 +283,7 @@ class TestBackwardCompatibility(unittest.TestCase):
         for scenario_type, scenario in presets.items():
             with self.subTest(scenario=scenario_type.value):
                 # Explicitly disable verified WACC for this test
-                scenario_copy = copy.deepcopy(scenario)
-                scenario_copy.use_verified_wacc = False
+                scenario_copy = scenario.with_overrides(use_verified_wacc=False)
 
                 model = PriceVolumeModel(scenario_copy)
                 results = model.run_full_analysis()
@@ -331,8 +325,7 @@ class TestWACCAdvantage(unittest.TestCase):
             self.skipTest("WACC module not available")
 
         presets = get_scenario_presets()
-        scenario = copy.deepcopy(presets[ScenarioType.BASE_CASE])
-        scenario.use_verified_wacc = True
+        scenario = presets[ScenarioType.BASE_CASE].with_overrides(use_verified_wacc=True)
 
         model = PriceVolumeModel(scenario)
         results = model.run_full_analysis()
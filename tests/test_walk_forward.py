@@ -0,0 +1,93 @@
+"""Tests for the walk-forward distribution backtest in monte_carlo.walk_forward."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from monte_carlo.distribution_fitter import DistributionFitter
+from monte_carlo.walk_forward import (
+    SortedWindow, window_moments, backtest_series, run_walk_forward,
+)
+
+
+@pytest.fixture(scope='module')
+def weekly():
+    rng = np.random.default_rng(11)
+    dates = pd.date_range('2010-01-01', '2020-12-31', freq='W-FRI').values
+    return dates, rng.lognormal(np.log(800), 0.15, len(dates))
+
+
+def test_window_moments_match_direct():
+    x = np.random.default_rng(1).normal(100, 5, 500)
+    lo, hi = np.array([0, 40, 300]), np.array([120, 200, 500])
+    n, mean, std = window_moments(x, lo, hi)
+    for i in range(3):
+        w = x[lo[i]:hi[i]]
+        assert n[i] == len(w)
+        assert mean[i] == pytest.approx(w.mean())
+        assert std[i] == pytest.approx(w.std(ddof=1))
+
+
+def test_sorted_window_percentiles():
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=300)
+    window = SortedWindow()
+    for v in x[:200]:
+        window.add(v)
+    for v in x[:50]:
+        window.remove(v)
+    for q in (1, 50, 99):
+        assert window.percentile(q) == pytest.approx(np.percentile(x[50:200], q))
+
+
+@pytest.mark.parametrize('dist_type', ['lognormal', 'normal', 'triangular'])
+def test_origin_refits_match_distribution_fitter(weekly, dist_type):
+    dates, values = weekly
+    result = backtest_series(dates, values, dist_type, window_years=3, horizon_months=6)
+    assert result['n_origins'] > 50
+
+    fitter = DistributionFitter(cache=None)
+    for record in result['origins'][::25]:
+        origin = pd.Timestamp(record['origin'])
+        mask = (dates > (origin - pd.DateOffset(years=3)).to_datetime64()) & (dates <= origin.to_datetime64())
+        fit = fitter.fit_distribution(values[mask], dist_type)
+        assert record['n_train'] == mask.sum()
+        for key, value in fit.parameters.items():
+            assert record[key] == pytest.approx(value)
+
+
+def test_stationary_series_is_calibrated(weekly):
+    dates, values = weekly
+    result = backtest_series(dates, values, 'lognormal', window_years=3, horizon_months=12)
+    assert result['coverage']['90'] == pytest.approx(0.90, abs=0.05)
+    assert result['coverage']['50'] == pytest.approx(0.50, abs=0.07)
+    assert sum(result['pit_histogram']) == pytest.approx(1.0)
+    assert result['pit_max_deviation'] < 0.05
+    assert result['valid']
+
+
+def test_level_shift_shows_up_in_coverage_by_year(weekly):
+    dates, values = weekly
+    shifted = values * np.where(dates >= np.datetime64('2016-01-01'), 1.8, 1.0)
+    result = backtest_series(dates, shifted, 'lognormal', window_years=3, horizon_months=12)
+    by_year = result['coverage_90_by_year']
+    # Origins whose test horizon crosses the break lose coverage; later windows recover
+    assert by_year[2015] < 0.6
+    assert by_year[2013] > 0.8 and by_year[2019] > 0.8
+
+
+def test_parallel_matches_serial(weekly):
+    dates, values = weekly
+    series = {'a': (dates, values, 'lognormal'), 'b': (dates, np.log(values), 'normal'),
+              'short': (dates[:60], values[:60], 'normal')}
+    serial = run_walk_forward(series, n_workers=1)
+    pooled = run_walk_forward(series, n_workers=2)
+    assert serial['a']['coverage'] == pooled['a']['coverage']
+    # log-normal on levels == normal on logs
+    assert serial['a']['coverage'] == pytest.approx(serial['b']['coverage'])
+    assert serial['short']['n_origins'] == 0 and not serial['short']['valid']